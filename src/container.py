@@ -11,7 +11,7 @@ from dependency_injector import containers, providers
 from src.core.config import config
 
 # AI Components
-from src.infrastructure.ai.api_client import OpenAIClient
+from src.infrastructure.ai.api_client import OpenAIClient, shared_transport
 from src.infrastructure.ai.circuit_breaker import CircuitBreaker
 from src.infrastructure.ai.file_renamer import AIFileRenamer
 from src.infrastructure.ai.key_pool import KeyPool
@@ -33,7 +33,14 @@ from src.infrastructure.notification.discord.webhook_client import DiscordWebhoo
 from src.infrastructure.repositories.anime_repository import AnimeRepository
 from src.infrastructure.repositories.download_repository import DownloadRepository
 from src.infrastructure.repositories.history_repository import HistoryRepository
+from src.infrastructure.repositories.queue_event_repository import QueueEventRepository
 from src.infrastructure.repositories.subtitle_repository import SubtitleRepository
+from src.infrastructure.repositories.title_parse_cache_repository import (
+    TitleParseCacheRepository,
+)
+from src.infrastructure.repositories.torrent_hash_cache_repository import (
+    TorrentHashCacheRepository,
+)
 
 # Anime Services
 from src.services.anime.anime_service import AnimeService
@@ -48,6 +55,7 @@ from src.services.download import (
     DownloadNotifier,
     RSSProcessor,
     StatusService,
+    TorrentFileResolver,
     UploadHandler,
 )
 from src.services.download_manager import DownloadManager
@@ -65,6 +73,7 @@ from src.services.rename.rename_service import RenameService
 
 # RSS Services
 from src.services.rss.filter_service import FilterService
+from src.services.rss.local_title_parser import LocalTitleParser
 from src.services.rss.rss_service import RSSService
 
 
@@ -110,6 +119,9 @@ class Container(containers.DeclarativeContainer):
     download_repo = providers.Singleton(DownloadRepository)
     history_repo = providers.Singleton(HistoryRepository)
     subtitle_repo = providers.Singleton(SubtitleRepository)
+    torrent_hash_cache_repo = providers.Singleton(TorrentHashCacheRepository)
+    title_parse_cache_repo = providers.Singleton(TitleParseCacheRepository)
+    queue_event_repo = providers.Singleton(QueueEventRepository)
 
     # ===== External Adapters =====
     qb_client = providers.Singleton(QBitAdapter)
@@ -120,13 +132,19 @@ class Container(containers.DeclarativeContainer):
     ai_debug_service = providers.Singleton(AIDebugService)
 
     # OpenAI API Clients - 分离标题解析和重命名的客户端（使用不同 timeout）
+    # 所有客户端共享同一个 keep-alive 连接池
+    ai_http_transport = providers.Object(shared_transport)
     title_parse_api_client = providers.Singleton(
         OpenAIClient,
-        timeout=config.openai.title_parse.timeout
+        timeout=config.openai.title_parse.timeout,
+        connect_timeout=config.openai.title_parse.connect_timeout,
+        transport=ai_http_transport
     )
     rename_api_client = providers.Singleton(
         OpenAIClient,
-        timeout=config.openai.multi_file_rename.timeout
+        timeout=config.openai.multi_file_rename.timeout,
+        connect_timeout=config.openai.multi_file_rename.connect_timeout,
+        transport=ai_http_transport
     )
 
     # Title Parse: KeyPool & CircuitBreaker
@@ -143,7 +161,8 @@ class Container(containers.DeclarativeContainer):
         key_pool=title_parse_pool,
         circuit_breaker=title_parse_breaker,
         api_client=title_parse_api_client,
-        ai_debug_service=ai_debug_service
+        ai_debug_service=ai_debug_service,
+        cache_repo=title_parse_cache_repo
     )
 
     # Multi-File Rename: KeyPool & CircuitBreaker
@@ -160,7 +179,12 @@ class Container(containers.DeclarativeContainer):
         key_pool=rename_pool,
         circuit_breaker=rename_breaker,
         api_client=rename_api_client,
-        ai_debug_service=ai_debug_service
+        ai_debug_service=ai_debug_service,
+        batch_size=config.openai.multi_file_rename.max_batch_size,
+        max_parallel_batches=config.openai.multi_file_rename.max_parallel_batches,
+        streaming=config.openai.multi_file_rename.streaming,
+        max_prompt_tokens=config.openai.multi_file_rename.max_prompt_tokens,
+        tvdb_simplifier=tvdb_client.provided.simplify_ai_format
     )
 
     # Subtitle Match: KeyPool & CircuitBreaker
@@ -169,7 +193,9 @@ class Container(containers.DeclarativeContainer):
         OpenAIClient,
         timeout=config.openai.subtitle_match.timeout
         if config.openai.subtitle_match.api_key or config.openai.subtitle_match.pool_name
-        else config.openai.multi_file_rename.timeout
+        else config.openai.multi_file_rename.timeout,
+        connect_timeout=config.openai.subtitle_match.connect_timeout,
+        transport=ai_http_transport
     )
     subtitle_match_pool = providers.Singleton(
         KeyPool,
@@ -212,6 +238,10 @@ class Container(containers.DeclarativeContainer):
 
     # ===== Core Services =====
     filter_service = providers.Singleton(FilterService)
+    local_title_parser = providers.Singleton(
+        LocalTitleParser,
+        anime_repo=anime_repo
+    )
 
     metadata_service = providers.Singleton(
         MetadataService,
@@ -220,7 +250,8 @@ class Container(containers.DeclarativeContainer):
 
     rss_service = providers.Singleton(
         RSSService,
-        download_repo=download_repo
+        download_repo=download_repo,
+        hash_cache_repo=torrent_hash_cache_repo
     )
 
     anime_service = providers.Singleton(
@@ -259,6 +290,12 @@ class Container(containers.DeclarativeContainer):
         notifier=download_notifier
     )
 
+    torrent_file_resolver = providers.Singleton(
+        TorrentFileResolver,
+        download_client=qb_client,
+        download_repo=download_repo
+    )
+
     rss_processor = providers.Singleton(
         RSSProcessor,
         anime_repo=anime_repo,
@@ -269,7 +306,9 @@ class Container(containers.DeclarativeContainer):
         rss_service=rss_service,
         filter_service=filter_service,
         path_builder=path_builder,
-        notifier=download_notifier
+        notifier=download_notifier,
+        local_title_parser=local_title_parser,
+        torrent_file_resolver=torrent_file_resolver
     )
 
     upload_handler = providers.Singleton(
@@ -279,7 +318,8 @@ class Container(containers.DeclarativeContainer):
         history_repo=history_repo,
         download_client=qb_client,
         path_builder=path_builder,
-        notifier=download_notifier
+        notifier=download_notifier,
+        torrent_file_resolver=torrent_file_resolver
     )
 
     completion_handler = providers.Singleton(
@@ -299,7 +339,8 @@ class Container(containers.DeclarativeContainer):
         download_repo=download_repo,
         history_repo=history_repo,
         download_client=qb_client,
-        hardlink_service=file_service
+        hardlink_service=file_service,
+        torrent_file_resolver=torrent_file_resolver
     )
 
     # ===== Core Orchestrator (Facade) =====
@@ -26,6 +26,7 @@ class RSSConfig(BaseModel):
 
     fixed_urls: list[str | RSSFeed] = []  # 兼容旧格式和新格式
     check_interval: int = Field(default=3600, ge=60)
+    queue_workers: int = Field(default=3, ge=1, le=16)  # RSS 队列并发处理线程数
 
     @field_validator('fixed_urls', mode='before')
     @classmethod
@@ -120,14 +121,24 @@ class OpenAIConfig(BaseModel):
         # 任务特定设置（始终使用，不受 pool 影响）
         extra_body: str = ''  # JSON格式的额外参数
         timeout: int = Field(default=180, ge=10, le=600)  # API 超时时间（秒）
+        connect_timeout: int = Field(default=10, ge=1, le=120)  # 连接超时时间（秒）
         retries: int = Field(default=3, ge=0, le=10)  # 重试次数
 
+    class TitleParseConfig(TaskConfig):
+        """标题解析任务配置（包含本地正则解析参数）"""
+
+        local_parse_enabled: bool = True  # 先用本地正则解析，置信度不足时再调用 AI
+        local_parse_min_confidence: float = Field(default=0.8, ge=0, le=1)  # 本地解析结果的最低置信度
+
     class MultiFileRenameConfig(TaskConfig):
         """多文件重命名任务配置（包含批处理参数）"""
 
         timeout: int = Field(default=360, ge=10, le=600)  # 多文件重命名默认360秒超时
         max_batch_size: int = Field(default=30, gt=0, le=100)  # 最大批处理大小
         batch_processing_retries: int = Field(default=2, ge=0)  # 批处理重试次数
+        max_parallel_batches: int = Field(default=4, ge=1, le=16)  # 并行处理的最大文件夹数
+        streaming: bool = False  # 流式接收响应并增量解析
+        max_prompt_tokens: int = Field(default=16000, ge=0)  # 单次请求提示词 Token 预算（0 表示只按文件数分批）
 
     class SubtitleMatchConfig(TaskConfig):
         """字幕匹配任务配置（较长超时时间）"""
@@ -150,7 +161,7 @@ class OpenAIConfig(BaseModel):
     key_pools: list[KeyPoolDefinition] = Field(default_factory=list)
 
     # 标题解析
-    title_parse: TaskConfig = Field(default_factory=TaskConfig)
+    title_parse: TitleParseConfig = Field(default_factory=TitleParseConfig)
     # 多文件重命名
     multi_file_rename: MultiFileRenameConfig = Field(default_factory=MultiFileRenameConfig)
     # 字幕匹配
@@ -6,6 +6,7 @@ and adapters, plus notification data classes.
 """
 
 from src.core.interfaces.adapters import (
+    FeedFetchResult,
     IDownloadClient,
     IFileRenamer,
     IMetadataClient,
@@ -39,6 +40,7 @@ __all__ = [
     'TitleParseResult',
     'RenameResult',
     'RSSItem',
+    'FeedFetchResult',
     # Adapter Interfaces
     'ITitleParser',
     'IFileRenamer',
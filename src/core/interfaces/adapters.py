@@ -5,6 +5,7 @@ Contains abstract base classes defining contracts for external service adapters.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -25,6 +26,7 @@ class TitleParseResult:
         episode: Episode number (if applicable).
         category: Content category ('tv' or 'movie').
         quality_info: Quality-related information (resolution, codec, etc.).
+        confidence: Parser confidence from 0.0 to 1.0 (None if not scored).
     """
     original_title: str
     clean_title: str
@@ -34,6 +36,7 @@ class TitleParseResult:
     episode: int | None = None
     category: str = 'tv'
     quality_info: dict[str, str] = field(default_factory=dict)
+    confidence: float | None = None
 
     @property
     def is_movie(self) -> bool:
@@ -102,6 +105,21 @@ class ITitleParser(ABC):
         """
         pass
 
+    def parse_many(self, titles: list[str]) -> list[TitleParseResult | None]:
+        """
+        Parse several anime titles.
+
+        The default implementation parses each title individually;
+        implementations may override it to batch requests.
+
+        Args:
+            titles: The title strings to parse.
+
+        Returns:
+            Results in input order, None where parsing failed.
+        """
+        return [self.parse(title) for title in titles]
+
 
 class IFileRenamer(ABC):
     """
@@ -247,6 +265,20 @@ class IDownloadClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def sync_torrents(self) -> dict[str, dict[str, Any]] | None:
+        """
+        Get information about all torrents in one request.
+
+        Implementations may keep a local mirror and fetch only the
+        changes since the previous call.
+
+        Returns:
+            Mapping of lowercase torrent hash to torrent info,
+            None if the request failed.
+        """
+        pass
+
     @abstractmethod
     def delete_torrent(self, hash_id: str, delete_files: bool = False) -> bool:
         """
@@ -261,6 +293,24 @@ class IDownloadClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def delete_torrents(
+        self,
+        hash_ids: Iterable[str],
+        delete_files: bool = False
+    ) -> list[str]:
+        """
+        Delete several torrents in as few requests as possible.
+
+        Args:
+            hash_ids: The torrent hashes.
+            delete_files: Whether to delete downloaded files.
+
+        Returns:
+            The hashes whose deletion request succeeded (deduplicated).
+        """
+        pass
+
     @abstractmethod
     def pause_torrent(self, hash_id: str) -> bool:
         """
@@ -274,6 +324,19 @@ class IDownloadClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def pause_torrents(self, hash_ids: Iterable[str]) -> bool:
+        """
+        Pause several torrents in as few requests as possible.
+
+        Args:
+            hash_ids: The torrent hashes.
+
+        Returns:
+            True if every pause request succeeded, False otherwise.
+        """
+        pass
+
     @abstractmethod
     def resume_torrent(self, hash_id: str) -> bool:
         """
@@ -287,6 +350,19 @@ class IDownloadClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def resume_torrents(self, hash_ids: Iterable[str]) -> bool:
+        """
+        Resume several paused torrents in as few requests as possible.
+
+        Args:
+            hash_ids: The torrent hashes.
+
+        Returns:
+            True if every resume request succeeded, False otherwise.
+        """
+        pass
+
 
 @dataclass
 class RSSItem:
@@ -321,6 +397,27 @@ class RSSItem:
         return self.torrent_url if self.torrent_url else self.link
 
 
+@dataclass
+class FeedFetchResult:
+    """
+    Result of fetching a single feed as part of a concurrent batch.
+
+    Attributes:
+        url: URL of the RSS feed.
+        items: Parsed items, or None if the fetch failed or the feed was
+            unchanged (conditional fetch).
+        error: Exception raised while fetching or parsing, if any.
+    """
+    url: str
+    items: list[RSSItem] | None = None
+    error: Exception | None = None
+
+    @property
+    def success(self) -> bool:
+        """Check if the feed was fetched and parsed successfully."""
+        return self.error is None
+
+
 class IRSSParser(ABC):
     """
     RSS parser interface.
@@ -341,6 +438,19 @@ class IRSSParser(ABC):
         """
         pass
 
+    @abstractmethod
+    def parse_feeds(self, rss_urls: list[str]) -> list[FeedFetchResult]:
+        """
+        Fetch and parse several feeds concurrently.
+
+        Args:
+            rss_urls: URLs of the RSS feeds.
+
+        Returns:
+            One FeedFetchResult per URL, in the same order as rss_urls.
+        """
+        pass
+
     @abstractmethod
     def filter_new_items(self, items: list[RSSItem]) -> list[RSSItem]:
         """
@@ -147,6 +147,19 @@ class IDownloadRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_by_hashes(self, hash_ids: list[str]) -> dict[str, DownloadRecord]:
+        """
+        Get the download records of several torrents in one query.
+
+        Args:
+            hash_ids: Torrent hashes.
+
+        Returns:
+            Records by hash; hashes without a record are omitted.
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, record_id: int) -> DownloadRecord | None:
         """
@@ -229,6 +242,22 @@ class IDownloadRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def update_statuses(
+        self,
+        updates: list[tuple[str, str, datetime | None]]
+    ) -> int:
+        """
+        Update the status of several downloads in one transaction.
+
+        Args:
+            updates: (hash, status, completion time) tuples.
+
+        Returns:
+            Number of records updated.
+        """
+        pass
+
     @abstractmethod
     def move_to_history(self, hash_id: str) -> bool:
         """
@@ -268,6 +297,19 @@ class IDownloadRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def existing_hashes(self, hash_ids: list[str]) -> set[str]:
+        """
+        Return the subset of hashes that already have download records.
+
+        Args:
+            hash_ids: Torrent hashes to check.
+
+        Returns:
+            Set of hashes that exist in the repository.
+        """
+        pass
+
 
 class IHardlinkRepository(ABC):
     """
@@ -328,6 +370,27 @@ class IHardlinkRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_many(
+        self,
+        records: list[HardlinkRecord],
+        failures: list[tuple[HardlinkRecord, str]] | None = None
+    ) -> int:
+        """
+        Save the results of several link operations in one transaction.
+
+        Records a hardlink and a successful attempt for each record, and a
+        failed attempt for each failure.
+
+        Args:
+            records: Created hardlinks (or copies).
+            failures: (record, failure reason) pairs of links that failed.
+
+        Returns:
+            Number of hardlink records saved.
+        """
+        pass
+
     @abstractmethod
     def delete(self, hardlink_id: int) -> bool:
         """
@@ -2,15 +2,18 @@
 AI 服务模块。
 
 提供 OpenAI API 集成功能，包括：
-- API 客户端（HTTP 通信）
+- API 客户端（HTTP 通信，共享 keep-alive 连接池）
 - Key Pool（API Key 管理和轮询）
 - 熔断器（故障保护）
+- 自适应并发限制器（AIMD 调整并发上限）
 - 标题解析器（AI 解析动漫标题）
 - 文件重命名器（AI 生成重命名映射）
+- Token 估算器（按提示词 Token 预算分批）
 """
 
-from src.infrastructure.ai.api_client import APIResponse, OpenAIClient
+from src.infrastructure.ai.api_client import APIResponse, HTTPTransport, OpenAIClient
 from src.infrastructure.ai.circuit_breaker import CircuitBreaker
+from src.infrastructure.ai.concurrency_limiter import AdaptiveConcurrencyLimiter
 from src.infrastructure.ai.file_renamer import AIFileRenamer
 from src.infrastructure.ai.key_pool import (
     KeyPool,
@@ -20,16 +23,20 @@ from src.infrastructure.ai.key_pool import (
     KeyUsage,
 )
 from src.infrastructure.ai.title_parser import AITitleParser
+from src.infrastructure.ai.token_budget import TokenEstimator
 
 __all__ = [
     'OpenAIClient',
     'APIResponse',
+    'HTTPTransport',
     'KeyPool',
     'KeySpec',
     'KeyReservation',
     'KeyState',
     'KeyUsage',
     'CircuitBreaker',
+    'AdaptiveConcurrencyLimiter',
     'AITitleParser',
     'AIFileRenamer',
+    'TokenEstimator',
 ]
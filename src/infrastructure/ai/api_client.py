@@ -5,15 +5,24 @@ OpenAI API 客户端模块。
 只负责网络请求，不包含业务逻辑。
 """
 
+import json
 import logging
+import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.infrastructure.ai.key_pool import count_keys_by_base_url
 
 logger = logging.getLogger(__name__)
 
+# 默认连接超时（秒）
+DEFAULT_CONNECT_TIMEOUT = 10
+
 
 @dataclass
 class APIResponse:
@@ -26,12 +35,101 @@ class APIResponse:
         error_code: HTTP 错误代码（失败时）
         error_message: 错误消息（失败时）
         response_time_ms: 响应时间（毫秒）
+        aborted: 流式请求是否被调用方提前中止（此时 content 为已接收的部分）
+        prompt_tokens: API 返回的实际输入 Token 数（未返回时为 None）
+        completion_tokens: API 返回的实际输出 Token 数（未返回时为 None）
     """
     success: bool
     content: str | None = None
     error_code: int | None = None
     error_message: str | None = None
     response_time_ms: int = 0
+    aborted: bool = False
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+
+
+class HTTPTransport:
+    """
+    共享的 keep-alive HTTP 连接池。
+
+    按 API 基础 URL 维护 requests.Session，复用 TCP/TLS 连接，
+    避免每次请求重新握手。连接池大小默认按已注册 Key Pool 中
+    该 URL 的 Key 数量确定（每个 Key 两个连接）。
+
+    Example:
+        >>> transport = HTTPTransport()
+        >>> session = transport.get_session('https://api.openai.com/v1')
+    """
+
+    MIN_POOL_SIZE = 4
+    MAX_POOL_SIZE = 32
+    CONNECTIONS_PER_KEY = 2
+
+    def __init__(self, pool_size_resolver: Callable[[str], int] | None = None):
+        """
+        初始化连接池。
+
+        Args:
+            pool_size_resolver: 根据 base_url 返回连接池大小的函数（可选，
+                默认按 Key Pool 配置计算）
+        """
+        self._pool_size_resolver = pool_size_resolver or self._pool_size_from_key_pools
+        self._sessions: dict[str, requests.Session] = {}
+        self._pool_sizes: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, base_url: str) -> requests.Session:
+        """
+        获取指定 base_url 的共享 Session（不存在则创建）。
+
+        Args:
+            base_url: API 基础 URL
+
+        Returns:
+            requests.Session 实例
+        """
+        key = base_url.rstrip('/')
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                pool_size = self._pool_size_resolver(key)
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=pool_size,
+                    max_retries=0
+                )
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._sessions[key] = session
+                self._pool_sizes[key] = pool_size
+                logger.debug(f'🔌 创建 AI HTTP 连接池: {key} (大小: {pool_size})')
+            return session
+
+    def reset(self) -> None:
+        """关闭所有连接池（Key Pool 配置变更后调用，下次请求时按新配置重建）"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._pool_sizes.clear()
+        for session in sessions:
+            session.close()
+
+    def get_status(self) -> dict[str, int]:
+        """获取各 base_url 的连接池大小"""
+        with self._lock:
+            return dict(self._pool_sizes)
+
+    @classmethod
+    def _pool_size_from_key_pools(cls, base_url: str) -> int:
+        """按 Key Pool 中该 base_url 的 Key 数量计算连接池大小"""
+        key_count = count_keys_by_base_url().get(base_url, 1)
+        return min(max(key_count * cls.CONNECTIONS_PER_KEY, cls.MIN_POOL_SIZE), cls.MAX_POOL_SIZE)
+
+
+# 全局实例（标题解析、重命名、字幕匹配共享）
+shared_transport = HTTPTransport()
 
 
 class OpenAIClient:
@@ -39,7 +137,7 @@ class OpenAIClient:
     OpenAI API 客户端。
 
     只负责 HTTP 通信，不包含重试逻辑、Key 管理等业务逻辑。
-    遵循单一职责原则 (SRP)。
+    遵循单一职责原则 (SRP)。默认使用全局共享的 keep-alive 连接池。
 
     Example:
         >>> client = OpenAIClient(timeout=30)
@@ -53,14 +151,23 @@ class OpenAIClient:
         ...     print(response.content)
     """
 
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: int = 30,
+        connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
+        transport: HTTPTransport | None = None
+    ):
         """
         初始化客户端。
 
         Args:
-            timeout: 请求超时时间（秒），默认 30 秒
+            timeout: 读取超时时间（秒），默认 30 秒
+            connect_timeout: 连接超时时间（秒），默认 10 秒
+            transport: HTTP 连接池（可选，默认使用全局共享实例）
         """
         self._timeout = timeout
+        self._connect_timeout = connect_timeout
+        self._transport = transport or shared_transport
 
     def call(
         self,
@@ -107,11 +214,12 @@ class OpenAIClient:
         url = f'{base_url}/chat/completions'
 
         try:
-            response = requests.post(
+            session = self._transport.get_session(base_url)
+            response = session.post(
                 url,
                 headers=headers,
                 json=payload,
-                timeout=self._timeout
+                timeout=(self._connect_timeout, self._timeout)
             )
 
             response_time_ms = int((time.time() - start_time) * 1000)
@@ -119,6 +227,7 @@ class OpenAIClient:
             if response.status_code == 200:
                 result = response.json()
                 content = result['choices'][0]['message']['content'].strip()
+                usage = result.get('usage') or {}
                 logger.debug(
                     f'🤖 API 请求成功: {model}, '
                     f'响应时间: {response_time_ms}ms'
@@ -126,7 +235,9 @@ class OpenAIClient:
                 return APIResponse(
                     success=True,
                     content=content,
-                    response_time_ms=response_time_ms
+                    response_time_ms=response_time_ms,
+                    prompt_tokens=usage.get('prompt_tokens'),
+                    completion_tokens=usage.get('completion_tokens')
                 )
             else:
                 error_message = self._extract_error_message(response)
@@ -177,6 +288,177 @@ class OpenAIClient:
                 response_time_ms=response_time_ms
             )
 
+    def call_stream(
+        self,
+        base_url: str,
+        api_key: str,
+        model: str,
+        messages: list[dict[str, str]],
+        on_delta: Callable[[str], bool] | None = None,
+        response_format: dict[str, Any] | None = None,
+        extra_params: dict[str, Any] | None = None
+    ) -> APIResponse:
+        """
+        以流式（SSE）方式发送 API 请求。
+
+        读取超时作用于相邻两个数据块之间而非整个响应，长响应不会因总耗时超时。
+        每收到一段内容都会调用 on_delta，返回 False 时立即中止请求。
+
+        Args:
+            base_url: API 基础 URL（如 https://api.openai.com/v1）
+            api_key: API Key
+            model: 模型名称
+            messages: 消息列表
+            on_delta: 内容增量回调，返回 False 表示中止
+            response_format: 响应格式设置（如 JSON mode）
+            extra_params: 额外的请求参数
+
+        Returns:
+            APIResponse: 响应数据（content 为拼接后的完整内容；
+            被中止时 success=False、aborted=True）
+        """
+        start_time = time.time()
+
+        headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json',
+            'Accept': 'text/event-stream'
+        }
+
+        payload: dict[str, Any] = {
+            'model': model,
+            'messages': messages,
+            'temperature': 0.1
+        }
+
+        if response_format:
+            payload['response_format'] = response_format
+
+        if extra_params:
+            payload.update(extra_params)
+
+        payload['stream'] = True
+
+        url = f'{base_url}/chat/completions'
+        parts: list[str] = []
+        usage: dict[str, Any] = {}
+
+        try:
+            session = self._transport.get_session(base_url)
+            with session.post(
+                url,
+                headers=headers,
+                json=payload,
+                timeout=(self._connect_timeout, self._timeout),
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    error_message = self._extract_error_message(response)
+                    logger.warning(
+                        f'⚠️ API 流式请求失败: {response.status_code}, '
+                        f'{error_message[:100]}'
+                    )
+                    return APIResponse(
+                        success=False,
+                        error_code=response.status_code,
+                        error_message=error_message,
+                        response_time_ms=int((time.time() - start_time) * 1000)
+                    )
+
+                for raw_line in response.iter_lines():
+                    line = raw_line.decode('utf-8').strip() if raw_line else ''
+                    if not line.startswith('data:'):
+                        continue
+                    data = line[5:].strip()
+                    if data == '[DONE]':
+                        break
+
+                    event = json.loads(data)
+                    if 'error' in event:
+                        error = event['error']
+                        error_message = (
+                            error.get('message', str(error))
+                            if isinstance(error, dict) else str(error)
+                        )
+                        logger.warning(f'⚠️ API 流式响应错误: {error_message[:100]}')
+                        return APIResponse(
+                            success=False,
+                            error_message=error_message,
+                            response_time_ms=int((time.time() - start_time) * 1000)
+                        )
+
+                    # 部分 Provider 在最后一个数据块中返回 usage
+                    if event.get('usage'):
+                        usage = event['usage']
+
+                    choices = event.get('choices') or []
+                    delta = (choices[0].get('delta') or {}).get('content') if choices else None
+                    if not delta:
+                        continue
+
+                    parts.append(delta)
+                    if on_delta and on_delta(delta) is False:
+                        response_time_ms = int((time.time() - start_time) * 1000)
+                        logger.warning(
+                            f'⚠️ API 流式请求已中止: 已接收 {len("".join(parts))} 字符'
+                        )
+                        return APIResponse(
+                            success=False,
+                            content=''.join(parts),
+                            error_message='Stream aborted by caller',
+                            response_time_ms=response_time_ms,
+                            aborted=True
+                        )
+
+            response_time_ms = int((time.time() - start_time) * 1000)
+            logger.debug(
+                f'🤖 API 流式请求成功: {model}, '
+                f'响应时间: {response_time_ms}ms'
+            )
+            return APIResponse(
+                success=True,
+                content=''.join(parts).strip(),
+                response_time_ms=response_time_ms,
+                prompt_tokens=usage.get('prompt_tokens'),
+                completion_tokens=usage.get('completion_tokens')
+            )
+
+        except requests.Timeout:
+            response_time_ms = int((time.time() - start_time) * 1000)
+            logger.error(f'❌ API 流式请求超时: {self._timeout}s 内无数据')
+            return APIResponse(
+                success=False,
+                error_message=f'Stream stalled for {self._timeout}s',
+                response_time_ms=response_time_ms
+            )
+
+        except requests.ConnectionError as e:
+            response_time_ms = int((time.time() - start_time) * 1000)
+            logger.error(f'❌ API 连接错误: {e}')
+            return APIResponse(
+                success=False,
+                error_message=f'Connection error: {str(e)}',
+                response_time_ms=response_time_ms
+            )
+
+        except requests.RequestException as e:
+            response_time_ms = int((time.time() - start_time) * 1000)
+            logger.error(f'❌ API 请求异常: {e}')
+            return APIResponse(
+                success=False,
+                error_message=f'Request error: {str(e)}',
+                response_time_ms=response_time_ms
+            )
+
+        except Exception as e:
+            response_time_ms = int((time.time() - start_time) * 1000)
+            logger.exception(f'❌ API 未预期错误: {e}')
+            return APIResponse(
+                success=False,
+                error_message=f'Unexpected error: {str(e)}',
+                response_time_ms=response_time_ms
+            )
+
     def _extract_error_message(self, response: requests.Response) -> str:
         """
         从响应中提取错误消息。
@@ -0,0 +1,163 @@
+"""
+自适应并发限制器模块。
+
+按 AIMD（加性增、乘性减）策略调整对同一 Provider 的并发请求上限：
+- 延迟健康且并发已用满时，每个请求周期上限加 1
+- 遇到 429 / 5xx 等拥塞信号时，上限减半
+- 429 携带 retry_after 时，在等待期内暂停增长
+
+目标是在不触发熔断器的前提下尽量用满 Provider 的吞吐能力。
+"""
+
+import logging
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD 自适应并发限制器。
+
+    由 KeyPool 持有，每个 Pool 一个实例，只负责计算并发上限，
+    排队和放行由 KeyPool 完成。线程安全。
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter('title_parse')
+        >>> if in_flight < limiter.limit:
+        ...     # 发起请求...
+        ...     limiter.on_success(latency_ms=800, in_flight=in_flight)
+        >>> limiter.on_congestion('rate_limited', retry_after=10)
+    """
+
+    # 默认配置
+    DEFAULT_INITIAL_LIMIT = 4    # 初始并发上限
+    DEFAULT_MIN_LIMIT = 1        # 最小并发上限
+    DEFAULT_MAX_LIMIT = 32       # 最大并发上限
+    BACKOFF_FACTOR = 0.5         # 拥塞时的乘性减系数
+    DECREASE_INTERVAL = 5.0      # 两次减小之间的最短间隔（秒），同一波拥塞只减一次
+    LATENCY_TOLERANCE = 2.0      # 响应时间超过基线该倍数视为延迟恶化，不再增长
+    BASELINE_ALPHA = 0.1         # 基线延迟移动平均权重
+
+    def __init__(
+        self,
+        purpose: str,
+        initial_limit: int | None = None,
+        min_limit: int | None = None,
+        max_limit: int | None = None
+    ):
+        """
+        初始化自适应并发限制器。
+
+        Args:
+            purpose: 用途标识（如 'title_parse' 或 Pool 名称）
+            initial_limit: 初始并发上限
+            min_limit: 最小并发上限
+            max_limit: 最大并发上限
+        """
+        self._purpose = purpose
+        self._min_limit = min_limit or self.DEFAULT_MIN_LIMIT
+        self._max_limit = max(self._min_limit, max_limit or self.DEFAULT_MAX_LIMIT)
+        self._limit = float(min(
+            self._max_limit,
+            max(self._min_limit, initial_limit or self.DEFAULT_INITIAL_LIMIT)
+        ))
+
+        self._baseline_latency_ms: float | None = None
+        self._last_decrease_time: float = 0
+        self._last_decrease_reason: str | None = None
+        self._hold_until: float = 0
+        self._decrease_count: int = 0
+
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """获取当前并发上限（整数）。"""
+        with self._lock:
+            return int(self._limit)
+
+    def on_success(self, latency_ms: int | None, in_flight: int) -> None:
+        """
+        报告请求成功。
+
+        只有在并发上限被用满、延迟健康且不在 retry_after 等待期内时才增长，
+        避免空闲时上限无意义地膨胀。
+
+        Args:
+            latency_ms: 响应时间（毫秒）
+            in_flight: 该请求结束前的进行中请求数（含该请求）
+        """
+        with self._lock:
+            healthy = True
+            if latency_ms is not None:
+                if self._baseline_latency_ms is None:
+                    self._baseline_latency_ms = float(latency_ms)
+                else:
+                    healthy = latency_ms <= self._baseline_latency_ms * self.LATENCY_TOLERANCE
+                    self._baseline_latency_ms += self.BASELINE_ALPHA * (
+                        latency_ms - self._baseline_latency_ms
+                    )
+
+            if not healthy or time.time() < self._hold_until:
+                return
+            if in_flight < int(self._limit) or self._limit >= self._max_limit:
+                return
+
+            # 加性增：每个完整的请求周期上限 +1
+            previous = int(self._limit)
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+            if int(self._limit) > previous:
+                logger.debug(
+                    f'📈 [{self._purpose}] 并发上限提升至 {int(self._limit)}'
+                )
+
+    def on_congestion(self, reason: str, retry_after: float | None = None) -> None:
+        """
+        报告拥塞信号（限流或服务端错误）。
+
+        Args:
+            reason: 拥塞原因（如 'rate_limited', 'server_error'）
+            retry_after: Provider 建议的重试等待时间（秒）
+        """
+        with self._lock:
+            now = time.time()
+            if retry_after:
+                self._hold_until = max(self._hold_until, now + retry_after)
+
+            if now - self._last_decrease_time < self.DECREASE_INTERVAL:
+                return
+
+            previous = int(self._limit)
+            self._limit = max(self._min_limit, self._limit * self.BACKOFF_FACTOR)
+            self._last_decrease_time = now
+            self._last_decrease_reason = reason
+            self._decrease_count += 1
+            logger.info(
+                f'📉 [{self._purpose}] 检测到拥塞 ({reason})，'
+                f'并发上限 {previous} → {int(self._limit)}'
+            )
+
+    def get_status(self) -> dict[str, Any]:
+        """
+        获取限制器状态。
+
+        Returns:
+            包含当前上限、上下限、基线延迟等信息的字典
+        """
+        with self._lock:
+            hold_remaining = max(0, self._hold_until - time.time())
+            return {
+                'limit': int(self._limit),
+                'min_limit': self._min_limit,
+                'max_limit': self._max_limit,
+                'baseline_latency_ms': (
+                    round(self._baseline_latency_ms)
+                    if self._baseline_latency_ms is not None else None
+                ),
+                'decrease_count': self._decrease_count,
+                'last_decrease_reason': self._last_decrease_reason,
+                'increase_hold_remaining_seconds': round(hold_remaining, 1),
+            }
@@ -6,26 +6,32 @@ AI 文件重命名器模块。
 
 import json
 import logging
+import time
 from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from src.core.config import config
 from src.core.exceptions import (
     AICircuitBreakerError,
     AIKeyExhaustedError,
+    AIResponseParseError,
 )
 from src.core.interfaces.adapters import IFileRenamer, RenameResult
 from src.infrastructure.repositories.ai_key_repository import ai_key_repository
 from src.services.debug.ai_debug_service import AIDebugService
 
-from .api_client import OpenAIClient
+from .api_client import APIResponse, OpenAIClient
 from .circuit_breaker import CircuitBreaker
-from .key_pool import KeyPool
+from .key_pool import KeyPool, KeyReservation
 from .prompts import (
     MULTI_FILE_RENAME_STANDARD_PROMPT,
     MULTI_FILE_RENAME_WITH_TVDB_PROMPT,
 )
 from .schemas import MULTI_FILE_RENAME_RESPONSE_FORMAT
+from .stream_parser import RenameStreamParser
+from .token_budget import TokenEstimator, trim_folder_structure, trim_tvdb_data
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +39,9 @@ logger = logging.getLogger(__name__)
 # 默认批次大小
 DEFAULT_BATCH_SIZE = 30
 
+# 默认最多同时处理的文件夹数
+DEFAULT_MAX_PARALLEL_BATCHES = 4
+
 
 class AIFileRenamer(IFileRenamer):
     """
@@ -41,6 +50,15 @@ class AIFileRenamer(IFileRenamer):
     实现 IFileRenamer 接口，使用 OpenAI API 生成文件重命名映射。
     支持 TVDB 数据、文件夹结构输入和批量处理。
 
+    分批处理时，不同文件夹的批次并行执行（并发数受可用 Key 数量限制），
+    同一文件夹内的批次按顺序执行并共享 previous_hardlinks 冲突检测。
+
+    启用 streaming 时以 SSE 流式接收响应，边接收边增量解析 main_files，
+    结构不符合 schema 时立即中止请求并重试。
+
+    设置 max_prompt_tokens 时按估算的提示词 Token 数划分批次（仍受 batch_size
+    限制），文件夹结构和 TVDB 数据超出各自预算份额时先行裁剪。
+
     Example:
         >>> renamer = AIFileRenamer(key_pool, circuit_breaker)
         >>> result = renamer.generate_rename_mapping(
@@ -55,6 +73,10 @@ class AIFileRenamer(IFileRenamer):
     # 任务用途标识（用于日志记录，独立于 Pool 名称）
     TASK_PURPOSE = 'multi_file_rename'
 
+    # Token 预算分配（占 max_prompt_tokens 的比例）
+    FOLDER_STRUCTURE_BUDGET_RATIO = 0.2
+    TVDB_BUDGET_RATIO = 0.3
+
     def __init__(
         self,
         key_pool: KeyPool,
@@ -62,7 +84,12 @@ class AIFileRenamer(IFileRenamer):
         api_client: OpenAIClient | None = None,
         max_retries: int = 3,
         batch_size: int = DEFAULT_BATCH_SIZE,
-        ai_debug_service: AIDebugService | None = None
+        ai_debug_service: AIDebugService | None = None,
+        max_parallel_batches: int = DEFAULT_MAX_PARALLEL_BATCHES,
+        streaming: bool = False,
+        max_prompt_tokens: int | None = None,
+        tvdb_simplifier: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+        token_estimator: TokenEstimator | None = None
     ):
         """
         初始化文件重命名器。
@@ -74,6 +101,11 @@ class AIFileRenamer(IFileRenamer):
             max_retries: 最大重试次数
             batch_size: 批量处理文件数
             ai_debug_service: AI 调试服务（可选）
+            max_parallel_batches: 最多同时处理的文件夹数（1 表示顺序处理）
+            streaming: 是否使用流式响应
+            max_prompt_tokens: 单次请求的提示词 Token 预算（None 或 0 表示只按文件数分批）
+            tvdb_simplifier: TVDB 数据简化函数（超出预算时使用）
+            token_estimator: Token 估算器（可选，默认创建新实例）
         """
         self._key_pool = key_pool
         self._circuit_breaker = circuit_breaker
@@ -81,6 +113,11 @@ class AIFileRenamer(IFileRenamer):
         self._max_retries = max_retries
         self._batch_size = batch_size
         self._ai_debug_service = ai_debug_service
+        self._max_parallel_batches = max(1, max_parallel_batches)
+        self._streaming = streaming
+        self._max_prompt_tokens = max_prompt_tokens or None
+        self._tvdb_simplifier = tvdb_simplifier
+        self._token_estimator = token_estimator or TokenEstimator()
 
     def generate_rename_mapping(
         self,
@@ -129,8 +166,16 @@ class AIFileRenamer(IFileRenamer):
 
         logger.info(f'🤖 开始处理 {len(files)} 个文件的重命名')
 
-        # 如果文件数量超过批次大小，分批处理
-        if len(files) > self._batch_size:
+        if self._max_prompt_tokens:
+            folder_structure, tvdb_data = self._fit_context_to_budget(
+                folder_structure, tvdb_data
+            )
+
+        # 如果文件数量超过批次大小或 Token 预算，分批处理
+        batches = self._split_files(
+            files, category, anime_title, folder_structure, tvdb_data
+        )
+        if len(batches) > 1:
             return self._process_batches(
                 files=files,
                 category=category,
@@ -206,6 +251,115 @@ class AIFileRenamer(IFileRenamer):
 
         return result
 
+    def _fit_context_to_budget(
+        self,
+        folder_structure: str | None,
+        tvdb_data: dict[str, Any] | None
+    ) -> tuple[str | None, dict[str, Any] | None]:
+        """
+        将文件夹结构和 TVDB 数据裁剪到各自的 Token 预算份额内。
+
+        Args:
+            folder_structure: 文件夹结构
+            tvdb_data: TVDB 数据
+
+        Returns:
+            (文件夹结构, TVDB 数据)，未超出预算时原样返回
+        """
+        if folder_structure:
+            folder_structure = trim_folder_structure(
+                folder_structure,
+                int(self._max_prompt_tokens * self.FOLDER_STRUCTURE_BUDGET_RATIO),
+                self._token_estimator
+            )
+        if tvdb_data:
+            tvdb_data = trim_tvdb_data(
+                tvdb_data,
+                int(self._max_prompt_tokens * self.TVDB_BUDGET_RATIO),
+                self._token_estimator,
+                simplifier=self._tvdb_simplifier
+            )
+        return folder_structure, tvdb_data
+
+    def _split_files(
+        self,
+        files: list[str],
+        category: str,
+        anime_title: str | None,
+        folder_structure: str | None,
+        tvdb_data: dict[str, Any] | None
+    ) -> list[list[str]]:
+        """
+        将文件列表划分为批次。
+
+        每批最多 batch_size 个文件；设置了 max_prompt_tokens 时，
+        同时保证每批的估算提示词 Token 数不超过预算（每批至少 1 个文件）。
+
+        Args:
+            files: 文件列表
+            category: 内容类型
+            anime_title: 动漫标题
+            folder_structure: 文件夹结构
+            tvdb_data: TVDB 数据
+
+        Returns:
+            批次列表（保持文件原始顺序）
+        """
+        if not self._max_prompt_tokens:
+            return [
+                files[start:start + self._batch_size]
+                for start in range(0, len(files), self._batch_size)
+            ]
+
+        # 不含文件列表的固定开销（系统提示词、标题、文件夹结构、TVDB 数据）
+        base_message, _ = self._build_user_message(
+            files=[],
+            category=category,
+            anime_title=anime_title,
+            folder_structure=folder_structure,
+            tvdb_data=tvdb_data,
+            previous_hardlinks=[]
+        )
+        base_tokens = self._token_estimator.estimate_messages([
+            {'role': 'system', 'content': self._select_system_prompt(tvdb_data)},
+            {'role': 'user', 'content': base_message}
+        ])
+        available = self._max_prompt_tokens - base_tokens
+
+        batches: list[list[str]] = []
+        current: list[str] = []
+        used = 0
+        for file_path in files:
+            key = str(len(current) + 1)
+            cost = self._token_estimator.estimate(
+                f'    {json.dumps(key)}: {json.dumps(file_path, ensure_ascii=False)},\n'
+            )
+            if current and (
+                len(current) >= self._batch_size or used + cost > available
+            ):
+                batches.append(current)
+                current, used = [], 0
+            current.append(file_path)
+            used += cost
+        if current:
+            batches.append(current)
+
+        if len(batches) > (len(files) + self._batch_size - 1) // self._batch_size:
+            logger.debug(
+                f'📏 按 Token 预算分批: {len(files)} 个文件 → {len(batches)} 个批次 '
+                f'(预算 {self._max_prompt_tokens}, 固定开销约 {base_tokens})'
+            )
+        return batches
+
+    @staticmethod
+    def _select_system_prompt(tvdb_data: dict[str, Any] | None) -> str:
+        """根据是否有 TVDB 数据选择系统提示词。"""
+        return (
+            MULTI_FILE_RENAME_WITH_TVDB_PROMPT
+            if tvdb_data
+            else MULTI_FILE_RENAME_STANDARD_PROMPT
+        )
+
     def _process_batches(
         self,
         files: list[str],
@@ -217,9 +371,12 @@ class AIFileRenamer(IFileRenamer):
         """
         分批处理大文件列表。
 
-        先按文件夹分组，再对每个文件夹组内的文件按数量分批。
+        先按文件夹分组，再对每个文件夹组内的文件按数量（和 Token 预算）分批。
         确保不同文件夹（如不同季度）的文件不会混在同一批次中。
 
+        不同文件夹并行处理，同一文件夹内的批次顺序处理。若并行结果中
+        出现跨文件夹的目标路径冲突，则带上前面文件夹的硬链接重新处理。
+
         Args:
             files: 文件名列表
             category: 内容类型
@@ -230,91 +387,207 @@ class AIFileRenamer(IFileRenamer):
         Returns:
             合并后的 RenameResult 或 None
         """
-        merged_result = RenameResult()
-        previous_hardlinks: list[str] = []
-
         # 先按文件夹分组
         folder_groups = self._group_files_by_folder(files)
 
-        # 计算总批次数（用于日志显示）
+        # 划分每个文件夹的批次，计算起始序号（用于日志显示）
+        folder_batches = []
+        batch_offsets = []
         total_batches = 0
         for folder_name, folder_files in folder_groups:
-            folder_batches = (len(folder_files) + self._batch_size - 1) // self._batch_size
-            total_batches += folder_batches
+            batches = self._split_files(
+                folder_files, category, anime_title, folder_structure, tvdb_data
+            )
+            folder_batches.append(batches)
+            batch_offsets.append(total_batches)
+            total_batches += len(batches)
 
+        workers = self._get_parallel_workers(len(folder_groups))
         logger.info(
             f'📊 分批策略: {len(folder_groups)} 个文件夹, '
-            f'共 {total_batches} 个批次'
+            f'共 {total_batches} 个批次, 并发 {workers}'
         )
 
-        batch_idx = 0
-        for folder_name, folder_files in folder_groups:
-            folder_display = folder_name.split('/')[-1] if folder_name else '根目录'
-            folder_batch_count = (
-                len(folder_files) + self._batch_size - 1
-            ) // self._batch_size
+        def process_folder(index: int, previous_hardlinks: list[str]) -> list[RenameResult]:
+            return self._process_folder_batches(
+                folder_name=folder_groups[index][0],
+                batches=folder_batches[index],
+                batch_offset=batch_offsets[index],
+                total_batches=total_batches,
+                category=category,
+                anime_title=anime_title,
+                folder_structure=folder_structure,
+                tvdb_data=tvdb_data,
+                previous_hardlinks=previous_hardlinks
+            )
 
-            logger.info(
-                f'📁 处理文件夹 [{folder_display}]: '
-                f'{len(folder_files)} 个文件, {folder_batch_count} 个批次'
+        merged_result = RenameResult()
+
+        if workers <= 1:
+            # 顺序处理：所有批次共享同一个硬链接列表
+            previous_hardlinks: list[str] = []
+            for index in range(len(folder_groups)):
+                for batch_result in process_folder(index, previous_hardlinks):
+                    self._merge_batch_result(merged_result, batch_result)
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix='rename-batch'
             )
+            try:
+                futures = [
+                    executor.submit(process_folder, index, [])
+                    for index in range(len(folder_groups))
+                ]
+                folder_results = [future.result() for future in futures]
+            except BaseException:
+                # 取消未开始的文件夹，并等待进行中的请求结束后再抛出
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+            executor.shutdown(wait=False)
+
+            for index, batch_results in enumerate(folder_results):
+                produced = [
+                    path for batch_result in batch_results
+                    for path in batch_result.main_files.values()
+                ]
+                existing = set(merged_result.main_files.values())
+                if existing.intersection(produced):
+                    folder_display = folder_groups[index][0].split('/')[-1] or '根目录'
+                    logger.warning(
+                        f'⚠️ 文件夹 [{folder_display}] 与已处理文件夹存在目标路径冲突，'
+                        '重新处理'
+                    )
+                    batch_results = process_folder(
+                        index, list(merged_result.main_files.values())
+                    )
+                for batch_result in batch_results:
+                    self._merge_batch_result(merged_result, batch_result)
 
-            # 对当前文件夹内的文件按数量分批
-            for inner_idx in range(folder_batch_count):
-                batch_idx += 1
-                start = inner_idx * self._batch_size
-                end = min(start + self._batch_size, len(folder_files))
-                batch_files = folder_files[start:end]
+        if not merged_result.has_files:
+            logger.warning('📭 批量处理完成但没有生成任何重命名映射')
+            return None
 
-                logger.info(
-                    f'🔄 处理批次 {batch_idx}/{total_batches}: '
-                    f'{len(batch_files)} 个文件 (来自 {folder_display})'
-                )
+        logger.info(
+            f'✅ 批量处理完成: {merged_result.file_count} 个文件映射, '
+            f'{merged_result.skipped_count} 个跳过'
+        )
+        return merged_result
 
-                batch_result = self._process_single_batch(
-                    files=batch_files,
-                    category=category,
-                    anime_title=anime_title,
-                    folder_structure=folder_structure,
-                    tvdb_data=tvdb_data,
-                    previous_hardlinks=previous_hardlinks
-                )
+    def _get_parallel_workers(self, folder_count: int) -> int:
+        """
+        计算并行处理的文件夹数。
 
-                if batch_result is None:
-                    logger.error(f'❌ 批次 {batch_idx} 处理失败')
-                    continue
+        受文件夹数、max_parallel_batches 和当前可用 Key 数量限制。
 
-                # 合并结果
-                merged_result.main_files.update(batch_result.main_files)
-                merged_result.skipped_files.extend(batch_result.skipped_files)
+        Args:
+            folder_count: 文件夹数量
 
-                # 合并季度信息
-                for season_key, season_info in batch_result.seasons_info.items():
-                    if season_key in merged_result.seasons_info:
-                        # 累加集数
-                        existing = merged_result.seasons_info[season_key]
-                        if isinstance(existing, dict) and isinstance(season_info, dict):
-                            existing['count'] = (
-                                existing.get('count', 0) + season_info.get('count', 0)
-                            )
-                    else:
-                        merged_result.seasons_info[season_key] = season_info
+        Returns:
+            并发数（至少为 1）
+        """
+        if folder_count <= 1 or self._max_parallel_batches <= 1:
+            return 1
+        try:
+            available_keys = self._key_pool.get_status().get('available_count', 1)
+        except Exception as e:
+            logger.warning(f'⚠️ 获取 Key Pool 状态失败，使用顺序处理: {e}')
+            return 1
+        return max(1, min(folder_count, self._max_parallel_batches, available_keys))
 
-                # 更新已处理的硬链接列表，用于后续批次冲突检测
-                previous_hardlinks.extend(batch_result.main_files.values())
+    def _process_folder_batches(
+        self,
+        folder_name: str,
+        batches: list[list[str]],
+        batch_offset: int,
+        total_batches: int,
+        category: str,
+        anime_title: str | None,
+        folder_structure: str | None,
+        tvdb_data: dict[str, Any] | None,
+        previous_hardlinks: list[str]
+    ) -> list[RenameResult]:
+        """
+        顺序处理一个文件夹内的所有批次。
 
-                # 保留最后一批的 patterns
-                merged_result.patterns = batch_result.patterns
+        Args:
+            folder_name: 文件夹路径
+            batches: 文件夹内已划分好的批次
+            batch_offset: 该文件夹第一个批次之前的批次数（用于日志）
+            total_batches: 总批次数（用于日志）
+            category: 内容类型
+            anime_title: 动漫标题
+            folder_structure: 文件夹结构
+            tvdb_data: TVDB 数据
+            previous_hardlinks: 已创建的硬链接列表，处理过程中会追加本文件夹的结果
 
-        if not merged_result.has_files:
-            logger.warning('📭 批量处理完成但没有生成任何重命名映射')
-            return None
+        Returns:
+            成功批次的 RenameResult 列表（按批次顺序）
+        """
+        folder_display = folder_name.split('/')[-1] if folder_name else '根目录'
+        file_count = sum(len(batch) for batch in batches)
 
         logger.info(
-            f'✅ 批量处理完成: {merged_result.file_count} 个文件映射, '
-            f'{merged_result.skipped_count} 个跳过'
+            f'📁 处理文件夹 [{folder_display}]: '
+            f'{file_count} 个文件, {len(batches)} 个批次'
         )
-        return merged_result
+
+        results: list[RenameResult] = []
+
+        for inner_idx, batch_files in enumerate(batches):
+            batch_idx = batch_offset + inner_idx + 1
+
+            logger.info(
+                f'🔄 处理批次 {batch_idx}/{total_batches}: '
+                f'{len(batch_files)} 个文件 (来自 {folder_display})'
+            )
+
+            batch_result = self._process_single_batch(
+                files=batch_files,
+                category=category,
+                anime_title=anime_title,
+                folder_structure=folder_structure,
+                tvdb_data=tvdb_data,
+                previous_hardlinks=list(previous_hardlinks)
+            )
+
+            if batch_result is None:
+                logger.error(f'❌ 批次 {batch_idx} 处理失败')
+                continue
+
+            results.append(batch_result)
+
+            # 更新已处理的硬链接列表，用于后续批次冲突检测
+            previous_hardlinks.extend(batch_result.main_files.values())
+
+        return results
+
+    @staticmethod
+    def _merge_batch_result(merged_result: RenameResult, batch_result: RenameResult) -> None:
+        """
+        将单个批次结果合并到总结果中。
+
+        Args:
+            merged_result: 合并目标
+            batch_result: 批次结果
+        """
+        merged_result.main_files.update(batch_result.main_files)
+        merged_result.skipped_files.extend(batch_result.skipped_files)
+
+        # 合并季度信息
+        for season_key, season_info in batch_result.seasons_info.items():
+            if season_key in merged_result.seasons_info:
+                # 累加集数
+                existing = merged_result.seasons_info[season_key]
+                if isinstance(existing, dict) and isinstance(season_info, dict):
+                    existing['count'] = (
+                        existing.get('count', 0) + season_info.get('count', 0)
+                    )
+            else:
+                merged_result.seasons_info[season_key] = season_info
+
+        # 保留最后一批的 patterns
+        merged_result.patterns = batch_result.patterns
 
     def _process_single_batch(
         self,
@@ -350,11 +623,18 @@ class AIFileRenamer(IFileRenamer):
         )
 
         # 选择提示词
-        system_prompt = (
-            MULTI_FILE_RENAME_WITH_TVDB_PROMPT
-            if tvdb_data
-            else MULTI_FILE_RENAME_STANDARD_PROMPT
-        )
+        system_prompt = self._select_system_prompt(tvdb_data)
+        messages = [
+            {'role': 'system', 'content': system_prompt},
+            {'role': 'user', 'content': user_message}
+        ]
+
+        estimated_tokens = self._token_estimator.estimate_messages(messages)
+        if self._max_prompt_tokens and estimated_tokens > self._max_prompt_tokens:
+            logger.warning(
+                f'⚠️ 提示词估算 {estimated_tokens} tokens，'
+                f'超出预算 {self._max_prompt_tokens}（已创建的硬链接列表较长）'
+            )
 
         for attempt in range(self._max_retries):
             # 预留 Key（启用 RPM/RPD 等待）
@@ -380,19 +660,19 @@ class AIFileRenamer(IFileRenamer):
             model = config.openai.multi_file_rename.model
 
             # 调用 API
-            response = self._api_client.call(
-                base_url=reservation.base_url,
-                api_key=reservation.api_key,
+            response = self._call_api(
+                reservation=reservation,
                 model=model,
-                messages=[
-                    {'role': 'system', 'content': system_prompt},
-                    {'role': 'user', 'content': user_message}
-                ],
-                response_format=MULTI_FILE_RENAME_RESPONSE_FORMAT,
-                extra_params=extra_params
+                messages=messages,
+                extra_params=extra_params,
+                file_count=len(indexed_files)
             )
 
-            if response.success:
+            token_usage = self._record_token_usage(estimated_tokens, response)
+
+            # 流式响应因 schema 违规被中止时，Key 本身是正常的，按解析失败处理
+            aborted = self._streaming and response.aborted
+            if response.success or aborted:
                 # 报告成功给 Key Pool
                 self._key_pool.report_success(
                     reservation.key_id,
@@ -409,8 +689,11 @@ class AIFileRenamer(IFileRenamer):
                     {}
                 )
 
-                # 解析响应
-                result = self._parse_response(response.content, indexed_files)
+                # 解析响应（被中止的流式响应不完整，直接重试）
+                result = (
+                    None if aborted
+                    else self._parse_response(response.content, indexed_files)
+                )
 
                 # 记录到数据库
                 ai_key_repository.log_usage(
@@ -436,7 +719,8 @@ class AIFileRenamer(IFileRenamer):
                             'anime_title': anime_title,
                             'folder_structure': folder_structure,
                             'tvdb_data': tvdb_data,
-                            'previous_hardlinks': previous_hardlinks
+                            'previous_hardlinks': previous_hardlinks,
+                            'token_usage': token_usage
                         },
                         output_data=response.content,
                         model=model,
@@ -525,6 +809,103 @@ class AIFileRenamer(IFileRenamer):
         )
         return None
 
+    def _record_token_usage(
+        self,
+        estimated_tokens: int,
+        response: APIResponse
+    ) -> dict[str, int | None]:
+        """
+        记录估算与实际的 Token 用量，并用实际值校准估算器。
+
+        Args:
+            estimated_tokens: 请求前估算的提示词 Token 数
+            response: API 响应
+
+        Returns:
+            Token 用量字典（写入 AI 调试日志）
+        """
+        actual_tokens = response.prompt_tokens
+        if isinstance(actual_tokens, int):
+            self._token_estimator.record(estimated_tokens, actual_tokens)
+            logger.debug(
+                f'📏 提示词 Token: 估算 {estimated_tokens}, 实际 {actual_tokens}, '
+                f'输出 {response.completion_tokens}'
+            )
+        else:
+            actual_tokens = None
+
+        return {
+            'estimated_prompt_tokens': estimated_tokens,
+            'prompt_tokens': actual_tokens,
+            'completion_tokens': (
+                response.completion_tokens
+                if isinstance(response.completion_tokens, int) else None
+            ),
+        }
+
+    def _call_api(
+        self,
+        reservation: KeyReservation,
+        model: str,
+        messages: list[dict[str, str]],
+        extra_params: dict[str, Any] | None,
+        file_count: int
+    ) -> APIResponse:
+        """
+        调用 API（根据配置选择普通或流式请求）。
+
+        流式模式下每收到一段内容就增量解析 main_files，
+        记录首个结果到达时间，遇到 schema 违规时中止请求。
+
+        Args:
+            reservation: Key 预留信息
+            model: 模型名称
+            messages: 消息列表
+            extra_params: 额外请求参数
+            file_count: 本批次文件数（用于进度日志）
+
+        Returns:
+            APIResponse
+        """
+        if not self._streaming:
+            return self._api_client.call(
+                base_url=reservation.base_url,
+                api_key=reservation.api_key,
+                model=model,
+                messages=messages,
+                response_format=MULTI_FILE_RENAME_RESPONSE_FORMAT,
+                extra_params=extra_params
+            )
+
+        parser = RenameStreamParser()
+        start_time = time.time()
+
+        def on_delta(delta: str) -> bool:
+            try:
+                entries = parser.feed(delta)
+            except AIResponseParseError as e:
+                logger.warning(f'⚠️ 流式响应不符合 schema，提前中止: {e.message}')
+                return False
+
+            if entries and parser.entry_count == len(entries):
+                logger.info(
+                    f'⚡ 首个重命名结果已到达 '
+                    f'({int((time.time() - start_time) * 1000)}ms)'
+                )
+            for key, new_name in entries:
+                logger.debug(f'📄 [{parser.entry_count}/{file_count}] {key} → {new_name}')
+            return True
+
+        return self._api_client.call_stream(
+            base_url=reservation.base_url,
+            api_key=reservation.api_key,
+            model=model,
+            messages=messages,
+            on_delta=on_delta,
+            response_format=MULTI_FILE_RENAME_RESPONSE_FORMAT,
+            extra_params=extra_params
+        )
+
     def _build_user_message(
         self,
         files: list[str],
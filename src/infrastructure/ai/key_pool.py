@@ -2,7 +2,10 @@
 API Key 池管理器模块。
 
 提供 API Key 的管理和轮询功能，包括：
-- Round-robin 轮询策略
+- 按余量、延迟和错误历史加权的最小负载选择策略
+- 就绪时间堆跟踪不可用 Key，避免每次预留都扫描全部 Key
+- 基于 Future 的非阻塞预留
+- AIMD 自适应并发上限（根据延迟和 429/5xx 调整）
 - RPM/RPD 限制检查
 - 三级冷却机制（30s → 60s → 180s）
 - 错误类型区分（限流、禁用、临时错误）
@@ -10,16 +13,20 @@ API Key 池管理器模块。
 - 线程安全操作
 """
 
+import heapq
 import logging
 import threading
 import time
 from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -119,6 +126,9 @@ class KeyUsage:
         last_error_type: 最近错误类型
         last_success_time: 最近成功时间戳
         last_response_time_ms: 最近响应时间（毫秒）
+        latency_ewma_ms: 响应时间指数移动平均（毫秒）
+        in_flight_since: 已预留但尚未报告结果的请求的预留时间戳（按预留顺序）
+        last_reserved_at: 最近预留时间戳
         cooldown_until: 冷却结束时间戳
         disabled: 是否被禁用
         disabled_reason: 禁用原因
@@ -134,12 +144,20 @@ class KeyUsage:
     last_error_type: ErrorType | None = None
     last_success_time: float | None = None
     last_response_time_ms: int | None = None
+    latency_ewma_ms: float | None = None
+    in_flight_since: deque = field(default_factory=deque)
+    last_reserved_at: float = 0
     cooldown_until: float = 0
     disabled: bool = False
     disabled_reason: str | None = None
     disabled_at: float | None = None
     error_history: deque = field(default_factory=lambda: deque(maxlen=20))
 
+    @property
+    def in_flight(self) -> int:
+        """已预留但尚未报告结果的请求数"""
+        return len(self.in_flight_since)
+
 
 @dataclass
 class KeySpec:
@@ -185,13 +203,30 @@ class KeyReservation:
     extra_body: str = ''
 
 
+@dataclass
+class _ReservationWaiter:
+    """等待可用 Key 的预留请求。"""
+    future: Future
+    deadline: float
+
+
 class KeyPool:
     """
     API Key 池管理器。
 
-    管理多个 API Key，提供 Round-robin 轮询、限流检查、冷却机制等功能。
+    管理多个 API Key，提供加权选择、限流检查、冷却机制等功能。
     线程安全。
 
+    Key 选择：
+    - 可用 Key 按得分选择：RPM/RPD 余量 × 延迟因子 × 错误因子 ÷ (1 + 进行中请求数)
+    - 得分相同时选择最久未使用的 Key
+    - 冷却中或达到 RPM/RPD 限制的 Key 按就绪时间放入最小堆，到期后才重新参与选择
+
+    并发控制：
+    - 整个 Pool 的进行中请求数受 AdaptiveConcurrencyLimiter 的上限约束
+    - 达到上限的预留请求排队等待已有请求结束，最多等待 CONCURRENCY_MAX_WAIT_SECONDS
+    - 429 / 5xx 使上限减半，延迟健康且上限用满时逐步提升
+
     冷却机制：
     - 限流冷却 (RATE_LIMIT_COOLDOWN): 10 秒，429 错误触发
     - 短冷却 (SHORT_COOLDOWN): 30 秒，单次一般错误触发
@@ -205,7 +240,9 @@ class KeyPool:
     RPM/RPD 智能等待：
     - 当所有 Key 都达到 RPM 限制时，自动等待最短时间后重试
     - 可配置最大等待时间
-    - 支持可中断等待：当通过 API 重置 RPM/RPD 时，等待会被立即中断并重试
+    - 等待的请求按 FIFO 排队，由后台分发线程在 Key 就绪时依次分配，
+      reserve_async 返回 Future，调用方无需占用线程等待
+    - 通过 API 重置冷却/RPM/RPD 或启用 Key 时，排队的请求会立即得到分配
 
     Example:
         >>> pool = KeyPool('title_parse')
@@ -243,6 +280,14 @@ class KeyPool:
     RPD_MAX_WAIT_SECONDS = 86400  # RPD 最大等待时间（24小时）
     RPD_WAIT_ENABLED = True       # 是否启用 RPD 等待（默认启用）
 
+    # 加权选择配置
+    LATENCY_EWMA_ALPHA = 0.3         # 响应时间移动平均权重
+    LATENCY_REFERENCE_MS = 2000      # 延迟因子基准：该延迟下得分减半
+    IN_FLIGHT_TIMEOUT_SECONDS = 300  # 超过此时间未报告结果的预留不再计入负载
+
+    # 并发上限等待配置
+    CONCURRENCY_MAX_WAIT_SECONDS = 60  # 超过此时间仍无空闲并发槽位时直接放行
+
     def __init__(self, purpose: str):
         """
         初始化 Key Pool。
@@ -254,10 +299,19 @@ class KeyPool:
         self._keys: dict[str, KeySpec] = {}
         self._usage: dict[str, KeyUsage] = {}
         self._lock = threading.Lock()
-        self._rr_index = 0
         self._on_key_disabled: Callable[[str, str, str], None] | None = None
-        # 用于中断等待的事件
-        self._wait_interrupt_event = threading.Event()
+        # 可立即预留的 Key
+        self._ready: set[str] = set()
+        # 不可用 Key 的就绪时间堆: (ready_at, version, key_id)
+        self._blocked: list[tuple[float, int, str]] = []
+        # 每个 Key 的调度版本号，用于使堆中的旧条目失效
+        self._versions: dict[str, int] = {}
+        # 等待可用 Key 的预留请求（FIFO）
+        self._waiters: deque[_ReservationWaiter] = deque()
+        self._waiters_changed = threading.Condition(self._lock)
+        self._dispatcher: threading.Thread | None = None
+        # 自适应并发上限
+        self._limiter = AdaptiveConcurrencyLimiter(purpose)
 
     @property
     def purpose(self) -> str:
@@ -292,6 +346,7 @@ class KeyPool:
             for key_id in self._keys:
                 if key_id not in self._usage:
                     self._usage[key_id] = KeyUsage()
+            self._rebuild_schedule()
             logger.info(
                 f'🔑 [{self._purpose}] 配置了 {len(self._keys)} 个 API Key'
             )
@@ -304,7 +359,7 @@ class KeyPool:
         """
         预留一个可用的 Key。
 
-        使用 Round-robin 策略从可用 Key 中选择一个。
+        从可用 Key 中选择得分最高的一个。
         当所有 Key 都达到 RPM/RPD 限制时，可自动等待后重试。
 
         Args:
@@ -315,55 +370,164 @@ class KeyPool:
             KeyReservation: 成功时返回预留信息
             None: 没有可用 Key 时返回 None
         """
+        return self.reserve_async(wait_for_rpm, wait_for_rpd).result()
+
+    def reserve_async(
+        self,
+        wait_for_rpm: bool = True,
+        wait_for_rpd: bool = False
+    ) -> Future:
+        """
+        非阻塞地预留一个 Key。
+
+        有可用 Key 时返回已完成的 Future；需要等待 RPM/RPD 窗口时，
+        请求进入 FIFO 队列，由后台分发线程在 Key 就绪时完成 Future。
+        取消 Future 即放弃排队。
+
+        Args:
+            wait_for_rpm: 当所有 Key 达到 RPM 限制时是否等待（默认 True）
+            wait_for_rpd: 当所有 Key 达到 RPD 限制时是否等待（默认 False，因为可能很长）
+
+        Returns:
+            Future，结果为 KeyReservation 或 None（没有可用 Key）
+        """
+        future: Future = Future()
+
         result = self._try_reserve()
         if result is not None:
-            return result
+            future.set_result(result)
+            return future
+
+        with self._lock:
+            throttled = self._is_throttled(time.time())
+        if throttled:
+            # 有可用 Key 但已达到并发上限，等待进行中的请求结束
+            logger.debug(
+                f'⏳ [{self._purpose}] 已达到并发上限 {self._limiter.limit}，排队等待'
+            )
+            wait_seconds = self.CONCURRENCY_MAX_WAIT_SECONDS
+        else:
+            wait_seconds = self._get_allowed_wait(wait_for_rpm, wait_for_rpd)
+        if wait_seconds is None:
+            future.set_result(None)
+            return future
+
+        with self._lock:
+            self._waiters.append(
+                _ReservationWaiter(future=future, deadline=time.time() + wait_seconds)
+            )
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch_waiters,
+                    name=f'KeyPool-{self._purpose}',
+                    daemon=True
+                )
+                self._dispatcher.start()
+            else:
+                self._waiters_changed.notify()
+
+        return future
+
+    def _get_allowed_wait(
+        self,
+        wait_for_rpm: bool,
+        wait_for_rpd: bool
+    ) -> float | None:
+        """
+        计算允许等待的时间（内部方法）。
 
-        # 如果没有可用 Key，检查是否可以等待
+        Returns:
+            等待秒数；不允许等待或等待时间超限时返回 None
+        """
         wait_info = self._calculate_wait_time()
+        if not wait_info:
+            return None
 
-        if wait_info:
-            reason = wait_info.get('reason')
-            wait_seconds = wait_info.get('wait_seconds', 0)
+        reason = wait_info.get('reason')
+        wait_seconds = wait_info.get('wait_seconds', 0)
 
-            if reason == 'rpm_limit' and wait_for_rpm:
-                if wait_seconds <= self.RPM_MAX_WAIT_SECONDS:
-                    logger.info(
-                        f'⏳ [{self._purpose}] 所有 Key 达到 RPM 限制，'
-                        f'等待 {wait_seconds:.1f}s 后重试...'
-                    )
-                    # 使用可中断的等待，reset_rpm/reset_rpd 可以提前唤醒
-                    self._wait_interrupt_event.clear()
-                    interrupted = self._wait_interrupt_event.wait(wait_seconds)
-                    if interrupted:
-                        logger.info(f'🔔 [{self._purpose}] 等待被中断，立即重试')
-                    return self._try_reserve()
-                else:
-                    logger.warning(
-                        f'⚠️ [{self._purpose}] RPM 等待时间 {wait_seconds:.1f}s '
-                        f'超过最大限制 {self.RPM_MAX_WAIT_SECONDS}s'
-                    )
+        if reason == 'rpm_limit' and wait_for_rpm:
+            if wait_seconds <= self.RPM_MAX_WAIT_SECONDS:
+                logger.info(
+                    f'⏳ [{self._purpose}] 所有 Key 达到 RPM 限制，'
+                    f'等待 {wait_seconds:.1f}s 后重试...'
+                )
+                return wait_seconds
+            logger.warning(
+                f'⚠️ [{self._purpose}] RPM 等待时间 {wait_seconds:.1f}s '
+                f'超过最大限制 {self.RPM_MAX_WAIT_SECONDS}s'
+            )
 
-            elif reason == 'rpd_limit' and wait_for_rpd and self.RPD_WAIT_ENABLED:
-                if wait_seconds <= self.RPD_MAX_WAIT_SECONDS:
-                    hours = wait_seconds / 3600
-                    logger.info(
-                        f'⏳ [{self._purpose}] 所有 Key 达到 RPD 限制，'
-                        f'等待 {hours:.1f}h 后重试（UTC 0点重置）...'
-                    )
-                    # 使用可中断的等待，reset_rpm/reset_rpd 可以提前唤醒
-                    self._wait_interrupt_event.clear()
-                    interrupted = self._wait_interrupt_event.wait(wait_seconds)
-                    if interrupted:
-                        logger.info(f'🔔 [{self._purpose}] 等待被中断，立即重试')
-                    return self._try_reserve()
-                else:
-                    logger.warning(
-                        f'⚠️ [{self._purpose}] RPD 等待时间超过最大限制'
-                    )
+        elif reason == 'rpd_limit' and wait_for_rpd and self.RPD_WAIT_ENABLED:
+            if wait_seconds <= self.RPD_MAX_WAIT_SECONDS:
+                hours = wait_seconds / 3600
+                logger.info(
+                    f'⏳ [{self._purpose}] 所有 Key 达到 RPD 限制，'
+                    f'等待 {hours:.1f}h 后重试（UTC 0点重置）...'
+                )
+                return wait_seconds
+            logger.warning(
+                f'⚠️ [{self._purpose}] RPD 等待时间超过最大限制'
+            )
 
         return None
 
+    def _dispatch_waiters(self) -> None:
+        """
+        分发线程主循环（内部方法）。
+
+        按 FIFO 顺序为排队的请求分配就绪的 Key，到达截止时间仍无可用 Key
+        的请求返回 None。队列清空后线程退出。
+        """
+        while True:
+            resolved: list[tuple[Future, KeyReservation | None]] = []
+            try:
+                with self._lock:
+                    now = time.time()
+                    while self._waiters:
+                        waiter = self._waiters[0]
+                        if waiter.future.cancelled():
+                            self._waiters.popleft()
+                            continue
+                        reservation = self._reserve_locked(now)
+                        if reservation is None:
+                            if waiter.deadline > now:
+                                break
+                            # 等待超时：不再受并发上限约束
+                            reservation = self._reserve_locked(now, enforce_limit=False)
+                        self._waiters.popleft()
+                        resolved.append((waiter.future, reservation))
+
+                    if not self._waiters:
+                        self._dispatcher = None
+                    elif not resolved:
+                        self._waiters_changed.wait(self._next_wakeup(now))
+                    running = self._dispatcher is not None
+            except Exception as e:
+                logger.error(f'❌ [{self._purpose}] Key 分发线程异常: {e}', exc_info=True)
+                with self._lock:
+                    resolved.extend((w.future, None) for w in self._waiters)
+                    self._waiters.clear()
+                    self._dispatcher = None
+                running = False
+
+            for future, reservation in resolved:
+                if future.set_running_or_notify_cancel():
+                    future.set_result(reservation)
+                elif reservation is not None:
+                    # 请求已取消，归还预留
+                    self._release(reservation.key_id)
+
+            if not running:
+                return
+
+    def _next_wakeup(self, now: float) -> float:
+        """计算分发线程下次唤醒前的等待秒数（需持有锁）。"""
+        wakeup = min(waiter.deadline for waiter in self._waiters)
+        if self._blocked:
+            wakeup = min(wakeup, self._blocked[0][0])
+        return max(0.0, wakeup - now)
+
     def _try_reserve(self) -> KeyReservation | None:
         """
         尝试预留一个可用的 Key（内部方法）。
@@ -373,71 +537,203 @@ class KeyPool:
             None: 没有可用 Key 时返回 None
         """
         with self._lock:
-            now = time.time()
-            available_keys = []
+            return self._reserve_locked(time.time())
 
-            for key_id, spec in self._keys.items():
-                if not spec.enabled:
-                    continue
+    def _reserve_locked(
+        self,
+        now: float,
+        enforce_limit: bool = True
+    ) -> KeyReservation | None:
+        """
+        选择并预留得分最高的就绪 Key（需持有锁）。
 
-                usage = self._usage.get(key_id, KeyUsage())
+        Args:
+            now: 当前时间戳
+            enforce_limit: 是否受自适应并发上限约束
 
-                # 检查是否被禁用
-                if usage.disabled:
-                    continue
+        Returns:
+            KeyReservation 或 None
+        """
+        self._promote_ready(now)
+        if enforce_limit and self._is_throttled(now):
+            return None
 
-                # 检查冷却
-                if usage.cooldown_until > now:
-                    continue
+        selected_key_id = None
+        best = None
+        for key_id in self._ready:
+            usage = self._usage[key_id]
+            self._roll_windows(self._keys[key_id], usage, now)
+            # 得分高者优先，同分时最久未使用者优先
+            rank = (self._score(key_id, now), -usage.last_reserved_at)
+            if best is None or rank > best:
+                best = rank
+                selected_key_id = key_id
+
+        if selected_key_id is None:
+            logger.debug(f'⚠️ [{self._purpose}] 当前没有可用的 API Key')
+            return None
 
-                # 检查 RPM
-                if spec.rpm_limit > 0:
-                    if usage.rpm_window_start + 60 < now:
-                        # 重置窗口
-                        usage.rpm_count = 0
-                        usage.rpm_window_start = now
-                    if usage.rpm_count >= spec.rpm_limit:
-                        continue
+        spec = self._keys[selected_key_id]
+        usage = self._usage[selected_key_id]
+
+        # 更新使用计数
+        usage.rpm_count += 1
+        usage.rpd_count += 1
+        # 丢弃超时的预留，避免泄漏的预留无限堆积
+        while usage.in_flight_since and (
+            now - usage.in_flight_since[0] > self.IN_FLIGHT_TIMEOUT_SECONDS
+        ):
+            usage.in_flight_since.popleft()
+        usage.in_flight_since.append(now)
+        usage.last_reserved_at = now
+        if (spec.rpm_limit > 0 and usage.rpm_count >= spec.rpm_limit) or (
+            spec.rpd_limit > 0 and usage.rpd_count >= spec.rpd_limit
+        ):
+            self._schedule(selected_key_id, now)
+
+        logger.debug(
+            f'🔑 [{self._purpose}] 预留 Key: {spec.name} '
+            f'(RPM: {usage.rpm_count}/{spec.rpm_limit or "∞"}, '
+            f'RPD: {usage.rpd_count}/{spec.rpd_limit or "∞"})'
+        )
 
-                # 检查 RPD
-                if spec.rpd_limit > 0:
-                    today = datetime.now(UTC).strftime('%Y-%m-%d')
-                    if usage.rpd_date != today:
-                        usage.rpd_count = 0
-                        usage.rpd_date = today
-                    if usage.rpd_count >= spec.rpd_limit:
-                        continue
+        return KeyReservation(
+            key_id=selected_key_id,
+            api_key=spec.api_key,
+            base_url=spec.base_url,
+            extra_body=spec.extra_body
+        )
 
-                available_keys.append(key_id)
+    def _effective_in_flight(self, usage: KeyUsage, now: float) -> int:
+        """获取计入负载的进行中请求数，忽略长时间未报告结果的预留。"""
+        return sum(
+            1 for reserved_at in usage.in_flight_since
+            if now - reserved_at <= self.IN_FLIGHT_TIMEOUT_SECONDS
+        )
 
-            if not available_keys:
-                logger.debug(f'⚠️ [{self._purpose}] 当前没有可用的 API Key')
-                return None
+    def _total_in_flight(self, now: float) -> int:
+        """获取整个 Pool 的进行中请求数（需持有锁）。"""
+        return sum(
+            self._effective_in_flight(self._usage[key_id], now)
+            for key_id in self._keys if key_id in self._usage
+        )
 
-            # Round-robin 选择
-            self._rr_index = self._rr_index % len(available_keys)
-            selected_key_id = available_keys[self._rr_index]
-            self._rr_index += 1
+    def _is_throttled(self, now: float) -> bool:
+        """
+        判断是否因并发上限而无法预留（需持有锁）。
 
-            spec = self._keys[selected_key_id]
-            usage = self._usage[selected_key_id]
+        只有存在就绪 Key 时才视为并发受限，否则应按 RPM/RPD 等待处理。
+        """
+        self._promote_ready(now)
+        return bool(self._ready) and self._total_in_flight(now) >= self._limiter.limit
 
-            # 更新使用计数
-            usage.rpm_count += 1
-            usage.rpd_count += 1
+    def _score(self, key_id: str, now: float) -> float:
+        """
+        计算 Key 的选择得分（需持有锁）。
 
-            logger.debug(
-                f'🔑 [{self._purpose}] 预留 Key: {spec.name} '
-                f'(RPM: {usage.rpm_count}/{spec.rpm_limit or "∞"}, '
-                f'RPD: {usage.rpd_count}/{spec.rpd_limit or "∞"})'
-            )
+        得分 = 余量 × 延迟因子 × 错误因子 ÷ (1 + 进行中请求数)
 
-            return KeyReservation(
-                key_id=selected_key_id,
-                api_key=spec.api_key,
-                base_url=spec.base_url,
-                extra_body=spec.extra_body
-            )
+        Args:
+            key_id: Key 唯一标识
+            now: 当前时间戳
+
+        Returns:
+            得分（越高越优先）
+        """
+        spec = self._keys[key_id]
+        usage = self._usage[key_id]
+
+        headroom = 1.0
+        if spec.rpm_limit > 0:
+            headroom = min(headroom, 1 - usage.rpm_count / spec.rpm_limit)
+        if spec.rpd_limit > 0:
+            headroom = min(headroom, 1 - usage.rpd_count / spec.rpd_limit)
+
+        latency_factor = 1.0
+        if usage.latency_ewma_ms is not None:
+            latency_factor = 1 / (1 + usage.latency_ewma_ms / self.LATENCY_REFERENCE_MS)
+
+        window_start = now - self.ERROR_WINDOW_SECONDS
+        recent_errors = sum(1 for t in usage.error_history if t >= window_start)
+        error_factor = 1 / (1 + recent_errors)
+
+        in_flight = self._effective_in_flight(usage, now)
+
+        return headroom * latency_factor * error_factor / (1 + in_flight)
+
+    def _roll_windows(self, spec: KeySpec, usage: KeyUsage, now: float) -> None:
+        """重置已过期的 RPM 窗口和跨日的 RPD 计数（需持有锁）。"""
+        if spec.rpm_limit > 0 and usage.rpm_window_start + 60 < now:
+            usage.rpm_count = 0
+            usage.rpm_window_start = now
+        if spec.rpd_limit > 0:
+            today = datetime.now(UTC).strftime('%Y-%m-%d')
+            if usage.rpd_date != today:
+                usage.rpd_count = 0
+                usage.rpd_date = today
+
+    def _schedule(self, key_id: str, now: float) -> None:
+        """
+        根据 Key 当前状态将其放入就绪集合或就绪时间堆（需持有锁）。
+
+        每次调度都会递增版本号，堆中旧条目在弹出时被忽略。
+
+        Args:
+            key_id: Key 唯一标识
+            now: 当前时间戳
+        """
+        version = self._versions.get(key_id, 0) + 1
+        self._versions[key_id] = version
+        self._ready.discard(key_id)
+
+        spec = self._keys.get(key_id)
+        usage = self._usage.get(key_id)
+        if spec is None or usage is None or usage.disabled:
+            return
+
+        self._roll_windows(spec, usage, now)
+        ready_at = usage.cooldown_until
+        if spec.rpm_limit > 0 and usage.rpm_count >= spec.rpm_limit:
+            ready_at = max(ready_at, usage.rpm_window_start + 60 + self.RPM_WAIT_BUFFER)
+        if spec.rpd_limit > 0 and usage.rpd_count >= spec.rpd_limit:
+            ready_at = max(ready_at, now + self._calculate_seconds_until_utc_midnight())
+
+        if ready_at <= now:
+            self._ready.add(key_id)
+            if self._waiters:
+                self._waiters_changed.notify()
+        else:
+            heapq.heappush(self._blocked, (ready_at, version, key_id))
+
+    def _promote_ready(self, now: float) -> None:
+        """将就绪时间已到的 Key 从堆中移回就绪集合（需持有锁）。"""
+        while self._blocked and self._blocked[0][0] <= now:
+            _, version, key_id = heapq.heappop(self._blocked)
+            if self._versions.get(key_id) == version:
+                self._schedule(key_id, now)
+
+    def _rebuild_schedule(self) -> None:
+        """重新调度所有 Key（需持有锁）。"""
+        now = time.time()
+        self._ready.clear()
+        self._blocked.clear()
+        for key_id in self._keys:
+            self._schedule(key_id, now)
+
+    def _release(self, key_id: str) -> None:
+        """减少 Key 的进行中请求数。"""
+        with self._lock:
+            self._finish_request(key_id)
+
+    def _finish_request(self, key_id: str) -> None:
+        """请求结束时减少进行中计数（需持有锁）。"""
+        usage = self._usage.get(key_id)
+        if usage and usage.in_flight_since:
+            # 结果无法对应到具体预留，移除最新的一条，让泄漏的旧预留按各自时间超时
+            usage.in_flight_since.pop()
+            # 释放了并发槽位，唤醒排队的请求
+            if self._waiters:
+                self._waiters_changed.notify()
 
     def _calculate_wait_time(self) -> dict[str, Any] | None:
         """
@@ -564,12 +860,22 @@ class KeyPool:
         with self._lock:
             if key_id in self._usage:
                 usage = self._usage[key_id]
+                self._limiter.on_success(
+                    response_time_ms, self._total_in_flight(time.time())
+                )
+                self._finish_request(key_id)
                 usage.error_count = 0
                 usage.last_success_time = time.time()
                 usage.last_error = None
                 usage.last_error_type = None
                 if response_time_ms is not None:
                     usage.last_response_time_ms = response_time_ms
+                    if usage.latency_ewma_ms is None:
+                        usage.latency_ewma_ms = float(response_time_ms)
+                    else:
+                        usage.latency_ewma_ms += self.LATENCY_EWMA_ALPHA * (
+                            response_time_ms - usage.latency_ewma_ms
+                        )
                 logger.debug(
                     f'✅ [{self._purpose}] Key {key_id} 请求成功'
                 )
@@ -604,6 +910,7 @@ class KeyPool:
 
             usage = self._usage[key_id]
             now = time.time()
+            self._finish_request(key_id)
 
             # 确定错误类型
             if error_type is None and status_code is not None:
@@ -627,10 +934,15 @@ class KeyPool:
                 key_id=key_id, name=key_id, api_key='', base_url=''
             )).name
 
+            # 限流和服务端错误是拥塞信号，降低并发上限
+            if error_type.is_rate_limit() or error_type.is_server_error():
+                self._limiter.on_congestion(error_type.value, retry_after)
+
             # 根据错误类型处理
             if error_type.should_disable_key():
                 # 禁用 Key
                 self._disable_key(key_id, f'{error_type.value}: {error_message}')
+                self._schedule(key_id, now)
                 return
 
             # 计算冷却时间
@@ -662,6 +974,7 @@ class KeyPool:
                 )
 
             usage.cooldown_until = now + cooldown
+            self._schedule(key_id, now)
 
     def _should_long_cooldown(self, usage: KeyUsage) -> bool:
         """
@@ -744,8 +1057,8 @@ class KeyPool:
             )).name
 
             logger.info(f'✅ [{self._purpose}] Key {key_name} 已重新启用')
-            # 唤醒等待中的线程
-            self._wait_interrupt_event.set()
+            # 重新调度，排队的请求会被立即分配
+            self._schedule(key_id, time.time())
             return True
 
     def reset_cooldown(self, key_id: str) -> bool:
@@ -767,8 +1080,8 @@ class KeyPool:
                     key_id=key_id, name=key_id, api_key='', base_url=''
                 )).name
                 logger.info(f'🔄 [{self._purpose}] Key {key_name} 冷却已重置')
-                # 唤醒等待中的线程
-                self._wait_interrupt_event.set()
+                # 重新调度，排队的请求会被立即分配
+                self._schedule(key_id, time.time())
                 return True
             return False
 
@@ -790,8 +1103,8 @@ class KeyPool:
                     key_id=key_id, name=key_id, api_key='', base_url=''
                 )).name
                 logger.info(f'🔄 [{self._purpose}] Key {key_name} RPM 计数已重置')
-                # 唤醒等待中的线程
-                self._wait_interrupt_event.set()
+                # 重新调度，排队的请求会被立即分配
+                self._schedule(key_id, time.time())
                 return True
             return False
 
@@ -813,8 +1126,8 @@ class KeyPool:
                     key_id=key_id, name=key_id, api_key='', base_url=''
                 )).name
                 logger.info(f'🔄 [{self._purpose}] Key {key_name} RPD 计数已重置')
-                # 唤醒等待中的线程
-                self._wait_interrupt_event.set()
+                # 重新调度，排队的请求会被立即分配
+                self._schedule(key_id, time.time())
                 return True
             return False
 
@@ -842,11 +1155,21 @@ class KeyPool:
                     key_id=key_id, name=key_id, api_key='', base_url=''
                 )).name
                 logger.info(f'🔄 [{self._purpose}] Key {key_name} 所有限制已重置')
-                # 唤醒等待中的线程
-                self._wait_interrupt_event.set()
+                # 重新调度，排队的请求会被立即分配
+                self._schedule(key_id, time.time())
                 return True
             return False
 
+    def get_base_urls(self) -> list[str]:
+        """
+        获取池中每个 Key 的 API 基础 URL（每个 Key 一项，可重复）。
+
+        Returns:
+            base_url 列表
+        """
+        with self._lock:
+            return [spec.base_url for spec in self._keys.values()]
+
     def get_status(self) -> dict[str, Any]:
         """
         获取 Key Pool 完整状态。
@@ -921,6 +1244,11 @@ class KeyPool:
                         if usage.last_error_type else None
                     ),
                     'last_response_time_ms': usage.last_response_time_ms,
+                    'latency_ewma_ms': (
+                        round(usage.latency_ewma_ms)
+                        if usage.latency_ewma_ms is not None else None
+                    ),
+                    'in_flight': usage.in_flight,
                     'cooldown_remaining_seconds': round(cooldown_remaining, 1),
                     'cooldown_until_utc': (
                         datetime.fromtimestamp(
@@ -974,6 +1302,9 @@ class KeyPool:
                 'disabled_count': disabled_count,
                 'rpm_blocked_count': rpm_blocked_count,
                 'rpd_blocked_count': rpd_blocked_count,
+                'waiting_count': len(self._waiters),
+                'in_flight': self._total_in_flight(now),
+                'concurrency': self._limiter.get_status(),
                 'all_in_long_cooling': all_unavailable,
             }
 
@@ -1011,6 +1342,8 @@ class KeyPool:
                         f'🔄 [{self._purpose}] 恢复 Key {key_id} RPD 计数: {db_count}'
                     )
 
+            self._rebuild_schedule()
+
             if restored_count > 0:
                 logger.info(
                     f'✅ [{self._purpose}] 已从数据库恢复 {restored_count} 个 Key 的 RPD 计数'
@@ -1207,6 +1540,25 @@ def get_pools_grouped_by_name() -> dict[str, dict[str, Any]]:
         return result
 
 
+def count_keys_by_base_url() -> dict[str, int]:
+    """
+    统计所有已注册 Key Pool 中各 API 基础 URL 的 Key 数量。
+
+    共享的命名 Pool 只统计一次，用于确定 HTTP 连接池大小。
+
+    Returns:
+        {base_url: key_count} 字典
+    """
+    with _pools_lock:
+        pools = {id(pool): pool for pool in [*_pools.values(), *_named_pools.values()]}
+    counts: dict[str, int] = {}
+    for pool in pools.values():
+        for base_url in pool.get_base_urls():
+            key = base_url.rstrip('/')
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
 def get_purpose_to_pool_mapping() -> dict[str, str]:
     """
     获取任务用途到 Pool 名称的映射。
@@ -172,6 +172,30 @@ def get_title_parse_system_prompt(language_priorities: list[str] | None = None)
 """
 
 
+def get_title_parse_batch_system_prompt(language_priorities: list[str] | None = None) -> str:
+    """
+    获取批量标题解析的系统提示词。
+
+    在单标题提示词的基础上说明批量输入输出格式，分析规则完全相同。
+
+    Args:
+        language_priorities: 语言优先级列表（语言名称字符串）
+
+    Returns:
+        动态生成的系统提示词
+    """
+    return get_title_parse_system_prompt(language_priorities) + """
+
+## 批量模式（优先于上文的单标题输出格式）
+
+本次输入是一个 JSON 数组，每个元素为 `{"index": 序号, "title": "标题"}`，请逐个独立分析：
+- 输出 Schema 为 `anime_title_parse_batch_result`，即 `{"results": [...]}`。
+- `results` 中每个元素包含对应输入的 `index`，以及与单标题模式完全相同的全部字段。
+- 每个输入标题必须恰好对应一个结果，`original_title` 原样填写输入的标题。
+- 不同标题之间互不影响，不要因为相邻标题而改变某个标题的解析结果。
+"""
+
+
 # 保持向后兼容的静态提示词（默认中文优先）
 TITLE_PARSE_SYSTEM_PROMPT = get_title_parse_system_prompt(['中文', 'English', '日本語'])
 
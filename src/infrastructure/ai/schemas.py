@@ -73,6 +73,46 @@ TITLE_PARSE_RESPONSE_FORMAT: ResponseFormat = {
 }
 
 
+def _build_title_parse_batch_format() -> ResponseFormat:
+    """Wrap the single-title schema into an indexed results array."""
+    item_schema = TITLE_PARSE_RESPONSE_FORMAT['json_schema']['schema']
+    return {
+        'type': 'json_schema',
+        'json_schema': {
+            'name': 'anime_title_parse_batch_result',
+            'strict': True,
+            'schema': {
+                'type': 'object',
+                'additionalProperties': False,
+                'required': ['results'],
+                'properties': {
+                    'results': {
+                        'type': 'array',
+                        'description': 'One result per input title',
+                        'items': {
+                            'type': 'object',
+                            'additionalProperties': False,
+                            'required': ['index', *item_schema['required']],
+                            'properties': {
+                                'index': {
+                                    'type': 'integer',
+                                    'minimum': 0,
+                                    'description': 'Index of the input title'
+                                },
+                                **item_schema['properties']
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+
+# 批量标题解析响应格式（与单标题字段相同，附带输入序号）
+TITLE_PARSE_BATCH_RESPONSE_FORMAT: ResponseFormat = _build_title_parse_batch_format()
+
+
 # 多文件重命名响应格式
 MULTI_FILE_RENAME_RESPONSE_FORMAT: ResponseFormat = {
     'type': 'json_schema',
@@ -0,0 +1,193 @@
+"""
+流式 JSON 解析模块。
+
+在 AI 流式响应尚未结束时增量解析 JSON，提前取出已完整到达的
+重命名映射条目，并在结构不符合 schema 时尽早报错。
+"""
+
+import json
+
+from src.core.exceptions import AIResponseParseError
+
+# JSON 标量值的起始字符（字符串除外）
+_SCALAR_START = set('-0123456789tfn')
+
+
+class RenameStreamParser:
+    """
+    重命名响应的增量解析器。
+
+    逐块接收响应文本，跟踪 JSON 嵌套结构，每当顶层对象中 mapping_field
+    （默认 main_files）下的一个 "key": "value" 完整到达时即返回该条目。
+    不构建完整的 JSON 树，内存占用与响应长度无关（字符串除外）。
+
+    以下情况视为 schema 违规并抛出 AIResponseParseError：
+    - 顶层不是对象
+    - mapping_field 不是对象
+    - mapping_field 中的值不是字符串
+
+    Example:
+        >>> parser = RenameStreamParser()
+        >>> parser.feed('{"main_files": {"1": "S01E01.mkv", ')
+        [('1', 'S01E01.mkv')]
+        >>> parser.feed('"2": "S01E02.mkv"}}')
+        [('2', 'S01E02.mkv')]
+    """
+
+    def __init__(self, mapping_field: str = 'main_files'):
+        """
+        初始化解析器。
+
+        Args:
+            mapping_field: 需要增量提取的映射字段名
+        """
+        self._mapping_field = mapping_field
+        self._started = False
+        self._complete = False
+        # 容器栈：'{' 或 '['
+        self._stack: list[str] = []
+        # 每层对象当前的键（数组层为 None）
+        self._keys: list[str | None] = []
+        # 每层对象是否正在等待键
+        self._expect_key: list[bool] = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._string_chars: list[str] = []
+        self._entry_count = 0
+
+    @property
+    def entry_count(self) -> int:
+        """已解析出的映射条目数。"""
+        return self._entry_count
+
+    @property
+    def complete(self) -> bool:
+        """顶层对象是否已完整结束。"""
+        return self._complete
+
+    def feed(self, chunk: str) -> list[tuple[str, str]]:
+        """
+        输入一段响应文本。
+
+        Args:
+            chunk: 新到达的响应文本
+
+        Returns:
+            本次新完成的 (key, value) 映射条目列表
+
+        Raises:
+            AIResponseParseError: 响应结构不符合 schema
+        """
+        entries: list[tuple[str, str]] = []
+
+        for char in chunk:
+            if self._complete:
+                break
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    entry = self._finish_string()
+                    if entry:
+                        entries.append(entry)
+                    continue
+                self._string_chars.append(char)
+                continue
+
+            if not self._started:
+                # 跳过 markdown 代码块等前缀
+                if char == '{':
+                    self._started = True
+                    self._push('{')
+                elif char == '[':
+                    raise AIResponseParseError('响应顶层不是 JSON 对象')
+                continue
+
+            if char == '"':
+                self._check_mapping_start(char)
+                self._in_string = True
+                self._string_is_key = self._stack[-1] == '{' and self._expect_key[-1]
+                self._string_chars = []
+            elif char in '{[':
+                if self._in_mapping_value():
+                    raise AIResponseParseError(
+                        f'{self._mapping_field} 的值必须是字符串',
+                        context={'key': self._keys[-1]}
+                    )
+                self._check_mapping_start(char)
+                self._push(char)
+            elif char in '}]':
+                self._stack.pop()
+                self._keys.pop()
+                self._expect_key.pop()
+                if not self._stack:
+                    self._complete = True
+            elif char == ':':
+                self._expect_key[-1] = False
+            elif char == ',':
+                if self._stack[-1] == '{':
+                    self._expect_key[-1] = True
+            elif char in _SCALAR_START:
+                if self._in_mapping_value():
+                    raise AIResponseParseError(
+                        f'{self._mapping_field} 的值必须是字符串',
+                        context={'key': self._keys[-1]}
+                    )
+                self._check_mapping_start(char)
+
+        return entries
+
+    def _push(self, container: str) -> None:
+        """进入新的对象或数组。"""
+        self._stack.append(container)
+        self._keys.append(None)
+        self._expect_key.append(container == '{')
+
+    def _check_mapping_start(self, char: str) -> None:
+        """检查 mapping_field 的值是否以对象开始。"""
+        if (
+            len(self._stack) == 1
+            and self._keys[0] == self._mapping_field
+            and not self._expect_key[0]
+            and char != '{'
+        ):
+            raise AIResponseParseError(f'{self._mapping_field} 必须是对象')
+
+    def _in_mapping(self) -> bool:
+        """当前是否位于 mapping_field 对象内部。"""
+        return (
+            len(self._stack) == 2
+            and self._stack[1] == '{'
+            and self._keys[0] == self._mapping_field
+        )
+
+    def _in_mapping_value(self) -> bool:
+        """当前是否位于 mapping_field 对象的值位置。"""
+        return self._in_mapping() and not self._expect_key[-1]
+
+    def _finish_string(self) -> tuple[str, str] | None:
+        """
+        处理一个完整的字符串。
+
+        Returns:
+            如果该字符串是 mapping_field 中的值，返回 (key, value)
+        """
+        try:
+            value = json.loads('"' + ''.join(self._string_chars) + '"')
+        except json.JSONDecodeError as e:
+            raise AIResponseParseError(f'响应包含无效字符串: {e}') from e
+
+        if self._string_is_key:
+            self._keys[-1] = value
+            return None
+
+        if self._in_mapping():
+            self._entry_count += 1
+            return self._keys[-1], value
+
+        return None
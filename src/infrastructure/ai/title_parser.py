@@ -4,9 +4,16 @@ AI 标题解析器模块。
 实现 ITitleParser 接口，使用 AI 解析动漫标题。
 """
 
+import dataclasses
+import hashlib
 import json
 import logging
-from typing import Any
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from time import time
+from typing import TYPE_CHECKING, Any
 
 from src.core.config import config
 from src.core.exceptions import (
@@ -20,11 +27,21 @@ from src.services.debug.ai_debug_service import AIDebugService
 from .api_client import OpenAIClient
 from .circuit_breaker import CircuitBreaker
 from .key_pool import KeyPool
-from .prompts import get_title_parse_system_prompt
-from .schemas import TITLE_PARSE_RESPONSE_FORMAT
+from .prompts import get_title_parse_batch_system_prompt, get_title_parse_system_prompt
+from .schemas import TITLE_PARSE_BATCH_RESPONSE_FORMAT, TITLE_PARSE_RESPONSE_FORMAT
+
+if TYPE_CHECKING:
+    from src.infrastructure.repositories.title_parse_cache_repository import (
+        TitleParseCacheRepository,
+    )
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 批量解析时单个请求包含的最大标题数
+DEFAULT_PARSE_BATCH_SIZE = 20
+
 
 class AITitleParser(ITitleParser):
     """
@@ -33,6 +50,13 @@ class AITitleParser(ITitleParser):
     实现 ITitleParser 接口，使用 OpenAI API 解析动漫标题。
     集成 KeyPool 和 CircuitBreaker 进行限流和熔断保护。
 
+    解析结果按「规范化标题 + 模型 + 提示词版本 + 语言优先级」缓存，
+    命中时不预留 Key、不检查熔断器、不发起请求。提供 cache_repo 时
+    结果会持久化，重启后仍可命中；提示词变化后旧条目自动失效。
+
+    parse_many 在一个请求中解析多个标题，结果写入同一缓存，
+    之后对这些标题调用 parse 会直接命中缓存。
+
     Example:
         >>> parser = AITitleParser(key_pool, circuit_breaker)
         >>> result = parser.parse('[字幕组] 动漫名称 - 01 [1080p]')
@@ -49,7 +73,11 @@ class AITitleParser(ITitleParser):
         circuit_breaker: CircuitBreaker,
         api_client: OpenAIClient | None = None,
         max_retries: int = 3,
-        ai_debug_service: AIDebugService | None = None
+        ai_debug_service: AIDebugService | None = None,
+        cache_repo: 'TitleParseCacheRepository | None' = None,
+        cache_ttl: int = 30 * 24 * 3600,
+        cache_max_entries: int = 20000,
+        memory_cache_entries: int = 2000
     ):
         """
         初始化标题解析器。
@@ -60,6 +88,10 @@ class AITitleParser(ITitleParser):
             api_client: API 客户端（可选，默认创建新实例）
             max_retries: 最大重试次数
             ai_debug_service: AI 调试服务（可选）
+            cache_repo: 解析结果持久化仓库（可选，不提供则只使用内存缓存）
+            cache_ttl: 缓存过期时间（秒），默认 30 天
+            cache_max_entries: 持久化缓存最大条目数
+            memory_cache_entries: 内存缓存最大条目数，超出后淘汰最久未使用的条目
         """
         self._key_pool = key_pool
         self._circuit_breaker = circuit_breaker
@@ -67,6 +99,16 @@ class AITitleParser(ITitleParser):
         self._max_retries = max_retries
         self._ai_debug_service = ai_debug_service
 
+        # 解析结果缓存
+        self._cache_repo = cache_repo
+        self._cache_ttl = cache_ttl
+        self._cache_max_entries = cache_max_entries
+        self._memory_cache_entries = memory_cache_entries
+        self._cache: OrderedDict[str, tuple[TitleParseResult, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
     def parse(self, title: str) -> TitleParseResult | None:
         """
         解析动漫标题。
@@ -82,18 +124,26 @@ class AITitleParser(ITitleParser):
             AICircuitBreakerError: 熔断器已开启
             AIKeyExhaustedError: 没有可用的 API Key
         """
+        # 解析 extra_body（从任务配置读取，不是从 pool）
+        extra_params = self._parse_extra_body(config.openai.title_parse.extra_body)
+
+        # 获取任务配置的 model（不是从 pool 读取）
+        model = config.openai.title_parse.model
+
+        # 获取语言优先级配置并生成提示词
+        language_priorities = self._get_language_priorities()
+        system_prompt = get_title_parse_system_prompt(language_priorities)
+        prompt_version = self.get_prompt_version(system_prompt)
+
+        # 命中缓存时直接返回，不消耗 Key 配额
+        cache_key = self._make_cache_key(title, model, prompt_version, language_priorities)
+        cached = self._get_cached(cache_key, title)
+        if cached:
+            logger.info(f'📦 标题解析命中缓存: {cached.clean_title}')
+            return cached
+
         # 检查熔断器是否允许请求
-        if not self._circuit_breaker.allow_request():
-            remaining = self._circuit_breaker.get_remaining_seconds()
-            state = self._circuit_breaker.state.value
-            logger.warning(
-                f'🔴 [{self._key_pool.purpose}] 熔断器状态: {state}，'
-                f'剩余 {remaining:.0f}s'
-            )
-            raise AICircuitBreakerError(
-                message=f'熔断器状态: {state}',
-                remaining_seconds=remaining
-            )
+        self._check_circuit_breaker()
 
         logger.info(f'🤖 开始解析标题: {title[:50]}...')
 
@@ -114,16 +164,6 @@ class AITitleParser(ITitleParser):
                 f'使用 Key {reservation.key_id}'
             )
 
-            # 解析 extra_body（从任务配置读取，不是从 pool）
-            extra_params = self._parse_extra_body(config.openai.title_parse.extra_body)
-
-            # 获取任务配置的 model（不是从 pool 读取）
-            model = config.openai.title_parse.model
-
-            # 获取语言优先级配置并生成提示词
-            language_priorities = self._get_language_priorities()
-            system_prompt = get_title_parse_system_prompt(language_priorities)
-
             # 调用 API
             response = self._api_client.call(
                 base_url=reservation.base_url,
@@ -194,6 +234,7 @@ class AITitleParser(ITitleParser):
                         f'✅ 标题解析成功: {result.clean_title} '
                         f'({response.response_time_ms}ms)'
                     )
+                    self._put_cached(cache_key, prompt_version, result)
                     return result
                 else:
                     logger.warning(
@@ -270,6 +311,454 @@ class AITitleParser(ITitleParser):
         logger.error(f'❌ 标题解析失败: 重试 {self._max_retries} 次后仍失败')
         return None
 
+    def parse_many(
+        self,
+        titles: list[str],
+        batch_size: int = DEFAULT_PARSE_BATCH_SIZE
+    ) -> list[TitleParseResult | None]:
+        """
+        批量解析多个动漫标题。
+
+        已缓存的标题直接返回，其余标题去重后每 batch_size 个合并为一个请求。
+        批量响应中缺失或格式错误的标题逐个回退到 parse()。
+
+        Args:
+            titles: 原始标题列表
+            batch_size: 单个请求包含的最大标题数
+
+        Returns:
+            与输入顺序一致的结果列表，解析失败的位置为 None
+
+        Raises:
+            AICircuitBreakerError: 熔断器已开启
+            AIKeyExhaustedError: 没有可用的 API Key
+        """
+        results: list[TitleParseResult | None] = [None] * len(titles)
+
+        extra_params = self._parse_extra_body(config.openai.title_parse.extra_body)
+        model = config.openai.title_parse.model
+        language_priorities = self._get_language_priorities()
+        prompt_version = self.get_prompt_version(
+            get_title_parse_system_prompt(language_priorities)
+        )
+
+        # 查缓存，并按缓存键合并重复标题
+        pending: dict[str, list[int]] = {}
+        for index, title in enumerate(titles):
+            cache_key = self._make_cache_key(title, model, prompt_version, language_priorities)
+            if cache_key in pending:
+                pending[cache_key].append(index)
+                continue
+            cached = self._get_cached(cache_key, title)
+            if cached:
+                results[index] = cached
+            else:
+                pending[cache_key] = [index]
+
+        if not pending:
+            return results
+
+        keys = list(pending)
+        logger.info(
+            f'🤖 开始批量解析 {len(keys)} 个标题 '
+            f'({len(titles) - sum(len(v) for v in pending.values())} 个命中缓存)'
+        )
+
+        batch_prompt = get_title_parse_batch_system_prompt(language_priorities)
+        for start in range(0, len(keys), max(1, batch_size)):
+            chunk = keys[start:start + max(1, batch_size)]
+            chunk_titles = [titles[pending[key][0]] for key in chunk]
+
+            if len(chunk) == 1:
+                parsed: list[TitleParseResult | None] | None = [self.parse(chunk_titles[0])]
+            else:
+                parsed = self._parse_batch(
+                    chunk_titles, model, batch_prompt, extra_params, language_priorities
+                )
+                if parsed is None:
+                    # 请求本身失败（已重试），不再逐个请求
+                    continue
+
+                for offset, result in enumerate(parsed):
+                    if result:
+                        self._put_cached(chunk[offset], prompt_version, result)
+                    else:
+                        logger.warning(
+                            f'⚠️ 批量响应缺少有效结果，单独解析: {chunk_titles[offset][:50]}...'
+                        )
+                        parsed[offset] = self.parse(chunk_titles[offset])
+
+            for key, result in zip(chunk, parsed, strict=True):
+                if result:
+                    for index in pending[key]:
+                        results[index] = dataclasses.replace(
+                            result, original_title=titles[index]
+                        )
+
+        return results
+
+    def _parse_batch(
+        self,
+        titles: list[str],
+        model: str,
+        system_prompt: str,
+        extra_params: dict[str, Any] | None,
+        language_priorities: list[str]
+    ) -> list[TitleParseResult | None] | None:
+        """
+        在一个请求中解析一组标题。
+
+        Args:
+            titles: 标题列表（已去重）
+            model: 模型名称
+            system_prompt: 批量解析系统提示词
+            extra_params: 额外请求参数
+            language_priorities: 语言优先级（用于调试日志）
+
+        Returns:
+            与 titles 对应的结果列表（缺失或无效的位置为 None），
+            重试后请求仍失败时返回 None
+        """
+        self._check_circuit_breaker()
+
+        user_message = json.dumps(
+            [{'index': index, 'title': title} for index, title in enumerate(titles)],
+            ensure_ascii=False
+        )
+        context_summary = f'[批量 {len(titles)}] {titles[0][:80]}'
+
+        for attempt in range(self._max_retries):
+            # 预留 Key（启用 RPM/RPD 等待）
+            reservation = self._key_pool.reserve(
+                wait_for_rpm=True,
+                wait_for_rpd=True
+            )
+            if not reservation:
+                logger.error(f'❌ [{self._key_pool.purpose}] 没有可用的 API Key')
+                raise AIKeyExhaustedError(
+                    message='没有可用的 API Key'
+                )
+
+            logger.debug(
+                f'🔑 批量解析尝试 {attempt + 1}/{self._max_retries}: '
+                f'使用 Key {reservation.key_id}'
+            )
+
+            response = self._api_client.call(
+                base_url=reservation.base_url,
+                api_key=reservation.api_key,
+                model=model,
+                messages=[
+                    {'role': 'system', 'content': system_prompt},
+                    {'role': 'user', 'content': user_message}
+                ],
+                response_format=TITLE_PARSE_BATCH_RESPONSE_FORMAT,
+                extra_params=extra_params
+            )
+
+            if response.success:
+                self._key_pool.report_success(
+                    reservation.key_id,
+                    response_time_ms=response.response_time_ms
+                )
+                self._circuit_breaker.report_success()
+            else:
+                retry_after = None
+                if response.error_code == 429:
+                    retry_after = self._extract_retry_after(response.error_message)
+                self._key_pool.report_error(
+                    reservation.key_id,
+                    response.error_message or 'Unknown error',
+                    status_code=response.error_code,
+                    retry_after=retry_after
+                )
+                self._circuit_breaker.report_failure(response.error_message)
+
+            # 获取 Key 信息和当前 RPM/RPD 计数
+            pool_status = self._key_pool.get_status()
+            key_info = next(
+                (k for k in pool_status.get('keys', []) if k['key_id'] == reservation.key_id),
+                {}
+            )
+
+            results = (
+                self._parse_batch_response(response.content, titles)
+                if response.success else None
+            )
+
+            # 记录到数据库
+            ai_key_repository.log_usage(
+                purpose=self.TASK_PURPOSE,
+                key_id=reservation.key_id,
+                key_name=key_info.get('name', ''),
+                model=model,
+                anime_title=f'批量解析 {sum(1 for r in results if r)}/{len(titles)}' if results else '',
+                context_summary=context_summary,
+                success=response.success,
+                error_code=None if response.success else response.error_code,
+                error_message=None if response.success else (
+                    response.error_message or 'Unknown error'
+                ),
+                response_time_ms=response.response_time_ms,
+                rpm_at_call=key_info.get('rpm_count', 0),
+                rpd_at_call=key_info.get('rpd_count', 0),
+            )
+
+            # 记录 AI 调试日志
+            if self._ai_debug_service and self._ai_debug_service.enabled:
+                self._ai_debug_service.log_ai_interaction(
+                    operation='title_parse_batch',
+                    input_data={
+                        'titles': titles,
+                        'language_priorities': language_priorities,
+                        'system_prompt': system_prompt,
+                        'base_url': reservation.base_url,
+                        'extra_params': extra_params,
+                    },
+                    output_data=response.content if response.success else None,
+                    model=model,
+                    response_time_ms=response.response_time_ms,
+                    key_id=reservation.key_id,
+                    success=response.success,
+                    error_message=None if response.success else response.error_message
+                )
+
+            if response.success:
+                logger.info(
+                    f'✅ 批量解析完成: {sum(1 for r in results if r)}/{len(titles)} 个标题 '
+                    f'({response.response_time_ms}ms)'
+                )
+                return results
+
+            # 检查是否需要触发熔断
+            if pool_status['all_in_long_cooling']:
+                self._circuit_breaker.trip(
+                    reason='所有 Key 都不可用（长冷却或已禁用）'
+                )
+                raise AICircuitBreakerError(
+                    message='所有 Key 都不可用，触发熔断',
+                    remaining_seconds=self._circuit_breaker.get_remaining_seconds()
+                )
+
+        logger.error(f'❌ 批量标题解析失败: 重试 {self._max_retries} 次后仍失败')
+        return None
+
+    def _parse_batch_response(
+        self,
+        content: str | None,
+        titles: list[str]
+    ) -> list[TitleParseResult | None]:
+        """
+        解析批量响应内容。
+
+        只接受序号有效且 original_title 与输入一致的结果，
+        防止模型错位时把一个标题的结果套到另一个标题上。
+
+        Args:
+            content: AI 响应内容
+            titles: 输入标题列表
+
+        Returns:
+            与 titles 对应的结果列表（缺失或无效的位置为 None）
+        """
+        results: list[TitleParseResult | None] = [None] * len(titles)
+        try:
+            data = json.loads(self._strip_code_fence(content or ''))
+            entries = data.get('results') if isinstance(data, dict) else None
+            if not isinstance(entries, list):
+                logger.error('❌ 批量响应缺少 results 数组')
+                return results
+        except json.JSONDecodeError as e:
+            logger.error(f'❌ 批量响应 JSON 解析失败: {e}')
+            logger.debug(f'响应内容: {(content or "")[:500]}')
+            return results
+
+        for entry in entries:
+            try:
+                index = int(entry['index'])
+                if not 0 <= index < len(titles) or results[index] is not None:
+                    continue
+                title = titles[index]
+                echoed = entry.get('original_title') or title
+                if self._normalize_title(echoed) != self._normalize_title(title):
+                    logger.debug(f'⚠️ 批量结果与输入标题不一致，忽略: index={index}')
+                    continue
+                results[index] = self._build_result(entry, title)
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                logger.debug(f'⚠️ 批量结果数据提取失败: {e}')
+        return results
+
+    def _check_circuit_breaker(self) -> None:
+        """
+        检查熔断器是否允许请求。
+
+        Raises:
+            AICircuitBreakerError: 熔断器已开启
+        """
+        if not self._circuit_breaker.allow_request():
+            remaining = self._circuit_breaker.get_remaining_seconds()
+            state = self._circuit_breaker.state.value
+            logger.warning(
+                f'🔴 [{self._key_pool.purpose}] 熔断器状态: {state}，'
+                f'剩余 {remaining:.0f}s'
+            )
+            raise AICircuitBreakerError(
+                message=f'熔断器状态: {state}',
+                remaining_seconds=remaining
+            )
+
+    @staticmethod
+    def get_prompt_version(system_prompt: str) -> str:
+        """
+        计算提示词版本（系统提示词与响应格式的摘要）。
+
+        Args:
+            system_prompt: 系统提示词
+
+        Returns:
+            16 位十六进制版本号
+        """
+        digest = hashlib.sha256(system_prompt.encode('utf-8'))
+        digest.update(json.dumps(TITLE_PARSE_RESPONSE_FORMAT, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def _normalize_title(title: str) -> str:
+        """规范化标题（全半角统一、合并空白），用于生成缓存键"""
+        return _WHITESPACE_PATTERN.sub(' ', unicodedata.normalize('NFKC', title)).strip()
+
+    def _make_cache_key(
+        self,
+        title: str,
+        model: str,
+        prompt_version: str,
+        language_priorities: list[str]
+    ) -> str:
+        """生成缓存键：规范化标题、模型、提示词版本与语言优先级的 SHA-256"""
+        material = json.dumps(
+            [self._normalize_title(title), model, prompt_version, language_priorities],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _get_cached(self, cache_key: str, title: str) -> TitleParseResult | None:
+        """
+        从内存或持久化缓存获取解析结果。
+
+        Args:
+            cache_key: 缓存键
+            title: 本次请求的原始标题（写回结果的 original_title）
+
+        Returns:
+            TitleParseResult 或 None
+        """
+        now = time()
+        min_cached_at = now - self._cache_ttl
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry and entry[1] >= min_cached_at:
+                self._cache.move_to_end(cache_key)
+                self._cache_hits += 1
+                return dataclasses.replace(entry[0], original_title=title)
+            if entry:
+                del self._cache[cache_key]
+
+        result = None
+        if self._cache_repo is not None:
+            try:
+                row = self._cache_repo.get(cache_key, min_cached_at)
+                if row:
+                    result = TitleParseResult(**json.loads(row[0]))
+                    self._remember(cache_key, result, row[1])
+            except Exception as e:
+                logger.warning(f'⚠️ 读取标题解析缓存失败: {e}')
+
+        with self._cache_lock:
+            if result:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+        return dataclasses.replace(result, original_title=title) if result else None
+
+    def _put_cached(
+        self,
+        cache_key: str,
+        prompt_version: str,
+        result: TitleParseResult
+    ) -> None:
+        """写入内存缓存，并在提供仓库时持久化"""
+        now = time()
+        self._remember(cache_key, result, now)
+        if self._cache_repo is None:
+            return
+        try:
+            self._cache_repo.save(
+                cache_key,
+                prompt_version,
+                json.dumps(dataclasses.asdict(result), ensure_ascii=False),
+                now
+            )
+        except Exception as e:
+            logger.warning(f'⚠️ 写入标题解析缓存失败: {e}')
+
+    def _remember(self, cache_key: str, result: TitleParseResult, cached_at: float) -> None:
+        """写入内存缓存并淘汰超出容量的最旧条目"""
+        with self._cache_lock:
+            self._cache[cache_key] = (result, cached_at)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self._memory_cache_entries:
+                self._cache.popitem(last=False)
+
+    def prune_cache(self) -> int:
+        """
+        清理持久化缓存中过期、提示词版本已变更和超出容量的条目。
+
+        Returns:
+            删除的条目数
+        """
+        if self._cache_repo is None:
+            return 0
+        system_prompt = get_title_parse_system_prompt(self._get_language_priorities())
+        try:
+            return self._cache_repo.prune(
+                self._cache_max_entries,
+                time() - self._cache_ttl,
+                prompt_version=self.get_prompt_version(system_prompt)
+            )
+        except Exception as e:
+            logger.warning(f'⚠️ 清理标题解析缓存失败: {e}')
+            return 0
+
+    def invalidate_cache(self) -> int:
+        """
+        清空所有解析结果缓存（例如修改提示词后）。
+
+        Returns:
+            删除的持久化条目数
+        """
+        with self._cache_lock:
+            self._cache.clear()
+        if self._cache_repo is None:
+            return 0
+        try:
+            deleted = self._cache_repo.clear()
+        except Exception as e:
+            logger.warning(f'⚠️ 清空标题解析缓存失败: {e}')
+            return 0
+        logger.info(f'🗑️ 已清空 {deleted} 条标题解析缓存')
+        return deleted
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """获取缓存统计信息"""
+        with self._cache_lock:
+            total = self._cache_hits + self._cache_misses
+            return {
+                'memory_entries': len(self._cache),
+                'hits': self._cache_hits,
+                'misses': self._cache_misses,
+                'hit_rate': round(self._cache_hits / total * 100, 2) if total else 0.0,
+            }
+
     def _parse_response(
         self,
         content: str | None,
@@ -289,32 +778,8 @@ class AITitleParser(ITitleParser):
             return None
 
         try:
-            # 清理 markdown 代码块
-            cleaned = content.strip()
-            if cleaned.startswith('```json'):
-                cleaned = cleaned[7:]
-            if cleaned.startswith('```'):
-                cleaned = cleaned[3:]
-            if cleaned.endswith('```'):
-                cleaned = cleaned[:-3]
-            cleaned = cleaned.strip()
-
-            data = json.loads(cleaned)
-
-            return TitleParseResult(
-                original_title=data.get('original_title', original_title),
-                clean_title=data.get('anime_clean_title', ''),
-                full_title=data.get('anime_full_title'),
-                subtitle_group=data.get('subtitle_group_name', ''),
-                season=int(data.get('season', 1)),
-                episode=data.get('episode'),
-                category=data.get('category', 'tv'),
-                quality_info={
-                    'quality': data.get('quality', ''),
-                    'codec': data.get('codec', ''),
-                    'source': data.get('source', '')
-                }
-            )
+            data = json.loads(self._strip_code_fence(content))
+            return self._build_result(data, original_title)
 
         except json.JSONDecodeError as e:
             logger.error(f'❌ JSON 解析失败: {e}')
@@ -329,6 +794,36 @@ class AITitleParser(ITitleParser):
             logger.exception(f'❌ 响应解析未预期错误: {e}')
             return None
 
+    @staticmethod
+    def _strip_code_fence(content: str) -> str:
+        """清理 markdown 代码块"""
+        cleaned = content.strip()
+        if cleaned.startswith('```json'):
+            cleaned = cleaned[7:]
+        if cleaned.startswith('```'):
+            cleaned = cleaned[3:]
+        if cleaned.endswith('```'):
+            cleaned = cleaned[:-3]
+        return cleaned.strip()
+
+    @staticmethod
+    def _build_result(data: dict[str, Any], original_title: str) -> TitleParseResult:
+        """从响应字段构建 TitleParseResult"""
+        return TitleParseResult(
+            original_title=data.get('original_title', original_title),
+            clean_title=data.get('anime_clean_title', ''),
+            full_title=data.get('anime_full_title'),
+            subtitle_group=data.get('subtitle_group_name', ''),
+            season=int(data.get('season', 1)),
+            episode=data.get('episode'),
+            category=data.get('category', 'tv'),
+            quality_info={
+                'quality': data.get('quality', ''),
+                'codec': data.get('codec', ''),
+                'source': data.get('source', '')
+            }
+        )
+
     def _extract_retry_after(self, error_message: str | None) -> float | None:
         """
         从错误消息中提取 retry-after 时间。
@@ -342,8 +837,6 @@ class AITitleParser(ITitleParser):
         if not error_message:
             return None
 
-        import re
-
         # 尝试匹配常见的 retry-after 格式
         patterns = [
             r'retry.?after[:\s]+(\d+(?:\.\d+)?)\s*(?:s|seconds?)?',
@@ -0,0 +1,213 @@
+"""
+Token 预算模块。
+
+在发送请求前估算提示词的 Token 数，用于：
+- 按 Token 预算（而非固定文件数）划分重命名批次
+- 在超出预算时裁剪文件夹结构和 TVDB 数据
+
+估算使用字符启发式（ASCII 约 4 字符 / Token，CJK 等非 ASCII 字符约 1 字符 / Token），
+并根据 API 返回的实际 prompt_tokens 持续校准，不依赖任何 tokenizer。
+"""
+
+import json
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class TokenEstimator:
+    """
+    提示词 Token 估算器。
+
+    线程安全，可在并行批次之间共享。
+
+    Example:
+        >>> estimator = TokenEstimator()
+        >>> estimated = estimator.estimate(prompt)
+        >>> # 请求完成后用实际用量校准
+        >>> estimator.record(estimated, response.prompt_tokens)
+    """
+
+    ASCII_CHARS_PER_TOKEN = 4.0  # ASCII 文本每 Token 字符数
+    NON_ASCII_TOKENS_PER_CHAR = 1.0  # 非 ASCII 字符（CJK 等）每字符 Token 数
+    MESSAGE_OVERHEAD_TOKENS = 4  # 每条消息的格式开销
+    CALIBRATION_ALPHA = 0.2  # 校准系数移动平均权重
+    MIN_RATIO = 0.5  # 校准系数下限
+    MAX_RATIO = 2.0  # 校准系数上限
+
+    def __init__(self):
+        """初始化估算器（校准系数为 1）。"""
+        self._ratio = 1.0
+        self._samples = 0
+        self._lock = threading.Lock()
+
+    @property
+    def ratio(self) -> float:
+        """当前校准系数（实际 / 原始估算）。"""
+        with self._lock:
+            return self._ratio
+
+    def estimate(self, text: str | None) -> int:
+        """
+        估算一段文本的 Token 数（已应用校准系数）。
+
+        Args:
+            text: 文本内容
+
+        Returns:
+            估算的 Token 数
+        """
+        with self._lock:
+            ratio = self._ratio
+        return int(self._raw_estimate(text) * ratio + 0.5)
+
+    def estimate_messages(self, messages: list[dict[str, str]]) -> int:
+        """
+        估算一组聊天消息的 prompt Token 数。
+
+        Args:
+            messages: 消息列表
+
+        Returns:
+            估算的 Token 数
+        """
+        return sum(
+            self.estimate(message.get('content')) + self.MESSAGE_OVERHEAD_TOKENS
+            for message in messages
+        )
+
+    def record(self, estimated: int, actual: int | None) -> None:
+        """
+        用 API 返回的实际用量校准估算。
+
+        Args:
+            estimated: 请求前的估算值（estimate_messages 的结果）
+            actual: API 返回的 prompt_tokens（None 表示未返回，忽略）
+        """
+        if not actual or estimated <= 0:
+            return
+
+        with self._lock:
+            raw_estimated = estimated / self._ratio
+            observed = min(self.MAX_RATIO, max(self.MIN_RATIO, actual / raw_estimated))
+            if self._samples == 0:
+                self._ratio = observed
+            else:
+                self._ratio += self.CALIBRATION_ALPHA * (observed - self._ratio)
+            self._samples += 1
+
+    def _raw_estimate(self, text: str | None) -> float:
+        """未校准的字符启发式估算。"""
+        if not text:
+            return 0.0
+        non_ascii = sum(1 for char in text if ord(char) > 127)
+        ascii_count = len(text) - non_ascii
+        return (
+            ascii_count / self.ASCII_CHARS_PER_TOKEN
+            + non_ascii * self.NON_ASCII_TOKENS_PER_CHAR
+        )
+
+
+def trim_folder_structure(
+    folder_structure: str,
+    max_tokens: int,
+    estimator: TokenEstimator
+) -> str:
+    """
+    将文件夹结构裁剪到 Token 预算内。
+
+    按行保留开头部分（目录树的上层结构最有参考价值），
+    末尾追加被省略的行数。
+
+    Args:
+        folder_structure: 文件夹结构文本
+        max_tokens: Token 上限
+        estimator: Token 估算器
+
+    Returns:
+        原文本或裁剪后的文本
+    """
+    if estimator.estimate(folder_structure) <= max_tokens:
+        return folder_structure
+
+    lines = folder_structure.splitlines()
+    kept: list[str] = []
+    used = 0
+    for line in lines:
+        cost = estimator.estimate(line) + 1
+        if used + cost > max_tokens:
+            break
+        kept.append(line)
+        used += cost
+
+    omitted = len(lines) - len(kept)
+    kept.append(f'... ({omitted} more lines omitted)')
+    logger.info(f'✂️ 文件夹结构超出 Token 预算，省略 {omitted}/{len(lines)} 行')
+    return '\n'.join(kept)
+
+
+def trim_tvdb_data(
+    tvdb_data: dict[str, Any],
+    max_tokens: int,
+    estimator: TokenEstimator,
+    simplifier: Callable[[dict[str, Any]], dict[str, Any]] | None = None
+) -> dict[str, Any]:
+    """
+    将 TVDB 数据裁剪到 Token 预算内。
+
+    逐级精简，直到符合预算：
+    1. 原始数据
+    2. 去掉每集的 runtime
+    3. simplifier 生成的简化版本（不含单集列表）
+
+    Args:
+        tvdb_data: AI 格式的 TVDB 数据
+        max_tokens: Token 上限
+        estimator: Token 估算器
+        simplifier: 简化函数（通常为 TVDBAdapter.simplify_ai_format）
+
+    Returns:
+        原数据或精简后的数据（最后一级仍超出预算时也返回最后一级）
+    """
+    def cost(data: dict[str, Any]) -> int:
+        return estimator.estimate(json.dumps(data, ensure_ascii=False, indent=2))
+
+    original_cost = cost(tvdb_data)
+    if original_cost <= max_tokens:
+        return tvdb_data
+
+    without_runtime = {
+        **tvdb_data,
+        'seasons': [
+            {
+                **season,
+                'episodes': [
+                    {k: v for k, v in episode.items() if k != 'runtime'}
+                    for episode in season['episodes']
+                ]
+            } if isinstance(season.get('episodes'), list) else season
+            for season in tvdb_data.get('seasons', [])
+        ]
+    }
+    trimmed_cost = cost(without_runtime)
+    if trimmed_cost <= max_tokens or simplifier is None:
+        logger.info(
+            f'✂️ TVDB 数据超出 Token 预算，去掉单集时长 '
+            f'({original_cost} → {trimmed_cost} tokens)'
+        )
+        return without_runtime
+
+    try:
+        simplified = simplifier(tvdb_data)
+    except (KeyError, TypeError) as e:
+        logger.warning(f'⚠️ TVDB 数据简化失败，保留完整数据: {e}')
+        return without_runtime
+
+    logger.info(
+        f'✂️ TVDB 数据超出 Token 预算，使用简化版本 '
+        f'({original_cost} → {cost(simplified)} tokens)'
+    )
+    return simplified
@@ -15,10 +15,12 @@ from src.infrastructure.database.models import (
     Hardlink,
     HardlinkAttempt,
     ManualUploadHistory,
+    QueueEventRecord,
     RssProcessingDetail,
     RssProcessingHistory,
     SqlQueryHistory,
     TorrentFile,
+    TorrentHashCache,
 )
 from src.infrastructure.database.session import (
     DatabaseSessionManager,
@@ -32,6 +34,8 @@ __all__ = [
     'AnimePattern',
     'DownloadStatus',
     'TorrentFile',
+    'TorrentHashCache',
+    'QueueEventRecord',
     'Hardlink',
     'HardlinkAttempt',
     'RssProcessingHistory',
@@ -142,6 +142,75 @@ class TorrentFile(Base):
         return f"<TorrentFile(id={self.id}, hash='{self.torrent_hash[:8]}...', file='{self.file_path}')>"
 
 
+class TorrentHashCache(Base):
+    """Torrent URL 到 info hash 的持久化缓存表"""
+
+    __tablename__ = 'torrent_hash_cache'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    torrent_url = Column(Text, nullable=False, unique=True)
+    hash_id = Column(Text, nullable=False)
+    cached_at = Column(Float, nullable=False)  # Unix 时间戳（秒）
+
+    __table_args__ = (
+        Index('idx_torrent_hash_cache_cached_at', 'cached_at'),
+    )
+
+    def __repr__(self):
+        return f"<TorrentHashCache(id={self.id}, hash='{self.hash_id[:8]}...')>"
+
+
+class TitleParseCache(Base):
+    """AI 标题解析结果的持久化缓存表"""
+
+    __tablename__ = 'title_parse_cache'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cache_key = Column(Text, nullable=False, unique=True)  # 标题 + 模型 + 提示词版本的 SHA-256
+    prompt_version = Column(Text, nullable=False)
+    result = Column(Text, nullable=False)  # JSON
+    cached_at = Column(Float, nullable=False)  # Unix 时间戳（秒）
+
+    __table_args__ = (
+        Index('idx_title_parse_cache_cached_at', 'cached_at'),
+        Index('idx_title_parse_cache_prompt_version', 'prompt_version'),
+    )
+
+    def __repr__(self):
+        return f"<TitleParseCache(id={self.id}, key='{self.cache_key[:8]}...')>"
+
+
+class QueueEventRecord(Base):
+    """队列事件持久化表（预写日志，处理成功后删除）"""
+
+    __tablename__ = 'queue_events'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    queue_name = Column(Text, nullable=False)
+    queue_id = Column(Text, nullable=False)
+    event_type = Column(Text, nullable=False)
+    payload_type = Column(Text, nullable=False, default='')
+    payload = Column(Text, nullable=False)  # JSON
+    event_metadata = Column(Text, nullable=False, default='{}')  # JSON
+    status = Column(Text, nullable=False, default='pending')  # pending / failed
+    error_message = Column(Text)
+    priority = Column(Integer)  # EventPriority，越小越优先
+    deadline = Column(TIMESTAMP)  # 超过该时间未处理则丢弃
+    received_at = Column(TIMESTAMP, default=get_utc_now)
+    updated_at = Column(TIMESTAMP, default=get_utc_now, onupdate=get_utc_now)
+
+    __table_args__ = (
+        UniqueConstraint('queue_name', 'queue_id', name='uq_queue_events_queue_id'),
+        Index('idx_queue_events_queue_status', 'queue_name', 'status'),
+    )
+
+    def __repr__(self):
+        return (
+            f"<QueueEventRecord(id={self.id}, queue='{self.queue_name}', "
+            f"type='{self.event_type}', status='{self.status}')>"
+        )
+
+
 class Hardlink(Base):
     """硬链接表"""
 
@@ -9,9 +9,17 @@ from src.infrastructure.downloader.qbit_adapter import (
     get_torrent_hash_from_file,
     get_torrent_hash_from_magnet,
 )
+from src.infrastructure.downloader.qbit_sync import TorrentSyncMirror
+from src.infrastructure.downloader.torrent_metainfo import (
+    build_folder_structure,
+    read_torrent_files,
+)
 
 __all__ = [
     'QBitAdapter',
+    'TorrentSyncMirror',
+    'build_folder_structure',
     'get_torrent_hash_from_file',
     'get_torrent_hash_from_magnet',
+    'read_torrent_files',
 ]
@@ -8,6 +8,9 @@ for interacting with qBittorrent Web API.
 import hashlib
 import logging
 import re
+import threading
+import time
+from collections.abc import Iterable
 from typing import Any
 from urllib.parse import urljoin
 
@@ -15,12 +18,25 @@ import requests
 
 from src.core.config import config
 from src.core.interfaces.adapters import IDownloadClient
+from src.infrastructure.downloader.qbit_sync import TorrentSyncMirror
+from src.infrastructure.downloader.torrent_metainfo import build_folder_structure
 
 logger = logging.getLogger(__name__)
 
 
 class QBitAdapter(IDownloadClient):
-    """qBittorrent 客户端适配器"""
+    """
+    qBittorrent 客户端适配器。
+
+    由容器以单例提供，整个进程共享同一个 requests.Session 和登录 Cookie，
+    可在多个线程中并发使用。qBittorrent 的 SID 在空闲 SESSION_TTL_SECONDS
+    后失效，适配器记录最后一次成功请求的时间，在即将过期前主动重新登录，
+    403 重试仅作为 qBittorrent 重启等意外失效时的兜底。
+    """
+
+    SESSION_TTL_SECONDS = 3600  # qBittorrent WebUI 默认会话超时
+    RELOGIN_MARGIN_SECONDS = 300  # 提前重新登录的余量
+    MAX_HASHES_PER_REQUEST = 100  # 批量操作每次请求的最大 hash 数
 
     def __init__(self):
         self.base_url = config.qbittorrent.url.rstrip('/')
@@ -28,12 +44,28 @@ class QBitAdapter(IDownloadClient):
         self.password = config.qbittorrent.password
         self.session = requests.Session()
         self.cookies = None
+        self._last_active_at: float | None = None
+        self._login_lock = threading.RLock()
+        self._sync_mirror = TorrentSyncMirror()
+        self._sync_lock = threading.Lock()
 
-    def _ensure_login(self) -> bool:
-        """确保已登录"""
+    def _session_expiring(self) -> bool:
+        """判断当前 SID 是否已失效或即将失效"""
         if not self.cookies:
-            return self.login()
-        return True
+            return True
+        if self._last_active_at is None:
+            return False
+        idle = time.monotonic() - self._last_active_at
+        return idle > self.SESSION_TTL_SECONDS - self.RELOGIN_MARGIN_SECONDS
+
+    def _ensure_login(self) -> bool:
+        """确保已登录（SID 即将过期时主动重新登录）"""
+        with self._login_lock:
+            if self._session_expiring():
+                if self.cookies:
+                    logger.debug('🔑 qBittorrent 会话即将过期，主动重新登录')
+                return self.login()
+            return True
 
     def login(self) -> bool:
         """登录qBittorrent"""
@@ -41,23 +73,35 @@ class QBitAdapter(IDownloadClient):
             logger.warning('qBittorrent credentials not configured')
             return False
 
-        try:
-            logger.debug(f'🔑 正在登录 qBittorrent: {self.base_url}')
-            login_url = urljoin(self.base_url, '/api/v2/auth/login')
-            data = {'username': self.username, 'password': self.password}
-
-            response = self.session.post(login_url, data=data)
-
-            if response.status_code == 200 and response.text == 'Ok.':
-                self.cookies = self.session.cookies.get_dict()
-                logger.info('✅ qBittorrent 登录成功')
-                return True
-            else:
-                logger.error(f'qBittorrent login failed: {response.status_code} - {response.text}')
+        with self._login_lock:
+            try:
+                logger.debug(f'🔑 正在登录 qBittorrent: {self.base_url}')
+                login_url = urljoin(self.base_url, '/api/v2/auth/login')
+                data = {'username': self.username, 'password': self.password}
+
+                response = self.session.post(login_url, data=data)
+
+                if response.status_code == 200 and response.text == 'Ok.':
+                    self.cookies = self.session.cookies.get_dict()
+                    self._last_active_at = time.monotonic()
+                    logger.info('✅ qBittorrent 登录成功')
+                    return True
+                else:
+                    logger.error(
+                        f'qBittorrent login failed: {response.status_code} - {response.text}'
+                    )
+                    return False
+            except Exception as e:
+                logger.error(f'qBittorrent login exception: {e}')
                 return False
-        except Exception as e:
-            logger.error(f'qBittorrent login exception: {e}')
-            return False
+
+    def reset_session(self) -> None:
+        """丢弃当前登录状态，下次请求时重新登录（用于配置热重载）"""
+        with self._login_lock:
+            self.cookies = None
+            self._last_active_at = None
+            self.session.cookies.clear()
+        self._sync_mirror.reset()
 
     def _get_headers(self) -> dict[str, str]:
         """获取请求头"""
@@ -66,24 +110,95 @@ class QBitAdapter(IDownloadClient):
             'Origin': self.base_url
         }
 
-    def _retry_on_403(self, method, url, **kwargs):
-        """在收到403时重试"""
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """
+        发送 Web API 请求。
+
+        调用方需先通过 _ensure_login 确认已登录。收到 403 时（SID 被 qBittorrent
+        提前作废）重新登录并重试一次；多个线程同时收到 403 时只重新登录一次。
+
+        Args:
+            method: session 方法名（'get' / 'post'）
+            path: API 路径
+            **kwargs: 传给 requests 的参数
+
+        Returns:
+            响应对象
+        """
+        url = urljoin(self.base_url, path)
         headers = kwargs.pop('headers', {})
         headers.update(self._get_headers())
         kwargs['headers'] = headers
+        send = getattr(self.session, method)
 
-        response = method(url, **kwargs)
+        cookies_used = self.cookies
+        response = send(url, **kwargs)
 
         if response.status_code == 403:
             logger.warning('Received 403, attempting to re-login and retry...')
-            self.cookies = None
-            if self.login():
-                response = method(url, **kwargs)
+            with self._login_lock:
+                # 其他线程已重新登录时直接使用新的 SID
+                relogged = self.cookies is not cookies_used or self.login()
+            if relogged:
+                response = send(url, **kwargs)
             else:
                 logger.error('Re-login failed')
 
+        if response.status_code == 200:
+            self._last_active_at = time.monotonic()
         return response
 
+    def _post_hashes(
+        self,
+        path: str,
+        hash_ids: Iterable[str],
+        action: str,
+        data: dict[str, str] | None = None
+    ) -> tuple[list[str], list[str]]:
+        """
+        对一组种子执行批量操作（hashes=a|b|c）。
+
+        Args:
+            path: API 路径
+            hash_ids: 种子 hash 列表
+            action: 日志中的操作名称
+            data: 额外的表单参数
+
+        Returns:
+            (请求成功的 hash 列表, 请求失败的 hash 列表)，均已去重
+        """
+        hashes = list(dict.fromkeys(hash_id for hash_id in hash_ids if hash_id))
+        if not hashes:
+            return [], []
+        if not self._ensure_login():
+            return [], hashes
+
+        succeeded: list[str] = []
+        failed: list[str] = []
+        for start in range(0, len(hashes), self.MAX_HASHES_PER_REQUEST):
+            chunk = hashes[start:start + self.MAX_HASHES_PER_REQUEST]
+            target = chunk[0] if len(chunk) == 1 else f'{len(chunk)} torrents'
+            try:
+                response = self._request(
+                    'post', path, data={**(data or {}), 'hashes': '|'.join(chunk)}
+                )
+            except Exception as e:
+                logger.error(f'{action.capitalize()} torrents exception: {e}')
+                failed.extend(chunk)
+                continue
+
+            if response.status_code == 200:
+                logger.info(f'Torrent {target} {action}d successfully')
+                succeeded.extend(chunk)
+            else:
+                logger.error(
+                    f'{action.capitalize()} torrents failed: '
+                    f'{response.status_code} - {response.text}'
+                )
+                failed.extend(chunk)
+
+        return succeeded, failed
+
     # ==================== IDownloadClient Interface ====================
 
     def is_connected(self) -> bool:
@@ -92,8 +207,7 @@ class QBitAdapter(IDownloadClient):
             if not self._ensure_login():
                 return False
 
-            version_url = urljoin(self.base_url, '/api/v2/app/version')
-            response = self.session.get(version_url)
+            response = self._request('get', '/api/v2/app/version')
             return response.status_code == 200
         except Exception as e:
             logger.error(f'Connection check failed: {e}')
@@ -115,7 +229,6 @@ class QBitAdapter(IDownloadClient):
             if save_path:
                 logger.debug(f'  保存路径: {save_path}')
 
-            add_url = urljoin(self.base_url, '/api/v2/torrents/add')
             params = {'urls': torrent_url}
 
             if save_path:
@@ -125,7 +238,7 @@ class QBitAdapter(IDownloadClient):
             if category:
                 params['category'] = category
 
-            response = self._retry_on_403(self.session.post, add_url, data=params)
+            response = self._request('post', '/api/v2/torrents/add', data=params)
 
             if response.status_code == 200:
                 logger.info('✅ 种子添加成功到 qBittorrent')
@@ -144,8 +257,6 @@ class QBitAdapter(IDownloadClient):
             return None
 
         try:
-            add_url = urljoin(self.base_url, '/api/v2/torrents/add')
-
             with open(file_path, 'rb') as f:
                 files = {'torrents': f}
                 data = {}
@@ -157,8 +268,8 @@ class QBitAdapter(IDownloadClient):
                 if category:
                     data['category'] = category
 
-                response = self._retry_on_403(
-                    self.session.post, add_url, files=files, data=data
+                response = self._request(
+                    'post', '/api/v2/torrents/add', files=files, data=data
                 )
 
             if response.status_code == 200:
@@ -179,7 +290,6 @@ class QBitAdapter(IDownloadClient):
             return None
 
         try:
-            add_url = urljoin(self.base_url, '/api/v2/torrents/add')
             params = {'urls': magnet_link}
 
             if save_path:
@@ -189,7 +299,7 @@ class QBitAdapter(IDownloadClient):
             if category:
                 params['category'] = category
 
-            response = self._retry_on_403(self.session.post, add_url, data=params)
+            response = self._request('post', '/api/v2/torrents/add', data=params)
 
             if response.status_code == 200:
                 logger.info('Magnet link added successfully')
@@ -209,10 +319,9 @@ class QBitAdapter(IDownloadClient):
             return None
 
         try:
-            info_url = urljoin(self.base_url, '/api/v2/torrents/info')
-            params = {'hashes': hash_id}
-
-            response = self.session.get(info_url, params=params)
+            response = self._request(
+                'get', '/api/v2/torrents/info', params={'hashes': hash_id}
+            )
 
             if response.status_code == 200:
                 torrents = response.json()
@@ -229,10 +338,9 @@ class QBitAdapter(IDownloadClient):
             return []
 
         try:
-            files_url = urljoin(self.base_url, '/api/v2/torrents/files')
-            params = {'hash': hash_id}
-
-            response = self.session.get(files_url, params=params)
+            response = self._request(
+                'get', '/api/v2/torrents/files', params={'hash': hash_id}
+            )
 
             if response.status_code == 200:
                 return response.json() or []
@@ -250,72 +358,77 @@ class QBitAdapter(IDownloadClient):
 
     def delete_torrent(self, hash_id: str, delete_files: bool = False) -> bool:
         """删除种子任务"""
-        if not self._ensure_login():
-            return False
-
-        try:
-            delete_url = urljoin(self.base_url, '/api/v2/torrents/delete')
-            params = {
-                'hashes': hash_id,
-                'deleteFiles': 'true' if delete_files else 'false'
-            }
-
-            response = self.session.post(delete_url, data=params)
-
-            if response.status_code == 200:
-                logger.info(f'Torrent {hash_id} deleted successfully (delete_files={delete_files})')
-                return True
-            else:
-                logger.error(f'Delete torrent failed: {response.status_code} - {response.text}')
-                return False
-
-        except Exception as e:
-            logger.error(f'Delete torrent exception: {e}')
-            return False
+        _, failed = self._post_hashes(
+            '/api/v2/torrents/delete',
+            [hash_id],
+            'delete',
+            data={'deleteFiles': 'true' if delete_files else 'false'}
+        )
+        return not failed
+
+    def delete_torrents(
+        self,
+        hash_ids: Iterable[str],
+        delete_files: bool = False
+    ) -> list[str]:
+        """批量删除种子任务，返回删除成功的 hash 列表"""
+        deleted, _ = self._post_hashes(
+            '/api/v2/torrents/delete',
+            hash_ids,
+            'delete',
+            data={'deleteFiles': 'true' if delete_files else 'false'}
+        )
+        return deleted
 
     def pause_torrent(self, hash_id: str) -> bool:
         """暂停种子"""
-        if not self._ensure_login():
-            return False
-
-        try:
-            pause_url = urljoin(self.base_url, '/api/v2/torrents/pause')
-            params = {'hashes': hash_id}
-
-            response = self.session.post(pause_url, data=params)
-
-            if response.status_code == 200:
-                logger.info(f'Torrent {hash_id} paused successfully')
-                return True
-            else:
-                logger.error(f'Pause torrent failed: {response.status_code} - {response.text}')
-                return False
+        return self.pause_torrents([hash_id])
 
-        except Exception as e:
-            logger.error(f'Pause torrent exception: {e}')
-            return False
+    def pause_torrents(self, hash_ids: Iterable[str]) -> bool:
+        """批量暂停种子"""
+        _, failed = self._post_hashes('/api/v2/torrents/pause', hash_ids, 'pause')
+        return not failed
 
     def resume_torrent(self, hash_id: str) -> bool:
         """恢复种子"""
-        if not self._ensure_login():
-            return False
+        return self.resume_torrents([hash_id])
 
-        try:
-            resume_url = urljoin(self.base_url, '/api/v2/torrents/resume')
-            params = {'hashes': hash_id}
+    def resume_torrents(self, hash_ids: Iterable[str]) -> bool:
+        """批量恢复种子"""
+        _, failed = self._post_hashes('/api/v2/torrents/resume', hash_ids, 'resume')
+        return not failed
 
-            response = self.session.post(resume_url, data=params)
+    def sync_torrents(self) -> dict[str, dict[str, Any]] | None:
+        """通过 sync/maindata 增量同步所有种子，返回 hash（小写）到种子信息的映射"""
+        if not self._ensure_login():
+            return None
 
-            if response.status_code == 200:
-                logger.info(f'Torrent {hash_id} resumed successfully')
-                return True
-            else:
-                logger.error(f'Resume torrent failed: {response.status_code} - {response.text}')
-                return False
+        # 同一时间只允许一个同步请求，保证 rid 顺序一致
+        with self._sync_lock:
+            try:
+                rid = self._sync_mirror.rid
 
-        except Exception as e:
-            logger.error(f'Resume torrent exception: {e}')
-            return False
+                response = self._request(
+                    'get', '/api/v2/sync/maindata', params={'rid': rid}
+                )
+
+                if response.status_code != 200:
+                    logger.error(f'Sync maindata failed: {response.status_code} - {response.text}')
+                    self._sync_mirror.reset()
+                    return None
+
+                data = response.json()
+                self._sync_mirror.apply(data)
+                logger.debug(
+                    f'🔄 qBittorrent 同步完成: rid {rid} → {self._sync_mirror.rid}, '
+                    f'{"全量" if data.get("full_update") else "增量"}, '
+                    f'共 {len(self._sync_mirror)} 个种子'
+                )
+                return self._sync_mirror.snapshot()
+            except Exception as e:
+                logger.error(f'Sync maindata exception: {e}')
+                self._sync_mirror.reset()
+                return None
 
     # ==================== Additional Methods ====================
 
@@ -325,12 +438,11 @@ class QBitAdapter(IDownloadClient):
             return None
 
         try:
-            info_url = urljoin(self.base_url, '/api/v2/torrents/info')
             params = {}
             if filter_type:
                 params['filter'] = filter_type
 
-            response = self.session.get(info_url, params=params)
+            response = self._request('get', '/api/v2/torrents/info', params=params)
 
             if response.status_code == 200:
                 return response.json()
@@ -353,74 +465,7 @@ class QBitAdapter(IDownloadClient):
         if not files:
             logger.warning(f'⚠️ 未获取到torrent文件列表: {hash_id[:8]}...')
             return None
-
-        try:
-            folders = set()
-            for file_info in files:
-                file_path = file_info.get('name', '')
-                if not file_path:
-                    continue
-
-                path_parts = file_path.replace('\\', '/').split('/')
-                for i in range(1, len(path_parts)):
-                    folder_path = '/'.join(path_parts[:i])
-                    if folder_path:
-                        folders.add(folder_path)
-
-            if not folders:
-                logger.debug('📁 Torrent没有子文件夹结构')
-                return '（无子文件夹）'
-
-            folder_tree = self._build_folder_tree(sorted(folders))
-
-            logger.debug(f'📁 获取到 {len(folders)} 个文件夹')
-            return folder_tree
-
-        except Exception as e:
-            logger.error(f'❌ 构建文件夹结构失败: {e}')
-            return None
-
-    def _build_folder_tree(self, folders: list[str]) -> str:
-        """将文件夹路径列表转换为树形结构字符串"""
-        if not folders:
-            return ''
-
-        tree_dict = {}
-        for folder in folders:
-            parts = folder.split('/')
-            current = tree_dict
-            for part in parts:
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
-
-        lines = []
-        self._format_tree(tree_dict, lines, prefix='', is_last=True)
-        return '\n'.join(lines)
-
-    def _format_tree(
-        self,
-        node: dict,
-        lines: list[str],
-        prefix: str = '',
-        is_last: bool = True
-    ):
-        """递归格式化树形结构"""
-        items = list(node.items())
-        for i, (name, children) in enumerate(items):
-            is_last_item = (i == len(items) - 1)
-
-            if is_last_item:
-                current_prefix = '└── '
-                child_prefix = '    '
-            else:
-                current_prefix = '├── '
-                child_prefix = '│   '
-
-            lines.append(f'{prefix}{current_prefix}{name}/')
-
-            if children:
-                self._format_tree(children, lines, prefix + child_prefix, is_last_item)
+        return build_folder_structure(files)
 
 
 def get_torrent_hash_from_magnet(magnet_link: str) -> str | None:
@@ -0,0 +1,82 @@
+"""
+qBittorrent sync mirror module.
+
+Maintains a local copy of all torrents from the qBittorrent
+``/api/v2/sync/maindata`` endpoint, applying the incremental deltas
+identified by the response id (rid).
+"""
+
+import logging
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class TorrentSyncMirror:
+    """
+    rid 增量同步的种子镜像。
+
+    qBittorrent 的 sync/maindata 接口在 rid=0 时返回全量数据，之后传入上次
+    返回的 rid 只返回变化的字段和被删除的种子。本类负责把这些增量应用到
+    本地镜像上，线程安全。
+
+    Example:
+        >>> mirror = TorrentSyncMirror()
+        >>> mirror.apply(client_get('/api/v2/sync/maindata', rid=mirror.rid))
+        >>> mirror.snapshot()['abc123']['progress']
+        0.42
+    """
+
+    def __init__(self):
+        """初始化空镜像（rid=0，下次请求获取全量数据）"""
+        self._rid = 0
+        self._torrents: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def rid(self) -> int:
+        """下次请求使用的 rid"""
+        with self._lock:
+            return self._rid
+
+    def apply(self, data: dict[str, Any]) -> None:
+        """
+        应用一次 maindata 响应。
+
+        Args:
+            data: sync/maindata 返回的 JSON
+        """
+        with self._lock:
+            if data.get('full_update'):
+                self._torrents = {}
+
+            for hash_id, changes in (data.get('torrents') or {}).items():
+                key = hash_id.lower()
+                torrent = self._torrents.setdefault(key, {'hash': key})
+                torrent.update(changes)
+
+            for hash_id in data.get('torrents_removed') or []:
+                self._torrents.pop(hash_id.lower(), None)
+
+            self._rid = data.get('rid', self._rid)
+
+    def reset(self) -> None:
+        """丢弃镜像，下次请求重新获取全量数据"""
+        with self._lock:
+            self._rid = 0
+            self._torrents = {}
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        获取当前镜像的副本。
+
+        Returns:
+            hash（小写）到种子信息的映射
+        """
+        with self._lock:
+            return {hash_id: dict(torrent) for hash_id, torrent in self._torrents.items()}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._torrents)
@@ -0,0 +1,184 @@
+"""
+Torrent metainfo module.
+
+Decodes .torrent (bencode) data and derives the file list locally,
+in the same shape as qBittorrent's ``/api/v2/torrents/files`` response,
+so the files of a torrent are known without waiting for the client.
+"""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def bdecode(data: bytes, idx: int = 0) -> tuple[Any, int]:
+    """
+    Decode bencoded data starting at the given index.
+
+    Args:
+        data: Bencoded data.
+        idx: Starting index.
+
+    Returns:
+        Tuple of (decoded_value, next_index).
+    """
+    char = chr(data[idx])
+
+    if char == 'd':  # Dictionary
+        idx += 1
+        result = {}
+        while chr(data[idx]) != 'e':
+            key, idx = bdecode(data, idx)
+            value, idx = bdecode(data, idx)
+            result[key] = value
+        return result, idx + 1
+
+    elif char == 'l':  # List
+        idx += 1
+        result = []
+        while chr(data[idx]) != 'e':
+            value, idx = bdecode(data, idx)
+            result.append(value)
+        return result, idx + 1
+
+    elif char == 'i':  # Integer
+        idx += 1
+        end = data.index(b'e', idx)
+        return int(data[idx:end]), end + 1
+
+    elif char.isdigit():  # String
+        colon = data.index(b':', idx)
+        length = int(data[idx:colon])
+        idx = colon + 1
+        return data[idx:idx + length], idx + length
+
+    raise ValueError(f'Invalid bencode at position {idx}')
+
+
+def _text(value: bytes | str) -> str:
+    """将 bencode 字符串解码为文本"""
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    return value
+
+
+def files_from_info(info: dict[bytes, Any]) -> list[dict[str, Any]]:
+    """
+    从 info 字典生成文件列表。
+
+    多文件种子的路径以种子名称（根目录）开头，与 qBittorrent 默认的
+    "原始" 内容布局一致；对齐用的 padding 文件不计入。
+
+    Args:
+        info: 解码后的 info 字典（键为 bytes）
+
+    Returns:
+        [{'name': 相对路径, 'size': 字节数}, ...]，无法识别时返回空列表
+    """
+    name = _text(info.get(b'name.utf-8') or info.get(b'name') or b'')
+
+    if b'files' not in info:
+        if b'length' in info and name:
+            return [{'name': name, 'size': info[b'length']}]
+        return []
+
+    files = []
+    for entry in info[b'files']:
+        parts = entry.get(b'path.utf-8') or entry.get(b'path') or []
+        if b'p' in entry.get(b'attr', b'') or (parts and parts[0] == b'.pad'):
+            continue
+        path = '/'.join(_text(part) for part in parts)
+        if not path:
+            continue
+        files.append({
+            'name': f'{name}/{path}' if name else path,
+            'size': entry.get(b'length', 0)
+        })
+    return files
+
+
+def read_torrent_files(data: bytes) -> list[dict[str, Any]]:
+    """
+    从 .torrent 文件内容解析文件列表。
+
+    Args:
+        data: .torrent 文件内容
+
+    Returns:
+        文件列表（格式同 files_from_info），解析失败时返回空列表
+    """
+    try:
+        decoded, _ = bdecode(data)
+    except (ValueError, IndexError) as e:
+        logger.debug(f'⚠️ 解析torrent元数据失败: {e}')
+        return []
+
+    if not isinstance(decoded, dict) or not isinstance(decoded.get(b'info'), dict):
+        return []
+    return files_from_info(decoded[b'info'])
+
+
+def build_folder_structure(files: list[dict[str, Any]]) -> str | None:
+    """
+    根据文件列表生成文件夹树形结构（只包含文件夹，不包含文件）。
+
+    Args:
+        files: 文件列表（name 为相对路径）
+
+    Returns:
+        树形结构字符串；没有子文件夹时返回 '（无子文件夹）'，出错时返回 None
+    """
+    try:
+        folders = set()
+        for file_info in files:
+            file_path = file_info.get('name', '')
+            if not file_path:
+                continue
+
+            path_parts = file_path.replace('\\', '/').split('/')
+            for i in range(1, len(path_parts)):
+                folder_path = '/'.join(path_parts[:i])
+                if folder_path:
+                    folders.add(folder_path)
+
+        if not folders:
+            logger.debug('📁 Torrent没有子文件夹结构')
+            return '（无子文件夹）'
+
+        logger.debug(f'📁 获取到 {len(folders)} 个文件夹')
+        return _build_folder_tree(sorted(folders))
+
+    except Exception as e:
+        logger.error(f'❌ 构建文件夹结构失败: {e}')
+        return None
+
+
+def _build_folder_tree(folders: list[str]) -> str:
+    """将文件夹路径列表转换为树形结构字符串"""
+    tree_dict = {}
+    for folder in folders:
+        current = tree_dict
+        for part in folder.split('/'):
+            current = current.setdefault(part, {})
+
+    lines = []
+    _format_tree(tree_dict, lines, prefix='')
+    return '\n'.join(lines)
+
+
+def _format_tree(node: dict, lines: list[str], prefix: str = '') -> None:
+    """递归格式化树形结构"""
+    items = list(node.items())
+    for i, (name, children) in enumerate(items):
+        if i == len(items) - 1:
+            current_prefix = '└── '
+            child_prefix = '    '
+        else:
+            current_prefix = '├── '
+            child_prefix = '│   '
+
+        lines.append(f'{prefix}{current_prefix}{name}/')
+
+        if children:
+            _format_tree(children, lines, prefix + child_prefix)
@@ -31,7 +31,7 @@ class DiscordNotifier:
 
     支持的通知类型:
     - RSS 处理通知 (notify_processing_start, notify_download_task, notify_processing_complete, notify_processing_interrupted)
-    - Webhook 接收通知 (notify_webhook_received)
+    - Webhook 接收通知 (notify_webhook_received, notify_webhooks_received)
     - 硬链接通知 (notify_hardlink_created, notify_hardlink_failed)
     - AI 使用通知 (notify_ai_usage)
     - 错误通知 (notify_error)
@@ -42,6 +42,9 @@ class DiscordNotifier:
         >>> notifier.notify_hardlink_created(HardlinkNotification(...))
     """
 
+    # Discord 单条消息最多包含的 embed 数
+    MAX_EMBEDS_PER_MESSAGE = 10
+
     def __init__(
         self,
         webhook_client: DiscordWebhookClient,
@@ -189,6 +192,34 @@ class DiscordNotifier:
         if not response.success:
             logger.warning(f'⚠️ Webhook 接收通知发送失败: {response.error_message}')
 
+    def notify_webhooks_received(
+        self,
+        notifications: list[WebhookReceivedNotification]
+    ) -> None:
+        """
+        批量通知收到了 Webhook，每条消息最多合并 MAX_EMBEDS_PER_MESSAGE 个 embed。
+
+        Args:
+            notifications: Webhook 接收通知数据列表
+        """
+        embeds = [
+            self._embed_builder.build_webhook_received_embed(
+                torrent_id=notification.torrent_id,
+                save_path=notification.save_path,
+                content_path=notification.content_path,
+                torrent_name=notification.torrent_name
+            )
+            for notification in notifications
+        ]
+
+        for i in range(0, len(embeds), self.MAX_EMBEDS_PER_MESSAGE):
+            response = self._client.send(
+                embeds=embeds[i:i + self.MAX_EMBEDS_PER_MESSAGE],
+                channel_type='hardlink'
+            )
+            if not response.success:
+                logger.warning(f'⚠️ Webhook 接收通知发送失败: {response.error_message}')
+
     # ==================== 硬链接通知方法 ====================
 
     def notify_hardlink_created(self, notification: HardlinkNotification) -> None:
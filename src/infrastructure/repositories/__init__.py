@@ -8,17 +8,31 @@ from src.infrastructure.repositories.ai_key_repository import AIKeyRepository, a
 from src.infrastructure.repositories.anime_repository import AnimeRepository
 from src.infrastructure.repositories.download_repository import DownloadRepository
 from src.infrastructure.repositories.history_repository import HistoryRepository
+from src.infrastructure.repositories.queue_event_repository import QueueEventRepository
 from src.infrastructure.repositories.subtitle_repository import (
     SubtitleRepository,
     subtitle_repository,
 )
+from src.infrastructure.repositories.title_parse_cache_repository import (
+    TitleParseCacheRepository,
+    title_parse_cache_repository,
+)
+from src.infrastructure.repositories.torrent_hash_cache_repository import (
+    TorrentHashCacheRepository,
+    torrent_hash_cache_repository,
+)
 
 __all__ = [
     'AnimeRepository',
     'DownloadRepository',
     'HistoryRepository',
+    'QueueEventRepository',
     'AIKeyRepository',
     'ai_key_repository',
     'SubtitleRepository',
     'subtitle_repository',
+    'TitleParseCacheRepository',
+    'title_parse_cache_repository',
+    'TorrentHashCacheRepository',
+    'torrent_hash_cache_repository',
 ]
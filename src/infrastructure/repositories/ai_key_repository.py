@@ -4,13 +4,16 @@ AI Key usage repository module.
 Contains the AIKeyRepository class for managing AI API key usage logging.
 """
 
+import atexit
 import logging
+import threading
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from sqlalchemy import desc
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.core.exceptions import DatabaseError
 from src.infrastructure.database.models import AIKeyDailyCount, AIKeyUsageLog
 from src.infrastructure.database.session import db_manager
 
@@ -65,7 +68,28 @@ def _expand_purpose_to_all_related(purpose: str) -> list[str]:
 
 
 class AIKeyRepository:
-    """AI Key 使用记录 Repository"""
+    """
+    AI Key 使用记录 Repository
+
+    log_usage 只写入内存缓冲区，由后台线程按时间间隔或缓冲数量
+    批量写入数据库，AI 请求路径上不再有 SQLite 写操作。
+    读取方法会先刷新缓冲区，进程退出时也会刷新。
+    """
+
+    # 写入缓冲配置
+    FLUSH_INTERVAL_SECONDS = 2.0  # 定时刷新间隔
+    FLUSH_BATCH_SIZE = 50         # 缓冲达到此数量时立即刷新
+    MAX_BUFFERED_LOGS = 5000      # 写入失败时最多保留的日志数
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 串行化刷新，保证每日计数按顺序写入
+        self._flush_lock = threading.Lock()
+        self._pending_logs: list[dict[str, Any]] = []
+        # {(purpose, key_id, date_utc): count}，只保留最大值
+        self._pending_counts: dict[tuple[str, str, str], int] = {}
+        self._wake = threading.Event()
+        self._flusher: threading.Thread | None = None
 
     def log_usage(
         self,
@@ -81,9 +105,9 @@ class AIKeyRepository:
         response_time_ms: int = 0,
         rpm_at_call: int = 0,
         rpd_at_call: int = 0,
-    ) -> int | None:
+    ) -> None:
         """
-        记录一次 AI Key 使用
+        记录一次 AI Key 使用（写入缓冲区，异步落库）
 
         Args:
             purpose: 用途 (title_parse, multi_file_rename)
@@ -98,58 +122,117 @@ class AIKeyRepository:
             response_time_ms: 响应时间（毫秒）
             rpm_at_call: 调用时的 RPM 计数
             rpd_at_call: 调用时的 RPD 计数
-
-        Returns:
-            新记录的 ID，失败返回 None
         """
-        today = _utc_date_str()
-
-        try:
-            with db_manager.session() as session:
-                # 记录使用日志
-                log_entry = AIKeyUsageLog(
-                    purpose=purpose,
-                    key_id=key_id,
-                    key_name=key_name or '',
-                    model=model or '',
-                    anime_title=(anime_title or '')[:500],
-                    context_summary=(context_summary or '')[:500],
-                    success=1 if success else 0,
-                    error_code=error_code,
-                    error_message=(error_message or '')[:1000] if not success else '',
-                    response_time_ms=response_time_ms,
-                    rpm_at_call=rpm_at_call,
-                    rpd_at_call=rpd_at_call,
-                )
-                session.add(log_entry)
-
-                # 同步更新每日计数表（用于启动时恢复）
-                daily_record = (
-                    session.query(AIKeyDailyCount)
-                    .filter(
-                        AIKeyDailyCount.purpose == purpose,
-                        AIKeyDailyCount.key_id == key_id,
-                        AIKeyDailyCount.date_utc == today,
-                    )
-                    .first()
-                )
+        now = datetime.now(UTC)
+        entry = {
+            'purpose': purpose,
+            'key_id': key_id,
+            'key_name': key_name or '',
+            'model': model or '',
+            'anime_title': (anime_title or '')[:500],
+            'context_summary': (context_summary or '')[:500],
+            'success': 1 if success else 0,
+            'error_code': error_code,
+            'error_message': (error_message or '')[:1000] if not success else '',
+            'response_time_ms': response_time_ms,
+            'rpm_at_call': rpm_at_call,
+            'rpd_at_call': rpd_at_call,
+            # 与 current_timestamp 一致，存储不带时区的 UTC 时间
+            'created_at': now.replace(tzinfo=None),
+        }
+        count_key = (purpose, key_id, now.date().isoformat())
+
+        with self._lock:
+            self._pending_logs.append(entry)
+            # 每日计数（用于启动时恢复）保留最新值，手动重置后的计数也会写入
+            self._pending_counts[count_key] = rpd_at_call
+            buffered = len(self._pending_logs)
+            self._ensure_flusher()
+
+        if buffered >= self.FLUSH_BATCH_SIZE:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """
+        将缓冲的使用日志和每日计数在一个事务中写入数据库
 
-                if daily_record:
-                    daily_record.count = rpd_at_call
-                else:
-                    daily_record = AIKeyDailyCount(
-                        purpose=purpose,
-                        key_id=key_id,
-                        date_utc=today,
-                        count=rpd_at_call,
-                    )
-                    session.add(daily_record)
+        写入失败时数据放回缓冲区，下次刷新重试。
 
-                session.flush()
-                return log_entry.id
-        except SQLAlchemyError as e:
-            logger.error(f'Failed to log AI key usage: {e}')
-            return None
+        Returns:
+            写入的日志条数
+        """
+        with self._flush_lock:
+            with self._lock:
+                logs, self._pending_logs = self._pending_logs, []
+                counts, self._pending_counts = self._pending_counts, {}
+
+            if not logs and not counts:
+                return 0
+
+            try:
+                with db_manager.session() as session:
+                    session.add_all([AIKeyUsageLog(**entry) for entry in logs])
+
+                    for (purpose, key_id, date_utc), count in counts.items():
+                        daily_record = (
+                            session.query(AIKeyDailyCount)
+                            .filter(
+                                AIKeyDailyCount.purpose == purpose,
+                                AIKeyDailyCount.key_id == key_id,
+                                AIKeyDailyCount.date_utc == date_utc,
+                            )
+                            .first()
+                        )
+                        if daily_record:
+                            daily_record.count = count
+                        else:
+                            session.add(AIKeyDailyCount(
+                                purpose=purpose,
+                                key_id=key_id,
+                                date_utc=date_utc,
+                                count=count,
+                            ))
+                logger.debug(f'💾 已批量写入 {len(logs)} 条 AI Key 使用记录')
+                return len(logs)
+            except (SQLAlchemyError, DatabaseError) as e:
+                logger.error(f'Failed to flush AI key usage logs: {e}')
+                with self._lock:
+                    self._pending_logs = (logs + self._pending_logs)[-self.MAX_BUFFERED_LOGS:]
+                    for count_key, count in counts.items():
+                        # 失败期间写入的新计数更新，优先保留
+                        self._pending_counts.setdefault(count_key, count)
+                return 0
+
+    def close(self) -> None:
+        """停止后台刷新线程并写入剩余缓冲"""
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+        if flusher:
+            self._wake.set()
+            flusher.join(timeout=self.FLUSH_INTERVAL_SECONDS * 2)
+        self.flush()
+
+    def _ensure_flusher(self) -> None:
+        """按需启动后台刷新线程（需持有锁）"""
+        if self._flusher is not None:
+            return
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            name='AIKeyUsageFlusher',
+            daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        """后台刷新线程主循环"""
+        current = threading.current_thread()
+        while self._flusher is current:
+            self._wake.wait(self.FLUSH_INTERVAL_SECONDS)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f'AI key usage flush loop error: {e}')
 
     def get_usage_history(
         self,
@@ -166,6 +249,8 @@ class AIKeyRepository:
         Returns:
             使用记录列表
         """
+        self.flush()
+
         try:
             # 扩展 purpose 到所有相关用途（支持共享 Pool 查询）
             purposes = _expand_purpose_to_all_related(purpose)
@@ -222,6 +307,8 @@ class AIKeyRepository:
         Returns:
             包含统计信息的字典
         """
+        self.flush()
+
         try:
             # 扩展 purpose 到所有相关用途（支持共享 Pool 查询）
             purposes = _expand_purpose_to_all_related(purpose)
@@ -349,6 +436,8 @@ class AIKeyRepository:
         if date_utc is None:
             date_utc = _utc_date_str()
 
+        self.flush()
+
         try:
             with db_manager.session() as session:
                 record = (
@@ -424,6 +513,8 @@ class AIKeyRepository:
         if date_utc is None:
             date_utc = _utc_date_str()
 
+        self.flush()
+
         try:
             with db_manager.session() as session:
                 records = (
@@ -490,3 +581,5 @@ class AIKeyRepository:
 
 # 全局实例
 ai_key_repository = AIKeyRepository()
+# 进程退出时写入剩余缓冲
+atexit.register(ai_key_repository.close)
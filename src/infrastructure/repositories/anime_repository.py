@@ -535,6 +535,26 @@ class AnimeRepository(IAnimeRepository):
                 }
             return None
 
+    def get_title_patterns(self) -> list[dict[str, Any]]:
+        """获取所有正则模式及其字幕组（按更新时间倒序，用于本地标题解析）"""
+        with db_manager.session() as session:
+            rows = (
+                session.query(AnimePattern, AnimeInfo.subtitle_group)
+                .join(AnimeInfo, AnimePattern.anime_id == AnimeInfo.id)
+                .order_by(AnimePattern.updated_at.desc())
+                .all()
+            )
+            return [
+                {
+                    'subtitle_group': subtitle_group,
+                    'title_group_regex': pattern.title_group_regex,
+                    'full_title_regex': pattern.full_title_regex,
+                    'short_title_regex': pattern.short_title_regex,
+                    'episode_regex': pattern.episode_regex,
+                }
+                for pattern, subtitle_group in rows
+            ]
+
     def count_all(self) -> int:
         """统计所有动漫数量"""
         with db_manager.session() as session:
@@ -25,6 +25,9 @@ from src.infrastructure.database.session import db_manager
 
 logger = logging.getLogger(__name__)
 
+# 批量查询 hash 时每条 IN (...) 语句的参数数量上限（低于 SQLite 默认变量限制）
+HASH_LOOKUP_CHUNK_SIZE = 500
+
 
 class DownloadRepository(IDownloadRepository):
     """下载状态仓库"""
@@ -94,6 +97,23 @@ class DownloadRepository(IDownloadRepository):
                 return self._to_entity(download)
             return None
 
+    def get_by_hashes(self, hash_ids: list[str]) -> dict[str, DownloadRecord]:
+        """批量根据hash获取下载状态"""
+        unique_hashes = list(dict.fromkeys(h for h in hash_ids if h))
+        records: dict[str, DownloadRecord] = {}
+        if not unique_hashes:
+            return records
+
+        with db_manager.session() as session:
+            for i in range(0, len(unique_hashes), HASH_LOOKUP_CHUNK_SIZE):
+                chunk = unique_hashes[i:i + HASH_LOOKUP_CHUNK_SIZE]
+                downloads = session.query(DownloadStatus).filter(
+                    DownloadStatus.hash_id.in_(chunk)
+                ).all()
+                for download in downloads:
+                    records[download.hash_id] = self._to_entity(download)
+        return records
+
     def get_by_id(self, record_id: int) -> DownloadRecord | None:
         """根据ID获取下载状态"""
         with db_manager.session() as session:
@@ -162,6 +182,33 @@ class DownloadRepository(IDownloadRepository):
                 return True
             return False
 
+    def update_statuses(
+        self,
+        updates: list[tuple[str, str, datetime | None]]
+    ) -> int:
+        """在一个事务中批量更新下载状态，返回更新的记录数"""
+        pending = {hash_id: (status, completion_time) for hash_id, status, completion_time in updates}
+        if not pending:
+            return 0
+
+        updated = 0
+        now = datetime.now(UTC)
+        with db_manager.session() as session:
+            hash_ids = list(pending)
+            for i in range(0, len(hash_ids), HASH_LOOKUP_CHUNK_SIZE):
+                chunk = hash_ids[i:i + HASH_LOOKUP_CHUNK_SIZE]
+                downloads = session.query(DownloadStatus).filter(
+                    DownloadStatus.hash_id.in_(chunk)
+                ).all()
+                for download in downloads:
+                    status, completion_time = pending[download.hash_id]
+                    download.status = status
+                    if completion_time:
+                        download.completion_time = completion_time
+                    download.updated_at = now
+                    updated += 1
+        return updated
+
     def move_to_history(self, hash_id: str) -> bool:
         """将下载记录移动到历史表"""
         with db_manager.session() as session:
@@ -200,6 +247,22 @@ class DownloadRepository(IDownloadRepository):
             count = session.query(DownloadStatus).filter_by(hash_id=hash_id).count()
             return count > 0
 
+    def existing_hashes(self, hash_ids: list[str]) -> set[str]:
+        """批量检查 hash 是否已存在，返回已存在的 hash 集合"""
+        unique_hashes = list(dict.fromkeys(h for h in hash_ids if h))
+        if not unique_hashes:
+            return set()
+
+        found: set[str] = set()
+        with db_manager.session() as session:
+            for i in range(0, len(unique_hashes), HASH_LOOKUP_CHUNK_SIZE):
+                chunk = unique_hashes[i:i + HASH_LOOKUP_CHUNK_SIZE]
+                rows = session.query(DownloadStatus.hash_id).filter(
+                    DownloadStatus.hash_id.in_(chunk)
+                ).all()
+                found.update(row.hash_id for row in rows)
+        return found
+
     # ==================== Legacy Methods ====================
 
     def insert_download_status(
@@ -28,6 +28,9 @@ from src.infrastructure.database.session import db_manager
 
 logger = logging.getLogger(__name__)
 
+# 批量查询路径时每条 IN (...) 语句的参数数量上限（低于 SQLite 默认变量限制）
+LINK_LOOKUP_CHUNK_SIZE = 500
+
 
 class HistoryRepository(IHardlinkRepository):
     """历史记录仓库"""
@@ -93,6 +96,61 @@ class HistoryRepository(IHardlinkRepository):
             session.flush()
             return hardlink.id
 
+    def save_many(
+        self,
+        records: list[HardlinkRecord],
+        failures: list[tuple[HardlinkRecord, str]] | None = None
+    ) -> int:
+        """在一个事务中批量保存硬链接记录及尝试记录"""
+        failures = failures or []
+        if not records and not failures:
+            return 0
+
+        saved = 0
+        with db_manager.session() as session:
+            targets = [record.hardlink_path for record in records]
+            existing = set()
+            for i in range(0, len(targets), LINK_LOOKUP_CHUNK_SIZE):
+                chunk = targets[i:i + LINK_LOOKUP_CHUNK_SIZE]
+                rows = session.query(
+                    Hardlink.original_file_path, Hardlink.hardlink_path
+                ).filter(Hardlink.hardlink_path.in_(chunk)).all()
+                existing.update((row.original_file_path, row.hardlink_path) for row in rows)
+
+            for record in records:
+                key = (record.original_file_path, record.hardlink_path)
+                if key not in existing:
+                    existing.add(key)
+                    session.add(Hardlink(
+                        anime_id=record.anime_id,
+                        torrent_hash=record.torrent_hash,
+                        original_file_path=record.original_file_path,
+                        hardlink_path=record.hardlink_path,
+                        file_size=record.file_size
+                    ))
+                    saved += 1
+                session.add(HardlinkAttempt(
+                    anime_id=record.anime_id,
+                    torrent_hash=record.torrent_hash,
+                    original_file_path=record.original_file_path,
+                    target_path=record.hardlink_path,
+                    file_size=record.file_size,
+                    success=1,
+                    link_method=record.link_method
+                ))
+
+            for record, reason in failures:
+                session.add(HardlinkAttempt(
+                    anime_id=record.anime_id,
+                    torrent_hash=record.torrent_hash,
+                    original_file_path=record.original_file_path,
+                    target_path=record.hardlink_path,
+                    file_size=record.file_size or None,
+                    success=0,
+                    failure_reason=reason
+                ))
+        return saved
+
     def delete(self, hardlink_id: int) -> bool:
         """删除硬链接记录"""
         with db_manager.session() as session:
@@ -0,0 +1,170 @@
+"""
+Queue event repository module.
+
+Contains the QueueEventRepository class, the durable backing store of
+the in-memory queue workers (write-ahead log with ack-on-success).
+"""
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from src.infrastructure.database.models import QueueEventRecord
+from src.infrastructure.database.session import db_manager
+
+logger = logging.getLogger(__name__)
+
+
+class QueueEventRepository:
+    """队列事件持久化仓库"""
+
+    STATUS_PENDING = 'pending'
+    STATUS_FAILED = 'failed'
+
+    def append(
+        self,
+        queue_name: str,
+        queue_id: str,
+        event_type: str,
+        payload_type: str,
+        payload: str,
+        metadata: str,
+        received_at: datetime,
+        priority: int | None = None,
+        deadline: datetime | None = None
+    ) -> None:
+        """
+        写入一个待处理事件。
+
+        Args:
+            queue_name: 队列名称。
+            queue_id: 事件 ID。
+            event_type: 事件类型。
+            payload_type: 载荷类型名称。
+            payload: JSON 序列化后的载荷。
+            metadata: JSON 序列化后的元数据。
+            received_at: 事件接收时间（UTC）。
+            priority: 事件优先级（EventPriority）。
+            deadline: 事件截止时间（UTC），超过后丢弃。
+        """
+        with db_manager.session() as session:
+            session.add(QueueEventRecord(
+                queue_name=queue_name,
+                queue_id=queue_id,
+                event_type=event_type,
+                payload_type=payload_type,
+                payload=payload,
+                event_metadata=metadata,
+                status=self.STATUS_PENDING,
+                priority=priority,
+                deadline=deadline,
+                received_at=received_at
+            ))
+
+    def update(
+        self,
+        queue_name: str,
+        queue_id: str,
+        payload: str,
+        priority: int | None,
+        deadline: datetime | None
+    ) -> bool:
+        """
+        更新待处理事件（重复事件合并进来之后调用）。
+
+        Args:
+            queue_name: 队列名称。
+            queue_id: 事件 ID。
+            payload: JSON 序列化后的载荷。
+            priority: 事件优先级（EventPriority）。
+            deadline: 事件截止时间（UTC），None 表示不再过期。
+
+        Returns:
+            是否存在该记录。
+        """
+        with db_manager.session() as session:
+            record = session.query(QueueEventRecord).filter_by(
+                queue_name=queue_name, queue_id=queue_id
+            ).first()
+            if record:
+                record.payload = payload
+                record.priority = priority
+                record.deadline = deadline
+                return True
+            return False
+
+    def ack(self, queue_name: str, queue_id: str) -> bool:
+        """确认事件已处理完成（删除记录），返回是否存在该记录"""
+        return self.ack_many(queue_name, [queue_id]) > 0
+
+    def ack_many(self, queue_name: str, queue_ids: list[str]) -> int:
+        """批量确认事件，返回删除的记录数"""
+        if not queue_ids:
+            return 0
+        with db_manager.session() as session:
+            return session.query(QueueEventRecord).filter(
+                QueueEventRecord.queue_name == queue_name,
+                QueueEventRecord.queue_id.in_(queue_ids)
+            ).delete(synchronize_session=False)
+
+    def mark_failed(self, queue_name: str, queue_id: str, error_message: str) -> bool:
+        """将事件标记为处理失败（保留记录用于排查，不会重放）"""
+        with db_manager.session() as session:
+            record = session.query(QueueEventRecord).filter_by(
+                queue_name=queue_name, queue_id=queue_id
+            ).first()
+            if record:
+                record.status = self.STATUS_FAILED
+                record.error_message = error_message[:1000] if error_message else None
+                return True
+            return False
+
+    def load_pending(self, queue_name: str) -> list[dict[str, Any]]:
+        """
+        加载未完成的事件（包括重启前正在处理的事件）。
+
+        Args:
+            queue_name: 队列名称。
+
+        Returns:
+            按写入顺序排列的事件字典列表。
+        """
+        with db_manager.session() as session:
+            records = session.query(QueueEventRecord).filter_by(
+                queue_name=queue_name, status=self.STATUS_PENDING
+            ).order_by(QueueEventRecord.id).all()
+            return [
+                {
+                    'queue_id': record.queue_id,
+                    'event_type': record.event_type,
+                    'payload_type': record.payload_type,
+                    'payload': record.payload,
+                    'metadata': record.event_metadata,
+                    'received_at': record.received_at,
+                    'priority': record.priority,
+                    'deadline': record.deadline,
+                }
+                for record in records
+            ]
+
+    def compact(self, queue_name: str, failed_retention_days: int = 7) -> int:
+        """
+        压缩队列日志：删除超过保留期的失败事件。
+
+        Args:
+            queue_name: 队列名称。
+            failed_retention_days: 失败事件的保留天数。
+
+        Returns:
+            删除的记录数。
+        """
+        cutoff = datetime.now(UTC) - timedelta(days=failed_retention_days)
+        with db_manager.session() as session:
+            deleted = session.query(QueueEventRecord).filter(
+                QueueEventRecord.queue_name == queue_name,
+                QueueEventRecord.status == self.STATUS_FAILED,
+                QueueEventRecord.updated_at < cutoff
+            ).delete(synchronize_session=False)
+            if deleted:
+                logger.debug(f'🧹 [{queue_name}] 清理了 {deleted} 条过期的失败队列事件')
+            return deleted
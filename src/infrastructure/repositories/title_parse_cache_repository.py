@@ -0,0 +1,111 @@
+"""
+Title parse cache repository module.
+
+Contains the TitleParseCacheRepository class for persisting AI title
+parse results used by AITitleParser.
+"""
+
+import logging
+
+from src.infrastructure.database.models import TitleParseCache
+from src.infrastructure.database.session import db_manager
+
+logger = logging.getLogger(__name__)
+
+
+class TitleParseCacheRepository:
+    """AI 标题解析结果缓存仓库"""
+
+    def get(self, cache_key: str, min_cached_at: float) -> tuple[str, float] | None:
+        """
+        获取未过期的缓存结果。
+
+        Args:
+            cache_key: 缓存键。
+            min_cached_at: 最早的有效缓存时间戳，更早的条目视为过期。
+
+        Returns:
+            (result_json, cached_at)，不存在或已过期时返回 None。
+        """
+        with db_manager.session() as session:
+            row = session.query(TitleParseCache).filter(
+                TitleParseCache.cache_key == cache_key,
+                TitleParseCache.cached_at >= min_cached_at
+            ).first()
+            return (row.result, row.cached_at) if row else None
+
+    def save(
+        self,
+        cache_key: str,
+        prompt_version: str,
+        result: str,
+        cached_at: float
+    ) -> None:
+        """
+        写入缓存结果（已存在则覆盖）。
+
+        Args:
+            cache_key: 缓存键。
+            prompt_version: 生成结果时使用的提示词版本。
+            result: JSON 序列化后的解析结果。
+            cached_at: 缓存时间戳。
+        """
+        with db_manager.session() as session:
+            row = session.query(TitleParseCache).filter_by(cache_key=cache_key).first()
+            if row:
+                row.prompt_version = prompt_version
+                row.result = result
+                row.cached_at = cached_at
+            else:
+                session.add(TitleParseCache(
+                    cache_key=cache_key,
+                    prompt_version=prompt_version,
+                    result=result,
+                    cached_at=cached_at
+                ))
+
+    def prune(
+        self,
+        max_entries: int,
+        min_cached_at: float,
+        prompt_version: str | None = None
+    ) -> int:
+        """
+        删除过期、提示词版本已变更以及超出容量的最旧条目。
+
+        Args:
+            max_entries: 保留的最大条目数。
+            min_cached_at: 早于该时间戳的条目将被删除。
+            prompt_version: 当前提示词版本，其他版本的条目将被删除（None 表示不按版本清理）。
+
+        Returns:
+            删除的条目数。
+        """
+        with db_manager.session() as session:
+            stale = TitleParseCache.cached_at < min_cached_at
+            if prompt_version is not None:
+                stale = stale | (TitleParseCache.prompt_version != prompt_version)
+            deleted = session.query(TitleParseCache).filter(stale).delete(
+                synchronize_session=False
+            )
+
+            overflow = session.query(TitleParseCache.id).order_by(
+                TitleParseCache.cached_at.desc()
+            ).offset(max_entries).all()
+            if overflow:
+                deleted += session.query(TitleParseCache).filter(
+                    TitleParseCache.id.in_([row.id for row in overflow])
+                ).delete(synchronize_session=False)
+
+            if deleted:
+                logger.debug(f'🧹 清理了 {deleted} 条过期的标题解析缓存')
+            return deleted
+
+    def clear(self) -> int:
+        """清空所有缓存条目，返回删除的条目数"""
+        with db_manager.session() as session:
+            return session.query(TitleParseCache).delete()
+
+
+# 全局实例
+title_parse_cache_repository = TitleParseCacheRepository()
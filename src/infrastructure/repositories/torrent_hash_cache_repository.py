@@ -0,0 +1,100 @@
+"""
+Torrent hash cache repository module.
+
+Contains the TorrentHashCacheRepository class for persisting the
+torrent URL to info hash cache used by HashExtractor.
+"""
+
+import logging
+
+from src.infrastructure.database.models import TorrentHashCache
+from src.infrastructure.database.session import db_manager
+
+logger = logging.getLogger(__name__)
+
+
+class TorrentHashCacheRepository:
+    """Torrent hash 缓存仓库"""
+
+    def load_recent(self, limit: int, min_cached_at: float) -> list[tuple[str, str, float]]:
+        """
+        加载未过期的缓存条目。
+
+        Args:
+            limit: 最多加载的条目数（按缓存时间从新到旧）。
+            min_cached_at: 最早的有效缓存时间戳，更早的条目视为过期。
+
+        Returns:
+            (torrent_url, hash_id, cached_at) 列表，按缓存时间从旧到新排序。
+        """
+        with db_manager.session() as session:
+            rows = session.query(TorrentHashCache).filter(
+                TorrentHashCache.cached_at >= min_cached_at
+            ).order_by(TorrentHashCache.cached_at.desc()).limit(limit).all()
+            return [(row.torrent_url, row.hash_id, row.cached_at) for row in reversed(rows)]
+
+    def save_many(self, entries: dict[str, tuple[str, float]]) -> None:
+        """
+        批量写入缓存条目（已存在则覆盖）。
+
+        Args:
+            entries: torrent_url 到 (hash_id, cached_at) 的映射。
+        """
+        if not entries:
+            return
+
+        with db_manager.session() as session:
+            existing = {
+                row.torrent_url: row
+                for row in session.query(TorrentHashCache).filter(
+                    TorrentHashCache.torrent_url.in_(list(entries.keys()))
+                ).all()
+            }
+            for url, (hash_id, cached_at) in entries.items():
+                row = existing.get(url)
+                if row:
+                    row.hash_id = hash_id
+                    row.cached_at = cached_at
+                else:
+                    session.add(TorrentHashCache(
+                        torrent_url=url,
+                        hash_id=hash_id,
+                        cached_at=cached_at
+                    ))
+
+    def prune(self, max_entries: int, min_cached_at: float) -> int:
+        """
+        删除过期条目以及超出容量的最旧条目。
+
+        Args:
+            max_entries: 保留的最大条目数。
+            min_cached_at: 早于该时间戳的条目将被删除。
+
+        Returns:
+            删除的条目数。
+        """
+        with db_manager.session() as session:
+            deleted = session.query(TorrentHashCache).filter(
+                TorrentHashCache.cached_at < min_cached_at
+            ).delete(synchronize_session=False)
+
+            overflow = session.query(TorrentHashCache.id).order_by(
+                TorrentHashCache.cached_at.desc()
+            ).offset(max_entries).all()
+            if overflow:
+                deleted += session.query(TorrentHashCache).filter(
+                    TorrentHashCache.id.in_([row.id for row in overflow])
+                ).delete(synchronize_session=False)
+
+            if deleted:
+                logger.debug(f'🧹 清理了 {deleted} 条过期的 torrent hash 缓存')
+            return deleted
+
+    def clear(self) -> int:
+        """清空所有缓存条目，返回删除的条目数"""
+        with db_manager.session() as session:
+            return session.query(TorrentHashCache).delete()
+
+
+# 全局实例
+torrent_hash_cache_repository = TorrentHashCacheRepository()
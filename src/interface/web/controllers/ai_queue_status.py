@@ -5,14 +5,17 @@ AI/队列状态控制器模块。
 """
 
 
+from dependency_injector.wiring import Provide, inject
 from flask import Blueprint, render_template, request
 
+from src.container import Container
 from src.infrastructure.ai.circuit_breaker import (
     get_breaker,
     get_breaker_for_purpose,
     get_breakers_grouped_by_name,
 )
 from src.infrastructure.ai.key_pool import get_pool, get_pool_for_purpose, get_pools_grouped_by_name
+from src.infrastructure.ai.title_parser import AITitleParser
 from src.infrastructure.repositories.ai_key_repository import ai_key_repository
 from src.infrastructure.repositories.history_repository import HistoryRepository
 from src.interface.web.utils import APIResponse, WebLogger, handle_api_errors
@@ -52,6 +55,7 @@ def get_status():
         - webhook_queue: Webhook 队列状态
         - rss_queue: RSS 队列状态
         - key_pools: 按 Pool 名称分组的 Key Pool 状态
+          （含 in_flight、waiting_count 和自适应并发上限 concurrency）
         - circuit_breakers: 按 Pool 名称分组的熔断器状态
     """
     logger.api_request('/api/ai-queue/status', 'GET')
@@ -315,6 +319,31 @@ def reset_circuit_breaker(purpose: str):
     return APIResponse.success(message=f'{purpose} 熔断器已重置')
 
 
+@ai_queue_bp.route('/api/ai-queue/title-cache/clear', methods=['POST'])
+@inject
+@handle_api_errors
+def clear_title_parse_cache(
+    title_parser: AITitleParser = Provide[Container.title_parser]
+):
+    """
+    清空 AI 标题解析结果缓存。
+
+    修改提示词或模型行为后调用，使后续解析重新请求 AI。
+
+    Returns:
+        JSON 响应:
+        - 成功: {success: true, message: '...', deleted: int}
+    """
+    logger.api_request('/api/ai-queue/title-cache/clear', 'POST')
+
+    deleted = title_parser.invalidate_cache()
+    logger.api_success(
+        '/api/ai-queue/title-cache/clear',
+        f'已清空 {deleted} 条标题解析缓存'
+    )
+    return APIResponse.success(message=f'已清空 {deleted} 条标题解析缓存', deleted=deleted)
+
+
 @ai_queue_bp.route('/api/ai-queue/queue/<queue_name>/pause', methods=['POST'])
 @handle_api_errors
 def pause_queue(queue_name: str):
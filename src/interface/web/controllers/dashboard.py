@@ -144,25 +144,18 @@ def get_hardlinks_by_hash(
 
 
 @dashboard_bp.route('/api/qbittorrent/active-downloads')
+@inject
 @handle_api_errors
-def get_active_downloads():
+def get_active_downloads(qbit: QBitAdapter = Provide[Container.qb_client]):
     """API: 获取qBittorrent活跃下载任务"""
     logger.api_request("获取qBittorrent活跃下载")
 
-    qbit = QBitAdapter()
-    if not qbit.login():
+    # 复用容器中的共享客户端，登录状态在请求之间保持
+    torrents = qbit.get_downloading_torrents()
+    if torrents is None:
         logger.api_error_msg('/api/qbittorrent/active-downloads', 'qBittorrent连接失败')
         return APIResponse.internal_error('qBittorrent连接失败')
 
-    # 获取所有种子信息
-    info_url = f"{qbit.base_url}/api/v2/torrents/info"
-    response = qbit.session.get(info_url, params={'filter': 'downloading'})
-
-    if response.status_code != 200:
-        logger.api_error_msg('/api/qbittorrent/active-downloads', 'Failed to fetch torrents')
-        return APIResponse.internal_error('Failed to fetch torrents')
-
-    torrents = response.json()
     active_downloads = []
 
     for torrent in torrents:
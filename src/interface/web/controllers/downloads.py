@@ -623,7 +623,8 @@ def api_send_webhook(
     # 入队
     evt = wq.webhook_queue_worker.enqueue_event(
         event_type='torrent_finished',
-        payload=payload
+        payload=payload,
+        force=True
     )
 
     logger.api_success(
@@ -735,7 +736,8 @@ def api_send_webhook_batch(
         # 入队
         evt = wq.webhook_queue_worker.enqueue_event(
             event_type='torrent_finished',
-            payload=payload
+            payload=payload,
+            force=True
         )
         queued_count += 1
         queued_items.append({
@@ -789,35 +791,28 @@ def api_delete_group(
     torrents_removed = 0
     db_records_deleted = 0
 
-    for download in downloads:
-        try:
-            if delete_source or delete_hardlinks:
-                result = download_manager.delete_download(
-                    download['hash_id'],
-                    delete_files=delete_source,
-                    delete_hardlinks=delete_hardlinks
-                )
-
-                if result.get('success'):
-                    if delete_source and result.get('deleted_files'):
-                        source_deleted += 1
-                        torrents_removed += 1
-                        if result.get('moved_to_history'):
-                            db_records_deleted += 1
-
-                    if delete_hardlinks and result.get('deleted_hardlinks'):
-                        hardlinks_deleted += result.get('hardlinks_deleted_count', 0)
-                else:
-                    if delete_source:
-                        source_failed += 1
-                    if delete_hardlinks:
-                        hardlinks_failed += 1
-
-        except Exception:
+    if downloads and (delete_source or delete_hardlinks):
+        # 整个分组的种子一次性从 qBittorrent 删除
+        result = download_manager.delete_downloads(
+            [download['hash_id'] for download in downloads],
+            delete_file=delete_source,
+            delete_hardlink=delete_hardlinks
+        )
+
+        if result.get('success'):
+            if delete_source:
+                torrents_removed = result.get('torrents_removed', 0)
+                source_deleted = torrents_removed
+                source_failed = result.get('torrents_failed', 0)
+                db_records_deleted = result.get('moved_to_history_count', 0)
+
+            if delete_hardlinks:
+                hardlinks_deleted = result.get('hardlinks_deleted_count', 0)
+        else:
             if delete_source:
-                source_failed += 1
+                source_failed = total_count
             if delete_hardlinks:
-                hardlinks_failed += 1
+                hardlinks_failed = total_count
 
     logger.api_success(
         '/api/downloads/group',
@@ -21,6 +21,7 @@ from src.interface.web.utils import (
     validate_json,
 )
 from src.services.download_manager import DownloadManager
+from src.services.queue.queue_worker import EventPriority
 from src.services.queue.rss_queue import RSSPayload, RSSQueueWorker, get_rss_queue
 from src.services.rss.rss_service import RSSService
 
@@ -291,7 +292,8 @@ def delete_rss_history_api(
 @inject
 @handle_api_errors
 def refresh_all_rss_api(
-    download_manager: DownloadManager = Provide[Container.download_manager]
+    download_manager: DownloadManager = Provide[Container.download_manager],
+    rss_service: RSSService = Provide[Container.rss_service]
 ):
     """API: 立即刷新所有配置的RSS"""
     # 获取配置中的所有RSS Feeds
@@ -305,6 +307,9 @@ def refresh_all_rss_api(
     # 确保队列已初始化
     worker = _ensure_rss_queue()
 
+    # 并发预取所有 Feed，队列处理时直接取用结果
+    rss_service.prefetch_feeds([feed.url for feed in rss_feeds])
+
     # 将每个 RSS feed 单独加入队列，这样可以看到每个的处理进度
     for feed in rss_feeds:
         feed_data = {
@@ -320,7 +325,8 @@ def refresh_all_rss_api(
         )
         worker.enqueue_event(
             event_type="single_feed",
-            payload=payload
+            payload=payload,
+            priority=EventPriority.INTERACTIVE
         )
 
     logger.api_success('/api/refresh_all_rss', f"已加入队列 {len(rss_feeds)} 个RSS")
@@ -504,12 +510,14 @@ def fetch_all_bangumi_rss_api(
     bangumi_feed_mapping = {}  # {parent_feed_index: {feed, episode_links, bangumi_rss}}
     episode_links = []
 
-    # 1. 从所有Mikan RSS链接中提取Episode链接
-    for feed_idx, feed in enumerate(mikan_feeds):
+    # 1. 从所有Mikan RSS链接中提取Episode链接（并发抓取）
+    fetch_results = rss_service.parse_feeds([feed.url for feed in mikan_feeds])
+    for feed_idx, (feed, fetch_result) in enumerate(zip(mikan_feeds, fetch_results, strict=True)):
         try:
-            rss_url = feed.url
-            logger.db_query("解析RSS", rss_url)
-            rss_items = rss_service.parse_feed(rss_url)
+            logger.db_query("解析RSS", feed.url)
+            if not fetch_result.success:
+                raise fetch_result.error
+            rss_items = fetch_result.items
 
             feed_episode_links = []
             for item in rss_items:
@@ -644,6 +652,7 @@ def fetch_all_bangumi_rss_api(
 
     # 6. 确保队列已初始化，将每个番组RSS加入队列
     worker = _ensure_rss_queue()
+    rss_service.prefetch_feeds([feed.url for feed in bangumi_rss_feeds])
 
     for idx, feed in enumerate(bangumi_rss_feeds):
         feed_data = {
@@ -663,9 +672,11 @@ def fetch_all_bangumi_rss_api(
                 "batch_index": idx
             }
         )
+        # 批量回填优先级最低，不阻塞手动刷新和定时检查
         worker.enqueue_event(
             event_type="single_feed",
-            payload=payload
+            payload=payload,
+            priority=EventPriority.BACKFILL
         )
 
     logger.api_success(
@@ -5,7 +5,7 @@ Handles qBittorrent webhook callbacks for torrent events.
 """
 
 import logging
-from datetime import UTC
+from datetime import UTC, datetime
 
 from flask import Blueprint, jsonify, request
 
@@ -17,6 +17,26 @@ from src.services.queue.webhook_queue import (
 logger = logging.getLogger(__name__)
 
 
+def _build_payload(data: dict) -> WebhookPayload:
+    """
+    Build a queue payload from one qBittorrent webhook event.
+
+    Args:
+        data: Webhook event data.
+
+    Returns:
+        WebhookPayload for the event.
+    """
+    return WebhookPayload(
+        hash_id=data['hash'],
+        name=data.get('name', data.get('torrent_name', '未知')),
+        category=data.get('category', ''),
+        status=data.get('status', ''),
+        save_path=data.get('save_path', data.get('content_path', '')),
+        extra_data=data
+    )
+
+
 def create_webhook_blueprint(prefix: str = '/webhook') -> Blueprint:
     """
     Create a Flask Blueprint for webhook endpoints.
@@ -35,56 +55,67 @@ def create_webhook_blueprint(prefix: str = '/webhook') -> Blueprint:
         Handle qBittorrent webhook callback.
 
         Processes torrent completion and other events from qBittorrent.
+        Accepts a single event object, a list of events or
+        ``{"events": [...]}``; duplicates of recent events are merged by
+        the queue.
 
         Returns:
             JSON response with processing status.
         """
         try:
-            data = request.json
+            data = request.get_json(silent=True)
             if not data:
                 logger.warning('⚠️ Webhook received empty data')
                 return jsonify({'error': 'No data provided'}), 400
-
-            event_type = data.get('event_type', 'unknown')
-            hash_id = data.get('hash', '')
-            torrent_name = data.get('name', data.get('torrent_name', '未知'))
-
-            logger.info('📨 收到 qBittorrent webhook')
-            logger.info(f'  事件类型: {event_type}')
-            logger.info(f'  种子Hash: {hash_id[:8]}...' if hash_id else '  种子Hash: (空)')
-            logger.info(f'  种子名称: {torrent_name}')
-
-            if not hash_id:
+            if not isinstance(data, (dict, list)):
+                logger.warning('⚠️ Webhook数据格式无效')
+                return jsonify({'error': 'Expected a JSON object or list'}), 400
+
+            is_batch = isinstance(data, list) or 'events' in data
+            events = data if isinstance(data, list) else data.get('events', [data])
+            if not isinstance(events, list):
+                logger.warning('⚠️ Webhook数据格式无效')
+                return jsonify({'error': 'Expected events to be a list'}), 400
+            events = [e for e in events if isinstance(e, dict) and e.get('hash')]
+            if not events:
                 logger.warning('⚠️ Webhook缺少hash信息')
                 return jsonify({'error': 'Missing hash'}), 400
 
-            # Get or initialize the queue worker
             queue_worker = get_webhook_queue()
+            queued = [
+                queue_worker.enqueue_event(
+                    event_type=event.get('event_type', 'unknown'),
+                    payload=_build_payload(event)
+                )
+                for event in events
+            ]
+
+            if len(events) == 1:
+                payload = queued[0].payload
+                logger.info(
+                    f'📨 收到 qBittorrent webhook: {events[0].get("event_type", "unknown")} '
+                    f'{events[0]["hash"][:8]}... {payload.name}'
+                )
+            else:
+                logger.info(f'📨 收到 qBittorrent webhook: {len(events)} 个事件')
+
+            queue_ids = list(dict.fromkeys(event.queue_id for event in queued))
+            received_at = datetime.now(UTC).isoformat()
+            if not is_batch:
+                return jsonify({
+                    'success': True,
+                    'queued': True,
+                    'queue_id': queued[0].queue_id,
+                    'received_at_utc': received_at,
+                    'queue_len': queue_worker.qsize()
+                }), 202
 
-            # Prepare payload
-            payload = WebhookPayload(
-                hash_id=hash_id,
-                name=torrent_name,
-                category=data.get('category', ''),
-                status=data.get('status', ''),
-                save_path=data.get('save_path', data.get('content_path', '')),
-                extra_data=data
-            )
-
-            # Enqueue the event using the convenience method
-            queued_event = queue_worker.enqueue_event(
-                event_type=event_type,
-                payload=payload
-            )
-
-            logger.info(f'✅ 已将事件加入队列 (queue_id: {queued_event.queue_id})')
-
-            from datetime import datetime
             return jsonify({
                 'success': True,
-                'queued': True,
-                'queue_id': queued_event.queue_id,
-                'received_at_utc': datetime.now(UTC).isoformat(),
+                'queued': len(queue_ids),
+                'coalesced': len(events) - len(queue_ids),
+                'queue_ids': queue_ids,
+                'received_at_utc': received_at,
                 'queue_len': queue_worker.qsize()
             }), 202
 
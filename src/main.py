@@ -12,8 +12,8 @@ import logging
 import os
 import sys
 import time
-from datetime import datetime, timedelta
-from threading import Thread
+from datetime import UTC, datetime, timedelta
+from threading import Lock, Thread
 
 import schedule
 
@@ -245,11 +245,11 @@ def test_repositories():
 
 def test_qbit_adapter():
     """测试 qBittorrent 适配器"""
-    from src.infrastructure.downloader.qbit_adapter import QBitAdapter
+    from src.container import container
 
     logger.info('📥 测试 qBittorrent 适配器...')
 
-    qb = QBitAdapter()
+    qb = container.qb_client()
     if qb.is_connected():
         logger.info('✅ qBittorrent 连接成功')
 
@@ -334,47 +334,61 @@ def init_queue_workers(download_manager):
     Args:
         download_manager: DownloadManager 实例
     """
+    from src.container import container
+    from src.core.config import config
     from src.services.queue.rss_queue import RSSQueueWorker, get_rss_queue
     from src.services.queue.webhook_queue import WebhookQueueWorker, get_webhook_queue
 
-    # 初始化 Webhook 队列
-    webhook_queue = get_webhook_queue()
+    queue_event_repo = container.queue_event_repo()
 
-    def handle_torrent_completed(payload):
-        """处理种子完成事件"""
-        try:
-            logger.info(f'🔔 处理种子完成事件: {payload.hash_id[:8]}...')
-            # 构建 webhook_data 字典，传递 payload 中的所有信息
-            webhook_data = {
-                'name': payload.name,
-                'save_path': payload.save_path,
-                'content_path': payload.extra_data.get('content_path', '') if payload.extra_data else '',
-                'category': payload.category,
-                'status': payload.status,
-            }
-            download_manager.handle_torrent_completed(payload.hash_id, webhook_data)
-        except Exception as e:
-            logger.error(f'❌ 处理种子完成事件失败: {e}', exc_info=True)
-            # 重新抛出异常，让 QueueWorker 正确统计失败数
-            raise
+    # 初始化 Webhook 队列（持久化，重启后重放未完成的事件）
+    webhook_queue = get_webhook_queue()
+    webhook_queue.attach_store(queue_event_repo)
+
+    def handle_torrents_completed(payloads):
+        """批量处理种子完成事件，返回失败种子的错误信息"""
+        logger.info(f'🔔 处理种子完成事件: {len(payloads)} 个')
+        # 构建 webhook_data 字典，传递 payload 中的所有信息
+        items = [
+            (
+                payload.hash_id,
+                {
+                    'name': payload.name,
+                    'save_path': payload.save_path,
+                    'content_path': payload.extra_data.get('content_path', '') if payload.extra_data else '',
+                    'category': payload.category,
+                    'status': payload.status,
+                }
+            )
+            for payload in payloads
+        ]
+        results = download_manager.handle_torrents_completed(items)
+        # 返回失败的种子，让 QueueWorker 正确统计失败数
+        return {
+            hash_id: result.get('error', 'unknown error')
+            for hash_id, result in results.items()
+            if not result.get('success')
+        }
 
-    # 注册 Webhook 处理器
-    webhook_queue.register_handler(
+    # 注册 Webhook 处理器（同一批次内的完成事件一起处理）
+    webhook_queue.register_batch_handler(
         WebhookQueueWorker.EVENT_TORRENT_COMPLETED,
-        handle_torrent_completed
+        handle_torrents_completed
     )
     # 兼容 qBittorrent 的 torrent_finished 事件
-    webhook_queue.register_handler(
-        'torrent_finished',
-        handle_torrent_completed
+    webhook_queue.register_batch_handler(
+        WebhookQueueWorker.EVENT_TORRENT_FINISHED,
+        handle_torrents_completed
     )
 
     # 启动 Webhook 队列
+    webhook_queue.restore_pending()
     webhook_queue.start()
     logger.info('✅ Webhook 队列 worker 已启动')
 
-    # 初始化 RSS 队列
+    # 初始化 RSS 队列（持久化，重启后重放未完成的事件）
     rss_queue = get_rss_queue()
+    rss_queue.attach_store(queue_event_repo)
 
     def handle_rss_event(payload):
         """处理 RSS Feed 事件 - 解析 Feed 并将项目加入队列"""
@@ -428,8 +442,14 @@ def init_queue_workers(download_manager):
                     triggered_by=payload.trigger_type
                 )
 
-            # 解析 RSS Feed
-            items = rss_service.parse_feed(payload.rss_url)
+            # 解析 RSS Feed（定时轮询使用条件请求，未变化的 Feed 直接跳过）
+            if payload.extra_data.get('skip_unchanged'):
+                items = rss_service.parse_feed_if_changed(payload.rss_url, filters=feed_data)
+                if items is None:
+                    logger.info(f'📭 RSS Feed 未变化，跳过: {payload.rss_url[:50]}...')
+                    items = []
+            else:
+                items = rss_service.parse_feed(payload.rss_url)
 
             if not items:
                 logger.info(f'📭 RSS Feed 没有新项目: {payload.rss_url[:50]}...')
@@ -475,16 +495,20 @@ def init_queue_workers(download_manager):
             exists_count = 0
             filter_service = container.filter_service()
 
+            # 一次性批量查询已存在的 hash
+            existing_hashes = download_repo.existing_hashes(
+                [item.hash for item in items if item.hash]
+            )
+
+            accepted_items = []
             for item in items:
                 # 检查是否已存在
-                if item.hash:
-                    existing = download_repo.get_by_hash(item.hash)
-                    if existing:
-                        history_repo.insert_rss_detail(
-                            history_id, item.title, 'exists', '已存在于数据库'
-                        )
-                        exists_count += 1
-                        continue
+                if item.hash and item.hash in existing_hashes:
+                    history_repo.insert_rss_detail(
+                        history_id, item.title, 'exists', '已存在于数据库'
+                    )
+                    exists_count += 1
+                    continue
 
                 # 检查过滤器
                 if blocked_keywords or blocked_regex:
@@ -496,8 +520,16 @@ def init_queue_workers(download_manager):
                         filtered_count += 1
                         continue
 
+                accepted_items.append(item)
+
+            # 新标题合并为批量 AI 请求预解析，后续单项处理直接命中缓存
+            container.rss_processor().prefetch_title_parses(
+                [item.title for item in accepted_items]
+            )
+
+            for item in accepted_items:
                 # 加入队列
-                rss_queue.enqueue_single_item(
+                queued = rss_queue.enqueue_single_item(
                     item_title=item.title,
                     torrent_url=item.torrent_url or item.link,
                     hash_id=item.hash or '',
@@ -509,8 +541,16 @@ def init_queue_workers(download_manager):
                         'pub_date': item.pub_date,
                         'history_id': history_id,
                         **filter_config
-                    }
+                    },
+                    priority=payload.extra_data.get('priority')
                 )
+                if not queued:
+                    # 已合并到等待中的同 hash 项目，由该项目所属的历史记录统计
+                    history_repo.insert_rss_detail(
+                        history_id, item.title, 'exists', '已在处理队列中'
+                    )
+                    exists_count += 1
+                    continue
                 enqueued_count += 1
 
             # 更新历史记录统计
@@ -588,10 +628,12 @@ def init_queue_workers(download_manager):
         except AniDownError as e:
             # 预期的业务错误，只记录消息
             logger.error(f'❌ 处理 RSS Feed 事件失败: {e}')
+            _invalidate_feed_state(payload.rss_url)
             raise
         except Exception as e:
             # 意外错误，记录完整堆栈用于调试
             logger.error(f'❌ 处理 RSS Feed 事件失败 (意外错误): {e}', exc_info=True)
+            _invalidate_feed_state(payload.rss_url)
             # 重新抛出异常，让 QueueWorker 正确统计失败数
             raise
 
@@ -610,17 +652,15 @@ def init_queue_workers(download_manager):
             # 检查是否已存在
             download_repo = container.download_repo()
 
-            if payload.hash_id:
-                existing = download_repo.get_by_hash(payload.hash_id)
-                if existing:
-                    logger.info(f'⏭️ 项目已存在: {payload.item_title[:50]}...')
-                    if history_repo and history_id:
-                        history_repo.insert_rss_detail(
-                            history_id, payload.item_title, 'exists', '已存在于数据库'
-                        )
-                        # 检查是否是最后一个项目
-                        _check_and_send_rss_completion(history_repo, history_id)
-                    return
+            if payload.hash_id and download_repo.existing_hashes([payload.hash_id]):
+                logger.info(f'⏭️ 项目已存在: {payload.item_title[:50]}...')
+                if history_repo and history_id:
+                    history_repo.insert_rss_detail(
+                        history_id, payload.item_title, 'exists', '已存在于数据库'
+                    )
+                    # 检查是否是最后一个项目
+                    _check_and_send_rss_completion(history_repo, history_id)
+                return
 
             # 调用 DownloadManager 处理单个项目
             item_data = {
@@ -658,10 +698,12 @@ def init_queue_workers(download_manager):
                 logger.info(f'✅ 项目处理成功: {payload.item_title[:50]}...')
             else:
                 logger.warning(f'⚠️ 项目处理失败: {payload.item_title[:50]}...')
+                _invalidate_feed_state(payload.rss_url)
 
         except AniDownError as e:
             # 预期的业务错误，只记录消息不记录堆栈
             logger.error(f'❌ 处理单个项目失败: {e}')
+            _invalidate_feed_state(payload.rss_url)
             # 记录失败
             try:
                 if history_id:
@@ -679,6 +721,7 @@ def init_queue_workers(download_manager):
         except Exception as e:
             # 意外错误，记录完整堆栈用于调试
             logger.error(f'❌ 处理单个项目失败 (意外错误): {e}', exc_info=True)
+            _invalidate_feed_state(payload.rss_url)
             # 记录失败
             try:
                 if history_id:
@@ -694,8 +737,29 @@ def init_queue_workers(download_manager):
             # 重新抛出异常，让 QueueWorker 正确统计失败数
             raise
 
+    def _invalidate_feed_state(rss_url):
+        """项目处理失败时清除 Feed 的条件请求状态，确保下次轮询重新解析并重试"""
+        if not rss_url:
+            return
+        try:
+            from src.container import container
+            container.rss_service().invalidate_feed_state(rss_url)
+        except Exception as e:
+            logger.warning(f'⚠️ 清除RSS条件请求状态失败: {e}')
+
+    # 多个 worker 可能同时处理完最后的项目，确保每个批次只发送一次完成通知
+    completion_lock = Lock()
+    completed_history_ids: set[int] = set()
+
     def _check_and_send_rss_completion(history_repo, history_id):
         """检查是否所有项目已处理完成，如果是则发送完成通知"""
+        with completion_lock:
+            if history_id in completed_history_ids:
+                return
+            _do_check_and_send_rss_completion(history_repo, history_id)
+
+    def _do_check_and_send_rss_completion(history_repo, history_id):
+        """完成检查的实际实现（调用方需持有 completion_lock）"""
         try:
             from src.container import container
 
@@ -726,6 +790,7 @@ def init_queue_workers(download_manager):
 
             # 如果所有入队项目都处理完成，发送完成通知
             if actual_processed >= items_attempted and items_attempted > 0:
+                completed_history_ids.add(history_id)
                 # 更新状态为完成
                 history_repo.update_rss_history_stats(
                     history_id,
@@ -789,9 +854,11 @@ def init_queue_workers(download_manager):
         handle_single_item
     )
 
-    # 启动 RSS 队列
+    # 启动 RSS 队列（同一番剧的项目串行，不同番剧并发处理）
+    rss_queue.set_num_workers(config.rss.queue_workers)
+    rss_queue.restore_pending()
     rss_queue.start()
-    logger.info('✅ RSS 队列 worker 已启动')
+    logger.info(f'✅ RSS 队列 worker 已启动 ({config.rss.queue_workers} 个线程)')
 
     return webhook_queue, rss_queue
 
@@ -803,8 +870,10 @@ def run_schedule(download_manager):
     Args:
         download_manager: DownloadManager 实例
     """
+    from src.container import container
     from src.core.config import config
     from src.interface.web.controllers.system_status import system_status_manager
+    from src.services.queue.queue_worker import EventPriority
     from src.services.queue.rss_queue import RSSPayload, RSSQueueWorker, get_rss_queue
 
     logger.info('🔔 启动定时任务调度器...')
@@ -820,27 +889,41 @@ def run_schedule(download_manager):
     rss_queue = get_rss_queue()
 
     def enqueue_rss_feeds(triggered_by: str):
-        """将所有配置的 RSS feeds 加入队列"""
+        """将所有配置的 RSS feeds 加入队列（下一轮开始前未处理的检查将被丢弃）"""
         feeds = config.rss.get_feeds()
         if not feeds:
             logger.info('📭 没有配置RSS链接')
             return
 
-        for feed in feeds:
-            feed_data = {
+        feed_data_by_url = {
+            feed.url: {
                 'url': feed.url,
                 'blocked_keywords': feed.blocked_keywords,
                 'blocked_regex': feed.blocked_regex,
                 'media_type': feed.media_type,
             }
+            for feed in feeds
+        }
+
+        # 先并发预取所有 Feed，队列按顺序处理时直接取用结果
+        # （过滤设置随 feed_data 传入，变化后会重新完整解析）
+        container.rss_service().prefetch_feeds(
+            list(feed_data_by_url), conditional=True, filters=feed_data_by_url
+        )
+
+        deadline = datetime.now(UTC) + timedelta(seconds=config.rss.check_interval)
+        for feed in feeds:
+            feed_data = feed_data_by_url[feed.url]
             payload = RSSPayload(
                 rss_url=feed.url,
                 trigger_type=triggered_by,
-                extra_data={'feed_data': feed_data}
+                extra_data={'feed_data': feed_data, 'skip_unchanged': True}
             )
             rss_queue.enqueue_event(
                 event_type=RSSQueueWorker.EVENT_SINGLE_FEED,
-                payload=payload
+                payload=payload,
+                priority=EventPriority.SCHEDULED,
+                deadline=deadline
             )
         logger.info(f'📥 已将 {len(feeds)} 个RSS链接加入处理队列')
 
@@ -858,7 +941,9 @@ def run_schedule(download_manager):
 
     while True:
         schedule.run_pending()
-        time.sleep(1)
+        # 直接休眠到下一个任务的执行时间，避免每秒空转唤醒
+        idle_seconds = schedule.idle_seconds()
+        time.sleep(max(idle_seconds, 0) if idle_seconds is not None else config.rss.check_interval)
 
 
 def handle_rss_command(args, download_manager):
@@ -1038,6 +1123,12 @@ def main():
     # 导入状态管理器
     from src.interface.web.controllers.system_status import system_status_manager
 
+    # 预热 torrent hash 缓存（避免重启后重复下载 torrent 文件）
+    container.rss_service().warm_hash_extractor_cache()
+
+    # 清理过期或提示词已变更的标题解析缓存
+    container.title_parser().prune_cache()
+
     # 初始化队列工作者
     webhook_queue, rss_queue = init_queue_workers(download_manager)
 
@@ -1089,6 +1180,10 @@ def main():
         webhook_queue.stop()
         rss_queue.stop()
 
+        # 写入缓冲中的 AI Key 使用记录
+        from src.infrastructure.repositories.ai_key_repository import ai_key_repository
+        ai_key_repository.close()
+
         # 清理未完成的 processing 状态历史记录
         from src.infrastructure.repositories.history_repository import HistoryRepository
         history_repo = HistoryRepository()
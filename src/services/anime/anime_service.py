@@ -515,21 +515,20 @@ class AnimeService:
         result: dict[str, Any]
     ) -> dict[str, Any]:
         """Delete original files and torrents."""
-        # Delete torrents from qBittorrent
-        for download in downloads:
+        # Delete torrents from qBittorrent (one multi-hash request)
+        hash_ids = [download.hash_id for download in downloads]
+        if hash_ids:
             try:
-                if self._download_client.delete_torrent(
-                    download.hash_id, delete_files=True
-                ):
-                    result['torrents_removed'] += 1
-                    logger.info(f'从qBittorrent删除torrent: {download.hash_id}')
-                else:
-                    logger.warning(
-                        f'从qBittorrent删除torrent失败: {download.hash_id}'
-                    )
+                removed = self._download_client.delete_torrents(hash_ids, delete_files=True)
+                failed_count = len(set(hash_ids)) - len(removed)
+                result['torrents_removed'] += len(removed)
+                if removed:
+                    logger.info(f'从qBittorrent删除 {len(removed)} 个torrent')
+                if failed_count:
+                    logger.warning(f'从qBittorrent删除torrent失败: {failed_count} 个')
             except Exception as e:
                 logger.error(f'删除torrent异常: {e}')
-                result['errors'].append(f'删除torrent失败: {download.hash_id}')
+                result['errors'].append(f'删除torrent失败: {len(hash_ids)} 个')
 
         # Delete folder
         if os.path.exists(original_folder):
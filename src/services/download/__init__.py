@@ -10,6 +10,7 @@ from src.services.download.completion_handler import CompletionHandler
 from src.services.download.download_notifier import DownloadNotifier
 from src.services.download.rss_processor import RSSProcessor, RSSProcessResult
 from src.services.download.status_service import StatusService
+from src.services.download.torrent_file_resolver import TorrentFileResolver
 from src.services.download.upload_handler import UploadHandler
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     'UploadHandler',
     'CompletionHandler',
     'StatusService',
+    'TorrentFileResolver',
 ]
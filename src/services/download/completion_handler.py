@@ -18,6 +18,7 @@ from src.core.interfaces.repositories import (
     IAnimeRepository,
     IDownloadRepository,
 )
+from src.infrastructure.downloader.torrent_metainfo import build_folder_structure
 from src.services.download.download_notifier import DownloadNotifier
 from src.services.file.path_builder import PathBuilder
 from src.services.file.file_service import FileService
@@ -112,35 +113,110 @@ class CompletionHandler:
                 logger.warning(f'未找到下载记录: {hash_id}')
                 return {'success': True, 'message': 'Download record not found'}
 
-            logger.info(f'  动漫: {download_info.anime_title or download_info.original_filename}')
+            return self._process_download(hash_id, download_info)
 
-            # Get torrent files
-            logger.debug('📋 正在获取种子文件列表...')
-            torrent_files = self._download_client.get_torrent_files(hash_id)
-            hardlink_count = 0
+        except Exception as e:
+            logger.error(f'处理种子完成事件失败: {e}')
+            # Send error notification to Discord
+            self._notifier.notify_error(f'处理种子完成事件失败: {e}')
+            # Re-raise exception so caller can get detailed error info
+            raise
 
-            if torrent_files:
-                logger.info(f'  文件数量: {len(torrent_files)}')
+    def handle_completed_batch(
+        self,
+        items: list[tuple[str, dict[str, Any] | None]]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Handle a burst of torrent completion events together.
 
-                # Create hardlinks
-                logger.info('🔗 开始创建硬链接...')
-                hardlink_count = self._create_hardlinks(
-                    hash_id, download_info, torrent_files
-                )
+        Webhook notifications are sent together, statuses are updated in one
+        transaction and the download records are loaded with one query; the
+        file list of each torrent is fetched once.
+
+        Args:
+            items: (hash, webhook data) pairs.
 
-            logger.info(f'✅ 种子处理完成: 成功创建 {hardlink_count} 个硬链接')
-            return {
-                'success': True,
-                'message': 'Torrent completion processed',
-                'hardlinks_created': hardlink_count
+        Returns:
+            Result dictionary by hash. Failed torrents have success=False
+            and an error message.
+        """
+        webhooks = dict(items)
+        logger.info(f'🎉 {len(webhooks)} 个种子下载完成')
+
+        self._notifier.notify_webhooks_received([
+            {
+                'torrent_id': hash_id,
+                'save_path': data.get('save_path', ''),
+                'content_path': data.get('content_path', ''),
+                'torrent_name': data.get('name', '')
             }
+            for hash_id, data in webhooks.items() if data
+        ])
 
+        try:
+            completion_time = datetime.now(UTC)
+            self._download_repo.update_statuses([
+                (hash_id, 'completed', completion_time) for hash_id in webhooks
+            ])
+            records = self._download_repo.get_by_hashes(list(webhooks))
         except Exception as e:
             logger.error(f'处理种子完成事件失败: {e}')
-            # Send error notification to Discord
             self._notifier.notify_error(f'处理种子完成事件失败: {e}')
-            # Re-raise exception so caller can get detailed error info
-            raise
+            return {hash_id: {'success': False, 'error': str(e)} for hash_id in webhooks}
+
+        results: dict[str, dict[str, Any]] = {}
+        for hash_id in webhooks:
+            logger.info(f'  Hash: {hash_id[:8]}...')
+            download_info = records.get(hash_id)
+            if not download_info:
+                logger.warning(f'未找到下载记录: {hash_id}')
+                results[hash_id] = {'success': True, 'message': 'Download record not found'}
+                continue
+            try:
+                results[hash_id] = self._process_download(hash_id, download_info)
+            except Exception as e:
+                logger.error(f'处理种子完成事件失败: {e}')
+                self._notifier.notify_error(f'处理种子完成事件失败: {e}')
+                results[hash_id] = {'success': False, 'error': str(e)}
+        return results
+
+    def _process_download(
+        self,
+        hash_id: str,
+        download_info: DownloadRecord
+    ) -> dict[str, Any]:
+        """
+        Fetch the files of a completed torrent and create its hardlinks.
+
+        Args:
+            hash_id: Torrent hash.
+            download_info: Download record.
+
+        Returns:
+            Result dictionary with processing details.
+        """
+        logger.info(f'  动漫: {download_info.anime_title or download_info.original_filename}')
+
+        # Get torrent files
+        logger.debug('📋 正在获取种子文件列表...')
+        torrent_files = self._download_client.get_torrent_files(hash_id)
+        hardlink_count = 0
+
+        if torrent_files:
+            logger.info(f'  文件数量: {len(torrent_files)}')
+
+            # Create hardlinks
+            logger.info('🔗 开始创建硬链接...')
+            hardlink_count = self._create_hardlinks(
+                hash_id, download_info, torrent_files
+            )
+
+        logger.info(f'✅ 种子处理完成: 成功创建 {hardlink_count} 个硬链接')
+        return {
+            'success': True,
+            'message': 'Torrent completion processed',
+            'hardlinks_created': hardlink_count
+        }
 
     def _create_hardlinks(
         self,
@@ -211,15 +287,10 @@ class CompletionHandler:
             requires_tvdb = download_info.requires_tvdb
 
             if download_method and download_method.value.startswith('manual_'):
-                # Get folder structure
-                try:
-                    folder_structure = self._download_client.get_torrent_folder_structure(
-                        hash_id
-                    ) if hasattr(self._download_client, 'get_torrent_folder_structure') else None
-                    if folder_structure:
-                        logger.info(f'📁 获取到Torrent目录结构:\n{folder_structure}')
-                except Exception as e:
-                    logger.warning(f'⚠️ 获取文件夹结构失败: {e}')
+                # Build folder structure from the file list fetched above
+                folder_structure = build_folder_structure(torrent_files)
+                if folder_structure:
+                    logger.info(f'📁 获取到Torrent目录结构:\n{folder_structure}')
 
                 # Get TVDB data - use requires_tvdb flag from download record
                 if requires_tvdb:
@@ -277,7 +348,8 @@ class CompletionHandler:
                     break
                 rename_examples.append(f'{old_name} → {new_name}')
 
-            # Create hardlinks for video files
+            # Collect video links
+            video_links = []
             for video in video_files:
                 original_name = video.name
                 source_path = video.full_path
@@ -298,39 +370,39 @@ class CompletionHandler:
                     logger.error(f'✗ 未找到重命名映射: {original_name}')
                     continue
 
-                # Create hardlink
-                success = self._file_service.create(
-                    source_path=source_path,
-                    target_dir=target_dir,
-                    new_name=new_name,
-                    anime_id=anime_id,
-                    torrent_hash=hash_id
-                )
-
-                if success:
-                    hardlink_count += 1
-                    logger.info(f'✓ 硬链接创建成功: {new_name}')
-                else:
-                    logger.warning(f'✗ 硬链接创建失败: {original_name}')
+                video_links.append((source_path, new_name))
 
-            # Process subtitle files
+            # Collect subtitle links
+            subtitle_links = []
             if subtitle_files:
                 subtitle_mapping = self._rename_service.generate_subtitle_mapping(
                     video_files, subtitle_files, rename_result.main_files
                 )
+                subtitle_links = [
+                    (sub_file.full_path, subtitle_mapping[sub_file.name])
+                    for sub_file in subtitle_files
+                    if sub_file.name in subtitle_mapping
+                ]
+
+            # Create all hardlinks in one batch
+            links = video_links + subtitle_links
+            link_methods = self._file_service.create_many(
+                links,
+                target_dir=target_dir,
+                anime_id=anime_id,
+                torrent_hash=hash_id
+            )
 
-                for sub_file in subtitle_files:
-                    if sub_file.name in subtitle_mapping:
-                        new_name = subtitle_mapping[sub_file.name]
-                        success = self._file_service.create(
-                            source_path=sub_file.full_path,
-                            target_dir=target_dir,
-                            new_name=new_name,
-                            anime_id=anime_id,
-                            torrent_hash=hash_id
-                        )
-                        if success:
-                            logger.info(f'✓ 字幕硬链接创建成功: {new_name}')
+            link_results = zip(links, link_methods, strict=True)
+            for i, ((source_path, new_name), link_method) in enumerate(link_results):
+                if i >= len(video_links):
+                    if link_method:
+                        logger.info(f'✓ 字幕硬链接创建成功: {new_name}')
+                elif link_method:
+                    hardlink_count += 1
+                    logger.info(f'✓ 硬链接创建成功: {new_name}')
+                else:
+                    logger.warning(f'✗ 硬链接创建失败: {os.path.basename(source_path)}')
 
             # Send notification
             if hardlink_count > 0:
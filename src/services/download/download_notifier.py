@@ -247,6 +247,29 @@ class DownloadNotifier:
         except Exception as e:
             logger.warning(f'⚠️ 发送webhook接收通知失败: {e}')
 
+    def notify_webhooks_received(self, webhooks: list[dict[str, str]]) -> None:
+        """
+        Send webhook received notifications for several torrents at once.
+
+        Args:
+            webhooks: Dicts with torrent_id, save_path, content_path and torrent_name.
+        """
+        if not self._notifier or not webhooks:
+            return
+
+        try:
+            self._notifier.notify_webhooks_received([
+                WebhookReceivedNotification(
+                    torrent_id=webhook['torrent_id'],
+                    save_path=webhook.get('save_path', ''),
+                    content_path=webhook.get('content_path') or webhook.get('save_path', ''),
+                    torrent_name=webhook.get('torrent_name', '')
+                )
+                for webhook in webhooks
+            ])
+        except Exception as e:
+            logger.warning(f'⚠️ 发送webhook接收通知失败: {e}')
+
     def notify_hardlink_created(
         self,
         anime_title: str,
@@ -6,7 +6,6 @@ Handles all RSS feed parsing, filtering, and download initiation.
 
 import logging
 import re
-import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -33,6 +32,7 @@ from src.core.interfaces.adapters import (
     IRSSParser,
     ITitleParser,
     RSSItem,
+    TitleParseResult,
 )
 from src.core.interfaces.repositories import (
     IAnimeRepository,
@@ -40,6 +40,7 @@ from src.core.interfaces.repositories import (
     IHardlinkRepository,
 )
 from src.services.download.download_notifier import DownloadNotifier
+from src.services.download.torrent_file_resolver import TorrentFileResolver
 from src.services.file.path_builder import PathBuilder
 from src.services.rss.filter_service import FilterService
 
@@ -94,7 +95,9 @@ class RSSProcessor:
         rss_service: IRSSParser,
         filter_service: FilterService,
         path_builder: PathBuilder,
-        notifier: DownloadNotifier
+        notifier: DownloadNotifier,
+        local_title_parser: ITitleParser | None = None,
+        torrent_file_resolver: TorrentFileResolver | None = None
     ):
         """
         Initialize the RSS processor.
@@ -109,6 +112,10 @@ class RSSProcessor:
             filter_service: Content filter service.
             path_builder: Path construction service.
             notifier: Download notifier service.
+            local_title_parser: Regex-based parser tried before the AI
+                parser; returns None for titles it cannot parse confidently.
+            torrent_file_resolver: Records torrent file lists without
+                blocking on qBittorrent metadata.
         """
         self._anime_repo = anime_repo
         self._download_repo = download_repo
@@ -119,6 +126,10 @@ class RSSProcessor:
         self._filter_service = filter_service
         self._path_builder = path_builder
         self._notifier = notifier
+        self._local_title_parser = local_title_parser
+        self._torrent_file_resolver = torrent_file_resolver or TorrentFileResolver(
+            download_client, download_repo
+        )
 
     def process_feeds(
         self,
@@ -160,13 +171,18 @@ class RSSProcessor:
         for feed in feed_objects:
             self._notifier.notify_rss_start(trigger_type, feed.url)
 
-        # Parse and process each feed
+        # Fetch all feeds concurrently, then process them in configured order
         all_items = []
         total_items_found = 0
 
-        for feed in feed_objects:
+        fetch_results = self._rss_service.parse_feeds([f.url for f in feed_objects])
+
+        for feed, fetch_result in zip(feed_objects, fetch_results, strict=True):
             try:
-                items = self._rss_service.parse_feed(feed.url)
+                if not fetch_result.success:
+                    raise fetch_result.error
+
+                items = fetch_result.items
                 total_items_found += len(items)
 
                 # Process each item
@@ -207,6 +223,9 @@ class RSSProcessor:
             items_attempted=len(all_items)
         )
 
+        # Parse new titles in batched AI requests; per-item parsing hits the cache
+        self.prefetch_title_parses([item.get('title', '') for item in all_items])
+
         # Process new items
         logger.info(f'🔄 开始处理 {len(all_items)} 个RSS项目...')
 
@@ -249,6 +268,55 @@ class RSSProcessor:
 
         return result
 
+    def prefetch_title_parses(self, titles: list[str]) -> int:
+        """
+        Warm the title parser cache for titles of new anime.
+
+        Titles matching an existing anime or parsed confidently by the
+        local parser never reach the AI parser and are skipped. Failures
+        are logged only; per-item processing falls back to parsing each
+        title individually.
+
+        Args:
+            titles: RSS item titles about to be processed.
+
+        Returns:
+            Number of titles sent to the batch parser.
+        """
+        pending = [
+            title for title in dict.fromkeys(titles)
+            if title
+            and not self._find_existing_anime(title)
+            and not self._parse_title_locally(title)
+        ]
+        if len(pending) < 2:
+            return 0
+
+        logger.info(f'🤖 批量预解析 {len(pending)} 个新动漫标题')
+        try:
+            self._title_parser.parse_many(pending)
+        except Exception as e:
+            logger.warning(f'⚠️ 批量预解析失败，将逐个解析: {e}')
+        return len(pending)
+
+    def _parse_title_locally(self, title: str) -> TitleParseResult | None:
+        """
+        Parse a title with the local parser, if one is configured.
+
+        Args:
+            title: RSS item title.
+
+        Returns:
+            TitleParseResult if parsed confidently, None otherwise.
+        """
+        if self._local_title_parser is None:
+            return None
+        try:
+            return self._local_title_parser.parse(title)
+        except Exception as e:
+            logger.warning(f'⚠️ 本地标题解析异常，交由 AI 解析: {e}')
+            return None
+
     def process_single_rss_item(
         self,
         item: dict[str, Any],
@@ -418,8 +486,10 @@ class RSSProcessor:
                         download_method='manual_rss'
                     )
 
-                    # Save torrent files information
-                    self._save_torrent_files_on_add(hash_id, anime_id)
+                    # Save torrent files information (from the downloaded .torrent if available)
+                    self._torrent_file_resolver.capture(
+                        hash_id, anime_id, files=self._rss_service.pop_torrent_files(hash_id)
+                    )
 
                     result.new_items += 1
                     self._history_repo.insert_rss_detail(history_id, title, 'success')
@@ -511,6 +581,10 @@ class RSSProcessor:
         else:
             logger.debug('📋 未配置过滤器')
 
+        existing_hashes = self._download_repo.existing_hashes(
+            [item.hash for item in items if item.hash]
+        )
+
         for item in items:
             title = item.title
             hash_id = item.hash
@@ -527,13 +601,11 @@ class RSSProcessor:
             }
 
             # Check if already exists
-            if hash_id:
-                existing = self._download_repo.get_by_hash(hash_id)
-                if existing:
-                    self._history_repo.insert_rss_detail(
-                        history_id, title, 'exists', '已存在于数据库'
-                    )
-                    continue
+            if hash_id and hash_id in existing_hashes:
+                self._history_repo.insert_rss_detail(
+                    history_id, title, 'exists', '已存在于数据库'
+                )
+                continue
 
             # Check filters
             should_skip = False
@@ -597,18 +669,27 @@ class RSSProcessor:
         hash_id = self._rss_service.ensure_valid_hash(hash_id, torrent_url)
 
         try:
-            # Send AI usage notification (在 AI 调用前发送，让用户知道正在等待)
-            self._notifier.notify_ai_usage(
-                reason='正在解析新动漫标题',
-                project_name=title[:50] + '...' if len(title) > 50 else title,
-                context='rss',
-                operation='title_parsing'
-            )
+            # 先尝试本地正则解析，置信度不足时再调用 AI
+            parse_result = self._parse_title_locally(title)
+            if parse_result:
+                logger.info(
+                    f'⚡ 本地解析标题 (置信度 {parse_result.confidence}): '
+                    f'{parse_result.clean_title} S{parse_result.season} '
+                    f'[{parse_result.subtitle_group}]'
+                )
+            else:
+                # Send AI usage notification (在 AI 调用前发送，让用户知道正在等待)
+                self._notifier.notify_ai_usage(
+                    reason='正在解析新动漫标题',
+                    project_name=title[:50] + '...' if len(title) > 50 else title,
+                    context='rss',
+                    operation='title_parsing'
+                )
 
-            # AI title parsing
-            parse_result = self._title_parser.parse(title)
-            if not parse_result:
-                raise AnimeInfoExtractionError('AI解析失败')
+                # AI title parsing
+                parse_result = self._title_parser.parse(title)
+                if not parse_result:
+                    raise AnimeInfoExtractionError('AI解析失败')
 
             # 二次校验：检查 AI 解析结果是否已存在于数据库
             # 防止因首次匹配失败但 AI 返回相同信息而创建重复条目
@@ -671,8 +752,10 @@ class RSSProcessor:
                 download_method='rss_ai'
             )
 
-            # Save torrent files information
-            self._save_torrent_files_on_add(hash_id, anime_id)
+            # Save torrent files information (from the downloaded .torrent if available)
+            self._torrent_file_resolver.capture(
+                hash_id, anime_id, files=self._rss_service.pop_torrent_files(hash_id)
+            )
 
             # Send download task notification (immediate)
             self._notifier.notify_download_task(
@@ -753,8 +836,10 @@ class RSSProcessor:
             download_method='fixed_rss'
         )
 
-        # Save torrent files information
-        self._save_torrent_files_on_add(hash_id, anime_id)
+        # Save torrent files information (from the downloaded .torrent if available)
+        self._torrent_file_resolver.capture(
+            hash_id, anime_id, files=self._rss_service.pop_torrent_files(hash_id)
+        )
 
         # Send download task notification (immediate)
         self._notifier.notify_download_task(
@@ -846,80 +931,6 @@ class RSSProcessor:
         )
         return self._download_repo.save(record)
 
-    def _save_torrent_file(
-        self,
-        torrent_hash: str,
-        file_path: str,
-        file_size: int,
-        anime_id: int | None
-    ) -> None:
-        """Save torrent file information."""
-        # Determine file type based on extension
-        file_type = 'other'
-        file_lower = file_path.lower()
-
-        if file_lower.endswith(('.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm')):
-            file_type = 'video'
-        elif file_lower.endswith(('.srt', '.ass', '.ssa', '.vtt', '.sub')):
-            file_type = 'subtitle'
-
-        # Save to database via repository
-        try:
-            self._download_repo.insert_torrent_file(
-                torrent_hash=torrent_hash,
-                file_path=file_path,
-                file_size=file_size,
-                file_type=file_type,
-                anime_id=anime_id
-            )
-        except Exception as e:
-            logger.warning(f'⚠️ Failed to save torrent file to database: {e}')
-
-    def _save_torrent_files_on_add(
-        self,
-        hash_id: str,
-        anime_id: int | None,
-        max_retries: int = 5,
-        retry_delay: float = 1.0
-    ) -> None:
-        """
-        Save torrent file information when download starts.
-
-        Waits for qBittorrent to parse the torrent and retrieves file list.
-        For magnet links, may need multiple retries to get metadata.
-
-        Args:
-            hash_id: Torrent hash.
-            anime_id: Anime ID for records.
-            max_retries: Maximum retry attempts for getting file list.
-            retry_delay: Delay between retries in seconds.
-        """
-        logger.debug(f'💾 正在保存种子文件信息: {hash_id[:8]}...')
-
-        torrent_files = []
-        for attempt in range(max_retries):
-            torrent_files = self._download_client.get_torrent_files(hash_id)
-            if torrent_files:
-                break
-            # Wait and retry (torrent may still be loading metadata)
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                logger.debug(f'  重试获取文件列表 ({attempt + 2}/{max_retries})...')
-
-        if not torrent_files:
-            logger.warning(f'⚠️ 无法获取种子文件列表: {hash_id[:8]} (可能是磁力链接等待元数据)')
-            return
-
-        logger.info(f'📋 获取到 {len(torrent_files)} 个文件，正在保存到数据库...')
-        for file_info in torrent_files:
-            self._save_torrent_file(
-                torrent_hash=hash_id,
-                file_path=file_info.get('name', ''),
-                file_size=file_info.get('size', 0),
-                anime_id=anime_id
-            )
-        logger.debug(f'✅ 种子文件信息保存完成: {hash_id[:8]}')
-
     def _extract_episode_from_title(
         self,
         title: str,
@@ -5,7 +5,6 @@ Handles status checking, deletion, and re-downloading of torrents.
 """
 
 import logging
-import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -20,6 +19,7 @@ from src.core.interfaces.repositories import (
     IDownloadRepository,
     IHardlinkRepository,
 )
+from src.services.download.torrent_file_resolver import TorrentFileResolver
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,8 @@ class StatusService:
         download_repo: IDownloadRepository,
         history_repo: IHardlinkRepository,
         download_client: IDownloadClient,
-        hardlink_service: Any  # HardlinkService (avoid circular import)
+        hardlink_service: Any,  # HardlinkService (avoid circular import)
+        torrent_file_resolver: TorrentFileResolver | None = None
     ):
         """
         Initialize the status service.
@@ -50,11 +51,16 @@ class StatusService:
             history_repo: Repository for history records.
             download_client: Download client (qBittorrent).
             hardlink_service: Hardlink service for cleanup.
+            torrent_file_resolver: Records torrent file lists without
+                blocking on qBittorrent metadata.
         """
         self._download_repo = download_repo
         self._history_repo = history_repo
         self._download_client = download_client
         self._hardlink_service = hardlink_service
+        self._torrent_file_resolver = torrent_file_resolver or TorrentFileResolver(
+            download_client, download_repo
+        )
 
     def check_torrent_status(self, hash_id: str) -> dict[str, Any]:
         """
@@ -84,17 +90,7 @@ class StatusService:
                         self._download_repo.update_status(hash_id, 'missing', None)
                     return {'success': True, 'status': 'missing', 'message': '未找到種子'}
 
-            status = 'completed' if torrent_info.get('progress', 0) >= 1.0 else 'downloading'
-            completion_time = None
-
-            if status == 'completed':
-                if torrent_info.get('completion_date', -1) != -1:
-                    completion_time = datetime.fromtimestamp(
-                        torrent_info['completion_date'],
-                        tz=UTC
-                    )
-                else:
-                    completion_time = datetime.now(UTC)
+            status, completion_time = self._status_from_torrent(torrent_info)
 
             # Update database
             self._download_repo.update_status(hash_id, status, completion_time)
@@ -109,10 +105,41 @@ class StatusService:
             logger.error(f'检查种子状态失败: {e}')
             return {'success': False, 'error': str(e)}
 
+    @staticmethod
+    def _status_from_torrent(
+        torrent_info: dict[str, Any]
+    ) -> tuple[str, datetime | None]:
+        """
+        Derive download status and completion time from torrent info.
+
+        Args:
+            torrent_info: Torrent information from the download client.
+
+        Returns:
+            Tuple of (status, completion time).
+        """
+        status = 'completed' if torrent_info.get('progress', 0) >= 1.0 else 'downloading'
+        completion_time = None
+
+        if status == 'completed':
+            if torrent_info.get('completion_date', -1) not in (-1, None):
+                completion_time = datetime.fromtimestamp(
+                    torrent_info['completion_date'],
+                    tz=UTC
+                )
+            else:
+                completion_time = datetime.now(UTC)
+
+        return status, completion_time
+
     def check_all_torrents(self) -> dict[str, Any]:
         """
         Check status of all incomplete torrents.
 
+        Fetches all torrents with one sync request and writes the changed
+        statuses in one transaction. Falls back to checking each torrent
+        individually if the sync request fails.
+
         Returns:
             Statistics dictionary.
         """
@@ -122,16 +149,44 @@ class StatusService:
             updated_count = 0
             completed_count = 0
 
-            for download in incomplete_downloads:
-                hash_value = download.hash_value if download.hash else ''
-                if not hash_value:
-                    continue
+            torrents = self._download_client.sync_torrents()
+            if torrents is None:
+                logger.warning('⚠️ 同步 qBittorrent 种子列表失败，逐个检查种子状态')
+                for download in incomplete_downloads:
+                    hash_value = download.hash_value if download.hash else ''
+                    if not hash_value:
+                        continue
+
+                    result = self.check_torrent_status(hash_value)
+                    if result.get('success'):
+                        updated_count += 1
+                        if result.get('status') == 'completed':
+                            completed_count += 1
+            else:
+                updates: list[tuple[str, str, datetime | None]] = []
+                for download in incomplete_downloads:
+                    hash_value = download.hash_value if download.hash else ''
+                    if not hash_value:
+                        continue
+
+                    torrent_info = torrents.get(hash_value.lower())
+                    if torrent_info:
+                        status, completion_time = self._status_from_torrent(torrent_info)
+                    else:
+                        status, completion_time = 'missing', None
 
-                result = self.check_torrent_status(hash_value)
-                if result.get('success'):
                     updated_count += 1
-                    if result.get('status') == 'completed':
+                    if status == 'completed':
                         completed_count += 1
+                    # 状态未变化的记录不写库
+                    if status != download.status.value or completion_time:
+                        updates.append((hash_value, status, completion_time))
+
+                written = self._download_repo.update_statuses(updates)
+                logger.info(
+                    f'🔄 种子状态同步完成: 检查 {updated_count} 个, '
+                    f'更新 {written} 个, 完成 {completed_count} 个'
+                )
 
             return {
                 'success': True,
@@ -157,38 +212,71 @@ class StatusService:
             delete_file: Whether to delete original files.
             delete_hardlink: Whether to delete hardlinks.
 
+        Returns:
+            Result dictionary.
+        """
+        return self.delete_downloads([hash_id], delete_file, delete_hardlink)
+
+    def delete_downloads(
+        self,
+        hash_ids: list[str],
+        delete_file: bool,
+        delete_hardlink: bool
+    ) -> dict[str, Any]:
+        """
+        Delete several download tasks.
+
+        Torrents are removed from the download client with a single
+        multi-hash request instead of one request per torrent.
+
+        Args:
+            hash_ids: Torrent hashes.
+            delete_file: Whether to delete original files.
+            delete_hardlink: Whether to delete hardlinks.
+
         Returns:
             Result dictionary.
         """
         result = {
             'success': True,
+            'total_count': len(hash_ids),
             'deleted_files': False,
             'deleted_hardlinks': False,
-            'moved_to_history': False
+            'moved_to_history': False,
+            'torrents_removed': 0,
+            'torrents_failed': 0,
+            'moved_to_history_count': 0
         }
 
         try:
             # Delete hardlinks if requested
             if delete_hardlink:
-                deleted_count = self._hardlink_service.delete_by_torrent(
-                    hash_id, delete_files=True
+                deleted_count = sum(
+                    self._hardlink_service.delete_by_torrent(hash_id, delete_files=True)
+                    for hash_id in hash_ids
                 )
                 result['deleted_hardlinks'] = deleted_count > 0
                 result['hardlinks_deleted_count'] = deleted_count
                 logger.info(f'删除了 {deleted_count} 个硬链接')
 
             # Delete original files if requested
-            if delete_file:
-                if self._download_client.delete_torrent(hash_id, delete_files=True):
-                    result['deleted_files'] = True
-                    logger.info(f'从qBittorrent删除了种子和文件: {hash_id}')
-                else:
-                    logger.warning(f'从qBittorrent删除失败: {hash_id}')
-
-                # Move download record to history
-                if self._download_repo.move_to_history(hash_id):
-                    result['moved_to_history'] = True
-                    logger.info(f'将下载记录移动到历史: {hash_id}')
+            if delete_file and hash_ids:
+                removed = self._download_client.delete_torrents(hash_ids, delete_files=True)
+                failed_count = len(set(hash_ids)) - len(removed)
+                result['deleted_files'] = bool(removed)
+                result['torrents_removed'] = len(removed)
+                result['torrents_failed'] = failed_count
+                if removed:
+                    logger.info(f'从qBittorrent删除了 {len(removed)} 个种子和文件')
+                if failed_count:
+                    logger.warning(f'从qBittorrent删除失败: {failed_count} 个种子')
+
+                # Move download records to history (failed torrents keep their records)
+                for hash_id in removed:
+                    if self._download_repo.move_to_history(hash_id):
+                        result['moved_to_history_count'] += 1
+                        logger.info(f'将下载记录移动到历史: {hash_id}')
+                result['moved_to_history'] = result['moved_to_history_count'] > 0
 
             return result
         except Exception as e:
@@ -246,7 +334,7 @@ class StatusService:
             )
 
             # Save torrent files information
-            self._save_torrent_files_on_add(hash_id, history.get('anime_id'))
+            self._torrent_file_resolver.capture(hash_id, history.get('anime_id'))
 
             # Delete from history
             if self._history_repo.delete_download_history_by_hash(hash_id):
@@ -335,77 +423,3 @@ class StatusService:
             download_time=datetime.now(UTC)
         )
         return self._download_repo.save(record)
-
-    def _save_torrent_file(
-        self,
-        torrent_hash: str,
-        file_path: str,
-        file_size: int,
-        anime_id: int | None
-    ) -> None:
-        """Save torrent file information."""
-        # Determine file type based on extension
-        file_type = 'other'
-        file_lower = file_path.lower()
-
-        if file_lower.endswith(('.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm')):
-            file_type = 'video'
-        elif file_lower.endswith(('.srt', '.ass', '.ssa', '.vtt', '.sub')):
-            file_type = 'subtitle'
-
-        # Save to database via repository
-        try:
-            self._download_repo.insert_torrent_file(
-                torrent_hash=torrent_hash,
-                file_path=file_path,
-                file_size=file_size,
-                file_type=file_type,
-                anime_id=anime_id
-            )
-        except Exception as e:
-            logger.warning(f'⚠️ Failed to save torrent file to database: {e}')
-
-    def _save_torrent_files_on_add(
-        self,
-        hash_id: str,
-        anime_id: int | None,
-        max_retries: int = 5,
-        retry_delay: float = 1.0
-    ) -> None:
-        """
-        Save torrent file information when download starts.
-
-        Waits for qBittorrent to parse the torrent and retrieves file list.
-        For magnet links, may need multiple retries to get metadata.
-
-        Args:
-            hash_id: Torrent hash.
-            anime_id: Anime ID for records.
-            max_retries: Maximum retry attempts for getting file list.
-            retry_delay: Delay between retries in seconds.
-        """
-        logger.debug(f'💾 正在保存种子文件信息: {hash_id[:8]}...')
-
-        torrent_files = []
-        for attempt in range(max_retries):
-            torrent_files = self._download_client.get_torrent_files(hash_id)
-            if torrent_files:
-                break
-            # Wait and retry (torrent may still be loading metadata)
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                logger.debug(f'  重试获取文件列表 ({attempt + 2}/{max_retries})...')
-
-        if not torrent_files:
-            logger.warning(f'⚠️ 无法获取种子文件列表: {hash_id[:8]} (可能是磁力链接等待元数据)')
-            return
-
-        logger.info(f'📋 获取到 {len(torrent_files)} 个文件，正在保存到数据库...')
-        for file_info in torrent_files:
-            self._save_torrent_file(
-                torrent_hash=hash_id,
-                file_path=file_info.get('name', ''),
-                file_size=file_info.get('size', 0),
-                anime_id=anime_id
-            )
-        logger.debug(f'✅ 种子文件信息保存完成: {hash_id[:8]}')
@@ -0,0 +1,209 @@
+"""
+Torrent file list capture service.
+
+Records the files of newly added torrents without blocking the caller.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.interfaces.adapters import IDownloadClient
+from src.core.interfaces.repositories import IDownloadRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingCapture:
+    """等待元数据的种子。"""
+    anime_id: int | None
+    deadline: float
+
+
+class TorrentFileResolver:
+    """
+    种子文件列表记录服务。
+
+    添加种子后记录其文件列表：
+    - 已有 .torrent 元数据（手动上传、为提取 hash 下载过的种子）时直接写入数据库
+    - 否则（磁力链接、qBittorrent 仍在下载 .torrent）交给后台线程，定期向
+      qBittorrent 查询，元数据就绪后再写入
+
+    调用方不会因等待元数据而阻塞。后台线程只在有待处理种子时运行。
+
+    Example:
+        >>> resolver = TorrentFileResolver(qb_client, download_repo)
+        >>> resolver.capture(hash_id, anime_id, files=rss_service.pop_torrent_files(hash_id))
+    """
+
+    POLL_INTERVAL_SECONDS = 2.0  # 查询 qBittorrent 的间隔
+    METADATA_TIMEOUT_SECONDS = 900  # 磁力链接等待元数据的最长时间
+
+    VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm')
+    SUBTITLE_EXTENSIONS = ('.srt', '.ass', '.ssa', '.vtt', '.sub')
+
+    def __init__(
+        self,
+        download_client: IDownloadClient,
+        download_repo: IDownloadRepository,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        metadata_timeout: float = METADATA_TIMEOUT_SECONDS
+    ):
+        """
+        初始化记录服务。
+
+        Args:
+            download_client: 下载客户端（qBittorrent）
+            download_repo: 下载记录仓储
+            poll_interval: 查询间隔（秒）
+            metadata_timeout: 等待元数据的最长时间（秒）
+        """
+        self._download_client = download_client
+        self._download_repo = download_repo
+        self._poll_interval = poll_interval
+        self._metadata_timeout = metadata_timeout
+        self._pending: dict[str, PendingCapture] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """等待元数据的种子数"""
+        with self._lock:
+            return len(self._pending)
+
+    def capture(
+        self,
+        hash_id: str,
+        anime_id: int | None,
+        files: list[dict[str, Any]] | None = None
+    ) -> None:
+        """
+        记录种子文件列表。
+
+        Args:
+            hash_id: 种子 hash
+            anime_id: 动漫 ID
+            files: 本地解析的文件列表；为空时异步向下载客户端获取
+        """
+        if not hash_id:
+            return
+
+        if files:
+            self.save_files(hash_id, files, anime_id)
+            return
+
+        with self._lock:
+            self._pending[hash_id] = PendingCapture(
+                anime_id=anime_id,
+                deadline=time.monotonic() + self._metadata_timeout
+            )
+            self._ensure_worker()
+        logger.debug(f'⏳ 等待种子元数据后记录文件列表: {hash_id[:8]}')
+
+    def save_files(
+        self,
+        hash_id: str,
+        files: list[dict[str, Any]],
+        anime_id: int | None
+    ) -> int:
+        """
+        将文件列表写入数据库。
+
+        Args:
+            hash_id: 种子 hash
+            files: 文件列表（name / size）
+            anime_id: 动漫 ID
+
+        Returns:
+            写入的文件数
+        """
+        logger.info(f'📋 获取到 {len(files)} 个文件，正在保存到数据库...')
+        saved = 0
+        for file_info in files:
+            file_path = file_info.get('name', '')
+            try:
+                self._download_repo.insert_torrent_file(
+                    torrent_hash=hash_id,
+                    file_path=file_path,
+                    file_size=file_info.get('size', 0),
+                    file_type=self._file_type(file_path),
+                    anime_id=anime_id
+                )
+                saved += 1
+            except Exception as e:
+                logger.warning(f'⚠️ Failed to save torrent file to database: {e}')
+        logger.debug(f'✅ 种子文件信息保存完成: {hash_id[:8]}')
+        return saved
+
+    def resolve_pending(self) -> int:
+        """
+        查询一轮等待中的种子，保存已就绪的文件列表。
+
+        Returns:
+            本轮完成记录的种子数
+        """
+        with self._lock:
+            pending = list(self._pending.items())
+
+        resolved = 0
+        now = time.monotonic()
+        for hash_id, capture in pending:
+            try:
+                files = self._download_client.get_torrent_files(hash_id)
+            except Exception as e:
+                logger.debug(f'获取种子文件列表失败: {hash_id[:8]} - {e}')
+                files = []
+
+            if files:
+                self.save_files(hash_id, files, capture.anime_id)
+                resolved += 1
+            elif now < capture.deadline:
+                continue
+            else:
+                logger.warning(f'⚠️ 无法获取种子文件列表: {hash_id[:8]} (等待元数据超时)')
+
+            with self._lock:
+                if self._pending.get(hash_id) is capture:
+                    del self._pending[hash_id]
+        return resolved
+
+    def stop(self) -> None:
+        """停止后台线程（未完成的种子会被丢弃）"""
+        self._stop.set()
+        worker = self._worker
+        if worker is not None:
+            worker.join(timeout=self._poll_interval + 1)
+
+    def _ensure_worker(self) -> None:
+        """按需启动后台线程（调用方需持有 _lock）"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=self._run, name='TorrentFileResolver', daemon=True
+        )
+        self._worker.start()
+
+    def _run(self) -> None:
+        """后台线程：定期查询，直到没有等待中的种子"""
+        while not self._stop.wait(self._poll_interval):
+            self.resolve_pending()
+            with self._lock:
+                if not self._pending:
+                    self._worker = None
+                    return
+
+    @classmethod
+    def _file_type(cls, file_path: str) -> str:
+        """根据扩展名判断文件类型"""
+        file_lower = file_path.lower()
+        if file_lower.endswith(cls.VIDEO_EXTENSIONS):
+            return 'video'
+        if file_lower.endswith(cls.SUBTITLE_EXTENSIONS):
+            return 'subtitle'
+        return 'other'
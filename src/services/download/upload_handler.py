@@ -8,7 +8,6 @@ import base64
 import logging
 import os
 import tempfile
-import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -30,6 +29,7 @@ from src.core.interfaces.repositories import (
     IHardlinkRepository,
 )
 from src.services.download.download_notifier import DownloadNotifier
+from src.services.download.torrent_file_resolver import TorrentFileResolver
 from src.services.file.path_builder import PathBuilder
 
 logger = logging.getLogger(__name__)
@@ -49,7 +49,8 @@ class UploadHandler:
         history_repo: IHardlinkRepository,
         download_client: IDownloadClient,
         path_builder: PathBuilder,
-        notifier: DownloadNotifier
+        notifier: DownloadNotifier,
+        torrent_file_resolver: TorrentFileResolver | None = None
     ):
         """
         Initialize the upload handler.
@@ -61,6 +62,8 @@ class UploadHandler:
             download_client: Download client (qBittorrent).
             path_builder: Path construction service.
             notifier: Download notifier service.
+            torrent_file_resolver: Records torrent file lists without
+                blocking on qBittorrent metadata.
         """
         self._anime_repo = anime_repo
         self._download_repo = download_repo
@@ -68,6 +71,9 @@ class UploadHandler:
         self._download_client = download_client
         self._path_builder = path_builder
         self._notifier = notifier
+        self._torrent_file_resolver = torrent_file_resolver or TorrentFileResolver(
+            download_client, download_repo
+        )
 
     def process_upload(self, data: dict[str, Any]) -> tuple[bool, str]:
         """
@@ -127,9 +133,10 @@ class UploadHandler:
 
             # Process based on upload type
             hash_id = None
+            torrent_files = None
 
             if upload_type == 'torrent':
-                hash_id = self._process_torrent_upload(data, save_path)
+                hash_id, torrent_files = self._process_torrent_upload(data, save_path)
             else:  # magnet
                 hash_id = self._process_magnet_upload(data, save_path)
 
@@ -150,8 +157,8 @@ class UploadHandler:
                 requires_tvdb=requires_tvdb
             )
 
-            # Save torrent files information
-            self._save_torrent_files_on_add(hash_id, anime_id)
+            # Save torrent files information (magnets are resolved in the background)
+            self._torrent_file_resolver.capture(hash_id, anime_id, files=torrent_files)
 
             # Record history (only on success)
             self._history_repo.insert_manual_upload_history(
@@ -197,9 +204,10 @@ class UploadHandler:
         self,
         data: dict[str, Any],
         save_path: str
-    ) -> str:
-        """Process torrent file upload."""
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Process torrent file upload, returning the hash and the file list."""
         from src.infrastructure.downloader.qbit_adapter import get_torrent_hash_from_file
+        from src.infrastructure.downloader.torrent_metainfo import read_torrent_files
 
         torrent_file = data.get('torrent_file')
         if not torrent_file:
@@ -219,7 +227,7 @@ class UploadHandler:
             result = self._download_client.add_torrent_file(temp_file_path, save_path)
             if not result:
                 raise ValueError('添加种子到qBittorrent失败（可能无法连接/登录qBittorrent）')
-            return hash_id
+            return hash_id, read_torrent_files(torrent_content)
         finally:
             if os.path.exists(temp_file_path):
                 os.unlink(temp_file_path)
@@ -314,77 +322,3 @@ class UploadHandler:
             download_time=datetime.now(UTC)
         )
         return self._download_repo.save(record)
-
-    def _save_torrent_file(
-        self,
-        torrent_hash: str,
-        file_path: str,
-        file_size: int,
-        anime_id: int | None
-    ) -> None:
-        """Save torrent file information."""
-        # Determine file type based on extension
-        file_type = 'other'
-        file_lower = file_path.lower()
-
-        if file_lower.endswith(('.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm')):
-            file_type = 'video'
-        elif file_lower.endswith(('.srt', '.ass', '.ssa', '.vtt', '.sub')):
-            file_type = 'subtitle'
-
-        # Save to database via repository
-        try:
-            self._download_repo.insert_torrent_file(
-                torrent_hash=torrent_hash,
-                file_path=file_path,
-                file_size=file_size,
-                file_type=file_type,
-                anime_id=anime_id
-            )
-        except Exception as e:
-            logger.warning(f'⚠️ Failed to save torrent file to database: {e}')
-
-    def _save_torrent_files_on_add(
-        self,
-        hash_id: str,
-        anime_id: int | None,
-        max_retries: int = 5,
-        retry_delay: float = 1.0
-    ) -> None:
-        """
-        Save torrent file information when download starts.
-
-        Waits for qBittorrent to parse the torrent and retrieves file list.
-        For magnet links, may need multiple retries to get metadata.
-
-        Args:
-            hash_id: Torrent hash.
-            anime_id: Anime ID for records.
-            max_retries: Maximum retry attempts for getting file list.
-            retry_delay: Delay between retries in seconds.
-        """
-        logger.debug(f'💾 正在保存种子文件信息: {hash_id[:8]}...')
-
-        torrent_files = []
-        for attempt in range(max_retries):
-            torrent_files = self._download_client.get_torrent_files(hash_id)
-            if torrent_files:
-                break
-            # Wait and retry (torrent may still be loading metadata)
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                logger.debug(f'  重试获取文件列表 ({attempt + 2}/{max_retries})...')
-
-        if not torrent_files:
-            logger.warning(f'⚠️ 无法获取种子文件列表: {hash_id[:8]} (可能是磁力链接等待元数据)')
-            return
-
-        logger.info(f'📋 获取到 {len(torrent_files)} 个文件，正在保存到数据库...')
-        for file_info in torrent_files:
-            self._save_torrent_file(
-                torrent_hash=hash_id,
-                file_path=file_info.get('name', ''),
-                file_size=file_info.get('size', 0),
-                anime_id=anime_id
-            )
-        logger.debug(f'✅ 种子文件信息保存完成: {hash_id[:8]}')
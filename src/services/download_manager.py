@@ -185,6 +185,21 @@ class DownloadManager:
         """
         return self._completion_handler.handle_completed(hash_id, webhook_data)
 
+    def handle_torrents_completed(
+        self,
+        items: list[tuple[str, dict[str, Any] | None]]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Handle several torrent completion events together.
+
+        Args:
+            items: (hash, webhook data) pairs.
+
+        Returns:
+            Result dictionary by hash.
+        """
+        return self._completion_handler.handle_completed_batch(items)
+
     # ==================== Status Management ====================
 
     def check_torrent_status(self, hash_id: str) -> dict[str, Any]:
@@ -227,6 +242,25 @@ class DownloadManager:
         """
         return self._status_service.delete_download(hash_id, delete_file, delete_hardlink)
 
+    def delete_downloads(
+        self,
+        hash_ids: list[str],
+        delete_file: bool,
+        delete_hardlink: bool
+    ) -> dict[str, Any]:
+        """
+        Delete several download tasks with one download client request.
+
+        Args:
+            hash_ids: Torrent hashes.
+            delete_file: Whether to delete original files.
+            delete_hardlink: Whether to delete hardlinks.
+
+        Returns:
+            Result dictionary.
+        """
+        return self._status_service.delete_downloads(hash_ids, delete_file, delete_hardlink)
+
     def redownload_from_history(
         self,
         hash_id: str,
@@ -8,6 +8,7 @@ Consolidated from FileService and HardlinkService for unified file management.
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 
@@ -29,6 +30,9 @@ class FileService:
     整合了原 HardlinkService 的所有功能。
     """
 
+    MAX_LINK_WORKERS = 4  # 并行创建链接/复制文件的线程数
+    COPY_CHUNK_SIZE = 64 * 1024 * 1024  # 内核复制每次调用的字节数
+
     def __init__(
         self,
         history_repo: IHardlinkRepository,
@@ -364,6 +368,112 @@ class FileService:
 
         return False
 
+    def create_many(
+        self,
+        links: list[tuple[str, str]],
+        target_dir: str,
+        anime_id: int | None = None,
+        torrent_hash: str | None = None
+    ) -> list[str | None]:
+        """
+        Create several hardlinks into a target directory.
+
+        Target directories are created once up front, links (or copy
+        fallbacks) are made concurrently with up to MAX_LINK_WORKERS threads,
+        and all results are recorded in one transaction.
+
+        Args:
+            links: (source path, new name) pairs; new names may include a
+                subdirectory like "Season 1/file.mkv".
+            target_dir: Target directory for the hardlinks.
+            anime_id: Optional anime ID for record keeping.
+            torrent_hash: Optional torrent hash for record keeping.
+
+        Returns:
+            Link method used for each pair ('hardlink' or 'copy'), or None
+            where it failed. Pairs sharing a target report the outcome of
+            the last one.
+        """
+        if not links:
+            return []
+
+        targets = [
+            os.path.join(target_dir, new_name.replace('/', os.sep).replace('\\', os.sep))
+            for _, new_name in links
+        ]
+
+        # Create every target directory once
+        ready_dirs = set()
+        for target_file_dir in dict.fromkeys(os.path.dirname(t) for t in targets):
+            if self._path_builder:
+                if self._path_builder.ensure_directory(target_file_dir):
+                    ready_dirs.add(target_file_dir)
+            else:
+                try:
+                    os.makedirs(target_file_dir, mode=0o775, exist_ok=True)
+                    ready_dirs.add(target_file_dir)
+                except OSError as e:
+                    logger.error(f'❌ Failed to create target directory {target_file_dir}: {e}')
+
+        def materialize(index: int) -> tuple[str | None, int, str | None]:
+            source = links[index][0]
+            target = targets[index]
+            if os.path.dirname(target) not in ready_dirs:
+                return None, 0, 'Failed to create target directory'
+            try:
+                file_size = os.path.getsize(source)
+            except OSError:
+                logger.error(f'❌ Source file does not exist: {source}')
+                return None, 0, 'Source file does not exist'
+            if os.path.lexists(target):
+                logger.info(f'🔄 Target already exists, replacing: {target}')
+                try:
+                    os.remove(target)
+                except OSError as e:
+                    logger.error(f'❌ Failed to remove existing file: {e}')
+                    return None, file_size, str(e)
+            link_method = self._create_link(source, target)
+            return link_method, file_size, None if link_method else 'Failed to link or copy file'
+
+        # Pairs mapping to the same target would race on remove-then-link;
+        # as with sequential create() calls, the last pair wins
+        last_index = {target: index for index, target in enumerate(targets)}
+        indices = list(last_index.values())
+
+        workers = min(self.MAX_LINK_WORKERS, len(indices))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='link') as pool:
+            outcomes = dict(zip(indices, pool.map(materialize, indices), strict=True))
+
+        records = []
+        failures = []
+        now = datetime.now(UTC)
+        for index, (link_method, file_size, error) in outcomes.items():
+            source, new_name = links[index]
+            record = HardlinkRecord(
+                anime_id=anime_id,
+                torrent_hash=torrent_hash or '',
+                original_file_path=source,
+                hardlink_path=targets[index],
+                file_size=file_size,
+                link_method=link_method or 'hardlink',
+                created_at=now
+            )
+            if link_method:
+                records.append(record)
+                logger.info(
+                    f'🔗 Created {link_method}: '
+                    f'{os.path.basename(source)} -> {new_name}'
+                )
+            else:
+                failures.append((record, error))
+
+        try:
+            self._history_repo.save_many(records, failures)
+        except Exception as e:
+            logger.error(f'❌ Failed to save hardlink records: {e}')
+
+        return [outcomes[last_index[target]][0] for target in targets]
+
     def _create_link(self, source: str, target: str) -> str | None:
         """
         Create a link from source to target, using hardlink or copy fallback.
@@ -384,12 +494,73 @@ class FileService:
 
         # Fallback to copy
         try:
-            shutil.copy2(source, target)
+            self._copy_file(source, target)
             return 'copy'
         except (OSError, shutil.Error) as e:
             logger.error(f'❌ Failed to copy file: {e}')
             return None
 
+    @classmethod
+    def _copy_file(cls, source: str, target: str) -> None:
+        """
+        Copy a file with its metadata, letting the kernel move the data.
+
+        Uses copy_file_range (server-side copy / reflink where the
+        filesystem supports it), then sendfile, then a buffered copy.
+
+        Args:
+            source: Source file path.
+            target: Target file path.
+        """
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            size = os.fstat(src.fileno()).st_size
+            if not cls._kernel_copy(src.fileno(), dst.fileno(), size):
+                dst.seek(0)
+                dst.truncate()
+                shutil.copyfileobj(src, dst, cls.COPY_CHUNK_SIZE)
+        shutil.copystat(source, target)
+
+    @classmethod
+    def _kernel_copy(cls, src_fd: int, dst_fd: int, size: int) -> bool:
+        """
+        Copy size bytes between file descriptors without user-space buffers.
+
+        Args:
+            src_fd: Source file descriptor.
+            dst_fd: Target file descriptor (empty, positioned at 0).
+            size: Number of bytes to copy.
+
+        Returns:
+            True if copied, False if neither syscall is usable here.
+        """
+        for name in ('copy_file_range', 'sendfile'):
+            if not hasattr(os, name):
+                continue
+            copied = 0
+            try:
+                while copied < size:
+                    count = min(cls.COPY_CHUNK_SIZE, size - copied)
+                    if name == 'copy_file_range':
+                        sent = os.copy_file_range(src_fd, dst_fd, count, copied, copied)
+                    else:
+                        sent = os.sendfile(dst_fd, src_fd, copied, count)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError as e:
+                logger.debug(f'{name} unavailable ({e}), trying next copy method')
+                os.ftruncate(dst_fd, 0)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                continue
+            if copied == size:
+                return True
+            if copied == 0:
+                # 部分文件系统不支持时直接返回 0，而不是报错
+                logger.debug(f'{name} copied nothing, trying next copy method')
+                continue
+            raise OSError(f'Short copy: {copied} of {size} bytes')
+        return False
+
     def delete_by_torrent(self, torrent_hash: str, delete_files: bool = False) -> int:
         """
         Delete hardlink records for a torrent.
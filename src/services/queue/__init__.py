@@ -4,13 +4,14 @@ Queue services module.
 Contains queue worker implementations for background task processing.
 """
 
-from src.services.queue.queue_worker import QueueEvent, QueueWorker
+from src.services.queue.queue_worker import EventPriority, QueueEvent, QueueWorker
 from src.services.queue.rss_queue import RSSQueueWorker
 from src.services.queue.webhook_queue import WebhookQueueWorker
 
 __all__ = [
     'QueueWorker',
     'QueueEvent',
+    'EventPriority',
     'WebhookQueueWorker',
     'RSSQueueWorker',
 ]
@@ -4,21 +4,39 @@ Queue worker base module.
 Provides base class for background queue processing with pause/resume/stop functionality.
 """
 
+import dataclasses
+import json
 import logging
 import queue
 import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Generic, TypeVar
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from src.infrastructure.repositories.queue_event_repository import (
+        QueueEventRepository,
+    )
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 
+class EventPriority(IntEnum):
+    """Priority classes of queue events (lower value is served first)."""
+    INTERACTIVE = 0  # 用户在 WebUI 中触发
+    WEBHOOK = 1      # 下载器 Webhook 触发
+    SCHEDULED = 2    # 定时任务触发
+    BACKFILL = 3     # 批量回填（如获取所有番组）
+
+
 @dataclass
 class QueueEvent(Generic[T]):
     """
@@ -32,12 +50,25 @@ class QueueEvent(Generic[T]):
         payload: Event data/payload.
         received_at: UTC timestamp when event was received.
         metadata: Optional additional metadata.
+        priority: Priority class (EventPriority); resolved by the worker if None.
+        deadline: Optional UTC time after which the event is dropped unprocessed.
     """
     event_type: str
     payload: T
     queue_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
     received_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     metadata: dict[str, Any] = field(default_factory=dict)
+    priority: int | None = None
+    deadline: datetime | None = None
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        """Check whether the event's deadline has passed."""
+        if self.deadline is None:
+            return False
+        deadline = self.deadline
+        if deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=UTC)
+        return (now or datetime.now(UTC)) > deadline
 
     def to_dict(self) -> dict[str, Any]:
         """Convert event to dictionary representation."""
@@ -45,7 +76,9 @@ class QueueEvent(Generic[T]):
             'queue_id': self.queue_id,
             'event_type': self.event_type,
             'received_at_utc': self.received_at.isoformat(),
-            'metadata': self.metadata
+            'metadata': self.metadata,
+            'priority': self.priority,
+            'deadline_utc': self.deadline.isoformat() if self.deadline else None
         }
         # 尝试从 payload 中获取 name 作为 display_name
         if hasattr(self.payload, 'name') and self.payload.name:
@@ -63,6 +96,7 @@ class QueueStats:
     total_processed: int = 0
     total_success: int = 0
     total_failed: int = 0
+    total_coalesced: int = 0
     processing_start_time: datetime | None = None
 
     @property
@@ -73,37 +107,254 @@ class QueueStats:
         return (self.total_success / self.total_processed) * 100
 
 
+class PriorityLanes:
+    """
+    One FIFO lane per priority class, with aging.
+
+    The head of every lane competes on its effective priority: the class
+    value minus one level for each aging_seconds spent waiting, ties broken
+    by arrival order. Aging never promotes an event into the interactive
+    lane, so user-triggered events always go first while scheduled and
+    backfill events still cannot starve each other.
+
+    Implements the subset of the queue.Queue API used by QueueWorker.
+    """
+
+    def __init__(self, aging_seconds: float = 120.0):
+        """
+        Initialize the lanes.
+
+        Args:
+            aging_seconds: Waiting time that raises an event by one priority level.
+        """
+        self._aging_seconds = aging_seconds
+        self._lanes: dict[int, deque[tuple[int, float, QueueEvent]]] = {}
+        self._seq = 0
+        self.mutex = threading.Lock()
+
+    def put(self, event: QueueEvent) -> None:
+        """Append an event to the lane of its priority."""
+        priority = EventPriority.SCHEDULED if event.priority is None else event.priority
+        with self.mutex:
+            self._seq += 1
+            self._lanes.setdefault(priority, deque()).append(
+                (self._seq, time.monotonic(), event)
+            )
+
+    def get_nowait(self) -> QueueEvent:
+        """
+        Remove and return the event to serve next.
+
+        Raises:
+            queue.Empty: If all lanes are empty.
+        """
+        with self.mutex:
+            now = time.monotonic()
+            best_lane = None
+            best_rank = None
+            for priority, lane in self._lanes.items():
+                if not lane:
+                    continue
+                seq, enqueued_at, _ = lane[0]
+                rank = (self._effective_priority(priority, now - enqueued_at), seq)
+                if best_rank is None or rank < best_rank:
+                    best_lane, best_rank = lane, rank
+            if best_lane is None:
+                raise queue.Empty
+            return best_lane.popleft()[2]
+
+    def take(
+        self,
+        predicate: Callable[[QueueEvent], bool],
+        limit: int
+    ) -> list[QueueEvent]:
+        """
+        Remove and return up to limit queued events matching predicate.
+
+        Lanes are scanned in priority order; the order of the remaining
+        events is preserved.
+
+        Args:
+            predicate: Selects the events to take.
+            limit: Maximum number of events.
+
+        Returns:
+            Taken events in priority, then arrival order.
+        """
+        taken: list[QueueEvent] = []
+        with self.mutex:
+            for _, lane in sorted(self._lanes.items()):
+                if len(taken) >= limit:
+                    break
+                kept = deque()
+                for entry in lane:
+                    if len(taken) < limit and predicate(entry[2]):
+                        taken.append(entry[2])
+                    else:
+                        kept.append(entry)
+                lane.clear()
+                lane.extend(kept)
+        return taken
+
+    def _effective_priority(self, priority: int, waited: float) -> int:
+        """Priority after aging; never promoted above the webhook class."""
+        if priority <= EventPriority.WEBHOOK or self._aging_seconds <= 0:
+            return priority
+        levels = int(waited // self._aging_seconds)
+        return max(priority - levels, EventPriority.WEBHOOK)
+
+    def promote(self, event: QueueEvent, priority: int) -> bool:
+        """
+        Move a queued event to a more urgent lane.
+
+        Args:
+            event: Queued event.
+            priority: New priority class.
+
+        Returns:
+            True if the event was found in the lanes.
+        """
+        with self.mutex:
+            current = EventPriority.SCHEDULED if event.priority is None else event.priority
+            lane = self._lanes.get(current)
+            if not lane:
+                return False
+            for index, entry in enumerate(lane):
+                if entry[2] is event:
+                    del lane[index]
+                    break
+            else:
+                return False
+            event.priority = priority
+            self._seq += 1
+            self._lanes.setdefault(priority, deque()).append(
+                (self._seq, time.monotonic(), event)
+            )
+            return True
+
+    def qsize(self) -> int:
+        """Return the number of queued events."""
+        with self.mutex:
+            return sum(len(lane) for lane in self._lanes.values())
+
+    def empty(self) -> bool:
+        """Check if all lanes are empty."""
+        return self.qsize() == 0
+
+    def lane_sizes(self) -> dict[str, int]:
+        """Return the number of queued events per priority class."""
+        with self.mutex:
+            return {
+                EventPriority(priority).name.lower(): len(lane)
+                for priority, lane in sorted(self._lanes.items())
+                if lane
+            }
+
+    @property
+    def queue(self) -> list[QueueEvent]:
+        """Snapshot of queued events ordered by priority class, then arrival."""
+        with self.mutex:
+            return [
+                entry[2]
+                for _, lane in sorted(self._lanes.items())
+                for entry in lane
+            ]
+
+
+@dataclass
+class WorkerSlot:
+    """
+    State of a single worker thread in the pool.
+
+    Attributes:
+        index: Worker index within the pool.
+        thread: The worker thread.
+        current_event: Event being processed, if any.
+        partition_key: Partition key held while processing current_event.
+        started_at: UTC timestamp when processing of current_event began.
+        processed: Number of events processed by this worker.
+        retired: Set when the pool shrinks; the thread exits after its
+            current event.
+    """
+    index: int
+    thread: threading.Thread | None = None
+    current_event: QueueEvent | None = None
+    partition_key: str | None = None
+    started_at: datetime | None = None
+    processed: int = 0
+    retired: bool = False
+
+
 class QueueWorker(ABC, Generic[T]):
     """
     Abstract base class for queue workers.
 
     Provides background queue processing with:
-    - Pause/resume functionality (thread keeps running but doesn't process)
-    - Stop/start functionality (completely stops/starts the worker thread)
+    - Pause/resume functionality (threads keep running but don't process)
+    - Stop/start functionality (completely stops/starts the worker threads)
+    - Optional worker pool (num_workers > 1) with partition keys: events
+      sharing a key are processed one at a time in enqueue order, while
+      events with different keys run concurrently
     - Event statistics tracking
     - Thread-safe operations
 
-    Subclasses must implement the _handle_event method.
+    - Optional durable backing store (attach_store): events are written
+      ahead before entering the in-memory queue, acknowledged on success
+      and replayed on startup via restore_pending
+    - Coalescing: enqueuing an event whose coalesce key matches an event
+      that is still pending returns the pending event instead
+
+    Subclasses must implement the _handle_event method and may override
+    _partition_key to enable per-key serialization and _coalesce_key to
+    deduplicate pending events. Subclasses using a store list their
+    payload dataclasses in PAYLOAD_TYPES.
     """
 
-    def __init__(self, name: str, max_failures: int = 5):
+    # Payload dataclasses that can be restored from the durable store
+    PAYLOAD_TYPES: tuple[type, ...] = ()
+
+    # Number of acknowledgements between two store compactions
+    COMPACT_EVERY = 500
+
+    # Priority of events enqueued without an explicit priority
+    DEFAULT_PRIORITY = EventPriority.SCHEDULED
+
+    # Waiting time that raises a queued event by one priority level
+    AGING_SECONDS = 120.0
+
+    def __init__(self, name: str, max_failures: int = 5, num_workers: int = 1):
         """
         Initialize the queue worker.
 
         Args:
             name: Worker name for logging.
             max_failures: Maximum consecutive failures before logging warning.
+            num_workers: Number of worker threads processing the queue.
         """
         self._name = name
-        self._queue: queue.Queue[QueueEvent[T]] = queue.Queue()
-        self._thread: threading.Thread | None = None
+        self._queue = PriorityLanes(aging_seconds=self.AGING_SECONDS)
         self._stop_event = threading.Event()
         self._pause_event = threading.Event()
-        self._current_event: QueueEvent[T] | None = None
-        self._processing_started_at: datetime | None = None
         self._consecutive_failures = 0
         self._max_failures = max_failures
         self._lock = threading.Lock()
+        # Signalled on enqueue, key release, resume and stop; idle workers
+        # block on it instead of polling
+        self._work_available = threading.Condition(self._lock)
+
+        # Worker pool and partition state
+        self._num_workers = max(1, num_workers)
+        self._slots: list[WorkerSlot] = []
+        self._local = threading.local()
+        self._active_keys: set[str] = set()
+        self._blocked: dict[str, deque[QueueEvent[T]]] = {}
+
+        # Pending (not yet claimed) events by coalesce key
+        self._pending: dict[str, QueueEvent[T]] = {}
+
+        # Durable backing store
+        self._store: QueueEventRepository | None = None
+        self._acks_since_compact = 0
 
         # Statistics
         self._stats = QueueStats()
@@ -113,42 +364,210 @@ class QueueWorker(ABC, Generic[T]):
         """Return the worker name."""
         return self._name
 
+    @property
+    def num_workers(self) -> int:
+        """Return the configured number of worker threads."""
+        return self._num_workers
+
+    @property
+    def _current_event(self) -> QueueEvent[T] | None:
+        """
+        Return the event being processed.
+
+        Inside a worker thread this is the event handled by that thread;
+        elsewhere it is the first in-flight event of the pool.
+        """
+        slot = getattr(self._local, 'slot', None)
+        if slot is not None:
+            return slot.current_event
+        for slot in self._slots:
+            if slot.current_event is not None:
+                return slot.current_event
+        return None
+
+    def set_num_workers(self, num_workers: int) -> None:
+        """
+        Change the number of worker threads.
+
+        Takes effect immediately if running: extra threads are started, or
+        surplus threads exit after finishing their current event. Otherwise
+        it applies on the next start().
+
+        Args:
+            num_workers: New number of worker threads.
+        """
+        num_workers = max(1, num_workers)
+        with self._work_available:
+            if num_workers == self._num_workers:
+                return
+            self._num_workers = num_workers
+            if self.is_running():
+                for slot in self._slots[num_workers:]:
+                    slot.retired = True
+                self._slots = self._slots[:num_workers]
+                for index in range(len(self._slots), num_workers):
+                    self._slots.append(self._start_slot(index))
+                self._work_available.notify_all()
+        logger.info(f'⚙️ [{self._name}] Worker count set to {num_workers}')
+
+    def attach_store(self, store: 'QueueEventRepository') -> None:
+        """
+        Attach a durable backing store.
+
+        From now on every enqueued event is persisted before it becomes
+        visible to the workers and removed once processed successfully.
+
+        Args:
+            store: Queue event repository.
+        """
+        self._store = store
+
+    def restore_pending(self) -> int:
+        """
+        Replay events left unfinished by a previous run.
+
+        Should be called once after attach_store() and before start().
+        Events that cannot be decoded are marked as failed.
+
+        Returns:
+            Number of events put back into the queue.
+        """
+        if self._store is None:
+            return 0
+
+        try:
+            self._store.compact(self._name)
+            records = self._store.load_pending(self._name)
+        except Exception as e:
+            logger.warning(f'⚠️ [{self._name}] 加载持久化队列失败: {e}')
+            return 0
+
+        restored = 0
+        for record in records:
+            try:
+                event = QueueEvent(
+                    event_type=record['event_type'],
+                    payload=self._deserialize_payload(
+                        record['payload_type'], json.loads(record['payload'])
+                    ),
+                    queue_id=record['queue_id'],
+                    received_at=record['received_at'] or datetime.now(UTC),
+                    metadata=json.loads(record['metadata'] or '{}'),
+                    priority=record.get('priority'),
+                    deadline=record.get('deadline')
+                )
+                if event.deadline is not None and event.deadline.tzinfo is None:
+                    event.deadline = event.deadline.replace(tzinfo=UTC)
+            except Exception as e:
+                logger.warning(
+                    f'⚠️ [{self._name}] 无法恢复队列事件 {record["queue_id"]}: {e}'
+                )
+                self._store_call('mark_failed', record['queue_id'], f'restore failed: {e}')
+                continue
+            if event.priority is None:
+                event.priority = self._resolve_priority(event)
+            if self._coalesce_pending(event) is not None:
+                self._store_call('ack', event.queue_id)
+                continue
+            self._queue.put(event)
+            restored += 1
+        self._wake_workers()
+
+        if restored:
+            logger.info(f'♻️ [{self._name}] 已恢复 {restored} 个未完成的队列事件')
+        return restored
+
+    def _serialize_payload(self, payload: T) -> tuple[str, str]:
+        """Serialize a payload to (type name, JSON) for the durable store."""
+        if dataclasses.is_dataclass(payload) and not isinstance(payload, type):
+            type_name = type(payload).__name__
+            data = dataclasses.asdict(payload)
+        else:
+            type_name = ''
+            data = payload
+        return type_name, json.dumps(data, ensure_ascii=False, default=str)
+
+    def _deserialize_payload(self, type_name: str, data: Any) -> T:
+        """Rebuild a payload serialized by _serialize_payload."""
+        if not type_name:
+            return data
+        for payload_type in self.PAYLOAD_TYPES:
+            if payload_type.__name__ == type_name:
+                return payload_type(**data)
+        raise ValueError(f'Unknown payload type: {type_name}')
+
+    def _store_call(self, method: str, *args) -> Any:
+        """Call a store method for this queue, logging (not raising) errors."""
+        if self._store is None:
+            return None
+        try:
+            return getattr(self._store, method)(self._name, *args)
+        except Exception as e:
+            logger.warning(f'⚠️ [{self._name}] 持久化队列操作失败 ({method}): {e}')
+            return None
+
+    def _ack(self, event: QueueEvent[T]) -> None:
+        """Acknowledge a processed event and compact the store periodically."""
+        if self._store is None:
+            return
+        self._store_call('ack', event.queue_id)
+        with self._lock:
+            self._acks_since_compact += 1
+            compact = self._acks_since_compact >= self.COMPACT_EVERY
+            if compact:
+                self._acks_since_compact = 0
+        if compact:
+            self._store_call('compact')
+
     def start(self) -> None:
         """
-        Start the worker thread.
+        Start the worker threads.
 
-        If the thread is already running, this is a no-op.
+        If the threads are already running, this is a no-op.
         """
-        if self._thread and self._thread.is_alive():
+        if any(slot.thread and slot.thread.is_alive() for slot in self._slots):
             logger.debug(f'[{self._name}] Worker already running')
             return
 
         self._stop_event.clear()
         self._pause_event.clear()
-        self._thread = threading.Thread(target=self._run, daemon=True, name=self._name)
-        self._thread.start()
-        logger.info(f'🚀 [{self._name}] Worker started')
+        self._slots = [self._start_slot(i) for i in range(self._num_workers)]
+        logger.info(f'🚀 [{self._name}] Worker started ({self._num_workers} threads)')
+
+    def _start_slot(self, index: int) -> WorkerSlot:
+        """Create a worker slot and start its thread."""
+        slot = WorkerSlot(index=index)
+        thread_name = self._name if self._num_workers == 1 else f'{self._name}-{index}'
+        slot.thread = threading.Thread(
+            target=self._run, args=(slot,), daemon=True, name=thread_name
+        )
+        slot.thread.start()
+        return slot
 
     def stop(self) -> None:
         """
-        Stop the worker thread completely.
+        Stop the worker threads completely.
 
-        The queue is preserved but the thread exits.
+        The queue is preserved but the threads exit.
         Use start() to restart processing.
         """
         self._stop_event.set()
-        self._pause_event.set()  # Unblock pause wait
-        if self._thread:
-            self._thread.join(timeout=5)
-            if self._thread.is_alive():
-                logger.warning(f'⚠️ [{self._name}] Worker thread did not stop cleanly')
+        self._pause_event.set()
+        self._wake_workers()
+        for slot in self._slots:
+            if slot.thread:
+                slot.thread.join(timeout=5)
+                if slot.thread.is_alive():
+                    logger.warning(
+                        f'⚠️ [{self._name}] Worker thread {slot.index} did not stop cleanly'
+                    )
         logger.info(f'🛑 [{self._name}] Worker stopped')
 
     def pause(self) -> None:
         """
         Pause queue processing.
 
-        The thread continues running but doesn't process new events.
+        The threads continue running but don't process new events.
         Events can still be added to the queue.
         """
         self._pause_event.set()
@@ -161,6 +580,7 @@ class QueueWorker(ABC, Generic[T]):
         Has no effect if the worker is not paused.
         """
         self._pause_event.clear()
+        self._wake_workers()
         logger.info(f'▶️ [{self._name}] Worker resumed')
 
     def is_paused(self) -> bool:
@@ -174,14 +594,13 @@ class QueueWorker(ABC, Generic[T]):
 
     def is_running(self) -> bool:
         """
-        Check if the worker thread is running.
+        Check if the worker threads are running.
 
         Returns:
-            True if thread is alive and not stopped.
+            True if any worker thread is alive and not stopped.
         """
         return (
-            self._thread is not None and
-            self._thread.is_alive() and
+            any(slot.thread and slot.thread.is_alive() for slot in self._slots) and
             not self._stop_event.is_set()
         )
 
@@ -201,7 +620,7 @@ class QueueWorker(ABC, Generic[T]):
         Returns:
             Number of events in the queue.
         """
-        return self._queue.qsize()
+        return self.get_queue_size()
 
     def enqueue(self, event: QueueEvent[T]) -> QueueEvent[T]:
         """
@@ -211,14 +630,55 @@ class QueueWorker(ABC, Generic[T]):
             event: Event to add.
 
         Returns:
-            The enqueued event with queue_id.
+            The enqueued event with queue_id, or the pending event it was
+            coalesced into.
         """
+        if event.priority is None:
+            event.priority = self._resolve_priority(event)
+        existing = self._coalesce_pending(event)
+        if existing is not None:
+            logger.debug(
+                f'🔁 [{self._name}] 合并重复事件 {event.event_type} -> {existing.queue_id}'
+            )
+            if self._store is not None:
+                # 合并可能提升了优先级、放宽了截止时间或改写了载荷，同步到持久化记录
+                _, payload = self._serialize_payload(existing.payload)
+                self._store_call(
+                    'update',
+                    existing.queue_id,
+                    payload,
+                    existing.priority,
+                    existing.deadline
+                )
+            return existing
+        if self._store is not None:
+            payload_type, payload = self._serialize_payload(event.payload)
+            self._store_call(
+                'append',
+                event.queue_id,
+                event.event_type,
+                payload_type,
+                payload,
+                json.dumps(event.metadata, ensure_ascii=False, default=str),
+                event.received_at,
+                event.priority,
+                event.deadline
+            )
         self._queue.put(event)
+        with self._work_available:
+            self._work_available.notify()
         queue_size = self._queue.qsize()
         logger.debug(f'📥 [{self._name}] Event enqueued, queue size: {queue_size}')
         return event
 
-    def enqueue_event(self, event_type: str, payload: T, **metadata) -> QueueEvent[T]:
+    def enqueue_event(
+        self,
+        event_type: str,
+        payload: T,
+        priority: int | None = None,
+        deadline: datetime | None = None,
+        **metadata
+    ) -> QueueEvent[T]:
         """
         Create and enqueue an event.
 
@@ -227,6 +687,8 @@ class QueueWorker(ABC, Generic[T]):
         Args:
             event_type: Type identifier for the event.
             payload: Event data.
+            priority: Priority class (EventPriority); resolved by the worker if None.
+            deadline: Optional UTC time after which the event is dropped.
             **metadata: Additional metadata.
 
         Returns:
@@ -235,50 +697,331 @@ class QueueWorker(ABC, Generic[T]):
         event = QueueEvent(
             event_type=event_type,
             payload=payload,
-            metadata=metadata
+            metadata=metadata,
+            priority=priority,
+            deadline=deadline
         )
         return self.enqueue(event)
 
-    def _run(self) -> None:
+    def _coalesce_key(self, event: QueueEvent[T]) -> str | None:
+        """
+        Return the coalesce key of an event.
+
+        While an event with the same key is pending, enqueuing another one
+        is a no-op. The default uses metadata['coalesce_key'] if present.
+
+        Args:
+            event: Event to inspect.
+
+        Returns:
+            Coalesce key, or None if the event is never deduplicated.
+        """
+        return event.metadata.get('coalesce_key')
+
+    def _coalesce_pending(self, event: QueueEvent[T]) -> QueueEvent[T] | None:
+        """
+        Merge an event into a pending duplicate, or register it as pending.
+
+        The pending event keeps its place and payload. It is promoted if the
+        duplicate is more urgent, and its deadline is extended to the later
+        of the two.
+
+        Args:
+            event: Event about to be enqueued.
+
+        Returns:
+            The pending event, or None if the event must be enqueued.
+        """
+        key = self._coalesce_key(event)
+        if key is None:
+            return None
+        with self._lock:
+            existing = self._pending.get(key)
+            if existing is None:
+                self._pending[key] = event
+                return None
+            if event.priority is not None and event.priority < existing.priority:
+                self._queue.promote(existing, event.priority)
+            if existing.deadline is not None:
+                if event.deadline is None:
+                    existing.deadline = None
+                else:
+                    existing.deadline = max(existing.deadline, event.deadline)
+            self._stats.total_coalesced += 1
+        self._on_coalesced(existing, event)
+        return existing
+
+    def _on_coalesced(self, existing: QueueEvent[T], duplicate: QueueEvent[T]) -> None:
+        """
+        Called after a duplicate event was merged into a pending one.
+
+        Args:
+            existing: The pending event that is kept.
+            duplicate: The event that was dropped.
+        """
+
+    def _forget_pending(self, event: QueueEvent[T]) -> None:
+        """Unregister a claimed event's coalesce key (caller must hold _lock)."""
+        key = self._coalesce_key(event)
+        if key is not None and self._pending.get(key) is event:
+            del self._pending[key]
+
+    def _resolve_priority(self, event: QueueEvent[T]) -> int:
+        """
+        Return the priority of an event enqueued without one.
+
+        Subclasses may override this to classify events by type or payload.
+
+        Args:
+            event: Event being enqueued.
+
+        Returns:
+            Priority class (EventPriority).
+        """
+        return self.DEFAULT_PRIORITY
+
+    def _on_expired(self, event: QueueEvent[T]) -> None:
+        """
+        Called when an event is dropped because its deadline passed.
+
+        Args:
+            event: The expired event.
+        """
+        logger.info(
+            f'⌛ [{self._name}] 事件已过期，跳过处理: {event.event_type} ({event.queue_id})'
+        )
+
+    def _run(self, slot: WorkerSlot) -> None:
         """
         Main worker loop.
 
-        Processes events from the queue until stopped.
-        Respects pause state by waiting without exiting.
+        Processes events from the queue until stopped. While idle or
+        paused the thread blocks on a condition variable and is woken
+        only by enqueue, key release, resume or stop.
+
+        Args:
+            slot: State of the worker thread running this loop.
         """
-        logger.debug(f'[{self._name}] Worker thread started')
+        logger.debug(f'[{self._name}] Worker thread {slot.index} started')
+        self._local.slot = slot
+
+        while True:
+            try:
+                claimed = self._next_event(slot)
+                if claimed is None:
+                    break
+                event, key = claimed
+                try:
+                    self._process_event(event, slot, key)
+                finally:
+                    self._release_key(key)
+            except Exception as e:
+                logger.exception(f'❌ [{self._name}] Unexpected error in worker loop: {e}')
+                self._on_failure()
 
-        while not self._stop_event.is_set():
-            # Handle pause state - wait without exiting
-            while self._pause_event.is_set() and not self._stop_event.is_set():
-                time.sleep(0.5)
+        logger.debug(f'[{self._name}] Worker thread {slot.index} exiting')
 
-            if self._stop_event.is_set():
-                break
+    def _wake_workers(self) -> None:
+        """Wake all workers so they re-check stop/pause state and pending work."""
+        with self._work_available:
+            self._work_available.notify_all()
+
+    def _next_event(
+        self,
+        slot: WorkerSlot | None = None
+    ) -> tuple[QueueEvent[T], str | None] | None:
+        """
+        Block until an event may be processed, then claim it.
+
+        Events whose partition key is held by another worker (or already
+        waiting behind it) are parked in a per-key backlog, and picked up
+        first once the key is released, preserving per-key order.
 
+        Args:
+            slot: State of the calling worker thread.
+
+        Returns:
+            Tuple of (event, partition key), or None once the worker is
+            stopped or its slot retired.
+        """
+        while True:
+            expired: list[QueueEvent[T]] = []
+            with self._work_available:
+                claimed = None
+                while not self._stop_event.is_set() and not (slot and slot.retired):
+                    if not self._pause_event.is_set():
+                        claimed = self._claim_ready_event(expired)
+                        if claimed is not None or expired:
+                            break
+                    self._work_available.wait()
+
+            for event in expired:
+                self._expire(event)
+            if claimed is not None:
+                return claimed
+            if self._stop_event.is_set() or (slot and slot.retired):
+                return None
+
+    def _expire(self, event: QueueEvent[T]) -> None:
+        """Drop an expired event: notify the subclass and acknowledge it."""
+        try:
+            self._on_expired(event)
+        except Exception as e:
+            logger.warning(f'⚠️ [{self._name}] 过期事件回调失败: {e}')
+        self._store_call('ack', event.queue_id)
+
+    def _claim_ready_event(
+        self,
+        expired: list[QueueEvent[T]]
+    ) -> tuple[QueueEvent[T], str | None] | None:
+        """
+        Claim a ready event without blocking (caller must hold _lock).
+
+        Events whose deadline has passed are moved to expired instead.
+        """
+        now = datetime.now(UTC)
+        for key, backlog in list(self._blocked.items()):
+            if key in self._active_keys:
+                continue
+            while backlog and backlog[0].is_expired(now):
+                self._forget_pending(backlog[0])
+                expired.append(backlog.popleft())
+            if not backlog:
+                del self._blocked[key]
+                continue
+            event = backlog.popleft()
+            if not backlog:
+                del self._blocked[key]
+            self._forget_pending(event)
+            self._active_keys.add(key)
+            return event, key
+
+        while True:
             try:
-                # Try to get an event with timeout
-                event = self._queue.get(timeout=1.0)
-                self._process_event(event)
+                event = self._queue.get_nowait()
             except queue.Empty:
-                # No event available, continue loop
+                return None
+
+            if event.is_expired(now):
+                self._forget_pending(event)
+                expired.append(event)
                 continue
-            except Exception as e:
-                logger.exception(f'❌ [{self._name}] Unexpected error in worker loop: {e}')
+
+            key = self._partition_key(event)
+            if key is not None and (key in self._active_keys or key in self._blocked):
+                # Parked events stay pending and keep absorbing duplicates
+                self._blocked.setdefault(key, deque()).append(event)
+                continue
+            self._forget_pending(event)
+            if key is not None:
+                self._active_keys.add(key)
+            return event, key
+
+    def _claim_batch(
+        self,
+        predicate: Callable[[QueueEvent[T]], bool],
+        limit: int
+    ) -> list[QueueEvent[T]]:
+        """
+        Claim further queued events to be handled together with the current one.
+
+        Only events without a partition key are claimed, so per-key ordering
+        is unaffected. Claimed events must be settled with _settle_batch.
+
+        Args:
+            predicate: Selects the events that can join the batch.
+            limit: Maximum number of additional events.
+
+        Returns:
+            Claimed events (possibly empty).
+        """
+        if limit <= 0:
+            return []
+        now = datetime.now(UTC)
+        with self._lock:
+            events = self._queue.take(
+                lambda event: (
+                    predicate(event)
+                    and not event.is_expired(now)
+                    and self._partition_key(event) is None
+                ),
+                limit
+            )
+            for event in events:
+                self._forget_pending(event)
+        return events
+
+    def _settle_batch(
+        self,
+        events: list[QueueEvent[T]],
+        failures: dict[str, str] | None = None
+    ) -> None:
+        """
+        Record the outcome of events claimed with _claim_batch.
+
+        Args:
+            events: Claimed events.
+            failures: Error message by queue_id for events that failed.
+        """
+        failures = failures or {}
+        for event in events:
+            error = failures.get(event.queue_id)
+            if error is None:
+                self._on_success()
+                self._ack(event)
+            else:
                 self._on_failure()
+                self._store_call('mark_failed', event.queue_id, error)
+            with self._lock:
+                self._stats.total_processed += 1
+
+    def _release_key(self, key: str | None) -> None:
+        """Release a partition key after its event has been processed."""
+        if key is None:
+            return
+        with self._work_available:
+            self._active_keys.discard(key)
+            if key in self._blocked:
+                self._work_available.notify()
+
+    def _partition_key(self, event: QueueEvent[T]) -> str | None:
+        """
+        Return the partition key of an event.
 
-        logger.debug(f'[{self._name}] Worker thread exiting')
+        Events with the same key are never processed concurrently. The
+        default uses metadata['partition_key'] if present; subclasses may
+        override this to derive a key from the payload.
 
-    def _process_event(self, event: QueueEvent[T]) -> None:
+        Args:
+            event: Event to inspect.
+
+        Returns:
+            Partition key, or None if the event can run concurrently with any other.
+        """
+        return event.metadata.get('partition_key')
+
+    def _process_event(
+        self,
+        event: QueueEvent[T],
+        slot: WorkerSlot | None = None,
+        key: str | None = None
+    ) -> None:
         """
         Process a single event.
 
         Args:
             event: Event to process.
+            slot: State of the worker thread processing the event.
+            key: Partition key held for the event.
         """
+        if slot is None:
+            slot = getattr(self._local, 'slot', None) or WorkerSlot(index=0)
+            self._local.slot = slot
+
         with self._lock:
-            self._current_event = event
-            self._processing_started_at = datetime.now(UTC)
+            slot.current_event = event
+            slot.partition_key = key
+            slot.started_at = datetime.now(UTC)
 
         try:
             logger.debug(
@@ -286,13 +1029,17 @@ class QueueWorker(ABC, Generic[T]):
             )
             self._handle_event(event)
             self._on_success()
+            self._ack(event)
         except Exception as e:
             logger.error(f'❌ [{self._name}] Event processing failed: {e}')
             self._on_failure()
+            self._store_call('mark_failed', event.queue_id, str(e))
         finally:
             with self._lock:
-                self._current_event = None
-                self._processing_started_at = None
+                slot.current_event = None
+                slot.partition_key = None
+                slot.started_at = None
+                slot.processed += 1
                 self._stats.total_processed += 1
 
     @abstractmethod
@@ -325,6 +1072,13 @@ class QueueWorker(ABC, Generic[T]):
                     f'(max: {self._max_failures})'
                 )
 
+    def _pending_snapshot(self) -> list[QueueEvent[T]]:
+        """Return pending events: queued first, then parked behind busy keys."""
+        pending = list(self._queue.queue)
+        for backlog in self._blocked.values():
+            pending.extend(backlog)
+        return pending
+
     def get_status(self) -> dict[str, Any]:
         """
         Get worker status.
@@ -336,25 +1090,44 @@ class QueueWorker(ABC, Generic[T]):
             # Get pending events (preview of first 10)
             pending_events = []
             try:
-                temp_list = list(self._queue.queue)[:10]
+                temp_list = self._pending_snapshot()[:10]
                 for evt in temp_list:
                     pending_events.append(evt.to_dict())
             except Exception:
                 pass
 
-            # Current event info
-            current = None
-            if self._current_event:
-                current = self._current_event.to_dict()
-                if self._processing_started_at:
-                    current['started_at_utc'] = self._processing_started_at.isoformat()
+            # Per-worker state
+            workers = []
+            for slot in self._slots:
+                event_info = None
+                if slot.current_event:
+                    event_info = slot.current_event.to_dict()
+                    if slot.started_at:
+                        event_info['started_at_utc'] = slot.started_at.isoformat()
+                workers.append({
+                    'index': slot.index,
+                    'thread_alive': slot.thread.is_alive() if slot.thread else False,
+                    'busy': slot.current_event is not None,
+                    'partition_key': slot.partition_key,
+                    'current_event': event_info,
+                    'processed': slot.processed,
+                })
+
+            # Current event info (first busy worker, for single-worker callers)
+            current = next(
+                (w['current_event'] for w in workers if w['current_event']), None
+            )
 
             return {
                 'name': self._name,
-                'queue_len': self._queue.qsize(),
-                'thread_alive': self._thread.is_alive() if self._thread else False,
+                'queue_len': self.get_queue_size(),
+                'thread_alive': any(w['thread_alive'] for w in workers),
                 'stopped': self._stop_event.is_set(),
                 'paused': self.is_paused(),
+                'lanes': self._queue.lane_sizes(),
+                'num_workers': self._num_workers,
+                'active_workers': sum(1 for w in workers if w['busy']),
+                'workers': workers,
                 'consecutive_failures': self._consecutive_failures,
                 'max_consecutive_failures': self._max_failures,
                 'current_event': current,
@@ -363,6 +1136,7 @@ class QueueWorker(ABC, Generic[T]):
                     'total_processed': self._stats.total_processed,
                     'total_success': self._stats.total_success,
                     'total_failed': self._stats.total_failed,
+                    'total_coalesced': self._stats.total_coalesced,
                     'success_rate': round(self._stats.success_rate, 2)
                 }
             }
@@ -380,10 +1154,16 @@ class QueueWorker(ABC, Generic[T]):
         count = 0
         history_ids = set()
         cleared_items = []
+        with self._lock:
+            parked = [event for backlog in self._blocked.values() for event in backlog]
+            self._blocked.clear()
+            self._pending.clear()
+        cleared_ids = []
         while True:
             try:
-                event = self._queue.get_nowait()
+                event = parked.pop(0) if parked else self._queue.get_nowait()
                 count += 1
+                cleared_ids.append(event.queue_id)
                 # 尝试从事件中提取 history_id 和 item_title
                 if hasattr(event, 'payload'):
                     payload = event.payload
@@ -409,6 +1189,7 @@ class QueueWorker(ABC, Generic[T]):
                             })
             except queue.Empty:
                 break
+        self._store_call('ack_many', cleared_ids)
         logger.info(f'🗑️ [{self._name}] Cleared {count} events from queue')
         return {
             'count': count,
@@ -421,6 +1202,7 @@ class QueueWorker(ABC, Generic[T]):
         Get current queue size.
 
         Returns:
-            Number of pending events.
+            Number of pending events, including events waiting on a busy
+            partition key.
         """
-        return self._queue.qsize()
+        return self._queue.qsize() + sum(len(b) for b in list(self._blocked.values()))
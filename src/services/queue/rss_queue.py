@@ -5,14 +5,54 @@ Provides queue processing for RSS feed processing events.
 """
 
 import logging
+import re
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any
 
-from src.services.queue.queue_worker import QueueEvent, QueueWorker
+from src.services.queue.queue_worker import EventPriority, QueueEvent, QueueWorker
 
 logger = logging.getLogger(__name__)
 
+# 标题中的括号片段，如 [字幕组]、【1080p】、(BD)
+_BRACKET_PATTERN = re.compile(r'[\[【(（]([^\]】)）]*)[\]】)）]')
+# 星号包围的宣传片段，如 ★10月新番★
+_DECORATION_PATTERN = re.compile(r'★[^★]*★')
+# 标题末尾的集数信息，如 " - 03"、"第03话"、"S01E03"、"EP03"
+_EPISODE_PATTERN = re.compile(
+    r'(?:\s[-_]\s*\d{1,4}(?:v\d)?\b|\s*第\s*\d+\s*[话話集]|\s*(?:S\d{1,2})?EP?\d{1,4}\b).*$',
+    re.IGNORECASE
+)
+
+
+def series_key(title: str) -> str:
+    """
+    从发布标题中粗略提取番剧名称，用作队列的分区键。
+
+    去掉字幕组、分辨率等括号片段、★宣传片段★和集数信息；若剩余部分不含有效字符
+    （标题全部位于括号内），则取最长的括号片段。结果仅用于让同一番剧
+    的项目串行处理，不要求精确。
+
+    Args:
+        title: 发布标题
+
+    Returns:
+        归一化后的番剧名称，无法提取时返回空字符串
+    """
+    if not title:
+        return ''
+    title = _DECORATION_PATTERN.sub(' ', title)
+    remainder = _BRACKET_PATTERN.sub(' ', title)
+    remainder = _EPISODE_PATTERN.sub('', remainder)
+    if len(re.findall(r'\w', remainder)) < 2:
+        segments = [
+            seg for seg in _BRACKET_PATTERN.findall(title)
+            if not re.fullmatch(r'[\d\sA-Za-z.+-]{0,8}', seg)
+        ]
+        remainder = max(segments, key=len, default=remainder)
+    return ' '.join(remainder.lower().split())
+
 
 @dataclass
 class RSSPayload:
@@ -65,6 +105,13 @@ class RSSItemPayload:
     media_type: str = 'anime'
     extra_data: dict[str, Any] = field(default_factory=dict)
 
+    def get_partition_key(self) -> str:
+        """获取队列分区键：同一番剧的项目串行处理"""
+        key = series_key(self.item_title)
+        if key:
+            return f'anime:{key}'
+        return f'hash:{self.hash_id}' if self.hash_id else ''
+
     def get_display_name(self) -> str:
         """获取用于显示的名称"""
         if self.item_title:
@@ -78,8 +125,23 @@ class RSSQueueWorker(QueueWorker[RSSPayload]):
 
     Processes RSS feed events for anime download discovery.
     Supports scheduled, manual, and fixed subscription triggers.
+
+    With several workers, items of the same anime (see series_key) and
+    events for the same feed URL are processed one at a time, while
+    unrelated items run concurrently.
+
+    Re-enqueuing a feed check or an item that is still pending returns
+    the pending event, so a slow poll does not make the next one fetch
+    and filter the same feed twice.
+
+    Manual checks are served before scheduled ones. The resolved priority
+    is stamped into payload.extra_data['priority'] so that items split
+    out of a feed can inherit it.
     """
 
+    # Payload types restored from the durable store
+    PAYLOAD_TYPES = (RSSPayload, RSSItemPayload)
+
     # Event type constants
     EVENT_SCHEDULED_CHECK = 'scheduled_check'
     EVENT_MANUAL_CHECK = 'manual_check'
@@ -90,7 +152,8 @@ class RSSQueueWorker(QueueWorker[RSSPayload]):
     def __init__(
         self,
         name: str = 'RSSQueue',
-        max_failures: int = 5
+        max_failures: int = 5,
+        num_workers: int = 1
     ):
         """
         Initialize the RSS queue worker.
@@ -98,8 +161,9 @@ class RSSQueueWorker(QueueWorker[RSSPayload]):
         Args:
             name: Worker name for logging.
             max_failures: Maximum consecutive failures.
+            num_workers: Number of worker threads.
         """
-        super().__init__(name=name, max_failures=max_failures)
+        super().__init__(name=name, max_failures=max_failures, num_workers=num_workers)
         self._handlers: dict[str, Callable] = {}
 
         # 分类统计：Feed级别 vs Item级别
@@ -166,30 +230,113 @@ class RSSQueueWorker(QueueWorker[RSSPayload]):
         """判断是否为 Item 级别事件"""
         return event_type == self.EVENT_SINGLE_ITEM
 
+    def _partition_key(self, event: QueueEvent) -> str | None:
+        """重写：Item 按番剧分区，Feed 按 URL 分区"""
+        key = super()._partition_key(event)
+        if key:
+            return key
+        payload = event.payload
+        if hasattr(payload, 'get_partition_key'):
+            return payload.get_partition_key() or None
+        if getattr(payload, 'rss_url', ''):
+            return f'feed:{payload.rss_url}'
+        return None
+
     def _on_success(self) -> None:
         """重写：在更新总统计的同时更新分类统计"""
         super()._on_success()
-        if self._current_event:
-            if self._is_item_event(self._current_event.event_type):
-                self._item_success += 1
-            else:
-                self._feed_success += 1
+        event = self._current_event
+        if event:
+            with self._lock:
+                if self._is_item_event(event.event_type):
+                    self._item_success += 1
+                else:
+                    self._feed_success += 1
 
     def _on_failure(self) -> None:
         """重写：在更新总统计的同时更新分类统计"""
         super()._on_failure()
-        if self._current_event:
-            if self._is_item_event(self._current_event.event_type):
-                self._item_failed += 1
-            else:
-                self._feed_failed += 1
+        event = self._current_event
+        if event:
+            with self._lock:
+                if self._is_item_event(event.event_type):
+                    self._item_failed += 1
+                else:
+                    self._feed_failed += 1
+
+    def enqueue(self, event: QueueEvent[RSSPayload]) -> QueueEvent[RSSPayload]:
+        """
+        Add an event to the queue, recording its priority in the payload.
+
+        Args:
+            event: Event to enqueue.
 
-    def enqueue_scheduled_check(self, rss_url: str) -> int:
+        Returns:
+            The enqueued event with queue_id.
+        """
+        if event.priority is None:
+            event.priority = self._resolve_priority(event)
+        extra_data = getattr(event.payload, 'extra_data', None)
+        if isinstance(extra_data, dict):
+            extra_data['priority'] = int(event.priority)
+        return super().enqueue(event)
+
+    def _resolve_priority(self, event: QueueEvent[RSSPayload]) -> int:
+        """Priority from payload.extra_data, else by event type."""
+        extra_data = getattr(event.payload, 'extra_data', None) or {}
+        priority = extra_data.get('priority')
+        if priority is not None:
+            try:
+                return EventPriority(int(priority))
+            except ValueError:
+                logger.warning(f'⚠️ [{self._name}] 无效的事件优先级: {priority}')
+        if event.event_type == self.EVENT_MANUAL_CHECK:
+            return EventPriority.INTERACTIVE
+        return self.DEFAULT_PRIORITY
+
+    def _coalesce_key(self, event: QueueEvent[RSSPayload]) -> str | None:
+        """
+        Deduplicate feed checks by (event_type, rss_url) and items by hash.
+
+        Feed events carrying their own history record, pre-fetched items or
+        batch bookkeeping are never merged.
+        """
+        payload = event.payload
+        if event.event_type == self.EVENT_SINGLE_ITEM:
+            hash_id = getattr(payload, 'hash_id', '')
+            return f'item:{hash_id.lower()}' if hash_id else None
+        if event.event_type not in (self.EVENT_SCHEDULED_CHECK, self.EVENT_SINGLE_FEED):
+            return None
+        extra_data = payload.extra_data or {}
+        if payload.items or 'history_id' in extra_data or 'batch_history_id' in extra_data:
+            return None
+        return f'{event.event_type}:{payload.rss_url}'
+
+    def _on_coalesced(
+        self,
+        existing: QueueEvent[RSSPayload],
+        duplicate: QueueEvent[RSSPayload]
+    ) -> None:
+        """Sync the recorded priority and honour a duplicate's full refresh."""
+        extra_data = getattr(existing.payload, 'extra_data', None)
+        if not isinstance(extra_data, dict):
+            return
+        if existing.priority is not None:
+            extra_data['priority'] = int(existing.priority)
+        if not (duplicate.payload.extra_data or {}).get('skip_unchanged'):
+            extra_data.pop('skip_unchanged', None)
+
+    def enqueue_scheduled_check(
+        self,
+        rss_url: str,
+        deadline: datetime | None = None
+    ) -> int:
         """
         Enqueue a scheduled RSS check.
 
         Args:
             rss_url: RSS feed URL.
+            deadline: Optional UTC time after which the check is dropped.
 
         Returns:
             Current queue size.
@@ -200,7 +347,9 @@ class RSSQueueWorker(QueueWorker[RSSPayload]):
         )
         return self.enqueue_event(
             event_type=self.EVENT_SCHEDULED_CHECK,
-            payload=payload
+            payload=payload,
+            priority=EventPriority.SCHEDULED,
+            deadline=deadline
         )
 
     def enqueue_manual_check(self, rss_url: str, title: str | None = None) -> int:
@@ -286,8 +435,9 @@ class RSSQueueWorker(QueueWorker[RSSPayload]):
         hash_id: str = '',
         rss_url: str = '',
         media_type: str = 'anime',
-        extra_data: dict[str, Any] = None
-    ) -> int:
+        extra_data: dict[str, Any] = None,
+        priority: int | None = None
+    ) -> bool:
         """
         将单个 RSS 项目加入队列。
 
@@ -298,9 +448,10 @@ class RSSQueueWorker(QueueWorker[RSSPayload]):
             rss_url: 来源 RSS URL
             media_type: 媒体类型
             extra_data: 额外数据
+            priority: 事件优先级（通常继承所属 Feed 的优先级）
 
         Returns:
-            当前队列大小
+            是否新加入了事件；同一 hash 的项目仍在等待时合并到该事件并返回 False
         """
         payload = RSSItemPayload(
             item_title=item_title,
@@ -310,10 +461,12 @@ class RSSQueueWorker(QueueWorker[RSSPayload]):
             media_type=media_type,
             extra_data=extra_data or {}
         )
-        return self.enqueue_event(
+        event = QueueEvent(
             event_type=self.EVENT_SINGLE_ITEM,
-            payload=payload
+            payload=payload,
+            priority=priority
         )
+        return self.enqueue(event) is event
 
     def get_status(self) -> dict[str, Any]:
         """
@@ -327,7 +480,8 @@ class RSSQueueWorker(QueueWorker[RSSPayload]):
         # 增强 pending_events 的显示信息
         enhanced_pending = []
         try:
-            temp_list = list(self._queue.queue)[:10]
+            with self._lock:
+                temp_list = self._pending_snapshot()[:10]
             for evt in temp_list:
                 event_info = evt.to_dict()
                 if hasattr(evt.payload, 'get_display_name'):
@@ -346,10 +500,17 @@ class RSSQueueWorker(QueueWorker[RSSPayload]):
 
         status['pending_events'] = enhanced_pending
 
-        # 增强 current_event 的显示信息
-        if status.get('current_event') and self._current_event:
-            if hasattr(self._current_event.payload, 'get_display_name'):
-                status['current_event']['display_name'] = self._current_event.payload.get_display_name()
+        # 增强 current_event 及各 worker 当前事件的显示信息
+        in_flight = {
+            slot.index: slot.current_event for slot in self._slots if slot.current_event
+        }
+        for worker in status.get('workers', []):
+            event = in_flight.get(worker['index'])
+            if worker.get('current_event') and event and hasattr(event.payload, 'get_display_name'):
+                worker['current_event']['display_name'] = event.payload.get_display_name()
+        busy = [w for w in status.get('workers', []) if w.get('current_event')]
+        if busy:
+            status['current_event'] = busy[0]['current_event']
 
         # 添加分类统计
         status['stats']['feed_success'] = self._feed_success
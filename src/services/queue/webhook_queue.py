@@ -5,11 +5,12 @@ Provides queue processing for webhook events (e.g., qBittorrent completion notif
 """
 
 import logging
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from src.services.queue.queue_worker import QueueEvent, QueueWorker
+from src.services.queue.queue_worker import EventPriority, QueueEvent, QueueWorker
 
 logger = logging.getLogger(__name__)
 
@@ -47,8 +48,21 @@ class WebhookQueueWorker(QueueWorker[WebhookPayload]):
 
     Processes webhook events from qBittorrent or other download clients.
     Delegates actual processing to registered handlers.
+
+    qBittorrent fires completion webhooks in bursts (season packs,
+    rechecks), so:
+    - duplicate (hash, event type) events are merged while pending and
+      for DEBOUNCE_SECONDS after they were picked up
+    - event types with a batch handler are handed over together with the
+      other queued events of the same kind (up to MAX_BATCH_SIZE)
     """
 
+    # Payload types restored from the durable store
+    PAYLOAD_TYPES = (WebhookPayload,)
+
+    # Every event on this queue is triggered by the download client
+    DEFAULT_PRIORITY = EventPriority.WEBHOOK
+
     # Event type constants
     EVENT_TORRENT_COMPLETED = 'torrent_completed'
     EVENT_TORRENT_FINISHED = 'torrent_finished'
@@ -58,6 +72,15 @@ class WebhookQueueWorker(QueueWorker[WebhookPayload]):
     EVENT_TORRENT_DELETED = 'torrent_deleted'
     EVENT_TORRENT_ERROR = 'torrent_error'
 
+    # Event types that all mean "download finished" (deduplicated together)
+    COMPLETION_EVENTS = (EVENT_TORRENT_COMPLETED, EVENT_TORRENT_FINISHED)
+
+    # Duplicates of an event picked up within this window are dropped
+    DEBOUNCE_SECONDS = 30.0
+
+    # Maximum number of events handed to a batch handler at once
+    MAX_BATCH_SIZE = 32
+
     def __init__(
         self,
         name: str = 'WebhookQueue',
@@ -76,6 +99,10 @@ class WebhookQueueWorker(QueueWorker[WebhookPayload]):
         """
         super().__init__(name=name, max_failures=max_failures)
         self._handlers: dict[str, Callable[[WebhookPayload], None]] = {}
+        self._batch_handlers: dict[
+            str, Callable[[list[WebhookPayload]], dict[str, str] | None]
+        ] = {}
+        self._recent: dict[str, tuple[float, QueueEvent[WebhookPayload]]] = {}
         self._download_manager = download_manager
         self._discord_client = discord_client
 
@@ -94,6 +121,25 @@ class WebhookQueueWorker(QueueWorker[WebhookPayload]):
         self._handlers[event_type] = handler
         logger.debug(f'[{self._name}] Registered handler for: {event_type}')
 
+    def register_batch_handler(
+        self,
+        event_type: str,
+        handler: Callable[[list[WebhookPayload]], dict[str, str] | None]
+    ) -> None:
+        """
+        Register a handler that processes several events of a type at once.
+
+        Takes precedence over a per-event handler for the same type. Event
+        types sharing the same handler function are batched together.
+
+        Args:
+            event_type: Event type to handle.
+            handler: Receives the payloads and returns an error message by
+                hash_id for the ones that failed (None/empty if all succeeded).
+        """
+        self._batch_handlers[event_type] = handler
+        logger.debug(f'[{self._name}] Registered batch handler for: {event_type}')
+
     def unregister_handler(self, event_type: str) -> None:
         """
         Unregister a handler for an event type.
@@ -101,6 +147,7 @@ class WebhookQueueWorker(QueueWorker[WebhookPayload]):
         Args:
             event_type: Event type to unregister.
         """
+        self._batch_handlers.pop(event_type, None)
         if event_type in self._handlers:
             del self._handlers[event_type]
             logger.debug(f'[{self._name}] Unregistered handler for: {event_type}')
@@ -109,11 +156,17 @@ class WebhookQueueWorker(QueueWorker[WebhookPayload]):
         """
         Handle a webhook event.
 
-        Dispatches to registered handler based on event type.
+        Dispatches to the registered batch handler (together with the other
+        queued events it handles) or to the per-event handler.
 
         Args:
             event: Webhook event to handle.
         """
+        batch_handler = self._batch_handlers.get(event.event_type)
+        if batch_handler:
+            self._handle_batch(event, batch_handler)
+            return
+
         handler = self._handlers.get(event.event_type)
 
         if handler:
@@ -121,12 +174,108 @@ class WebhookQueueWorker(QueueWorker[WebhookPayload]):
                 f'🔔 [{self._name}] Processing {event.event_type}: '
                 f'{event.payload.hash_id[:8]}...'
             )
-            handler(event.payload)
+            self._remember([event])
+            try:
+                handler(event.payload)
+            except Exception:
+                self._forget([event])
+                raise
         else:
             logger.warning(
                 f'⚠️ [{self._name}] No handler for event type: {event.event_type}'
             )
 
+    def _handle_batch(
+        self,
+        event: QueueEvent[WebhookPayload],
+        handler: Callable[[list[WebhookPayload]], dict[str, str] | None]
+    ) -> None:
+        """
+        Hand an event and the queued events sharing its batch handler to the handler.
+
+        Args:
+            event: Event claimed by the worker.
+            handler: Batch handler registered for the event type.
+        """
+        extra = self._claim_batch(
+            lambda other: self._batch_handlers.get(other.event_type) is handler,
+            self.MAX_BATCH_SIZE - 1
+        )
+        events = [event, *extra]
+        if extra:
+            logger.info(f'🔔 [{self._name}] Processing batch of {len(events)} events')
+        else:
+            logger.info(
+                f'🔔 [{self._name}] Processing {event.event_type}: '
+                f'{event.payload.hash_id[:8]}...'
+            )
+
+        self._remember(events)
+        try:
+            failed_hashes = handler([e.payload for e in events]) or {}
+        except Exception as e:
+            self._forget(events)
+            self._settle_batch(extra, {other.queue_id: str(e) for other in extra})
+            raise
+
+        failed = [e for e in events if e.payload.hash_id in failed_hashes]
+        self._forget(failed)
+        self._settle_batch(extra, {
+            e.queue_id: failed_hashes[e.payload.hash_id] for e in failed if e is not event
+        })
+        if event in failed:
+            raise RuntimeError(failed_hashes[event.payload.hash_id])
+
+    def _coalesce_key(self, event: QueueEvent[WebhookPayload]) -> str | None:
+        """Deduplicate by (event type, hash); completion aliases share a key."""
+        hash_id = getattr(event.payload, 'hash_id', '')
+        if not hash_id:
+            return None
+        event_type = event.event_type
+        if event_type in self.COMPLETION_EVENTS:
+            event_type = self.EVENT_TORRENT_COMPLETED
+        return f'{event_type}:{hash_id.lower()}'
+
+    def _coalesce_pending(
+        self,
+        event: QueueEvent[WebhookPayload]
+    ) -> QueueEvent[WebhookPayload] | None:
+        """
+        Also drop duplicates of events picked up within DEBOUNCE_SECONDS.
+
+        Events enqueued with metadata force=True (manual re-runs) skip the
+        window but are still merged into a pending duplicate.
+        """
+        key = self._coalesce_key(event)
+        if key is not None and not event.metadata.get('force'):
+            with self._lock:
+                recent = self._recent.get(key)
+                if recent and time.monotonic() - recent[0] < self.DEBOUNCE_SECONDS:
+                    self._stats.total_coalesced += 1
+                    logger.debug(f'🔁 [{self._name}] 忽略重复的 webhook: {key}')
+                    return recent[1]
+        return super()._coalesce_pending(event)
+
+    def _remember(self, events: list[QueueEvent[WebhookPayload]]) -> None:
+        """Start the debounce window of events being processed."""
+        now = time.monotonic()
+        with self._lock:
+            for key, (seen_at, _) in list(self._recent.items()):
+                if now - seen_at >= self.DEBOUNCE_SECONDS:
+                    del self._recent[key]
+            for event in events:
+                key = self._coalesce_key(event)
+                if key is not None:
+                    self._recent[key] = (now, event)
+
+    def _forget(self, events: list[QueueEvent[WebhookPayload]]) -> None:
+        """End the debounce window of failed events so a retry is accepted."""
+        with self._lock:
+            for event in events:
+                key = self._coalesce_key(event)
+                if key is not None and self._recent.get(key, (0, None))[1] is event:
+                    del self._recent[key]
+
     def enqueue(
         self,
         event: QueueEvent[WebhookPayload] = None,
@@ -276,27 +425,6 @@ def init_webhook_queue(
         discord_client=discord_client
     )
 
-    # Create default completion handler if not provided
-    if completion_handler is None and download_manager is not None:
-        def default_completion_handler(payload: WebhookPayload) -> None:
-            """Default handler that processes completed torrents."""
-            try:
-                logger.info(f'🔔 Processing torrent completion: {payload.hash_id[:8]}...')
-                # Call download manager's handle_torrent_completion if available
-                if hasattr(download_manager, 'handle_torrent_completion'):
-                    download_manager.handle_torrent_completion(
-                        hash_id=payload.hash_id,
-                        name=payload.name,
-                        category=payload.category,
-                        save_path=payload.save_path
-                    )
-            except Exception as e:
-                logger.error(f'❌ Error processing torrent completion: {e}')
-                # 重新抛出异常，让 QueueWorker 正确统计失败数
-                raise
-
-        completion_handler = default_completion_handler
-
     # Register handlers
     if completion_handler:
         webhook_queue_worker.register_handler(
@@ -308,6 +436,31 @@ def init_webhook_queue(
             WebhookQueueWorker.EVENT_TORRENT_FINISHED,
             completion_handler
         )
+    elif download_manager is not None:
+        def default_completion_handler(payloads: list[WebhookPayload]) -> dict[str, str]:
+            """Default handler that processes completed torrents in batches."""
+            logger.info(f'🔔 Processing torrent completion: {len(payloads)} torrent(s)')
+            results = download_manager.handle_torrents_completed([
+                (
+                    payload.hash_id,
+                    {
+                        'name': payload.name,
+                        'save_path': payload.save_path,
+                        'content_path': payload.extra_data.get('content_path', ''),
+                        'category': payload.category,
+                        'status': payload.status,
+                    }
+                )
+                for payload in payloads
+            ])
+            return {
+                hash_id: result.get('error', 'unknown error')
+                for hash_id, result in results.items()
+                if not result.get('success')
+            }
+
+        for event_type in WebhookQueueWorker.COMPLETION_EVENTS:
+            webhook_queue_worker.register_batch_handler(event_type, default_completion_handler)
 
     # Start the worker
     webhook_queue_worker.start()
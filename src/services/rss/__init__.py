@@ -1,15 +1,18 @@
 """
 RSS services module.
 
-Contains services for RSS feed parsing and content filtering.
+Contains services for RSS feed parsing, content filtering and local
+title parsing.
 """
 
 from src.services.rss.filter_service import FilterService
+from src.services.rss.local_title_parser import LocalTitleParser
 from src.services.rss.rss_service import CachedHash, HashExtractor, RSSService
 
 __all__ = [
     'RSSService',
     'FilterService',
+    'LocalTitleParser',
     'HashExtractor',
     'CachedHash',
 ]
@@ -0,0 +1,501 @@
+"""
+Local title parser module.
+
+Parses regular fansub release titles with regular expressions so that
+only ambiguous titles need to be sent to the AI title parser.
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from time import time
+from typing import TYPE_CHECKING
+
+from src.core.config import config
+from src.core.interfaces.adapters import ITitleParser, TitleParseResult
+
+if TYPE_CHECKING:
+    from src.infrastructure.repositories.anime_repository import AnimeRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ReleaseFormat:
+    """
+    A known release title format.
+
+    Attributes:
+        name: Format name (for logging).
+        pattern: Compiled regex with named groups ``group``, ``title``
+            and ``episode``.
+        confidence: Confidence of a match before title-level adjustments.
+    """
+    name: str
+    pattern: re.Pattern
+    confidence: float
+
+
+# Common fansub naming formats, most specific first
+BUILTIN_FORMATS: tuple[ReleaseFormat, ...] = (
+    # [Group] Title - 05 [1080p][...]
+    ReleaseFormat(
+        name='dash_episode',
+        pattern=re.compile(
+            r'^\[(?P<group>[^\[\]]+)\]\s*(?P<title>[^\[\]【】]+?)\s+-\s+'
+            r'(?P<episode>\d{1,4})(?:v\d)?(?:\s*(?:END|Fin|完))?'
+            r'\s*(?:[\[(（].*)?$',
+            re.IGNORECASE
+        ),
+        confidence=0.9
+    ),
+    # [Group] Title [05][1080p][...]
+    ReleaseFormat(
+        name='bracket_episode',
+        pattern=re.compile(
+            r'^\[(?P<group>[^\[\]]+)\]\s*(?P<title>[^\[\]【】]+?)\s*'
+            r'\[(?P<episode>\d{1,4})(?:v\d)?(?:\s*(?:END|Fin|完))?\]'
+            r'\s*(?:\[.*)?$',
+            re.IGNORECASE
+        ),
+        confidence=0.85
+    ),
+    # [Group][Title][05][1080p][...]
+    ReleaseFormat(
+        name='bracketed_title',
+        pattern=re.compile(
+            r'^\[(?P<group>[^\[\]]+)\]\s*\[(?P<title>[^\[\]]+)\]\s*'
+            r'\[(?P<episode>\d{1,4})(?:v\d)?(?:\s*(?:END|Fin|完))?\]'
+            r'\s*(?:\[.*)?$',
+            re.IGNORECASE
+        ),
+        confidence=0.85
+    ),
+    # [Group] Title EP05 / 第05话 [1080p]
+    ReleaseFormat(
+        name='marked_episode',
+        pattern=re.compile(
+            r'^\[(?P<group>[^\[\]]+)\]\s*(?P<title>[^\[\]【】]+?)\s+'
+            r'(?:EP?|第)(?P<episode>\d{1,4})(?:v\d)?(?:話|话|集)?'
+            r'\s*(?:[\[(（].*)?$',
+            re.IGNORECASE
+        ),
+        confidence=0.85
+    ),
+)
+
+_GROUP_PREFIX = re.compile(r'^\s*[\[【]([^\[\]【】]+)[\]】]')
+_LANGUAGE_SEPARATOR = re.compile(r'\s+/\s+|\s*／\s*')
+_KANA = re.compile(r'[぀-ヿ]')
+_HAN = re.compile(r'[一-鿿]')
+_LATIN = re.compile(r'[A-Za-z]')
+_NOISE = re.compile(r'[\[\]【】★☆]')
+_BATCH_MARKERS = re.compile(
+    r'\d+[-~～]\d+|\[\d+\s*[-~～]\s*\d+|合集|全集|Batch|Complete|BDBOX|Vol\.?\s*\d',
+    re.IGNORECASE
+)
+_MOVIE_MARKERS = re.compile(r'剧场版|劇場版|映画|Movie|Theatrical', re.IGNORECASE)
+
+# Trailing season markers stripped from the clean title
+_SEASON_MARKERS = (
+    re.compile(r'\s*第([一二三四五六七八九十]+|\d{1,2})[季期]$'),
+    re.compile(r'\s*\b(?:Season|S)\s*(\d{1,2})$', re.IGNORECASE),
+    re.compile(r'\s*(\d{1,2})(?:st|nd|rd|th)\s+Season$', re.IGNORECASE),
+)
+# Trailing markers that may or may not be a season ("Kaiju No. 8", "Title II")
+_AMBIGUOUS_SEASON = re.compile(r'\s(?:\d{1,2}|I{2,3}|IV|V|VI{1,3})$')
+
+_CHINESE_NUMERALS = {
+    '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
+    '六': 6, '七': 7, '八': 8, '九': 9, '十': 10,
+}
+
+# Language priority name -> script class detected in the title
+_LANGUAGE_SCRIPTS = {
+    '中文': 'han',
+    '日本語': 'kana',
+    'English': 'latin',
+    'Romaji': 'latin',
+}
+
+
+class LocalTitleParser(ITitleParser):
+    """
+    Regex-first title parser.
+
+    Matches titles against the release formats learned for the title's
+    subtitle group (the ``AnimePattern`` regexes stored after AI renames)
+    and a library of common fansub formats. Every result carries a
+    confidence score; ``parse`` only returns results at or above the
+    configured threshold so that callers can escalate the rest to the
+    AI title parser.
+
+    Example:
+        >>> parser = LocalTitleParser(anime_repo)
+        >>> result = parser.parse('[ANi] Title - 05 [1080P][Baha][WEB-DL]')
+        >>> result.clean_title, result.episode, result.confidence
+        ('Title', 5, 0.9)
+    """
+
+    LEARNED_FORMAT_CONFIDENCE = 0.95
+    PATTERN_REFRESH_SECONDS = 600
+    MULTI_LANGUAGE_CONFIDENCE = 0.9
+    AMBIGUOUS_LANGUAGE_CONFIDENCE = 0.4
+    AMBIGUOUS_SEASON_CONFIDENCE = 0.5
+    MOVIE_CONFIDENCE = 0.5
+    NOISY_TITLE_CONFIDENCE = 0.3
+    # Four-digit "episodes" are usually a year ("Title - 2024"); let the AI decide
+    MAX_PLAUSIBLE_EPISODE = 999
+    IMPLAUSIBLE_EPISODE_CONFIDENCE = 0.4
+
+    def __init__(
+        self,
+        anime_repo: 'AnimeRepository | None' = None,
+        min_confidence: float | None = None
+    ):
+        """
+        Initialize the local title parser.
+
+        Args:
+            anime_repo: Anime repository providing learned patterns (optional).
+            min_confidence: Minimum confidence for ``parse`` to return a
+                result. Reads ``openai.title_parse.local_parse_min_confidence``
+                on every call when omitted.
+        """
+        self._anime_repo = anime_repo
+        self._min_confidence = min_confidence
+        self._learned: dict[str, list[dict[str, re.Pattern | None]]] = {}
+        self._learned_loaded_at: float | None = None
+        self._lock = threading.Lock()
+
+    def parse(self, title: str) -> TitleParseResult | None:
+        """
+        Parse a title locally.
+
+        Args:
+            title: The title string to parse.
+
+        Returns:
+            TitleParseResult if confidence reaches the threshold, None otherwise.
+        """
+        if not self._is_enabled():
+            return None
+
+        result = self.analyze(title)
+        if result is None:
+            logger.debug(f'🔎 本地解析未匹配，交由 AI 解析: {title}')
+            return None
+
+        min_confidence = self._get_min_confidence()
+        if result.confidence < min_confidence:
+            logger.debug(
+                f'🔎 本地解析置信度不足 ({result.confidence:.2f} < {min_confidence:.2f})，'
+                f'交由 AI 解析: {title}'
+            )
+            return None
+
+        logger.debug(
+            f'⚡ 本地解析标题成功 (置信度 {result.confidence:.2f}): '
+            f'{result.clean_title} S{result.season}E{result.episode} '
+            f'[{result.subtitle_group}]'
+        )
+        return result
+
+    def analyze(self, title: str) -> TitleParseResult | None:
+        """
+        Parse a title and score the result without applying the threshold.
+
+        Args:
+            title: The title string to parse.
+
+        Returns:
+            TitleParseResult from the first matching format (learned
+            formats first), or None if no format matches.
+        """
+        title = (title or '').strip()
+        if not title or _BATCH_MARKERS.search(title):
+            return None
+
+        group_match = _GROUP_PREFIX.match(title)
+        if not group_match:
+            return None
+        group = group_match.group(1).strip()
+
+        for patterns in self._get_learned_formats(group):
+            fields = self._match_learned(title, group, patterns)
+            if fields:
+                return self._build_result(
+                    title, *fields, base_confidence=self.LEARNED_FORMAT_CONFIDENCE
+                )
+
+        for release_format in BUILTIN_FORMATS:
+            match = release_format.pattern.match(title)
+            if match:
+                return self._build_result(
+                    title,
+                    match.group('group').strip(),
+                    match.group('title').strip(),
+                    None,
+                    int(match.group('episode')),
+                    base_confidence=release_format.confidence
+                )
+
+        return None
+
+    def _build_result(
+        self,
+        title: str,
+        group: str,
+        title_part: str,
+        full_title: str | None,
+        episode: int | None,
+        base_confidence: float
+    ) -> TitleParseResult:
+        """
+        Build a scored TitleParseResult from matched title fields.
+
+        Args:
+            title: Original title.
+            group: Subtitle group name.
+            title_part: Anime title portion (may contain several languages).
+            full_title: Full title captured by a learned format, if any.
+            episode: Episode number.
+            base_confidence: Confidence of the matched format.
+
+        Returns:
+            TitleParseResult with confidence set.
+        """
+        confidence = base_confidence
+        title_part = title_part.strip(' -_')
+
+        clean_title, language_confidence = self._select_language(title_part)
+        confidence = min(confidence, language_confidence)
+
+        clean_title, season, season_confidence = self._extract_season(clean_title)
+        confidence = min(confidence, season_confidence)
+
+        category = 'tv'
+        if _MOVIE_MARKERS.search(title_part):
+            category = 'movie'
+            season = 1
+            confidence = min(confidence, self.MOVIE_CONFIDENCE)
+
+        if not clean_title or _NOISE.search(clean_title) or clean_title.isdigit():
+            confidence = min(confidence, self.NOISY_TITLE_CONFIDENCE)
+
+        if episode is not None and episode > self.MAX_PLAUSIBLE_EPISODE:
+            confidence = min(confidence, self.IMPLAUSIBLE_EPISODE_CONFIDENCE)
+
+        return TitleParseResult(
+            original_title=title,
+            clean_title=clean_title,
+            full_title=full_title or title_part,
+            subtitle_group=group,
+            season=season,
+            episode=episode,
+            category=category,
+            confidence=round(confidence, 2)
+        )
+
+    def _select_language(self, title_part: str) -> tuple[str, float]:
+        """
+        Pick the clean title from a possibly multi-language title.
+
+        Segments are classified by script (kana, Han, Latin) and matched
+        against the configured language priorities. English and Romaji
+        cannot be told apart by script, so a choice between two Latin
+        segments is treated as ambiguous.
+
+        Args:
+            title_part: Title portion, segments separated by ' / '.
+
+        Returns:
+            Tuple of (clean title, confidence cap).
+        """
+        segments = [s.strip() for s in _LANGUAGE_SEPARATOR.split(title_part) if s.strip()]
+        if len(segments) <= 1:
+            return title_part, 1.0
+
+        scripts = [self._classify_script(segment) for segment in segments]
+        for language in self._get_language_priorities():
+            script = _LANGUAGE_SCRIPTS.get(language)
+            if script is None or script not in scripts:
+                continue
+            if script == 'latin' and scripts.count('latin') > 1:
+                return segments[scripts.index(script)], self.AMBIGUOUS_LANGUAGE_CONFIDENCE
+            return segments[scripts.index(script)], self.MULTI_LANGUAGE_CONFIDENCE
+
+        return segments[0], self.MULTI_LANGUAGE_CONFIDENCE
+
+    @staticmethod
+    def _classify_script(segment: str) -> str:
+        """Classify a title segment by its script."""
+        if _KANA.search(segment):
+            return 'kana'
+        if _HAN.search(segment):
+            return 'han'
+        if _LATIN.search(segment):
+            return 'latin'
+        return 'other'
+
+    def _extract_season(self, clean_title: str) -> tuple[str, int, float]:
+        """
+        Strip a trailing season marker from the clean title.
+
+        Args:
+            clean_title: Clean title that may end with a season marker.
+
+        Returns:
+            Tuple of (title without marker, season, confidence cap).
+        """
+        for marker in _SEASON_MARKERS:
+            match = marker.search(clean_title)
+            if match:
+                value = match.group(1)
+                season = int(value) if value.isdigit() else self._chinese_to_int(value)
+                return clean_title[:match.start()].strip(), season, 1.0
+
+        if _AMBIGUOUS_SEASON.search(clean_title):
+            return clean_title, 1, self.AMBIGUOUS_SEASON_CONFIDENCE
+
+        return clean_title, 1, 1.0
+
+    @staticmethod
+    def _chinese_to_int(value: str) -> int:
+        """Convert a Chinese numeral up to 99 to an integer."""
+        if value.startswith('十'):
+            value = '一' + value
+        if '十' in value:
+            tens, _, ones = value.partition('十')
+            return _CHINESE_NUMERALS.get(tens, 1) * 10 + _CHINESE_NUMERALS.get(ones, 0)
+        return _CHINESE_NUMERALS.get(value, 1)
+
+    def _match_learned(
+        self,
+        title: str,
+        group: str,
+        patterns: dict[str, re.Pattern | None]
+    ) -> tuple[str, str, str | None, int | None] | None:
+        """
+        Apply a learned pattern set to a title.
+
+        The captured group must equal the group the patterns were learned
+        for, and both the title and the episode must be captured.
+
+        Returns:
+            Tuple of (group, title, full title, episode), or None.
+        """
+        try:
+            group_match = patterns['group'].search(title)
+            title_match = patterns['title'].search(title)
+            episode_match = patterns['episode'].search(title)
+            full_match = patterns['full'].search(title) if patterns['full'] else None
+        except (re.error, IndexError):
+            return None
+
+        if not (group_match and title_match and episode_match):
+            return None
+        if not (group_match.groups() and title_match.groups() and episode_match.groups()):
+            return None
+        if (group_match.group(1) or '').strip().lower() != group.lower():
+            return None
+
+        clean = (title_match.group(1) or '').strip()
+        try:
+            episode = int(float(episode_match.group(1)))
+        except (TypeError, ValueError):
+            return None
+        full = (full_match.group(1) or '').strip() if full_match and full_match.groups() else None
+        if not clean:
+            return None
+        return group, clean, full or None, episode
+
+    def _get_learned_formats(self, group: str) -> list[dict[str, re.Pattern | None]]:
+        """
+        Get the learned pattern sets for a subtitle group.
+
+        Patterns are loaded from the repository lazily and refreshed every
+        PATTERN_REFRESH_SECONDS.
+
+        Args:
+            group: Subtitle group name.
+
+        Returns:
+            Compiled pattern sets (most recently updated first).
+        """
+        if self._anime_repo is None:
+            return []
+
+        with self._lock:
+            loaded_at = self._learned_loaded_at
+            if loaded_at is None or time() - loaded_at > self.PATTERN_REFRESH_SECONDS:
+                self._learned = self._load_learned_formats()
+                self._learned_loaded_at = time()
+            return self._learned.get(group.lower(), [])
+
+    def _load_learned_formats(self) -> dict[str, list[dict[str, re.Pattern | None]]]:
+        """Load and compile learned patterns grouped by subtitle group."""
+        try:
+            rows = self._anime_repo.get_title_patterns()
+        except Exception as e:
+            logger.warning(f'⚠️ 加载已学习的标题正则失败: {e}')
+            return {}
+
+        learned: dict[str, list[dict[str, re.Pattern | None]]] = {}
+        seen: set[tuple[str, ...]] = set()
+        for row in rows:
+            group = (row.get('subtitle_group') or '').strip().lower()
+            sources = tuple(
+                row.get(field) or ''
+                for field in (
+                    'title_group_regex', 'short_title_regex',
+                    'episode_regex', 'full_title_regex'
+                )
+            )
+            if not group or (group, *sources) in seen:
+                continue
+            seen.add((group, *sources))
+
+            compiled = [self._compile(source) for source in sources]
+            if not all(compiled[:3]):
+                continue
+            learned.setdefault(group, []).append({
+                'group': compiled[0],
+                'title': compiled[1],
+                'episode': compiled[2],
+                'full': compiled[3],
+            })
+
+        logger.debug(f'📚 已加载 {len(learned)} 个字幕组的标题正则')
+        return learned
+
+    @staticmethod
+    def _compile(source: str) -> re.Pattern | None:
+        """Compile a stored regex; placeholders and invalid regexes yield None."""
+        if not source or source.strip() in ('无', 'None', 'null'):
+            return None
+        try:
+            return re.compile(source)
+        except re.error:
+            return None
+
+    def _is_enabled(self) -> bool:
+        """Check whether local parsing is enabled in the configuration."""
+        return config.openai.title_parse.local_parse_enabled
+
+    def _get_min_confidence(self) -> float:
+        """Get the confidence threshold for accepting a local result."""
+        if self._min_confidence is not None:
+            return self._min_confidence
+        return config.openai.title_parse.local_parse_min_confidence
+
+    def _get_language_priorities(self) -> list[str]:
+        """Get the configured language priority names."""
+        try:
+            priorities = config.openai.language_priorities
+            if priorities:
+                return [p.name for p in priorities]
+        except Exception as e:
+            logger.warning(f'⚠️ 获取语言优先级配置失败: {e}')
+        return ['中文', 'English', '日本語']
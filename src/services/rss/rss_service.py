@@ -5,23 +5,32 @@ Provides RSS/Atom feed parsing, item filtering, and hash extraction functionalit
 """
 
 import base64
+import hashlib
+import io
+import json
 import logging
 import re
 import threading
 import xml.etree.ElementTree as ET
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from time import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 from urllib.parse import urlparse
 
 import requests
 
 from src.core.exceptions import RSSError
-from src.core.interfaces.adapters import IRSSParser, RSSItem
+from src.core.interfaces.adapters import FeedFetchResult, IRSSParser, RSSItem
 from src.core.interfaces.repositories import IDownloadRepository
+from src.infrastructure.downloader.torrent_metainfo import bdecode, files_from_info
 
 if TYPE_CHECKING:
+    from src.infrastructure.repositories.torrent_hash_cache_repository import (
+        TorrentHashCacheRepository,
+    )
     from src.services.rss.rss_service import RSSService
 
 logger = logging.getLogger(__name__)
@@ -32,6 +41,23 @@ class CachedHash:
     """缓存的 Hash 条目。"""
     hash_id: str
     timestamp: float
+    persistent: bool = False  # 是否来自 torrent 文件下载（会持久化）
+
+
+@dataclass
+class FeedState:
+    """
+    RSS Feed 的条件请求状态。
+
+    用于在下次轮询时发送 If-None-Match / If-Modified-Since，
+    并在服务端不支持条件请求时通过内容摘要判断 Feed 是否变化。
+    filter_digest 记录生成该状态时的过滤设置；过滤设置变化后状态作废，
+    以便重新检查之前被过滤掉的项目。
+    """
+    etag: str = ''
+    last_modified: str = ''
+    content_digest: str = ''
+    filter_digest: str = ''
 
 
 class HashExtractor:
@@ -40,6 +66,10 @@ class HashExtractor:
 
     用于 RSS 预览时快速获取 torrent hash，优化用户体验。
 
+    缓存为 LRU 结构并带有 TTL：从 URL 直接解析出的 hash 使用 cache_ttl，
+    需要下载 torrent 文件才能得到的 hash 使用更长的 persistent_ttl，
+    并在提供 cache_repo 时写入数据库，重启后自动预热，避免重复下载。
+
     Example:
         >>> extractor = HashExtractor(rss_service)
         >>> hashes = extractor.batch_extract(['url1', 'url2', 'url3'])
@@ -51,7 +81,10 @@ class HashExtractor:
         rss_service: 'RSSService',
         cache_ttl: int = 3600,
         max_workers: int = 10,
-        fetch_timeout: int = 10
+        fetch_timeout: int = 10,
+        max_entries: int = 5000,
+        persistent_ttl: int = 30 * 24 * 3600,
+        cache_repo: 'TorrentHashCacheRepository | None' = None
     ):
         """
         初始化 HashExtractor。
@@ -61,13 +94,63 @@ class HashExtractor:
             cache_ttl: 缓存过期时间（秒），默认 1 小时。
             max_workers: 并行下载的最大线程数，默认 10。
             fetch_timeout: 单个下载超时时间（秒），默认 10 秒。
+            max_entries: 内存缓存最大条目数，超出后淘汰最久未使用的条目。
+            persistent_ttl: 从 torrent 文件获取的 hash 的过期时间（秒），默认 30 天。
+            cache_repo: 可选的持久化仓库，用于跨重启保留 torrent hash。
         """
         self._rss_service = rss_service
-        self._cache: dict[str, CachedHash] = {}
+        self._cache: OrderedDict[str, CachedHash] = OrderedDict()
         self._cache_lock = threading.Lock()
         self._cache_ttl = cache_ttl
         self._max_workers = max_workers
         self._fetch_timeout = fetch_timeout
+        self._max_entries = max_entries
+        self._persistent_ttl = persistent_ttl
+        self._cache_repo = cache_repo
+        self._warmed = cache_repo is None
+
+        # 缓存统计
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._warmed_entries = 0
+
+    def warm_cache(self) -> int:
+        """
+        从持久化仓库加载未过期的 torrent hash 到内存缓存。
+
+        只会执行一次，后续调用直接返回。
+
+        Returns:
+            加载的条目数。
+        """
+        with self._cache_lock:
+            if self._warmed:
+                return 0
+            self._warmed = True
+
+        min_cached_at = time() - self._persistent_ttl
+        try:
+            self._cache_repo.prune(self._max_entries, min_cached_at)
+            entries = self._cache_repo.load_recent(self._max_entries, min_cached_at)
+        except Exception as e:
+            logger.warning(f'⚠️ 加载持久化 hash 缓存失败: {e}')
+            return 0
+
+        with self._cache_lock:
+            for url, hash_id, cached_at in entries:
+                if url not in self._cache:
+                    self._cache[url] = CachedHash(
+                        hash_id=hash_id, timestamp=cached_at, persistent=True
+                    )
+                    self._cache.move_to_end(url, last=False)
+            self._evict_overflow()
+            self._warmed_entries = len(entries)
+
+        if entries:
+            logger.info(f'📦 已从数据库预热 {len(entries)} 条 torrent hash 缓存')
+        return len(entries)
 
     def batch_extract(
         self,
@@ -86,6 +169,8 @@ class HashExtractor:
         Returns:
             URL 到 hash 的映射字典。
         """
+        self.warm_cache()
+
         results: dict[str, str] = {}
         urls_to_fetch: list[str] = []
         current_time = time()
@@ -124,9 +209,10 @@ class HashExtractor:
             fetched = self._parallel_fetch(urls_to_fetch)
             for url, hash_id in fetched.items():
                 results[url] = hash_id
-                self._add_to_cache(url, hash_id, current_time)
+                self._add_to_cache(url, hash_id, current_time, persistent=True)
                 stats['fetch'] += 1
                 logger.debug(f'🌐 [fetch] hash={hash_id[:8]}... url={url[:50]}...')
+            self._persist(fetched, current_time)
 
         # 输出统计信息
         logger.debug(
@@ -138,18 +224,81 @@ class HashExtractor:
 
         return results
 
+    def fetch_hash(self, torrent_url: str) -> str:
+        """
+        获取单个 torrent URL 的 hash，优先使用缓存。
+
+        缓存未命中时下载 torrent 文件提取 hash，并写入缓存。
+
+        Args:
+            torrent_url: torrent 文件 URL。
+
+        Returns:
+            hash 字符串，失败返回空字符串。
+        """
+        self.warm_cache()
+
+        current_time = time()
+        cached = self._get_from_cache(torrent_url, current_time)
+        if cached:
+            return cached
+
+        hash_id = self._rss_service._fetch_hash_from_torrent_file(torrent_url)
+        if hash_id:
+            self._add_to_cache(torrent_url, hash_id, current_time, persistent=True)
+            self._persist({torrent_url: hash_id}, current_time)
+        return hash_id
+
     def _get_from_cache(self, url: str, current_time: float) -> str | None:
-        """从缓存获取 hash，检查 TTL。"""
+        """从缓存获取 hash，检查 TTL 并更新 LRU 顺序。"""
         with self._cache_lock:
             cached = self._cache.get(url)
-            if cached and (current_time - cached.timestamp) < self._cache_ttl:
-                return cached.hash_id
-            return None
-
-    def _add_to_cache(self, url: str, hash_id: str, current_time: float) -> None:
-        """添加 hash 到缓存。"""
+            if cached is None:
+                self._misses += 1
+                return None
+
+            ttl = self._persistent_ttl if cached.persistent else self._cache_ttl
+            if (current_time - cached.timestamp) >= ttl:
+                del self._cache[url]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._cache.move_to_end(url)
+            self._hits += 1
+            return cached.hash_id
+
+    def _add_to_cache(
+        self,
+        url: str,
+        hash_id: str,
+        current_time: float,
+        persistent: bool = False
+    ) -> None:
+        """添加 hash 到缓存，超出容量时淘汰最久未使用的条目。"""
         with self._cache_lock:
-            self._cache[url] = CachedHash(hash_id=hash_id, timestamp=current_time)
+            self._cache[url] = CachedHash(
+                hash_id=hash_id, timestamp=current_time, persistent=persistent
+            )
+            self._cache.move_to_end(url)
+            self._evict_overflow()
+
+    def _evict_overflow(self) -> None:
+        """淘汰超出容量的条目（调用方需持有 _cache_lock）。"""
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+
+    def _persist(self, fetched: dict[str, str], current_time: float) -> None:
+        """将从 torrent 文件获取的 hash 写入持久化仓库。"""
+        if not fetched or self._cache_repo is None:
+            return
+        try:
+            self._cache_repo.save_many({
+                url: (hash_id, current_time) for url, hash_id in fetched.items()
+            })
+        except Exception as e:
+            logger.warning(f'⚠️ 保存 hash 缓存到数据库失败: {e}')
 
     def _parallel_fetch(self, urls: list[str]) -> dict[str, str]:
         """并行下载 torrent 文件并提取 hash。"""
@@ -175,17 +324,29 @@ class HashExtractor:
         return results
 
     def clear_cache(self) -> None:
-        """清空缓存。"""
+        """清空缓存（包括持久化的条目）。"""
         with self._cache_lock:
             self._cache.clear()
-            logger.debug('🧹 HashExtractor 缓存已清空')
+        if self._cache_repo is not None:
+            try:
+                self._cache_repo.clear()
+            except Exception as e:
+                logger.warning(f'⚠️ 清空持久化 hash 缓存失败: {e}')
+        logger.debug('🧹 HashExtractor 缓存已清空')
 
     def get_cache_stats(self) -> dict[str, int]:
         """获取缓存统计信息。"""
         with self._cache_lock:
             return {
                 'size': len(self._cache),
-                'ttl': self._cache_ttl
+                'max_entries': self._max_entries,
+                'ttl': self._cache_ttl,
+                'persistent_ttl': self._persistent_ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'warmed_entries': self._warmed_entries,
             }
 
 
@@ -206,6 +367,16 @@ class RSSService(IRSSParser):
     DEFAULT_TIMEOUT = 30
     DEFAULT_USER_AGENT = 'AniDown/1.0'
 
+    # Concurrent feed fetching configuration
+    DEFAULT_FETCH_WORKERS = 8
+    DEFAULT_PER_HOST_LIMIT = 2
+
+    # Items checked against the database per query during incremental parsing
+    KNOWN_CHECK_BATCH_SIZE = 20
+
+    # File lists kept from downloaded .torrent files until the torrent is added
+    TORRENT_FILES_CACHE_SIZE = 256
+
     # XML namespaces for various RSS formats
     NAMESPACES = {
         '': 'http://www.w3.org/2005/Atom',
@@ -218,7 +389,10 @@ class RSSService(IRSSParser):
     def __init__(
         self,
         download_repo: IDownloadRepository,
-        timeout: int = DEFAULT_TIMEOUT
+        timeout: int = DEFAULT_TIMEOUT,
+        hash_cache_repo: 'TorrentHashCacheRepository | None' = None,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT
     ):
         """
         Initialize the RSS service.
@@ -226,6 +400,9 @@ class RSSService(IRSSParser):
         Args:
             download_repo: Repository for checking existing downloads.
             timeout: HTTP request timeout in seconds.
+            hash_cache_repo: Optional repository persisting the torrent hash cache.
+            fetch_workers: Maximum number of feeds fetched concurrently.
+            per_host_limit: Maximum concurrent requests to the same host.
         """
         self._download_repo = download_repo
         self._session = requests.Session()
@@ -233,7 +410,23 @@ class RSSService(IRSSParser):
             'User-Agent': self.DEFAULT_USER_AGENT
         })
         self._timeout = timeout
-        self._hash_extractor = HashExtractor(self)
+        self._hash_extractor = HashExtractor(self, cache_repo=hash_cache_repo)
+        self._feed_states: dict[str, FeedState] = {}
+        self._feed_filter_digests: dict[str, str] = {}
+        self._feed_states_lock = threading.Lock()
+
+        # 并发抓取：线程池、每个主机的并发限制和预取结果
+        self._fetch_workers = max(1, fetch_workers)
+        self._per_host_limit = max(1, per_host_limit)
+        self._fetch_executor: ThreadPoolExecutor | None = None
+        self._host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._executor_lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._prefetched: dict[tuple[str, bool], Future] = {}
+
+        # 下载 torrent 文件提取 hash 时顺带解析出的文件列表（hash → 文件列表）
+        self._torrent_files: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        self._torrent_files_lock = threading.Lock()
 
     def parse_feed(self, rss_url: str) -> list[RSSItem]:
         """
@@ -248,29 +441,295 @@ class RSSService(IRSSParser):
         Returns:
             List of RSSItem objects parsed from the feed.
 
+        Raises:
+            RSSError: If fetching or parsing fails.
+        """
+        future = self._pop_prefetched(rss_url, conditional=False)
+        if future is not None:
+            return future.result()
+        return self._fetch_and_parse(rss_url, conditional=False)
+
+    def parse_feed_if_changed(
+        self,
+        rss_url: str,
+        filters: dict[str, Any] | None = None
+    ) -> list[RSSItem] | None:
+        """
+        Parse an RSS/Atom feed only if it changed since the last poll.
+
+        Sends If-None-Match / If-Modified-Since using the validators from
+        the previous successful poll, and falls back to comparing a digest
+        of the response body when the server ignores conditional requests.
+        An unchanged feed is never handed to the XML parser. Once a feed has
+        been polled, parsing stops at the first item already in the download
+        database (invalidate_feed_state forces a full parse again). Both
+        shortcuts are skipped when the feed's filter settings changed since
+        the previous poll, so items the old filters rejected are re-checked.
+
+        Args:
+            rss_url: URL of the RSS feed.
+            filters: Filter settings of the feed (blocked_keywords,
+                blocked_regex, ...).
+
+        Returns:
+            List of RSSItem objects, or None if the feed is unchanged.
+
+        Raises:
+            RSSError: If fetching or parsing fails.
+        """
+        filters_changed = self._apply_feed_filters(rss_url, filters)
+        future = self._pop_prefetched(rss_url, conditional=True)
+        # 过滤设置变化时预取结果基于旧状态，丢弃后重新完整解析
+        if future is not None and not filters_changed:
+            return future.result()
+        return self._fetch_and_parse(rss_url, conditional=True)
+
+    def parse_feeds(
+        self,
+        rss_urls: list[str],
+        conditional: bool = False
+    ) -> list[FeedFetchResult]:
+        """
+        Fetch and parse several feeds concurrently.
+
+        Feeds are downloaded on a bounded thread pool with at most
+        per_host_limit concurrent requests per host, so one slow tracker
+        no longer delays every other subscription.
+
+        Args:
+            rss_urls: URLs of the RSS feeds.
+            conditional: Whether to use conditional requests (see
+                parse_feed_if_changed); unchanged feeds yield items=None.
+
+        Returns:
+            One FeedFetchResult per URL, in the same order as rss_urls.
+        """
+        futures = self._dispatch_fetches(rss_urls, conditional)
+
+        results = []
+        for url in rss_urls:
+            try:
+                results.append(FeedFetchResult(url=url, items=futures[url].result()))
+            except Exception as e:
+                results.append(FeedFetchResult(url=url, error=e))
+        return results
+
+    def prefetch_feeds(
+        self,
+        rss_urls: list[str],
+        conditional: bool = False,
+        filters: dict[str, dict[str, Any]] | None = None
+    ) -> None:
+        """
+        Start fetching feeds in the background without waiting for them.
+
+        A later parse_feed / parse_feed_if_changed call for the same URL
+        (with the matching conditional flag) waits for and consumes the
+        prefetched result instead of issuing a new request. This lets the
+        queue worker process feeds one by one in enqueue order while the
+        network I/O for all of them happens concurrently.
+
+        Args:
+            rss_urls: URLs of the RSS feeds.
+            conditional: Whether the consumer will use parse_feed_if_changed.
+            filters: Filter settings by URL, as later passed to
+                parse_feed_if_changed.
+        """
+        with self._fetch_lock:
+            urls = []
+            for url in dict.fromkeys(rss_urls):
+                if conditional and filters is not None:
+                    self._apply_feed_filters(url, filters.get(url))
+                pending = self._prefetched.get((url, conditional))
+                if pending is not None and not pending.done():
+                    continue
+                if pending is not None and conditional:
+                    # 上次预取结果未被消费，清除状态以免遗漏其中的新项目
+                    self.invalidate_feed_state(url)
+                urls.append(url)
+
+            futures = self._dispatch_fetches(urls, conditional)
+            for url, future in futures.items():
+                self._prefetched[(url, conditional)] = future
+
+        if urls:
+            logger.debug(f'🚀 已开始并发预取 {len(urls)} 个RSS订阅源')
+
+    def _pop_prefetched(self, rss_url: str, conditional: bool) -> Future | None:
+        """取出（并移除）指定 Feed 的预取结果。"""
+        with self._fetch_lock:
+            return self._prefetched.pop((rss_url, conditional), None)
+
+    def _dispatch_fetches(
+        self,
+        rss_urls: list[str],
+        conditional: bool
+    ) -> dict[str, Future]:
+        """
+        Submit feed fetches to the thread pool, grouped into per-host lanes.
+
+        Each host gets at most per_host_limit lanes and each lane fetches
+        its feeds sequentially, so pool threads never sit blocked waiting
+        for a busy host while feeds from other hosts are queued.
+
+        Returns:
+            Mapping of URL to a Future resolving to the parsed items.
+        """
+        futures: dict[str, Future] = {url: Future() for url in dict.fromkeys(rss_urls)}
+        if not futures:
+            return futures
+
+        by_host: dict[str, list[str]] = defaultdict(list)
+        for url in futures:
+            by_host[urlparse(url).netloc.lower()].append(url)
+
+        executor = self._get_fetch_executor()
+        for host_urls in by_host.values():
+            lanes = min(self._per_host_limit, len(host_urls))
+            for lane in range(lanes):
+                executor.submit(
+                    self._run_fetch_lane, host_urls[lane::lanes], futures, conditional
+                )
+        return futures
+
+    def _run_fetch_lane(
+        self,
+        rss_urls: list[str],
+        futures: dict[str, Future],
+        conditional: bool
+    ) -> None:
+        """依次抓取同一主机的一组 Feed，并将结果写入对应的 Future。"""
+        for url in rss_urls:
+            future = futures[url]
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with self._get_host_semaphore(url):
+                    items = self._fetch_and_parse(url, conditional)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(items)
+
+    def _get_fetch_executor(self) -> ThreadPoolExecutor:
+        """延迟创建 Feed 抓取线程池。"""
+        with self._executor_lock:
+            if self._fetch_executor is None:
+                self._fetch_executor = ThreadPoolExecutor(
+                    max_workers=self._fetch_workers,
+                    thread_name_prefix='rss-fetch'
+                )
+            return self._fetch_executor
+
+    def _get_host_semaphore(self, rss_url: str) -> threading.BoundedSemaphore:
+        """获取 URL 所在主机的并发限制信号量。"""
+        host = urlparse(rss_url).netloc.lower()
+        with self._executor_lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self._per_host_limit)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+    def invalidate_feed_state(self, rss_url: str) -> None:
+        """
+        Forget the conditional request state of a feed.
+
+        Should be called when processing items of a feed failed, so that
+        the next poll re-parses the feed and retries those items.
+
+        Args:
+            rss_url: URL of the RSS feed.
+        """
+        with self._feed_states_lock:
+            if self._feed_states.pop(rss_url, None) is not None:
+                logger.debug(f'🧹 已清除RSS条件请求状态: {rss_url}')
+
+    def _apply_feed_filters(self, rss_url: str, filters: dict[str, Any] | None) -> bool:
+        """
+        记录 Feed 当前的过滤设置，设置变化时清除条件请求状态。
+
+        Returns:
+            过滤设置是否与已记录的状态不同
+        """
+        digest = ''
+        if filters:
+            digest = hashlib.sha256(json.dumps(
+                {key: value or '' for key, value in filters.items()},
+                sort_keys=True, default=str
+            ).encode('utf-8')).hexdigest()
+
+        with self._feed_states_lock:
+            self._feed_filter_digests[rss_url] = digest
+            state = self._feed_states.get(rss_url)
+            if state is None or state.filter_digest == digest:
+                return False
+            del self._feed_states[rss_url]
+        logger.info(f'🔄 RSS过滤设置已变化，将完整解析: {rss_url}')
+        return True
+
+    def _fetch_and_parse(
+        self,
+        rss_url: str,
+        conditional: bool
+    ) -> list[RSSItem] | None:
+        """
+        Fetch and parse a feed, optionally short-circuiting unchanged feeds.
+
+        Args:
+            rss_url: URL of the RSS feed.
+            conditional: Whether to use and record the conditional request state.
+
+        Returns:
+            List of parsed items, or None if conditional and unchanged.
+
         Raises:
             RSSError: If fetching or parsing fails.
         """
         try:
             logger.info(f'🔍 正在解析RSS链接: {rss_url}')
-            response = self._session.get(rss_url, timeout=self._timeout)
+
+            headers = {}
+            state = None
+            if conditional:
+                with self._feed_states_lock:
+                    state = self._feed_states.get(rss_url)
+                if state:
+                    if state.etag:
+                        headers['If-None-Match'] = state.etag
+                    if state.last_modified:
+                        headers['If-Modified-Since'] = state.last_modified
+
+            response = self._session.get(
+                rss_url, timeout=self._timeout, headers=headers
+            )
+
+            if conditional and state and response.status_code == 304:
+                logger.info(f'📭 RSS未变化 (304 Not Modified): {rss_url}')
+                return None
 
             if response.status_code != 200:
                 logger.error(f'❌ RSS请求失败: {response.status_code}')
                 raise RSSError(f'RSS request failed with status {response.status_code}')
 
-            # Parse XML
-            root = ET.fromstring(response.content)
+            content = response.content
+            digest = hashlib.sha256(content).hexdigest()
 
-            items = []
+            if conditional and state and state.content_digest == digest:
+                # 服务端不支持条件请求，但内容未变化
+                self._remember_feed_state(rss_url, response, digest)
+                logger.info(f'📭 RSS内容未变化 (摘要一致): {rss_url}')
+                return None
 
-            # Detect feed format and parse accordingly
-            if root.tag == 'feed' or root.tag.endswith('}feed'):
-                # Atom format
-                items = self._parse_atom_feed(root)
+            # Stream-parse XML; incremental polls stop at the first known item
+            item_iter = self.iter_feed_items(io.BytesIO(content))
+            if conditional and state:
+                items = self._collect_until_known(item_iter)
             else:
-                # RSS 2.0 format
-                items = self._parse_rss_feed(root)
+                items = list(item_iter)
+
+            if conditional:
+                self._remember_feed_state(rss_url, response, digest)
 
             logger.info(f'✅ RSS解析完成，获取到{len(items)}个项目')
             return items
@@ -285,11 +744,27 @@ class RSSService(IRSSParser):
             logger.error(f'❌ RSS解析异常: {e}')
             raise RSSError(f'RSS parsing error: {e}')
 
+    def _remember_feed_state(
+        self,
+        rss_url: str,
+        response: requests.Response,
+        digest: str
+    ) -> None:
+        """记录 Feed 的 ETag / Last-Modified 和内容摘要。"""
+        with self._feed_states_lock:
+            self._feed_states[rss_url] = FeedState(
+                etag=response.headers.get('ETag', '') or '',
+                last_modified=response.headers.get('Last-Modified', '') or '',
+                content_digest=digest,
+                filter_digest=self._feed_filter_digests.get(rss_url, '')
+            )
+
     def filter_new_items(self, items: list[RSSItem]) -> list[RSSItem]:
         """
         Filter out items that already exist in the database.
 
-        Checks each item's hash against the download repository.
+        Checks all item hashes against the download repository in a
+        single batched lookup.
 
         Args:
             items: List of RSS items to filter.
@@ -297,7 +772,7 @@ class RSSService(IRSSParser):
         Returns:
             List of new items not present in the database.
         """
-        new_items = []
+        hashed_items: list[tuple[RSSItem, str]] = []
 
         for item in items:
             hash_id = item.hash
@@ -310,10 +785,13 @@ class RSSService(IRSSParser):
                 logger.debug(f'⚠️ 无法获取 hash: {item.title[:50]}...')
                 continue
 
-            # Check if already exists in database
-            existing = self._download_repo.get_by_hash(hash_id)
-            if not existing:
-                new_items.append(item)
+            hashed_items.append((item, hash_id))
+
+        # Check if already exists in database
+        existing = self._download_repo.existing_hashes(
+            [hash_id for _, hash_id in hashed_items]
+        )
+        new_items = [item for item, hash_id in hashed_items if hash_id not in existing]
 
         logger.info(f'✅ 过滤完成，找到{len(new_items)}个新项目')
         return new_items
@@ -370,9 +848,13 @@ class RSSService(IRSSParser):
         return self._hash_extractor.batch_extract(urls, skip_slow_fetch)
 
     def get_hash_extractor_stats(self) -> dict[str, int]:
-        """获取 hash 提取器的缓存统计。"""
+        """获取 hash 提取器的缓存统计（大小、命中/未命中/淘汰计数等）。"""
         return self._hash_extractor.get_cache_stats()
 
+    def warm_hash_extractor_cache(self) -> int:
+        """从数据库预热 hash 提取器的缓存，返回加载的条目数。"""
+        return self._hash_extractor.warm_cache()
+
     def clear_hash_extractor_cache(self) -> None:
         """清空 hash 提取器的缓存。"""
         self._hash_extractor.clear_cache()
@@ -398,58 +880,115 @@ class RSSService(IRSSParser):
         if hash_id and len(hash_id) >= 32:
             return hash_id
 
-        # Try to download torrent file and extract hash
+        # Try to download torrent file and extract hash (cached across restarts)
         if torrent_url and torrent_url.endswith('.torrent'):
-            fetched_hash = self._fetch_hash_from_torrent_file(torrent_url)
+            fetched_hash = self._hash_extractor.fetch_hash(torrent_url)
             if fetched_hash:
                 logger.debug(f'🔑 从torrent文件获取hash: {fetched_hash[:8]}...')
                 return fetched_hash
 
         return hash_id
 
-    def _parse_rss_feed(self, root: ET.Element) -> list[RSSItem]:
+    def pop_torrent_files(self, hash_id: str) -> list[dict[str, Any]] | None:
         """
-        Parse RSS 2.0 format feed.
+        取出下载 torrent 文件时解析的文件列表。
 
         Args:
-            root: XML root element.
+            hash_id: 种子 hash
 
         Returns:
-            List of parsed RSSItem objects.
+            文件列表（格式同 qBittorrent 的 torrents/files），未下载过该种子时返回 None
+        """
+        with self._torrent_files_lock:
+            return self._torrent_files.pop((hash_id or '').lower(), None)
+
+    def _remember_torrent_files(self, hash_id: str, files: list[dict[str, Any]]) -> None:
+        """缓存 torrent 文件列表，超出容量时淘汰最早的条目。"""
+        if not files:
+            return
+        with self._torrent_files_lock:
+            self._torrent_files[hash_id] = files
+            self._torrent_files.move_to_end(hash_id)
+            while len(self._torrent_files) > self.TORRENT_FILES_CACHE_SIZE:
+                self._torrent_files.popitem(last=False)
+
+    def iter_feed_items(self, source: BinaryIO) -> Iterator[RSSItem]:
         """
-        items = []
-        channel_items = root.findall('.//item')
+        Incrementally parse items from an RSS 2.0 or Atom document.
 
-        for item_elem in channel_items:
-            parsed = self._parse_rss_item(item_elem)
-            if parsed:
-                items.append(parsed)
+        Uses ET.iterparse so that each <item>/<entry> is parsed as soon as
+        its end tag is read, then detached from the tree and cleared. Memory
+        stays bounded by a single item regardless of feed size, and the
+        caller can stop consuming the iterator early.
+
+        Args:
+            source: Binary file-like object containing the feed XML.
 
-        return items
+        Yields:
+            Parsed RSSItem objects in document order.
 
-    def _parse_atom_feed(self, root: ET.Element) -> list[RSSItem]:
+        Raises:
+            ET.ParseError: If the XML is malformed.
         """
-        Parse Atom format feed.
+        stack: list[ET.Element] = []
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if elem.tag == 'item':
+                parsed = self._parse_rss_item(elem)
+            elif elem.tag in ('entry', '{http://www.w3.org/2005/Atom}entry'):
+                parsed = self._parse_atom_entry(elem)
+            else:
+                continue
+
+            # 释放已处理的元素，保持内存占用恒定
+            if stack:
+                stack[-1].remove(elem)
+            elem.clear()
+
+            if parsed:
+                yield parsed
+
+    def _collect_until_known(self, items: Iterator[RSSItem]) -> list[RSSItem]:
+        """
+        Collect items until the first one already in the download database.
+
+        Feeds list the newest entries first, so everything after an already
+        downloaded item has been seen by an earlier poll. Hashes are checked
+        in small batches to keep the number of database queries low.
 
         Args:
-            root: XML root element.
+            items: Iterator of parsed items (newest first).
 
         Returns:
-            List of parsed RSSItem objects.
+            Items preceding the first known item.
         """
-        items = []
+        collected: list[RSSItem] = []
+        pending: list[RSSItem] = []
 
-        # Find entries (with or without namespace)
-        entries = root.findall('.//entry')
-        if not entries:
-            entries = root.findall('.//{http://www.w3.org/2005/Atom}entry')
+        def flush() -> bool:
+            known = self._download_repo.existing_hashes(
+                [item.hash for item in pending if item.hash]
+            )
+            for item in pending:
+                if item.hash and item.hash in known:
+                    return True
+                collected.append(item)
+            pending.clear()
+            return False
 
-        for entry in entries:
-            parsed = self._parse_atom_entry(entry)
-            if parsed:
-                items.append(parsed)
+        for item in items:
+            pending.append(item)
+            if len(pending) >= self.KNOWN_CHECK_BATCH_SIZE and flush():
+                logger.debug(f'⏹️ 遇到已下载的项目，提前结束解析 (新项目 {len(collected)} 个)')
+                return collected
 
-        return items
+        if pending and flush():
+            logger.debug(f'⏹️ 遇到已下载的项目，提前结束解析 (新项目 {len(collected)} 个)')
+        return collected
 
     def _parse_rss_item(self, item: ET.Element) -> RSSItem | None:
         """
@@ -695,6 +1234,7 @@ class RSSService(IRSSParser):
                 info_bencoded = self._bencode(info_dict)
                 info_hash = hashlib.sha1(info_bencoded).hexdigest().lower()
                 logger.debug(f'✅ 从torrent文件提取hash: {info_hash}')
+                self._remember_torrent_files(info_hash, files_from_info(info_dict))
                 return info_hash
 
         except Exception as e:
@@ -713,56 +1253,13 @@ class RSSService(IRSSParser):
             The 'info' dictionary if found, None otherwise.
         """
         try:
-            decoded, _ = self._bdecode(data, 0)
+            decoded, _ = bdecode(data)
             if isinstance(decoded, dict) and b'info' in decoded:
                 return decoded[b'info']
         except Exception:
             pass
         return None
 
-    def _bdecode(self, data: bytes, idx: int) -> tuple:
-        """
-        Decode bencoded data starting at the given index.
-
-        Args:
-            data: Bencoded data.
-            idx: Starting index.
-
-        Returns:
-            Tuple of (decoded_value, next_index).
-        """
-        char = chr(data[idx])
-
-        if char == 'd':  # Dictionary
-            idx += 1
-            result = {}
-            while chr(data[idx]) != 'e':
-                key, idx = self._bdecode(data, idx)
-                value, idx = self._bdecode(data, idx)
-                result[key] = value
-            return result, idx + 1
-
-        elif char == 'l':  # List
-            idx += 1
-            result = []
-            while chr(data[idx]) != 'e':
-                value, idx = self._bdecode(data, idx)
-                result.append(value)
-            return result, idx + 1
-
-        elif char == 'i':  # Integer
-            idx += 1
-            end = data.index(b'e', idx)
-            return int(data[idx:end]), end + 1
-
-        elif char.isdigit():  # String
-            colon = data.index(b':', idx)
-            length = int(data[idx:colon])
-            idx = colon + 1
-            return data[idx:idx + length], idx + length
-
-        raise ValueError(f'Invalid bencode at position {idx}')
-
     def _bencode(self, data: Any) -> bytes:
         """
         Encode data into bencode format.
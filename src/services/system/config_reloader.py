@@ -99,6 +99,7 @@ class ConfigReloader:
         try:
             from src.container import container
             from src.core.config import config
+            from src.infrastructure.ai.api_client import shared_transport
             from src.infrastructure.ai.circuit_breaker import (
                 CircuitBreaker,
                 clear_all_breaker_registries,
@@ -202,6 +203,9 @@ class ConfigReloader:
             # 需要直接更新这些实例的内部属性
             self._update_ai_service_references()
 
+            # Phase 4: 重建 HTTP 连接池，使连接数匹配新的 Key 数量
+            shared_transport.reset()
+
             logger.info('✅ Key Pools 热重载完成')
             return True
         except Exception as e:
@@ -310,9 +314,8 @@ class ConfigReloader:
             qb_client.username = config.qbittorrent.username
             qb_client.password = config.qbittorrent.password
 
-            # 清除现有登录状态，强制重新登录
-            qb_client.cookies = None
-            qb_client.session.cookies.clear()
+            # 清除现有登录状态和同步镜像，强制重新登录
+            qb_client.reset_session()
 
             # 尝试重新登录
             if qb_client.login():
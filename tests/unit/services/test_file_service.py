@@ -205,3 +205,122 @@ class TestFileServiceCreate:
         expected_target = os.path.join(target_dir, 'Season 1', 'episode01.mkv')
         assert os.path.exists(expected_target)
         mock_history_repo.save.assert_called_once()
+
+
+class TestFileServiceCreateMany:
+    """Tests for FileService.create_many() method."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    @pytest.fixture
+    def mock_history_repo(self):
+        """Create a mock history repository."""
+        return MagicMock()
+
+    @pytest.fixture
+    def mock_path_builder(self):
+        """Create a path builder mock that creates directories."""
+        mock = MagicMock()
+
+        def ensure_dir_side_effect(path):
+            os.makedirs(path, exist_ok=True)
+            return True
+        mock.ensure_directory.side_effect = ensure_dir_side_effect
+        return mock
+
+    @pytest.fixture
+    def file_service(self, mock_history_repo, mock_path_builder):
+        """Create a FileService instance with mocked dependencies."""
+        return FileService(
+            history_repo=mock_history_repo,
+            path_builder=mock_path_builder,
+        )
+
+    def _make_source(self, temp_dir, name, content='test content'):
+        source_path = os.path.join(temp_dir, 'source', name)
+        os.makedirs(os.path.dirname(source_path), exist_ok=True)
+        with open(source_path, 'w') as f:
+            f.write(content)
+        return source_path
+
+    def test_links_all_files_and_records_once(
+        self, file_service, temp_dir, mock_history_repo, mock_path_builder
+    ):
+        """Should create each directory once and save all results in one call."""
+        first = self._make_source(temp_dir, 'ep01.mkv')
+        second = self._make_source(temp_dir, 'ep02.mkv')
+        missing = os.path.join(temp_dir, 'source', 'ep03.mkv')
+        target_dir = os.path.join(temp_dir, 'target')
+
+        result = file_service.create_many(
+            [
+                (first, 'Season 1/S01E01.mkv'),
+                (second, 'Season 1/S01E02.mkv'),
+                (missing, 'Season 1/S01E03.mkv'),
+            ],
+            target_dir=target_dir,
+            anime_id=1,
+            torrent_hash='abc123',
+        )
+
+        assert result == ['hardlink', 'hardlink', None]
+        assert os.path.samefile(first, os.path.join(target_dir, 'Season 1', 'S01E01.mkv'))
+        mock_path_builder.ensure_directory.assert_called_once_with(
+            os.path.join(target_dir, 'Season 1')
+        )
+        mock_history_repo.save_many.assert_called_once()
+        records, failures = mock_history_repo.save_many.call_args[0]
+        assert [r.original_file_path for r in records] == [first, second]
+        assert failures[0][0].original_file_path == missing
+        mock_history_repo.save.assert_not_called()
+
+    def test_duplicate_targets_keep_last_pair(
+        self, file_service, temp_dir, mock_history_repo
+    ):
+        """Should link a shared target once, from the last pair."""
+        first = self._make_source(temp_dir, 'v1.mkv')
+        second = self._make_source(temp_dir, 'v2.mkv')
+        target_dir = os.path.join(temp_dir, 'target')
+
+        result = file_service.create_many(
+            [(first, 'S01E01.mkv'), (second, 'S01E01.mkv')], target_dir
+        )
+
+        assert result == ['hardlink', 'hardlink']
+        assert os.path.samefile(second, os.path.join(target_dir, 'S01E01.mkv'))
+        records, failures = mock_history_repo.save_many.call_args[0]
+        assert [r.original_file_path for r in records] == [second]
+        assert failures == []
+
+    def test_copy_fallback_uses_next_kernel_copy(self, file_service, temp_dir):
+        """Should copy across devices, falling back from copy_file_range."""
+        source_path = self._make_source(temp_dir, 'video.mkv', 'x' * 10000)
+        target_dir = os.path.join(temp_dir, 'target')
+
+        with patch('os.link', side_effect=OSError(18, 'Invalid cross-device link')), \
+                patch('os.copy_file_range', side_effect=OSError(18, 'EXDEV'), create=True):
+            result = file_service.create_many([(source_path, 'renamed.mkv')], target_dir)
+
+        target_path = os.path.join(target_dir, 'renamed.mkv')
+        assert result == ['copy']
+        assert not os.path.samefile(source_path, target_path)
+        with open(target_path) as f:
+            assert f.read() == 'x' * 10000
+
+    def test_copy_falls_back_when_kernel_copy_returns_zero(self, file_service, temp_dir):
+        """Should try the next copy method when copy_file_range copies nothing."""
+        source_path = self._make_source(temp_dir, 'video.mkv', 'y' * 5000)
+        target_dir = os.path.join(temp_dir, 'target')
+
+        with patch('os.link', side_effect=OSError(18, 'Invalid cross-device link')), \
+                patch('os.copy_file_range', return_value=0, create=True), \
+                patch('os.sendfile', return_value=0, create=True):
+            result = file_service.create_many([(source_path, 'renamed.mkv')], target_dir)
+
+        assert result == ['copy']
+        with open(os.path.join(target_dir, 'renamed.mkv')) as f:
+            assert f.read() == 'y' * 5000
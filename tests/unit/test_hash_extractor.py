@@ -189,6 +189,78 @@ class TestHashExtractor:
         assert result == {}
 
 
+class TestHashExtractorPersistence:
+    """Test suite for HashExtractor LRU bounds and persistent cache."""
+
+    @pytest.fixture
+    def mock_rss_service(self):
+        """Create a mock RSSService for testing."""
+        mock = MagicMock()
+        mock.extract_hash_from_url.return_value = ''
+        mock._fetch_hash_from_torrent_file.return_value = ''
+        return mock
+
+    @pytest.fixture
+    def mock_cache_repo(self):
+        """Create a mock TorrentHashCacheRepository."""
+        repo = MagicMock()
+        repo.load_recent.return_value = []
+        repo.prune.return_value = 0
+        return repo
+
+    def test_lru_eviction_is_bounded(self, mock_rss_service):
+        """Test that the cache evicts least recently used entries."""
+        from src.services.rss.rss_service import HashExtractor
+        extractor = HashExtractor(mock_rss_service, max_entries=2)
+        mock_rss_service.extract_hash_from_url.side_effect = lambda url: url[-4:]
+
+        extractor.batch_extract(['magnet:aaaa', 'magnet:bbbb'])
+        # Touch aaaa so bbbb becomes the LRU entry
+        extractor.batch_extract(['magnet:aaaa'])
+        extractor.batch_extract(['magnet:cccc'])
+
+        assert list(extractor._cache) == ['magnet:aaaa', 'magnet:cccc']
+        stats = extractor.get_cache_stats()
+        assert stats['size'] == 2
+        assert stats['evictions'] == 1
+        assert stats['hits'] == 1
+
+    def test_fetched_hash_is_persisted(self, mock_rss_service, mock_cache_repo):
+        """Test that hashes fetched from torrent files are saved to the repo."""
+        from src.services.rss.rss_service import HashExtractor
+        extractor = HashExtractor(mock_rss_service, cache_repo=mock_cache_repo)
+        mock_rss_service._fetch_hash_from_torrent_file.return_value = 'd' * 40
+
+        result = extractor.batch_extract(['https://example.com/a.torrent'])
+
+        assert result == {'https://example.com/a.torrent': 'd' * 40}
+        saved = mock_cache_repo.save_many.call_args[0][0]
+        assert saved['https://example.com/a.torrent'][0] == 'd' * 40
+
+    def test_warm_cache_avoids_refetch(self, mock_rss_service, mock_cache_repo):
+        """Test that persisted entries are loaded and reused after restart."""
+        from src.services.rss.rss_service import HashExtractor
+        url = 'https://example.com/b.torrent'
+        mock_cache_repo.load_recent.return_value = [(url, 'e' * 40, time() - 86400)]
+        extractor = HashExtractor(mock_rss_service, cache_repo=mock_cache_repo)
+
+        assert extractor.fetch_hash(url) == 'e' * 40
+        mock_rss_service._fetch_hash_from_torrent_file.assert_not_called()
+        # Warming happens only once
+        extractor.fetch_hash(url)
+        assert mock_cache_repo.load_recent.call_count == 1
+        assert extractor.get_cache_stats()['warmed_entries'] == 1
+
+    def test_warm_cache_failure_is_non_fatal(self, mock_rss_service, mock_cache_repo):
+        """Test that a repository error during warm-up does not break extraction."""
+        from src.services.rss.rss_service import HashExtractor
+        mock_cache_repo.load_recent.side_effect = RuntimeError('db locked')
+        extractor = HashExtractor(mock_rss_service, cache_repo=mock_cache_repo)
+        mock_rss_service._fetch_hash_from_torrent_file.return_value = 'f' * 40
+
+        assert extractor.fetch_hash('https://example.com/c.torrent') == 'f' * 40
+
+
 class TestRSSServiceHashIntegration:
     """Integration tests for RSSService hash extraction methods."""
 
@@ -176,7 +176,8 @@ class TestKeyPool:
             res = key_pool.reserve()
             if res:
                 reservations.append(res)
-                # Don't report success to keep using same key
+                # Release the concurrency slot; RPM counts are kept
+                key_pool.report_success(res.key_id)
 
         # Should have gotten some reservations before hitting limit
         assert len(reservations) > 0
@@ -230,6 +231,245 @@ class TestKeyPool:
         assert status['available_count'] == 2
 
 
+class TestKeySelection:
+    """Tests for weighted key selection and queued reservations."""
+
+    @pytest.fixture
+    def make_pool(self):
+        """Create a KeyPool with the given (key_id, rpm_limit) pairs."""
+        from src.infrastructure.ai.key_pool import KeyPool, KeySpec
+
+        def _make(*keys):
+            pool = KeyPool(purpose='test_selection')
+            pool.configure([
+                KeySpec(
+                    key_id=key_id,
+                    name=key_id,
+                    api_key=f'sk-{key_id}',
+                    base_url='https://api.example.com/v1',
+                    rpm_limit=rpm_limit
+                )
+                for key_id, rpm_limit in keys
+            ])
+            return pool
+
+        return _make
+
+    def test_prefers_faster_key(self, make_pool):
+        """Test keys with lower observed latency are preferred."""
+        pool = make_pool(('fast', 0), ('slow', 0))
+        pool.report_success(pool.reserve().key_id, response_time_ms=100)
+        pool.report_success(pool.reserve().key_id, response_time_ms=100)
+        pool._usage['slow'].latency_ewma_ms = 8000
+
+        picks = []
+        for _ in range(5):
+            reservation = pool.reserve()
+            picks.append(reservation.key_id)
+            pool.report_success(reservation.key_id, response_time_ms=100)
+
+        assert picks == ['fast'] * 5
+
+    def test_prefers_least_loaded_key(self, make_pool):
+        """Test keys with in-flight requests are deprioritized."""
+        pool = make_pool(('a', 0), ('b', 0))
+
+        first = pool.reserve()
+        second = pool.reserve()
+
+        assert {first.key_id, second.key_id} == {'a', 'b'}
+        assert pool.get_status()['keys'][0]['in_flight'] == 1
+
+    def test_leaked_reservation_expires_under_load(self, make_pool, monkeypatch):
+        """Test a never-reported reservation stops counting despite newer ones."""
+        from src.infrastructure.ai import key_pool
+
+        now = [1000.0]
+        monkeypatch.setattr(key_pool.time, 'time', lambda: now[0])
+        pool = make_pool(('only', 0))
+        pool.reserve()  # leaked: its result is never reported
+
+        for _ in range(3):
+            now[0] += pool.IN_FLIGHT_TIMEOUT_SECONDS / 2
+            pool.report_success(pool.reserve().key_id, response_time_ms=100)
+
+        usage = pool._usage['only']
+        assert pool._effective_in_flight(usage, now[0]) == 0
+        pool.reserve()
+        assert pool._effective_in_flight(usage, now[0]) == 1
+
+    def test_rpm_exhausted_key_leaves_ready_set(self, make_pool):
+        """Test a key hitting its RPM limit is tracked in the ready-time heap."""
+        pool = make_pool(('limited', 1), ('open', 0))
+
+        picks = {pool.reserve().key_id for _ in range(3)}
+
+        assert picks == {'limited', 'open'}
+        assert pool._ready == {'open'}
+        assert pool._blocked[0][2] == 'limited'
+
+        pool.reset_rpm('limited')
+        assert pool._ready == {'limited', 'open'}
+
+    def test_reserve_async_waits_without_blocking(self, make_pool):
+        """Test queued reservations resolve in order once a key frees up."""
+        pool = make_pool(('only', 1))
+        assert pool.reserve_async().result(timeout=1).key_id == 'only'
+
+        first = pool.reserve_async()
+        second = pool.reserve_async()
+        assert not first.done()
+        assert pool.get_status()['waiting_count'] == 2
+
+        pool.reset_rpm('only')
+        assert first.result(timeout=2).key_id == 'only'
+        assert not second.done()
+
+        pool.reset_rpm('only')
+        assert second.result(timeout=2).key_id == 'only'
+
+    def test_reserve_async_without_wait_returns_none(self, make_pool):
+        """Test reservations that may not wait resolve to None immediately."""
+        pool = make_pool(('only', 1))
+        pool.reserve()
+
+        future = pool.reserve_async(wait_for_rpm=False)
+
+        assert future.done()
+        assert future.result() is None
+
+
+class TestAdaptiveConcurrency:
+    """Tests for the AIMD concurrency limiter and its KeyPool integration."""
+
+    def test_increases_only_when_saturated_and_healthy(self):
+        """Test the limit grows additively only while fully used and fast."""
+        from src.infrastructure.ai.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter('test', initial_limit=2)
+
+        for _ in range(5):
+            limiter.on_success(latency_ms=100, in_flight=1)
+        assert limiter.limit == 2
+
+        for _ in range(4):
+            limiter.on_success(latency_ms=100, in_flight=2)
+        assert limiter.limit == 3
+
+        limiter.on_success(latency_ms=5000, in_flight=3)
+        assert limiter.get_status()['limit'] == 3
+
+    def test_congestion_halves_once_and_holds_growth(self):
+        """Test 429s back off once per interval and respect retry_after."""
+        from src.infrastructure.ai.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter('test', initial_limit=8)
+
+        limiter.on_congestion('rate_limited', retry_after=30)
+        limiter.on_congestion('rate_limited')
+        assert limiter.limit == 4
+
+        for _ in range(10):
+            limiter.on_success(latency_ms=100, in_flight=4)
+        assert limiter.limit == 4
+        assert limiter.get_status()['last_decrease_reason'] == 'rate_limited'
+
+    def test_pool_queues_beyond_concurrency_limit(self):
+        """Test reservations over the limit wait for an in-flight request."""
+        from src.infrastructure.ai.concurrency_limiter import AdaptiveConcurrencyLimiter
+        from src.infrastructure.ai.key_pool import KeyPool, KeySpec
+
+        pool = KeyPool(purpose='test_concurrency')
+        pool._limiter = AdaptiveConcurrencyLimiter('test_concurrency', initial_limit=1)
+        pool.configure([
+            KeySpec(key_id='k', name='k', api_key='sk-k', base_url='https://api.example.com/v1')
+        ])
+
+        first = pool.reserve()
+        waiting = pool.reserve_async(wait_for_rpm=False)
+        assert not waiting.done()
+
+        status = pool.get_status()
+        assert status['in_flight'] == 1
+        assert status['concurrency']['limit'] == 1
+
+        pool.report_error(first.key_id, 'Service unavailable', status_code=503)
+        pool.reset_cooldown(first.key_id)
+        assert waiting.result(timeout=2).key_id == 'k'
+
+
+class TestAIKeyUsageBuffer:
+    """Tests for write-behind AI key usage logging."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create an AIKeyRepository bound to a temporary database."""
+        from src.infrastructure.database.session import DatabaseSessionManager
+        from src.infrastructure.repositories.ai_key_repository import AIKeyRepository
+
+        manager = DatabaseSessionManager(db_path=str(tmp_path / 'usage.db'))
+        manager.init_db()
+        repo = AIKeyRepository()
+        with patch('src.infrastructure.repositories.ai_key_repository.db_manager', manager):
+            yield repo, manager
+            repo.close()
+
+    def _count_logs(self, manager):
+        from src.infrastructure.database.models import AIKeyUsageLog
+
+        with manager.session() as session:
+            return session.query(AIKeyUsageLog).count()
+
+    def test_log_usage_is_buffered_until_flush(self, repo):
+        """Test usage logs are written in one batch on flush."""
+        repo, manager = repo
+        repo.FLUSH_INTERVAL_SECONDS = 60
+
+        for rpd in (1, 2, 3):
+            repo.log_usage('title_parse', 'key1', rpd_at_call=rpd)
+
+        assert self._count_logs(manager) == 0
+        assert repo.flush() == 3
+        assert self._count_logs(manager) == 3
+        assert repo.get_daily_count('title_parse', 'key1') == 3
+
+    def test_daily_count_follows_manual_reset(self, repo):
+        """Test a lower count after reset_rpd replaces the stored count."""
+        repo, _ = repo
+        repo.FLUSH_INTERVAL_SECONDS = 60
+
+        repo.log_usage('title_parse', 'key1', rpd_at_call=50)
+        repo.flush()
+        repo.log_usage('title_parse', 'key1', rpd_at_call=1)
+        repo.flush()
+
+        assert repo.get_daily_count('title_parse', 'key1') == 1
+
+    def test_reads_see_buffered_usage(self, repo):
+        """Test daily counts and history include unflushed entries."""
+        repo, _ = repo
+        repo.FLUSH_INTERVAL_SECONDS = 60
+
+        repo.log_usage('title_parse', 'key1', rpd_at_call=5)
+
+        assert repo.get_daily_count('title_parse', 'key1') == 5
+        assert len(repo.get_usage_history('title_parse', 'key1')) == 1
+
+    def test_failed_flush_keeps_entries(self, repo):
+        """Test entries are retried after a failed flush."""
+        from src.core.exceptions import DatabaseError
+
+        repo, manager = repo
+        repo.FLUSH_INTERVAL_SECONDS = 60
+        repo.log_usage('title_parse', 'key1', rpd_at_call=1)
+
+        with patch.object(manager, 'session', side_effect=DatabaseError('locked')):
+            assert repo.flush() == 0
+
+        assert repo.flush() == 1
+        assert self._count_logs(manager) == 1
+
+
 class TestCircuitBreaker:
     """Tests for circuit breaker functionality."""
 
@@ -340,10 +580,10 @@ class TestAITitleParser:
     @pytest.fixture
     def title_parser(self, mock_api_response):
         """Create AITitleParser with mocked dependencies."""
-        from src.infrastructure.ai.title_parser import AITitleParser
-        from src.infrastructure.ai.key_pool import KeyPool, KeySpec
-        from src.infrastructure.ai.circuit_breaker import CircuitBreaker
         from src.infrastructure.ai.api_client import OpenAIClient
+        from src.infrastructure.ai.circuit_breaker import CircuitBreaker
+        from src.infrastructure.ai.key_pool import KeyPool, KeySpec
+        from src.infrastructure.ai.title_parser import AITitleParser
 
         key_pool = KeyPool(purpose='title_parse')
         key_pool.configure([
@@ -387,10 +627,10 @@ class TestAITitleParser:
 
     def test_title_parser_circuit_breaker_open(self):
         """Test that circuit breaker blocks requests when open."""
-        from src.infrastructure.ai.title_parser import AITitleParser
-        from src.infrastructure.ai.key_pool import KeyPool, KeySpec
-        from src.infrastructure.ai.circuit_breaker import CircuitBreaker
         from src.core.exceptions import AICircuitBreakerError
+        from src.infrastructure.ai.circuit_breaker import CircuitBreaker
+        from src.infrastructure.ai.key_pool import KeyPool, KeySpec
+        from src.infrastructure.ai.title_parser import AITitleParser
 
         key_pool = KeyPool(purpose='title_parse_test')
         key_pool.configure([
@@ -412,6 +652,344 @@ class TestAITitleParser:
             parser.parse('[Test] Anime - 01.mkv')
 
 
+class TestAIFileRenamerBatches:
+    """Tests for parallel folder batches in AIFileRenamer."""
+
+    @staticmethod
+    def _make_renamer(available_keys, fake_batch):
+        from src.infrastructure.ai.file_renamer import AIFileRenamer
+
+        key_pool = MagicMock()
+        key_pool.get_status.return_value = {'available_count': available_keys}
+        renamer = AIFileRenamer(key_pool, MagicMock(), api_client=MagicMock(), batch_size=2)
+        renamer._process_single_batch = fake_batch
+        return renamer
+
+    def test_folders_run_in_parallel_with_per_folder_hardlinks(self):
+        """Test folder groups overlap while batches of one folder stay ordered."""
+        import threading
+
+        from src.core.interfaces.adapters import RenameResult
+
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+        seen_hardlinks = {}
+
+        def fake_batch(files, category, anime_title, folder_structure, tvdb_data,
+                       previous_hardlinks):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+                seen_hardlinks[files[0]] = list(previous_hardlinks)
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+            return RenameResult(main_files={f: f'out/{f}' for f in files})
+
+        files = [f'Box/S{s}/e{e}.mkv' for s in range(1, 4) for e in range(1, 5)]
+        result = self._make_renamer(3, fake_batch).generate_rename_mapping(files, 'tv')
+
+        assert state['peak'] > 1
+        assert list(result.main_files) == files
+        # The second batch of a folder sees only that folder's first batch
+        assert seen_hardlinks['Box/S2/e3.mkv'] == ['out/Box/S2/e1.mkv', 'out/Box/S2/e2.mkv']
+        assert seen_hardlinks['Box/S2/e1.mkv'] == []
+
+    def test_cross_folder_conflict_reprocesses_folder(self):
+        """Test a folder whose targets collide with an earlier folder is redone."""
+        from src.core.interfaces.adapters import RenameResult
+
+        calls = []
+
+        def fake_batch(files, category, anime_title, folder_structure, tvdb_data,
+                       previous_hardlinks):
+            calls.append((files[0], list(previous_hardlinks)))
+            if previous_hardlinks:
+                return RenameResult(main_files={f: f'fixed/{f}' for f in files})
+            return RenameResult(main_files=dict.fromkeys(files[:1], 'same.mkv'))
+
+        files = ['Box/A/1.mkv', 'Box/A/2.mkv', 'Box/A/3.mkv', 'Box/B/1.mkv']
+        result = self._make_renamer(2, fake_batch).generate_rename_mapping(files, 'tv')
+
+        assert calls[-1] == ('Box/B/1.mkv', ['same.mkv', 'fixed/Box/A/3.mkv'])
+        assert result.main_files['Box/B/1.mkv'] == 'fixed/Box/B/1.mkv'
+
+    def test_single_available_key_keeps_sequential_order(self):
+        """Test batches share one hardlink list when only one key is available."""
+        from src.core.interfaces.adapters import RenameResult
+
+        seen = []
+
+        def fake_batch(files, category, anime_title, folder_structure, tvdb_data,
+                       previous_hardlinks):
+            seen.append(list(previous_hardlinks))
+            return RenameResult(main_files={f: f'out/{f}' for f in files})
+
+        files = ['Box/A/1.mkv', 'Box/A/2.mkv', 'Box/B/1.mkv']
+        self._make_renamer(1, fake_batch).generate_rename_mapping(files, 'tv')
+
+        assert seen == [[], ['out/Box/A/1.mkv', 'out/Box/A/2.mkv']]
+
+
+class TestHTTPTransport:
+    """Tests for the shared keep-alive transport used by OpenAIClient."""
+
+    def test_session_reused_and_sized_from_key_pools(self):
+        """Test one session per base_url, sized by the registered keys."""
+        from src.infrastructure.ai.api_client import HTTPTransport
+        from src.infrastructure.ai.key_pool import (
+            KeyPool,
+            KeySpec,
+            clear_all_registries,
+            register_pool,
+        )
+
+        clear_all_registries()
+        pool = KeyPool(purpose='transport_test')
+        pool.configure([
+            KeySpec(key_id=f'k{i}', name=f'K{i}', api_key='sk', base_url='https://ai.example/v1/')
+            for i in range(5)
+        ])
+        register_pool(pool)
+        try:
+            transport = HTTPTransport()
+            session = transport.get_session('https://ai.example/v1')
+
+            assert transport.get_session('https://ai.example/v1/') is session
+            assert transport.get_session('https://other.example/v1') is not session
+            assert transport.get_status() == {
+                'https://ai.example/v1': 10,
+                'https://other.example/v1': HTTPTransport.MIN_POOL_SIZE,
+            }
+            assert session.get_adapter('https://ai.example/v1')._pool_maxsize == 10
+
+            transport.reset()
+            assert transport.get_session('https://ai.example/v1') is not session
+        finally:
+            clear_all_registries()
+
+    def test_client_posts_through_shared_session(self):
+        """Test OpenAIClient uses the transport session with split timeouts."""
+        from src.infrastructure.ai.api_client import OpenAIClient
+
+        session = MagicMock()
+        session.post.return_value.status_code = 200
+        session.post.return_value.json.return_value = {
+            'choices': [{'message': {'content': ' ok '}}]
+        }
+        transport = MagicMock()
+        transport.get_session.return_value = session
+
+        client = OpenAIClient(timeout=60, connect_timeout=5, transport=transport)
+        response = client.call('https://ai.example/v1', 'sk', 'gpt', [])
+
+        assert response.success and response.content == 'ok'
+        transport.get_session.assert_called_once_with('https://ai.example/v1')
+        assert session.post.call_args.kwargs['timeout'] == (5, 60)
+
+
+class TestRenameStreaming:
+    """Tests for streaming rename responses and incremental parsing."""
+
+    RESPONSE = json.dumps({
+        'main_files': {'1': 'Show/S01E01.mkv', '2': 'Show/S01E02.mkv'},
+        'skipped_files': [],
+        'seasons_info': {},
+        'season': 1,
+    })
+
+    @staticmethod
+    def _sse_session(chunks):
+        """Build a fake session whose streamed response yields SSE chunks."""
+        lines = [
+            f'data: {json.dumps({"choices": [{"delta": {"content": c}}]})}'.encode()
+            for c in chunks
+        ] + [b'', b'data: [DONE]']
+        response = MagicMock()
+        response.status_code = 200
+        response.iter_lines.return_value = iter(lines)
+        response.__enter__.return_value = response
+        session = MagicMock()
+        session.post.return_value = response
+        return session
+
+    def test_parser_yields_entries_across_chunks(self):
+        """Test mapping entries are returned as soon as they are complete."""
+        from src.infrastructure.ai.stream_parser import RenameStreamParser
+
+        parser = RenameStreamParser()
+        chunks = [self.RESPONSE[i:i + 7] for i in range(0, len(self.RESPONSE), 7)]
+        seen = [(len(''.join(chunks[:i + 1])), e) for i, c in enumerate(chunks)
+                for e in parser.feed(c)]
+
+        assert [e for _, e in seen] == [('1', 'Show/S01E01.mkv'), ('2', 'Show/S01E02.mkv')]
+        assert seen[0][0] < len(self.RESPONSE) // 2
+        assert parser.complete
+
+    def test_parser_rejects_non_string_mapping(self):
+        """Test schema violations raise before the response is complete."""
+        from src.core.exceptions import AIResponseParseError
+        from src.infrastructure.ai.stream_parser import RenameStreamParser
+
+        parser = RenameStreamParser()
+        parser.feed('{"main_files": {"1": "ok.mkv", ')
+        with pytest.raises(AIResponseParseError):
+            parser.feed('"2": 3')
+
+    def test_call_stream_assembles_and_aborts(self):
+        """Test call_stream concatenates deltas and stops when asked."""
+        from src.infrastructure.ai.api_client import OpenAIClient
+
+        transport = MagicMock()
+        transport.get_session.return_value = self._sse_session(['{"a"', ': 1}'])
+        client = OpenAIClient(timeout=30, transport=transport)
+
+        response = client.call_stream('https://ai.example/v1', 'sk', 'gpt', [])
+        assert response.success and response.content == '{"a": 1}'
+        post_kwargs = transport.get_session.return_value.post.call_args.kwargs
+        assert post_kwargs['stream'] is True and post_kwargs['json']['stream'] is True
+
+        transport.get_session.return_value = self._sse_session(['{"a"', ': 1}'])
+        response = client.call_stream(
+            'https://ai.example/v1', 'sk', 'gpt', [], on_delta=lambda delta: False
+        )
+        assert not response.success and response.aborted
+        assert response.content == '{"a"'
+
+    def test_renamer_retries_after_schema_violation(self):
+        """Test an aborted stream is retried without penalizing the key."""
+        from src.infrastructure.ai.api_client import APIResponse
+        from src.infrastructure.ai.file_renamer import AIFileRenamer
+
+        contents = iter(['{"main_files": {"1": 1}}', self.RESPONSE])
+
+        def call_stream(on_delta, **kwargs):
+            content = next(contents)
+            if on_delta(content) is False:
+                return APIResponse(success=False, content=content, aborted=True)
+            return APIResponse(success=True, content=content, response_time_ms=5)
+
+        key_pool = MagicMock()
+        key_pool.get_status.return_value = {'keys': [], 'all_in_long_cooling': False}
+        api_client = MagicMock()
+        api_client.call_stream.side_effect = call_stream
+
+        renamer = AIFileRenamer(key_pool, MagicMock(), api_client=api_client, streaming=True)
+        with patch('src.infrastructure.ai.file_renamer.ai_key_repository'):
+            result = renamer.generate_rename_mapping(['a.mkv', 'b.mkv'], 'tv')
+
+        assert result.main_files == {'a.mkv': 'Show/S01E01.mkv', 'b.mkv': 'Show/S01E02.mkv'}
+        assert api_client.call_stream.call_count == 2
+        api_client.call.assert_not_called()
+        key_pool.report_error.assert_not_called()
+
+
+class TestPromptTokenBudget:
+    """Tests for token estimation and token-aware rename batching."""
+
+    def test_estimator_calibrates_from_actual_usage(self):
+        """Test reported prompt tokens scale later estimates."""
+        from src.infrastructure.ai.token_budget import TokenEstimator
+
+        estimator = TokenEstimator()
+        assert estimator.estimate('abcd' * 100) == 100
+        assert estimator.estimate('动漫标题') == 4
+
+        estimator.record(100, 150)
+        assert estimator.ratio == pytest.approx(1.5)
+        assert estimator.estimate('abcd' * 100) == 150
+
+        estimator.record(150, None)
+        assert estimator.ratio == pytest.approx(1.5)
+
+    def test_trim_context_to_budget(self):
+        """Test folder structure and TVDB data are trimmed only when over budget."""
+        from src.infrastructure.ai.token_budget import (
+            TokenEstimator,
+            trim_folder_structure,
+            trim_tvdb_data,
+        )
+        from src.infrastructure.metadata.tvdb_adapter import TVDBAdapter
+
+        estimator = TokenEstimator()
+        structure = '\n'.join(f'Show/Season 1/Episode {i:03d}.mkv' for i in range(200))
+        trimmed = trim_folder_structure(structure, 100, estimator)
+        assert structure.startswith(trimmed.rsplit('\n', 1)[0])
+        assert trimmed.endswith('more lines omitted)')
+        assert estimator.estimate(trimmed) <= 120
+        assert trim_folder_structure('Show/', 100, estimator) == 'Show/'
+
+        tvdb_data = {
+            'series_name': 'Show',
+            'tvdb_id': 1,
+            'total_seasons': 1,
+            'seasons': [{
+                'season': 1,
+                'total_episodes': 100,
+                'episodes': [
+                    {'episode': i, 'title': f'Episode title {i}', 'runtime': 24}
+                    for i in range(100)
+                ]
+            }]
+        }
+        simplifier = TVDBAdapter.__new__(TVDBAdapter).simplify_ai_format
+        assert trim_tvdb_data(tvdb_data, 100000, estimator, simplifier) is tvdb_data
+        simplified = trim_tvdb_data(tvdb_data, 100, estimator, simplifier)
+        assert simplified['seasons'] == [{'season': 1, 'total_episodes': 100}]
+
+    def test_renamer_splits_batches_by_token_budget(self):
+        """Test batches are sized by estimated prompt tokens, capped by batch_size."""
+        from src.core.interfaces.adapters import RenameResult
+        from src.infrastructure.ai.file_renamer import AIFileRenamer
+        from src.infrastructure.ai.prompts import MULTI_FILE_RENAME_STANDARD_PROMPT
+        from src.infrastructure.ai.token_budget import TokenEstimator
+
+        estimator = TokenEstimator()
+        budget = estimator.estimate(MULTI_FILE_RENAME_STANDARD_PROMPT) + 200
+        key_pool = MagicMock()
+        key_pool.get_status.return_value = {'available_count': 1}
+        renamer = AIFileRenamer(
+            key_pool, MagicMock(), api_client=MagicMock(), batch_size=30,
+            max_prompt_tokens=budget, token_estimator=estimator
+        )
+        batches = []
+
+        def fake_batch(files, category, anime_title, folder_structure, tvdb_data,
+                       previous_hardlinks):
+            batches.append(files)
+            return RenameResult(main_files={f: f'out/{f}' for f in files})
+
+        renamer._process_single_batch = fake_batch
+        files = [f'Show/[Group] Show - {i:02d} [1080p][HEVC].mkv' for i in range(20)]
+        result = renamer.generate_rename_mapping(files, 'tv')
+
+        assert len(batches) > 1
+        assert [f for batch in batches for f in batch] == files
+        for batch in batches:
+            message, _ = renamer._build_user_message(batch, 'tv', None, None, None, [])
+            assert estimator.estimate_messages([
+                {'role': 'system', 'content': MULTI_FILE_RENAME_STANDARD_PROMPT},
+                {'role': 'user', 'content': message}
+            ]) <= budget
+        assert result.file_count == 20
+
+    def test_api_client_reports_usage(self):
+        """Test prompt and completion tokens are read from the response usage."""
+        from src.infrastructure.ai.api_client import OpenAIClient
+
+        http_response = MagicMock()
+        http_response.status_code = 200
+        http_response.json.return_value = {
+            'choices': [{'message': {'content': '{}'}}],
+            'usage': {'prompt_tokens': 321, 'completion_tokens': 12}
+        }
+        transport = MagicMock()
+        transport.get_session.return_value.post.return_value = http_response
+
+        response = OpenAIClient(transport=transport).call('https://ai.example/v1', 'sk', 'gpt', [])
+        assert (response.prompt_tokens, response.completion_tokens) == (321, 12)
+
+
 @pytest.mark.integration
 class TestKeyPoolIntegration:
     """Integration tests for key pool with real configuration."""
@@ -0,0 +1,146 @@
+"""
+Tests for the shared qBittorrent adapter session and bulk operations.
+
+Tests proactive re-login before SID expiry, multi-hash requests and the
+bulk delete path in StatusService.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+HASH_A = 'a' * 40
+HASH_B = 'b' * 40
+
+
+def _response(status_code=200, text='Ok.'):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    return response
+
+
+@pytest.fixture
+def adapter():
+    from src.infrastructure.downloader.qbit_adapter import QBitAdapter
+
+    qbit = QBitAdapter()
+    qbit.username = 'admin'
+    qbit.password = 'secret'
+    qbit.session = MagicMock()
+    qbit.session.cookies.get_dict.return_value = {'SID': 'x'}
+    qbit.session.post.return_value = _response()
+    qbit.session.get.return_value = _response()
+    return qbit
+
+
+class TestQBitSession:
+    """Tests for login reuse and proactive re-login."""
+
+    def test_reuses_session_until_near_expiry(self, adapter, monkeypatch):
+        """Test the SID is reused and renewed before qBittorrent expires it."""
+        from src.infrastructure.downloader import qbit_adapter
+
+        now = [1000.0]
+        monkeypatch.setattr(qbit_adapter.time, 'monotonic', lambda: now[0])
+
+        assert adapter.is_connected()
+        assert adapter.is_connected()
+        login_calls = [
+            call for call in adapter.session.post.call_args_list
+            if call.args[0].endswith('/auth/login')
+        ]
+        assert len(login_calls) == 1
+
+        now[0] += adapter.SESSION_TTL_SECONDS - adapter.RELOGIN_MARGIN_SECONDS + 1
+        assert adapter.is_connected()
+        login_calls = [
+            call for call in adapter.session.post.call_args_list
+            if call.args[0].endswith('/auth/login')
+        ]
+        assert len(login_calls) == 2
+
+    def test_reset_session_forces_login(self, adapter):
+        """Test reset_session drops the SID."""
+        adapter.login()
+        adapter.reset_session()
+
+        assert adapter.cookies is None
+        adapter.session.cookies.clear.assert_called_once()
+
+
+class TestBulkOperations:
+    """Tests for multi-hash torrent operations."""
+
+    def test_delete_torrents_uses_one_request(self, adapter):
+        """Test several hashes are joined into a single delete request."""
+        adapter.login()
+        adapter.session.post.reset_mock()
+
+        assert adapter.delete_torrents([HASH_A, HASH_B, HASH_A], delete_files=True) == [
+            HASH_A, HASH_B
+        ]
+
+        adapter.session.post.assert_called_once()
+        call = adapter.session.post.call_args
+        assert call.args[0].endswith('/api/v2/torrents/delete')
+        assert call.kwargs['data'] == {
+            'deleteFiles': 'true',
+            'hashes': f'{HASH_A}|{HASH_B}'
+        }
+
+    def test_large_batches_are_chunked(self, adapter):
+        """Test hashes beyond MAX_HASHES_PER_REQUEST are split into chunks."""
+        adapter.login()
+        adapter.session.post.reset_mock()
+        adapter.MAX_HASHES_PER_REQUEST = 2
+        adapter.session.post.side_effect = [_response(), _response(status_code=500)]
+
+        assert not adapter.pause_torrents([f'{i:040x}' for i in range(3)])
+        assert adapter.session.post.call_count == 2
+
+    def test_partial_delete_returns_deleted_hashes(self, adapter):
+        """Test a failed chunk only drops its own hashes from the result."""
+        adapter.login()
+        adapter.session.post.reset_mock()
+        adapter.MAX_HASHES_PER_REQUEST = 2
+        adapter.session.post.side_effect = [_response(), _response(status_code=500)]
+        hashes = [f'{i:040x}' for i in range(3)]
+
+        assert adapter.delete_torrents(hashes) == hashes[:2]
+
+
+class TestBulkDelete:
+    """Tests for StatusService.delete_downloads."""
+
+    def test_deletes_all_torrents_in_one_client_call(self):
+        """Test a group delete issues one client call and moves every record."""
+        from src.services.download.status_service import StatusService
+
+        download_repo = MagicMock()
+        client = MagicMock()
+        client.delete_torrents.return_value = [HASH_A, HASH_B]
+        service = StatusService(download_repo, MagicMock(), client, MagicMock())
+
+        result = service.delete_downloads([HASH_A, HASH_B], True, False)
+
+        client.delete_torrents.assert_called_once_with([HASH_A, HASH_B], delete_files=True)
+        client.delete_torrent.assert_not_called()
+        assert result['torrents_removed'] == 2
+        assert result['moved_to_history_count'] == 2
+        assert result['torrents_failed'] == 0
+
+    def test_partial_failure_keeps_failed_records(self):
+        """Test only deleted torrents count as removed and move to history."""
+        from src.services.download.status_service import StatusService
+
+        download_repo = MagicMock()
+        client = MagicMock()
+        client.delete_torrents.return_value = [HASH_A]
+        service = StatusService(download_repo, MagicMock(), client, MagicMock())
+
+        result = service.delete_downloads([HASH_A, HASH_B], True, False)
+
+        assert result['torrents_removed'] == 1
+        assert result['torrents_failed'] == 1
+        download_repo.move_to_history.assert_called_once_with(HASH_A)
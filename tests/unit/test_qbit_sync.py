@@ -0,0 +1,129 @@
+"""
+Tests for qBittorrent sync-data polling.
+
+Tests the rid-based torrent mirror, the adapter's sync request and the
+single-pass status reconciliation in StatusService.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.domain.entities import DownloadRecord
+from src.core.domain.value_objects import DownloadStatus, TorrentHash
+
+HASH_A = 'a' * 40
+HASH_B = 'b' * 40
+HASH_C = 'c' * 40
+
+
+class TestTorrentSyncMirror:
+    """Tests for applying maindata deltas."""
+
+    def test_full_update_then_deltas(self):
+        """Test partial updates merge and removed torrents disappear."""
+        from src.infrastructure.downloader.qbit_sync import TorrentSyncMirror
+
+        mirror = TorrentSyncMirror()
+        mirror.apply({
+            'rid': 1,
+            'full_update': True,
+            'torrents': {
+                HASH_A.upper(): {'progress': 0.5, 'name': 'A'},
+                HASH_B: {'progress': 0.1, 'name': 'B'},
+            }
+        })
+        mirror.apply({
+            'rid': 2,
+            'torrents': {HASH_A: {'progress': 1.0}},
+            'torrents_removed': [HASH_B]
+        })
+
+        snapshot = mirror.snapshot()
+        assert mirror.rid == 2
+        assert snapshot == {HASH_A: {'hash': HASH_A, 'progress': 1.0, 'name': 'A'}}
+
+        mirror.apply({'rid': 3, 'full_update': True, 'torrents': {HASH_C: {}}})
+        assert list(mirror.snapshot()) == [HASH_C]
+
+
+class TestQBitSync:
+    """Tests for QBitAdapter.sync_torrents."""
+
+    @staticmethod
+    def _response(payload, status_code=200):
+        response = MagicMock()
+        response.status_code = status_code
+        response.json.return_value = payload
+        return response
+
+    def test_sync_sends_previous_rid_and_resets_on_failure(self):
+        """Test each request continues from the last rid and errors restart at 0."""
+        from src.infrastructure.downloader.qbit_adapter import QBitAdapter
+
+        adapter = QBitAdapter()
+        adapter.cookies = {'SID': 'x'}
+        adapter.session = MagicMock()
+        adapter.session.get.side_effect = [
+            self._response({'rid': 7, 'full_update': True,
+                            'torrents': {HASH_A: {'progress': 0.2}}}),
+            self._response({'rid': 8, 'torrents': {HASH_A: {'progress': 0.4}}}),
+            self._response({}, status_code=500),
+        ]
+
+        assert adapter.sync_torrents()[HASH_A]['progress'] == 0.2
+        assert adapter.sync_torrents()[HASH_A]['progress'] == 0.4
+        assert adapter.sync_torrents() is None
+
+        rids = [call.kwargs['params']['rid'] for call in adapter.session.get.call_args_list]
+        assert rids == [0, 7, 8]
+        assert adapter._sync_mirror.rid == 0
+
+
+class TestStatusReconciliation:
+    """Tests for StatusService.check_all_torrents."""
+
+    @pytest.fixture
+    def parts(self):
+        from src.services.download.status_service import StatusService
+
+        download_repo = MagicMock()
+        download_repo.get_incomplete.return_value = [
+            DownloadRecord(hash=TorrentHash(HASH_A), status=DownloadStatus.DOWNLOADING),
+            DownloadRecord(hash=TorrentHash(HASH_B), status=DownloadStatus.DOWNLOADING),
+            DownloadRecord(hash=TorrentHash(HASH_C), status=DownloadStatus.PENDING),
+        ]
+        download_repo.update_statuses.side_effect = len
+        client = MagicMock()
+        service = StatusService(download_repo, MagicMock(), client, MagicMock())
+        return service, download_repo, client
+
+    def test_one_sync_call_and_batched_updates(self, parts):
+        """Test all torrents are reconciled from one sync without per-hash calls."""
+        service, download_repo, client = parts
+        client.sync_torrents.return_value = {
+            HASH_A: {'progress': 1.0, 'completion_date': 1700000000},
+            HASH_B: {'progress': 0.3},
+        }
+
+        result = service.check_all_torrents()
+
+        assert result['success'] and result['total_checked'] == 3
+        assert result['completed_count'] == 1
+        client.get_torrent_info.assert_not_called()
+        download_repo.update_status.assert_not_called()
+        updates = download_repo.update_statuses.call_args.args[0]
+        assert [(h, s) for h, s, _ in updates] == [(HASH_A, 'completed'), (HASH_C, 'missing')]
+        assert updates[0][2].timestamp() == 1700000000
+
+    def test_falls_back_to_per_torrent_checks(self, parts):
+        """Test a failed sync checks each torrent individually."""
+        service, download_repo, client = parts
+        client.sync_torrents.return_value = None
+        client.get_torrent_info.return_value = {'progress': 0.5}
+
+        result = service.check_all_torrents()
+
+        assert result['updated_count'] == 3
+        assert client.get_torrent_info.call_count == 3
+        download_repo.update_statuses.assert_not_called()
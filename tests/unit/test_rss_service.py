@@ -4,14 +4,9 @@ Unit tests for RSS service functionality.
 Tests RSS parsing, filtering, and hash extraction.
 """
 
-import pytest
 from unittest.mock import MagicMock, patch
 
-from tests.fixtures.test_data import (
-    RSS_MIKAN_MY_BANGUMI,
-    RSS_MIKAN_BLOCKED_KEYWORDS,
-    SAMPLE_ANIME_TITLES,
-)
+import pytest
 
 
 class TestRSSService:
@@ -133,6 +128,7 @@ class TestRSSService:
     def test_parse_feed_network_error(self, mock_get, rss_service):
         """Test handling network error when fetching feed."""
         import requests
+
         from src.core.exceptions import RSSError
 
         mock_get.side_effect = requests.RequestException('Network error')
@@ -154,6 +150,207 @@ class TestRSSService:
         # Should return all items when none exist in database
         assert len(new_items) <= len(items)
 
+    @patch('requests.Session.get')
+    def test_parse_feed_if_changed_not_modified(self, mock_get, rss_service, mock_rss_response):
+        """Test 304 response short-circuits parsing on the second poll."""
+        first = MagicMock()
+        first.status_code = 200
+        first.content = mock_rss_response.encode('utf-8')
+        first.headers = {'ETag': '"v1"', 'Last-Modified': 'Sat, 01 Jan 2025 12:00:00 GMT'}
+        second = MagicMock()
+        second.status_code = 304
+        second.headers = {}
+        mock_get.side_effect = [first, second]
+
+        assert len(rss_service.parse_feed_if_changed('https://example.com/rss')) == 2
+        assert rss_service.parse_feed_if_changed('https://example.com/rss') is None
+
+        sent_headers = mock_get.call_args_list[1].kwargs['headers']
+        assert sent_headers['If-None-Match'] == '"v1"'
+        assert sent_headers['If-Modified-Since'] == 'Sat, 01 Jan 2025 12:00:00 GMT'
+
+    @patch('requests.Session.get')
+    def test_parse_feed_if_changed_same_digest(self, mock_get, rss_service, mock_rss_response):
+        """Test unchanged body is detected by digest when server ignores validators."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = mock_rss_response.encode('utf-8')
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        assert len(rss_service.parse_feed_if_changed('https://example.com/rss')) == 2
+        with patch('src.services.rss.rss_service.ET.iterparse') as mock_iterparse:
+            assert rss_service.parse_feed_if_changed('https://example.com/rss') is None
+            mock_iterparse.assert_not_called()
+
+        # Invalidated state forces a full re-parse
+        rss_service.invalidate_feed_state('https://example.com/rss')
+        assert len(rss_service.parse_feed_if_changed('https://example.com/rss')) == 2
+
+    @patch('requests.Session.get')
+    def test_parse_feed_if_changed_after_filter_change(self, mock_get, rss_service, mock_rss_response):
+        """Test changed filter settings force a full re-parse of an unchanged feed."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = mock_rss_response.encode('utf-8')
+        mock_response.headers = {'ETag': '"v1"'}
+        mock_get.return_value = mock_response
+        url = 'https://example.com/rss'
+
+        assert len(rss_service.parse_feed_if_changed(url, filters={'blocked_keywords': 'a'})) == 2
+        assert rss_service.parse_feed_if_changed(url, filters={'blocked_keywords': 'a'}) is None
+
+        assert len(rss_service.parse_feed_if_changed(url, filters={'blocked_keywords': ''})) == 2
+        assert 'If-None-Match' not in mock_get.call_args.kwargs['headers']
+
+    @patch('requests.Session.get')
+    def test_parse_feed_does_not_record_state(self, mock_get, rss_service, mock_rss_response):
+        """Test plain parse_feed (preview) does not mark a feed as seen."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = mock_rss_response.encode('utf-8')
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        rss_service.parse_feed('https://example.com/rss')
+
+        assert len(rss_service.parse_feed_if_changed('https://example.com/rss')) == 2
+
+    def test_parse_feeds_keeps_order_and_captures_errors(self, rss_service):
+        """Test concurrent fetch returns results in input order with errors captured."""
+        from src.core.exceptions import RSSError
+
+        def fake_fetch(url, conditional):
+            if 'bad' in url:
+                raise RSSError('boom')
+            return [url]
+
+        urls = ['https://a.example/1', 'https://bad.example/2', 'https://b.example/3']
+        with patch.object(rss_service, '_fetch_and_parse', side_effect=fake_fetch):
+            results = rss_service.parse_feeds(urls)
+
+        assert [r.url for r in results] == urls
+        assert results[0].items == ['https://a.example/1']
+        assert not results[1].success
+        assert isinstance(results[1].error, RSSError)
+        assert results[2].items == ['https://b.example/3']
+
+    def test_parse_feeds_respects_per_host_limit(self, download_repo):
+        """Test feeds on the same host never exceed the per-host concurrency."""
+        import threading
+        import time
+
+        from src.services.rss.rss_service import RSSService
+
+        service = RSSService(download_repo=download_repo, fetch_workers=8, per_host_limit=2)
+        lock = threading.Lock()
+        active = {'slow.example': 0}
+        peak = {'slow.example': 0}
+
+        def fake_fetch(url, conditional):
+            host = url.split('/')[2]
+            if host in active:
+                with lock:
+                    active[host] += 1
+                    peak[host] = max(peak[host], active[host])
+                time.sleep(0.05)
+                with lock:
+                    active[host] -= 1
+            return []
+
+        urls = [f'https://slow.example/{i}' for i in range(6)] + ['https://fast.example/x']
+        with patch.object(service, '_fetch_and_parse', side_effect=fake_fetch):
+            results = service.parse_feeds(urls)
+
+        assert all(r.success for r in results)
+        assert peak['slow.example'] == 2
+
+    @patch('requests.Session.get')
+    def test_prefetched_feed_is_consumed_once(self, mock_get, rss_service, mock_rss_response):
+        """Test parse_feed reuses a prefetched result instead of refetching."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = mock_rss_response.encode('utf-8')
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        rss_service.prefetch_feeds(['https://example.com/rss'])
+        assert len(rss_service.parse_feed('https://example.com/rss')) == 2
+        assert mock_get.call_count == 1
+
+        # The prefetched result is consumed; the next call fetches again
+        rss_service.parse_feed('https://example.com/rss')
+        assert mock_get.call_count == 2
+
+    @staticmethod
+    def _build_feed(hashes):
+        """Build an RSS 2.0 document with one magnet item per hash."""
+        items = ''.join(
+            f'<item><title>Episode {i}</title>'
+            f'<link>magnet:?xt=urn:btih:{h}</link></item>'
+            for i, h in enumerate(hashes)
+        )
+        return f'<?xml version="1.0"?><rss><channel>{items}</channel></rss>'.encode()
+
+    def test_iter_feed_items_streams_and_detaches(self, rss_service):
+        """Test items are yielded incrementally and removed from the tree."""
+        import io
+
+        content = self._build_feed([f'{i:040x}' for i in range(3)])
+        iterator = rss_service.iter_feed_items(io.BytesIO(content))
+
+        first = next(iterator)
+        assert first.title == 'Episode 0'
+        assert first.hash == f'{0:040x}'
+        assert [item.title for item in iterator] == ['Episode 1', 'Episode 2']
+
+    @patch('requests.Session.get')
+    def test_incremental_poll_stops_at_known_item(self, mock_get):
+        """Test conditional polls stop parsing at the first downloaded item."""
+        from src.services.rss.rss_service import RSSService
+
+        repo = MagicMock()
+        repo.existing_hashes.return_value = set()
+        service = RSSService(download_repo=repo)
+
+        old_hashes = [f'{i:040x}' for i in range(100, 600)]
+        new_hashes = [f'{i:040x}' for i in range(3)]
+        first = MagicMock(status_code=200, headers={}, content=self._build_feed(old_hashes))
+        second = MagicMock(
+            status_code=200, headers={}, content=self._build_feed(new_hashes + old_hashes)
+        )
+        mock_get.side_effect = [first, second]
+
+        # First poll has no prior state: full parse
+        assert len(service.parse_feed_if_changed('https://example.com/rss')) == 500
+
+        repo.existing_hashes.side_effect = lambda hashes: set(hashes) & set(old_hashes)
+        items = service.parse_feed_if_changed('https://example.com/rss')
+
+        assert [item.hash for item in items] == new_hashes
+        # Only the first batch was checked; later items were never processed
+        assert repo.existing_hashes.call_count == 1
+
+    def test_filter_new_items_uses_single_batch_lookup(self):
+        """Test existing hashes are checked with one bulk repository call."""
+        from src.core.interfaces.adapters import RSSItem
+        from src.services.rss.rss_service import RSSService
+
+        repo = MagicMock()
+        repo.existing_hashes.return_value = {'a' * 40}
+        service = RSSService(download_repo=repo)
+        items = [
+            RSSItem(title='old', link='', hash='a' * 40),
+            RSSItem(title='new', link='', hash='b' * 40),
+            RSSItem(title='no hash', link='https://example.com/x'),
+        ]
+
+        new_items = service.filter_new_items(items)
+
+        assert [item.title for item in new_items] == ['new']
+        repo.existing_hashes.assert_called_once_with(['a' * 40, 'b' * 40])
+        repo.get_by_hash.assert_not_called()
+
     def test_filter_new_items_empty_list(self, rss_service):
         """Test filtering empty item list."""
         new_items = rss_service.filter_new_items([])
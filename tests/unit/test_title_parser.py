@@ -0,0 +1,299 @@
+"""
+Tests for AI title parser functionality.
+
+Tests the content-addressed parse result cache, batched parsing and
+the regex-first local parser.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+AI_RESPONSE = json.dumps({
+    'original_title': '[Group] Anime - 01 [1080p]',
+    'anime_full_title': 'Anime',
+    'anime_clean_title': 'Anime',
+    'subtitle_group_name': 'Group',
+    'season': 1,
+    'episode': 1,
+    'category': 'tv',
+})
+
+
+class FakeTitleCacheRepo:
+    """In-memory stand-in for TitleParseCacheRepository."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def get(self, cache_key, min_cached_at):
+        row = self.rows.get(cache_key)
+        if row and row[2] >= min_cached_at:
+            return row[1], row[2]
+        return None
+
+    def save(self, cache_key, prompt_version, result, cached_at):
+        self.rows[cache_key] = (prompt_version, result, cached_at)
+
+    def clear(self):
+        count = len(self.rows)
+        self.rows.clear()
+        return count
+
+
+class TestTitleParseCache:
+    """Tests for AITitleParser result caching."""
+
+    @pytest.fixture
+    def parser_parts(self):
+        """Create a parser with mocked pool, breaker and API client."""
+        from src.infrastructure.ai.api_client import APIResponse
+        from src.infrastructure.ai.title_parser import AITitleParser
+
+        key_pool = MagicMock()
+        key_pool.get_status.return_value = {'keys': [], 'all_in_long_cooling': False}
+        breaker = MagicMock()
+        breaker.allow_request.return_value = True
+        api_client = MagicMock()
+        api_client.call.return_value = APIResponse(
+            success=True, content=AI_RESPONSE, response_time_ms=5
+        )
+        repo = FakeTitleCacheRepo()
+
+        def make_parser():
+            return AITitleParser(key_pool, breaker, api_client=api_client, cache_repo=repo)
+
+        with patch('src.infrastructure.ai.title_parser.ai_key_repository'):
+            yield make_parser, key_pool, breaker, api_client, repo
+
+    def test_cache_hit_skips_reserve_breaker_and_request(self, parser_parts):
+        """Test a repeated (normalized) title is answered from cache."""
+        make_parser, key_pool, breaker, api_client, _ = parser_parts
+        parser = make_parser()
+
+        first = parser.parse('[Group] Anime - 01 [1080p]')
+        second = parser.parse('  [Group]  Anime - 01 [1080p] ')
+
+        assert first.clean_title == second.clean_title == 'Anime'
+        assert second.original_title == '  [Group]  Anime - 01 [1080p] '
+        assert api_client.call.call_count == 1
+        assert key_pool.reserve.call_count == 1
+        assert breaker.allow_request.call_count == 1
+        assert parser.get_cache_stats()['hits'] == 1
+
+    def test_persistent_cache_survives_restart_and_invalidates(self, parser_parts):
+        """Test a new parser reuses persisted results until invalidated."""
+        make_parser, _, _, api_client, repo = parser_parts
+        make_parser().parse('[Group] Anime - 01 [1080p]')
+        assert len(repo.rows) == 1
+
+        restarted = make_parser()
+        assert restarted.parse('[Group] Anime - 01 [1080p]').clean_title == 'Anime'
+        assert api_client.call.call_count == 1
+
+        assert restarted.invalidate_cache() == 1
+        restarted.parse('[Group] Anime - 01 [1080p]')
+        assert api_client.call.call_count == 2
+
+    def test_prompt_change_misses_cache(self, parser_parts):
+        """Test changing language priorities produces a different cache key."""
+        make_parser, _, _, api_client, _ = parser_parts
+        parser = make_parser()
+
+        parser.parse('[Group] Anime - 01 [1080p]')
+        with patch.object(parser, '_get_language_priorities', return_value=['English']):
+            parser.parse('[Group] Anime - 01 [1080p]')
+
+        assert api_client.call.call_count == 2
+
+
+def _batch_response(*entries):
+    """Build a batch response body from (index, original_title, clean_title) tuples."""
+    return json.dumps({'results': [
+        {
+            'index': index,
+            'original_title': original,
+            'anime_full_title': clean,
+            'anime_clean_title': clean,
+            'subtitle_group_name': 'Group',
+            'season': 1,
+            'episode': 1,
+            'category': 'tv',
+        }
+        for index, original, clean in entries
+    ]})
+
+
+class TestParseMany:
+    """Tests for AITitleParser batched parsing."""
+
+    TITLES = ['[Group] Alpha - 01', '[Group] Beta - 01', '[Group] Gamma - 01']
+
+    @pytest.fixture
+    def parser_parts(self):
+        """Create a parser with mocked pool, breaker and API client."""
+        from src.infrastructure.ai.title_parser import AITitleParser
+
+        key_pool = MagicMock()
+        key_pool.get_status.return_value = {'keys': [], 'all_in_long_cooling': False}
+        breaker = MagicMock()
+        breaker.allow_request.return_value = True
+        api_client = MagicMock()
+        parser = AITitleParser(
+            key_pool, breaker, api_client=api_client, cache_repo=FakeTitleCacheRepo()
+        )
+
+        with patch('src.infrastructure.ai.title_parser.ai_key_repository'):
+            yield parser, api_client
+
+    def test_batch_uses_one_request_and_fills_cache(self, parser_parts):
+        """Test several titles share one request and later parse() hits cache."""
+        from src.infrastructure.ai.api_client import APIResponse
+
+        parser, api_client = parser_parts
+        api_client.call.return_value = APIResponse(
+            success=True,
+            content=_batch_response(
+                (0, self.TITLES[0], 'Alpha'),
+                (1, self.TITLES[1], 'Beta'),
+                (2, self.TITLES[2], 'Gamma'),
+            ),
+            response_time_ms=5
+        )
+
+        results = parser.parse_many(self.TITLES + [self.TITLES[0]])
+
+        assert [r.clean_title for r in results] == ['Alpha', 'Beta', 'Gamma', 'Alpha']
+        assert api_client.call.call_count == 1
+        user_message = json.loads(api_client.call.call_args.kwargs['messages'][1]['content'])
+        assert [entry['title'] for entry in user_message] == self.TITLES
+
+        assert parser.parse(self.TITLES[1]).clean_title == 'Beta'
+        assert api_client.call.call_count == 1
+
+    def test_missing_or_mismatched_entries_fall_back(self, parser_parts):
+        """Test entries missing or echoing the wrong title are parsed singly."""
+        from src.infrastructure.ai.api_client import APIResponse
+
+        parser, api_client = parser_parts
+        single = json.loads(AI_RESPONSE)
+        single['anime_clean_title'] = 'Fallback'
+        api_client.call.side_effect = [
+            APIResponse(
+                success=True,
+                content=_batch_response(
+                    (0, self.TITLES[0], 'Alpha'),
+                    (1, self.TITLES[2], 'Wrong'),
+                ),
+                response_time_ms=5
+            ),
+            APIResponse(success=True, content=json.dumps(single), response_time_ms=5),
+            APIResponse(success=True, content=json.dumps(single), response_time_ms=5),
+        ]
+
+        results = parser.parse_many(self.TITLES)
+
+        assert [r.clean_title for r in results] == ['Alpha', 'Fallback', 'Fallback']
+        assert results[1].original_title == self.TITLES[1]
+        assert api_client.call.call_count == 3
+
+    def test_failed_batch_request_returns_none(self, parser_parts):
+        """Test a failing batch request does not trigger per-title requests."""
+        from src.infrastructure.ai.api_client import APIResponse
+
+        parser, api_client = parser_parts
+        api_client.call.return_value = APIResponse(
+            success=False, error_code=500, error_message='boom', response_time_ms=5
+        )
+
+        assert parser.parse_many(self.TITLES[:2]) == [None, None]
+        assert api_client.call.call_count == parser._max_retries
+
+
+class TestLocalTitleParser:
+    """Tests for the regex-first local title parser."""
+
+    @pytest.fixture
+    def parser(self):
+        from src.services.rss.local_title_parser import LocalTitleParser
+
+        return LocalTitleParser(min_confidence=0.8)
+
+    def test_common_formats_parse_without_ai(self, parser):
+        """Test regular fansub titles are parsed with high confidence."""
+        result = parser.parse('[SubsPlease] Oshi no Ko S2 - 05v2 (1080p) [ABCD1234]')
+        assert (result.clean_title, result.season, result.episode) == ('Oshi no Ko', 2, 5)
+        assert result.subtitle_group == 'SubsPlease'
+
+        result = parser.parse('[北宇治字幕组] 药屋少女的呢喃 第二季 [05][WebRip][1080p]')
+        assert (result.clean_title, result.season, result.episode) == ('药屋少女的呢喃', 2, 5)
+
+        result = parser.parse("[ANi] Frieren / 葬送的芙莉莲 - 02 [1080P][Baha][WEB-DL]")
+        assert result.clean_title == '葬送的芙莉莲'
+        assert result.full_title == 'Frieren / 葬送的芙莉莲'
+
+    def test_ambiguous_titles_escalate(self, parser):
+        """Test ambiguous or irregular titles return None for the AI parser."""
+        assert parser.parse('[SubsPlease] Sousou no Frieren / Frieren - 03 [1080p]') is None
+        assert parser.parse('[SubsPlease] Kaiju No. 8 - 05 (1080p)') is None
+        assert parser.parse('[ANi] 劇場版 Title - 01 [1080P]') is None
+        assert parser.parse('[Group] Title [01-12][BDRip]') is None
+        assert parser.parse('【喵萌奶茶屋】★04月新番★[Title][05][1080p]') is None
+        assert parser.parse('[Group] Title - 2024 [1080p]') is None
+
+        analyzed = parser.analyze('[SubsPlease] Kaiju No. 8 - 05 (1080p)')
+        assert analyzed.episode == 5 and analyzed.confidence < 0.8
+
+    def test_learned_group_patterns_take_precedence(self):
+        """Test patterns stored for a group parse its unusual format."""
+        from src.services.rss.local_title_parser import LocalTitleParser
+
+        anime_repo = MagicMock()
+        anime_repo.get_title_patterns.return_value = [{
+            'subtitle_group': 'Odd',
+            'title_group_regex': r'^\[(.*?)\]',
+            'short_title_regex': r'^\[[^\]]+\]\s*(.*?)\s*#',
+            'full_title_regex': '无',
+            'episode_regex': r'#(\d+)',
+        }]
+        parser = LocalTitleParser(anime_repo, min_confidence=0.8)
+
+        result = parser.parse('[Odd] Some Show #07 {1080p}')
+        assert (result.clean_title, result.episode, result.confidence) == ('Some Show', 7, 0.95)
+        assert parser.parse('[Other] Some Show #07 {1080p}') is None
+        parser.parse('[Odd] Some Show #08 {1080p}')
+        anime_repo.get_title_patterns.assert_called_once()
+
+    def test_rss_processor_skips_ai_for_local_results(self):
+        """Test confidently parsed titles skip the AI parser and its prefetch."""
+        from src.services.download.rss_processor import RSSProcessor
+        from src.services.rss.local_title_parser import LocalTitleParser
+
+        anime_repo = MagicMock()
+        anime_repo.get_by_core_info.return_value = None
+        title_parser = MagicMock()
+        processor = RSSProcessor(
+            anime_repo=anime_repo,
+            download_repo=MagicMock(),
+            history_repo=MagicMock(),
+            title_parser=title_parser,
+            download_client=MagicMock(),
+            rss_service=MagicMock(),
+            filter_service=MagicMock(),
+            path_builder=MagicMock(),
+            notifier=MagicMock(),
+            local_title_parser=LocalTitleParser(min_confidence=0.8)
+        )
+
+        sent = processor.prefetch_title_parses([
+            '[ANi] Title A - 01 [1080P]',
+            '[SubsPlease] Kaiju No. 8 - 05 (1080p)',
+            '[SubsPlease] Sousou no Frieren / Frieren - 03 [1080p]',
+        ])
+
+        assert sent == 2
+        title_parser.parse_many.assert_called_once_with([
+            '[SubsPlease] Kaiju No. 8 - 05 (1080p)',
+            '[SubsPlease] Sousou no Frieren / Frieren - 03 [1080p]',
+        ])
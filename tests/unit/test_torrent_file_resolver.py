@@ -0,0 +1,116 @@
+"""
+Tests for torrent file list capture.
+
+Tests local file list parsing from .torrent metainfo and the
+non-blocking metadata resolution for magnets.
+"""
+
+import hashlib
+from unittest.mock import MagicMock
+
+import bencodepy
+import pytest
+
+HASH_A = 'a' * 40
+
+# Keys in sorted order, so bencodepy produces the canonical encoding
+MULTI_FILE_INFO = {
+    b'files': [
+        {b'length': 100, b'path': [b'Show - 01.mkv']},
+        {b'attr': b'p', b'length': 5, b'path': [b'.pad', b'5']},
+        {b'length': 20, b'path': [b'Subs', b'Show - 01.ass']},
+    ],
+    b'name': b'[Group] Show S01',
+    b'piece length': 16384,
+    b'pieces': b'',
+}
+
+
+class TestTorrentMetainfo:
+    """Tests for deriving file lists from metainfo."""
+
+    def test_multi_file_paths_include_root_and_skip_padding(self):
+        """Test file names match qBittorrent's layout without pad files."""
+        from src.infrastructure.downloader.torrent_metainfo import read_torrent_files
+
+        data = bencodepy.encode({b'announce': b'http://t', b'info': MULTI_FILE_INFO})
+
+        assert read_torrent_files(data) == [
+            {'name': '[Group] Show S01/Show - 01.mkv', 'size': 100},
+            {'name': '[Group] Show S01/Subs/Show - 01.ass', 'size': 20},
+        ]
+
+    def test_single_file_and_invalid_data(self):
+        """Test single-file torrents and undecodable input."""
+        from src.infrastructure.downloader.torrent_metainfo import read_torrent_files
+
+        data = bencodepy.encode({b'info': {b'name': b'Movie.mkv', b'length': 42}})
+
+        assert read_torrent_files(data) == [{'name': 'Movie.mkv', 'size': 42}]
+        assert read_torrent_files(b'not a torrent') == []
+
+    def test_rss_service_keeps_files_of_fetched_torrents(self):
+        """Test the file list is kept when a .torrent is downloaded for its hash."""
+        from src.services.rss.rss_service import RSSService
+
+        service = RSSService(download_repo=MagicMock())
+        response = MagicMock(status_code=200)
+        response.content = bencodepy.encode({b'info': MULTI_FILE_INFO})
+        service._session = MagicMock()
+        service._session.get.return_value = response
+
+        hash_id = service._fetch_hash_from_torrent_file('https://example.com/a.torrent')
+
+        assert hash_id == hashlib.sha1(bencodepy.encode(MULTI_FILE_INFO)).hexdigest()
+        assert len(service.pop_torrent_files(hash_id)) == 2
+        assert service.pop_torrent_files(hash_id) is None
+
+
+class TestTorrentFileResolver:
+    """Tests for TorrentFileResolver."""
+
+    @pytest.fixture
+    def parts(self):
+        from src.services.download.torrent_file_resolver import TorrentFileResolver
+
+        client = MagicMock()
+        repo = MagicMock()
+        resolver = TorrentFileResolver(client, repo, poll_interval=60, metadata_timeout=60)
+        yield resolver, client, repo
+        resolver.stop()
+
+    def test_local_files_are_saved_without_client_calls(self, parts):
+        """Test metainfo file lists are written immediately."""
+        resolver, client, repo = parts
+
+        resolver.capture(HASH_A, 1, files=[{'name': 'Show/Show - 01.mkv', 'size': 100}])
+
+        client.get_torrent_files.assert_not_called()
+        assert resolver.pending_count == 0
+        assert repo.insert_torrent_file.call_args.kwargs['file_type'] == 'video'
+
+    def test_magnet_files_are_resolved_later(self, parts):
+        """Test capture returns immediately and files are saved once metadata arrives."""
+        resolver, client, repo = parts
+        client.get_torrent_files.side_effect = [[], [{'name': 'Show - 01.ass', 'size': 1}]]
+
+        resolver.capture(HASH_A, 1)
+        assert resolver.pending_count == 1
+        client.get_torrent_files.assert_not_called()
+
+        assert resolver.resolve_pending() == 0
+        assert resolver.resolve_pending() == 1
+        assert resolver.pending_count == 0
+        assert repo.insert_torrent_file.call_args.kwargs['file_type'] == 'subtitle'
+
+    def test_gives_up_after_timeout(self, parts):
+        """Test torrents without metadata are dropped after the timeout."""
+        resolver, client, repo = parts
+        resolver._metadata_timeout = 0
+        client.get_torrent_files.return_value = []
+
+        resolver.capture(HASH_A, 1)
+        resolver.resolve_pending()
+
+        assert resolver.pending_count == 0
+        repo.insert_torrent_file.assert_not_called()
@@ -5,12 +5,11 @@ Tests webhook event processing and queue worker behavior.
 """
 
 import json
-import pytest
 import time
 import uuid
 from unittest.mock import MagicMock, patch
 
-from tests.fixtures.test_data import QUEUE_TEST_EVENTS
+import pytest
 
 
 class TestWebhookHandler:
@@ -20,6 +19,7 @@ class TestWebhookHandler:
     def webhook_app(self):
         """Create Flask app with webhook blueprint."""
         from flask import Flask
+
         from src.interface.webhook.handler import create_webhook_blueprint
 
         app = Flask(__name__)
@@ -137,6 +137,31 @@ class TestWebhookHandler:
 
         assert response.status_code in [200, 202, 204]
 
+    def test_webhook_qbit_batch_payload(self, client):
+        """Test a list of events is queued in one request."""
+        from src.services.queue.webhook_queue import WebhookQueueWorker
+
+        worker = WebhookQueueWorker(name='webhook_batch_endpoint')
+        data = {'events': [
+            {'event_type': 'torrent_completed', 'hash': 'a' * 40, 'name': 'A'},
+            {'event_type': 'torrent_finished', 'hash': 'A' * 40, 'name': 'A'},
+            {'event_type': 'torrent_completed', 'hash': 'b' * 40, 'name': 'B'},
+            {'event_type': 'torrent_completed', 'name': 'no hash'},
+        ]}
+
+        with patch('src.interface.webhook.handler.get_webhook_queue', return_value=worker):
+            response = client.post(
+                '/webhook/qbit',
+                data=json.dumps(data),
+                content_type='application/json'
+            )
+
+        assert response.status_code == 202
+        body = response.get_json()
+        assert body['queued'] == 2
+        assert body['coalesced'] == 1
+        assert worker.get_queue_size() == 2
+
     def test_webhook_qbit_invalid_json(self, client):
         """Test webhook with invalid JSON."""
         response = client.post(
@@ -147,6 +172,19 @@ class TestWebhookHandler:
 
         assert response.status_code in [400, 500]
 
+    @pytest.mark.parametrize(
+        'body', ['"x"', '5', '{"events": null}', '{"events": 5}', '{"events": "x"}']
+    )
+    def test_webhook_qbit_scalar_json(self, client, body):
+        """Test a JSON body or events field of the wrong shape is rejected."""
+        response = client.post(
+            '/webhook/qbit',
+            data=body,
+            content_type='application/json'
+        )
+
+        assert response.status_code == 400
+
     def test_webhook_qbit_missing_event(self, client):
         """Test webhook with missing event field."""
         data = {
@@ -298,6 +336,577 @@ class TestQueueWorkerBase:
         assert 'queue_len' in status
 
 
+class TestQueueWorkerPool:
+    """Tests for multi-worker processing with partition keys."""
+
+    @staticmethod
+    def _make_worker(num_workers, handle):
+        from src.services.queue.queue_worker import QueueWorker
+
+        class TestWorker(QueueWorker):
+            def _handle_event(self, event):
+                handle(event)
+
+        return TestWorker(name='pool_worker', num_workers=num_workers)
+
+    @staticmethod
+    def _wait_for(predicate, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_unrelated_events_run_concurrently(self):
+        """Test events without a shared key are processed in parallel."""
+        import threading
+
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0, 'done': 0}
+
+        def handle(event):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.1)
+            with lock:
+                state['active'] -= 1
+                state['done'] += 1
+
+        worker = self._make_worker(3, handle)
+        worker.start()
+        for i in range(3):
+            worker.enqueue_event('job', payload=i, partition_key=f'key-{i}')
+
+        assert self._wait_for(lambda: state['done'] == 3)
+        worker.stop()
+        assert state['peak'] == 3
+
+    def test_same_key_is_serialized_in_order(self):
+        """Test events sharing a partition key never overlap and keep order."""
+        import threading
+
+        lock = threading.Lock()
+        order = []
+        active = {'a': 0, 'peak': 0}
+
+        def handle(event):
+            if event.metadata['partition_key'] == 'a':
+                with lock:
+                    active['a'] += 1
+                    active['peak'] = max(active['peak'], active['a'])
+                time.sleep(0.02)
+                with lock:
+                    active['a'] -= 1
+            with lock:
+                order.append(event.payload)
+
+        worker = self._make_worker(4, handle)
+        for i in range(8):
+            worker.enqueue_event('job', payload=('a', i), partition_key='a')
+            worker.enqueue_event('job', payload=('b', i), partition_key=f'b-{i}')
+        worker.start()
+
+        assert self._wait_for(lambda: len(order) == 16)
+        worker.stop()
+        assert active['peak'] == 1
+        assert [i for key, i in order if key == 'a'] == list(range(8))
+        assert worker.get_queue_size() == 0
+
+    def test_status_reports_each_worker(self):
+        """Test get_status lists per-worker state."""
+        import threading
+
+        release = threading.Event()
+        worker = self._make_worker(2, lambda event: release.wait(2))
+        worker.start()
+        worker.enqueue_event('job', payload='x', partition_key='k')
+
+        assert self._wait_for(lambda: worker.get_status()['active_workers'] == 1)
+        status = worker.get_status()
+        release.set()
+        worker.stop()
+
+        assert status['num_workers'] == 2
+        assert len(status['workers']) == 2
+        busy = [w for w in status['workers'] if w['busy']]
+        assert busy[0]['partition_key'] == 'k'
+        assert status['current_event']['event_type'] == 'job'
+
+    def test_resize_while_running_keeps_processing(self):
+        """Test set_num_workers adds and retires threads without stopping the pool."""
+        import threading
+
+        release = threading.Event()
+        handled = []
+        worker = self._make_worker(1, lambda event: (release.wait(2), handled.append(event)))
+        worker.start()
+        worker.enqueue_event('job', payload='busy')
+        assert self._wait_for(lambda: worker.get_status()['active_workers'] == 1)
+
+        worker.set_num_workers(3)
+        assert len([s for s in worker._slots if s.thread.is_alive()]) == 3
+
+        # Shrinking does not wait for the busy handler
+        worker.set_num_workers(1)
+        assert worker.is_running()
+        release.set()
+        worker.enqueue_event('job', payload='after')
+        assert self._wait_for(lambda: len(handled) == 2)
+        assert self._wait_for(lambda: sum(
+            t.name.startswith('pool_worker') for t in threading.enumerate()
+        ) == 1)
+        worker.stop()
+
+    def test_idle_workers_block_and_wake_immediately(self):
+        """Test idle workers sleep on the condition and react to enqueue/resume/stop."""
+        import threading
+
+        done = threading.Event()
+        worker = self._make_worker(2, lambda event: done.set())
+        worker.start()
+
+        with patch.object(worker._queue, 'get_nowait', wraps=worker._queue.get_nowait) as polls:
+            time.sleep(0.3)
+            # Nothing was enqueued: no polling while idle beyond the first check
+            assert polls.call_count <= 2
+
+        worker.pause()
+        worker.enqueue_event('job', payload='x')
+        assert not done.wait(0.2)
+
+        started = time.time()
+        worker.resume()
+        assert done.wait(1.0)
+        assert time.time() - started < 0.5
+
+        started = time.time()
+        worker.stop()
+        assert time.time() - started < 0.5
+        assert not worker.is_running()
+
+    def test_rss_item_partition_key_groups_same_anime(self):
+        """Test RSS items of one anime share a key while others differ."""
+        from src.services.queue.rss_queue import RSSItemPayload, series_key
+
+        ep3 = RSSItemPayload(
+            item_title='[Lilith-Raws] Sousou no Frieren - 03 [Baha][WEB-DL][1080p]',
+            torrent_url=''
+        )
+        ep4 = RSSItemPayload(
+            item_title='[Lilith-Raws] Sousou no Frieren - 04 [Baha][WEB-DL][1080p]',
+            torrent_url=''
+        )
+        other = RSSItemPayload(
+            item_title='[Lilith-Raws] Kusuriya no Hitorigoto - 04 [Baha][1080p]',
+            torrent_url=''
+        )
+
+        assert ep3.get_partition_key() == ep4.get_partition_key()
+        assert ep3.get_partition_key() != other.get_partition_key()
+        assert series_key(
+            '【喵萌奶茶屋】★10月新番★[葬送的芙莉莲 / Sousou no Frieren][03][1080p][简日双语]'
+        ) == '葬送的芙莉莲 / sousou no frieren'
+
+
+class InMemoryQueueStore:
+    """Minimal in-memory stand-in for QueueEventRepository."""
+
+    def __init__(self):
+        self.records = {}
+
+    def append(self, queue_name, queue_id, event_type, payload_type, payload,
+               metadata, received_at, priority=None, deadline=None):
+        self.records[(queue_name, queue_id)] = {
+            'queue_id': queue_id, 'event_type': event_type,
+            'payload_type': payload_type, 'payload': payload,
+            'metadata': metadata, 'received_at': received_at, 'status': 'pending',
+            'priority': priority, 'deadline': deadline,
+        }
+
+    def update(self, queue_name, queue_id, payload, priority, deadline):
+        record = self.records.get((queue_name, queue_id))
+        if record is None:
+            return False
+        record.update(payload=payload, priority=priority, deadline=deadline)
+        return True
+
+    def ack(self, queue_name, queue_id):
+        return self.records.pop((queue_name, queue_id), None) is not None
+
+    def ack_many(self, queue_name, queue_ids):
+        return sum(self.ack(queue_name, queue_id) for queue_id in queue_ids)
+
+    def mark_failed(self, queue_name, queue_id, error_message):
+        self.records[(queue_name, queue_id)]['status'] = 'failed'
+        return True
+
+    def load_pending(self, queue_name):
+        return [
+            record for (name, _), record in self.records.items()
+            if name == queue_name and record['status'] == 'pending'
+        ]
+
+    def compact(self, queue_name):
+        return 0
+
+
+class TestDurableQueue:
+    """Tests for the write-ahead durable queue store."""
+
+    def test_events_are_acked_or_marked_failed(self):
+        """Test success removes the record and failure keeps it as failed."""
+        from src.services.queue.rss_queue import RSSPayload, RSSQueueWorker
+
+        store = InMemoryQueueStore()
+        worker = RSSQueueWorker(name='durable_rss')
+        worker.attach_store(store)
+
+        def handler(payload):
+            if payload.rss_url.endswith('bad'):
+                raise RuntimeError('boom')
+
+        worker.register_handler(RSSQueueWorker.EVENT_MANUAL_CHECK, handler)
+        ok = worker.enqueue_event(RSSQueueWorker.EVENT_MANUAL_CHECK, RSSPayload(rss_url='https://a/ok'))
+        bad = worker.enqueue_event(RSSQueueWorker.EVENT_MANUAL_CHECK, RSSPayload(rss_url='https://a/bad'))
+        assert len(store.records) == 2
+
+        worker._process_event(worker._queue.get_nowait())
+        worker._process_event(worker._queue.get_nowait())
+
+        assert ('durable_rss', ok.queue_id) not in store.records
+        assert store.records[('durable_rss', bad.queue_id)]['status'] == 'failed'
+
+    def test_restore_pending_replays_unfinished_events(self):
+        """Test a new worker replays events a previous run never finished."""
+        from src.services.queue.rss_queue import RSSItemPayload, RSSQueueWorker
+
+        store = InMemoryQueueStore()
+        previous = RSSQueueWorker(name='durable_items')
+        previous.attach_store(store)
+        event = previous.enqueue_event(
+            RSSQueueWorker.EVENT_SINGLE_ITEM,
+            RSSItemPayload(
+                item_title='[Group] Title - 01', torrent_url='magnet:?x', hash_id='a' * 40,
+                extra_data={'history_id': 7}
+            )
+        )
+
+        restarted = RSSQueueWorker(name='durable_items')
+        restarted.attach_store(store)
+        assert restarted.restore_pending() == 1
+
+        restored = restarted._queue.get_nowait()
+        assert restored.queue_id == event.queue_id
+        assert restored.event_type == RSSQueueWorker.EVENT_SINGLE_ITEM
+        assert isinstance(restored.payload, RSSItemPayload)
+        assert restored.payload.extra_data == {'history_id': 7, 'priority': 2}
+
+        # Clearing the queue also drops the persisted records
+        restarted._queue.put(restored)
+        restarted.clear_queue()
+        assert store.records == {}
+
+
+class TestPriorityLanes:
+    """Tests for priority lanes, aging and event deadlines."""
+
+    def test_interactive_event_jumps_backlog(self):
+        """Test a manual check is served before queued backfill and scheduled events."""
+        from src.services.queue.queue_worker import EventPriority
+        from src.services.queue.rss_queue import RSSPayload, RSSQueueWorker
+
+        worker = RSSQueueWorker(name='priority_rss')
+        for i in range(3):
+            worker.enqueue_event(
+                RSSQueueWorker.EVENT_SINGLE_FEED, RSSPayload(rss_url=f'https://a/{i}'),
+                priority=EventPriority.BACKFILL
+            )
+        worker.enqueue_scheduled_check('https://a/scheduled')
+        manual = worker.enqueue_manual_check('https://a/manual')
+
+        assert manual.priority == EventPriority.INTERACTIVE
+        assert manual.payload.extra_data['priority'] == EventPriority.INTERACTIVE
+        assert worker.get_status()['lanes'] == {'interactive': 1, 'scheduled': 1, 'backfill': 3}
+
+        order = [worker._queue.get_nowait().payload.rss_url for _ in range(5)]
+        assert order == [
+            'https://a/manual', 'https://a/scheduled', 'https://a/0', 'https://a/1', 'https://a/2'
+        ]
+
+    def test_aging_prevents_starvation(self):
+        """Test a long-waiting backfill event overtakes newer scheduled events."""
+        from src.services.queue.queue_worker import EventPriority, PriorityLanes, QueueEvent
+
+        lanes = PriorityLanes(aging_seconds=60)
+        with patch('src.services.queue.queue_worker.time.monotonic', return_value=0.0):
+            lanes.put(QueueEvent('old', None, priority=EventPriority.BACKFILL))
+        with patch('src.services.queue.queue_worker.time.monotonic', return_value=90.0):
+            lanes.put(QueueEvent('new', None, priority=EventPriority.SCHEDULED))
+            lanes.put(QueueEvent('interactive', None, priority=EventPriority.INTERACTIVE))
+        with patch('src.services.queue.queue_worker.time.monotonic', return_value=130.0):
+            order = [lanes.get_nowait().event_type for _ in range(3)]
+
+        # Aged by two levels, the backfill event competes as WEBHOOK but never
+        # overtakes the interactive lane
+        assert order == ['interactive', 'old', 'new']
+
+    def test_expired_event_is_dropped_and_acked(self):
+        """Test an event past its deadline is skipped and removed from the store."""
+        from datetime import UTC, datetime, timedelta
+
+        from src.services.queue.queue_worker import QueueWorker
+
+        handled = []
+
+        class TestWorker(QueueWorker):
+            def _handle_event(self, event):
+                handled.append(event.event_type)
+
+        store = InMemoryQueueStore()
+        worker = TestWorker(name='deadline_worker')
+        worker.attach_store(store)
+        worker.enqueue_event(
+            'stale', {}, deadline=datetime.now(UTC) - timedelta(seconds=1)
+        )
+        worker.enqueue_event('fresh', {}, deadline=datetime.now(UTC) + timedelta(minutes=5))
+
+        worker.start()
+        try:
+            assert TestQueueWorkerPool._wait_for(lambda: handled == ['fresh'])
+            assert TestQueueWorkerPool._wait_for(lambda: store.records == {})
+        finally:
+            worker.stop()
+
+
+class TestEventCoalescing:
+    """Tests for deduplication of pending RSS events."""
+
+    def test_duplicate_feed_check_returns_pending_event(self):
+        """Test re-enqueuing a pending feed check is a no-op."""
+        from src.services.queue.rss_queue import RSSPayload, RSSQueueWorker
+
+        worker = RSSQueueWorker(name='coalesce_feed')
+        first = worker.enqueue_scheduled_check('https://a/rss')
+        second = worker.enqueue_scheduled_check('https://a/rss')
+        other = worker.enqueue_scheduled_check('https://b/rss')
+
+        assert second is first
+        assert other is not first
+        assert worker.get_queue_size() == 2
+        assert worker.get_status()['stats']['total_coalesced'] == 1
+
+        # Feed events with their own history record are never merged
+        manual = RSSPayload(rss_url='https://a/rss', extra_data={'history_id': 1})
+        worker.enqueue_event(RSSQueueWorker.EVENT_SINGLE_FEED, manual)
+        worker.enqueue_event(RSSQueueWorker.EVENT_SINGLE_FEED, manual)
+        assert worker.get_queue_size() == 4
+
+    def test_item_coalesced_by_hash_until_claimed(self):
+        """Test items with the same hash merge only while still pending."""
+        from src.services.queue.rss_queue import RSSQueueWorker
+
+        worker = RSSQueueWorker(name='coalesce_item', num_workers=2)
+        assert worker.enqueue_single_item('[A] Show - 01', 'magnet:?1', hash_id='A' * 40)
+        assert not worker.enqueue_single_item('[A] Show - 01', 'magnet:?2', hash_id='a' * 40)
+
+        claimed, _ = worker._claim_ready_event([])
+        assert claimed.payload.torrent_url == 'magnet:?1'
+
+        assert worker.enqueue_single_item('[A] Show - 01', 'magnet:?3', hash_id='a' * 40)
+        assert worker.get_queue_size() == 1
+
+    def test_feed_handler_counts_only_new_items(self, tmp_path):
+        """Test an item merged into another history's pending event is not attempted."""
+        from src.core.interfaces.adapters import RSSItem
+        from src.services.queue.rss_queue import RSSPayload, RSSQueueWorker
+
+        with patch.dict('os.environ', {'LOG_PATH': str(tmp_path)}):
+            from src.main import init_queue_workers
+
+        worker = RSSQueueWorker(name='coalesce_history')
+        worker.enqueue_single_item(
+            '[A] Show - 01', 'magnet:?1', hash_id='a' * 40, extra_data={'history_id': 1}
+        )
+        container = MagicMock()
+        container.rss_service().parse_feed.return_value = [
+            RSSItem(title='[A] Show - 01', link='magnet:?1', hash='a' * 40),
+            RSSItem(title='[A] Show - 02', link='magnet:?2', hash='b' * 40),
+        ]
+        container.download_repo().existing_hashes.return_value = set()
+        history_repo = container.history_repo()
+
+        with patch('src.container.container', container), \
+                patch('src.core.config.config'), \
+                patch('src.services.queue.rss_queue.get_rss_queue', return_value=worker), \
+                patch('src.services.queue.webhook_queue.get_webhook_queue'), \
+                patch.object(worker, 'set_num_workers'), \
+                patch.object(worker, 'restore_pending'), \
+                patch.object(worker, 'start'):
+            init_queue_workers(MagicMock())
+            worker._handlers[RSSQueueWorker.EVENT_SINGLE_FEED](
+                RSSPayload(rss_url='https://a/rss', extra_data={'history_id': 2})
+            )
+
+        history_repo.insert_rss_detail.assert_called_once_with(
+            2, '[A] Show - 01', 'exists', '已在处理队列中'
+        )
+        history_repo.update_rss_history_stats.assert_called_with(
+            2, items_found=2, items_attempted=1, status='processing'
+        )
+        assert worker.get_queue_size() == 2
+
+    def test_urgent_duplicate_promotes_pending_event(self):
+        """Test a manual refresh promotes a pending scheduled check of the same feed."""
+        from src.services.queue.queue_worker import EventPriority
+        from src.services.queue.rss_queue import RSSPayload, RSSQueueWorker
+
+        worker = RSSQueueWorker(name='coalesce_promote')
+        worker.enqueue_event(
+            RSSQueueWorker.EVENT_SINGLE_FEED, RSSPayload(rss_url='https://a/other'),
+            priority=EventPriority.SCHEDULED
+        )
+        scheduled = worker.enqueue_event(
+            RSSQueueWorker.EVENT_SINGLE_FEED,
+            RSSPayload(rss_url='https://a/rss', extra_data={'skip_unchanged': True}),
+            priority=EventPriority.SCHEDULED
+        )
+        refreshed = worker.enqueue_event(
+            RSSQueueWorker.EVENT_SINGLE_FEED, RSSPayload(rss_url='https://a/rss'),
+            priority=EventPriority.INTERACTIVE
+        )
+
+        assert refreshed is scheduled
+        assert scheduled.priority == EventPriority.INTERACTIVE
+        assert scheduled.payload.extra_data == {'priority': EventPriority.INTERACTIVE}
+        assert worker._queue.get_nowait() is scheduled
+
+    def test_merged_event_is_persisted(self):
+        """Test a restart replays the merged priority, deadline and payload."""
+        from datetime import UTC, datetime, timedelta
+
+        from src.services.queue.queue_worker import EventPriority
+        from src.services.queue.rss_queue import RSSPayload, RSSQueueWorker
+
+        store = InMemoryQueueStore()
+        worker = RSSQueueWorker(name='coalesce_durable')
+        worker.attach_store(store)
+        scheduled = worker.enqueue_event(
+            RSSQueueWorker.EVENT_SINGLE_FEED,
+            RSSPayload(rss_url='https://a/rss', extra_data={'skip_unchanged': True}),
+            priority=EventPriority.SCHEDULED,
+            deadline=datetime.now(UTC) + timedelta(minutes=5)
+        )
+        worker.enqueue_event(
+            RSSQueueWorker.EVENT_SINGLE_FEED, RSSPayload(rss_url='https://a/rss'),
+            priority=EventPriority.INTERACTIVE
+        )
+
+        restarted = RSSQueueWorker(name='coalesce_durable')
+        restarted.attach_store(store)
+        assert restarted.restore_pending() == 1
+
+        restored = restarted._queue.get_nowait()
+        assert restored.queue_id == scheduled.queue_id
+        assert restored.priority == EventPriority.INTERACTIVE
+        assert restored.deadline is None
+        assert restored.payload.extra_data == {'priority': EventPriority.INTERACTIVE}
+
+
+class TestWebhookBatching:
+    """Tests for webhook debouncing and batch handoff."""
+
+    def test_recent_duplicate_is_debounced(self):
+        """Test a duplicate completion arriving after pickup is dropped within the window."""
+        from src.services.queue.webhook_queue import WebhookQueueWorker
+
+        worker = WebhookQueueWorker(name='webhook_debounce')
+        handled = []
+        worker.register_handler(WebhookQueueWorker.EVENT_TORRENT_COMPLETED, handled.append)
+
+        first = worker.enqueue_completion('a' * 40, name='A')
+        event, _ = worker._claim_ready_event([])
+        worker._process_event(event)
+
+        assert worker.enqueue_completion('a' * 40, name='A') is first
+        assert worker.get_queue_size() == 0
+        assert len(handled) == 1
+
+        # Manual re-runs bypass the window
+        forced = worker.enqueue_event(
+            WebhookQueueWorker.EVENT_TORRENT_FINISHED, first.payload, force=True
+        )
+        assert forced is not first
+
+        worker.DEBOUNCE_SECONDS = 0
+        assert worker.enqueue_completion('b' * 40) is not None
+        assert worker.get_queue_size() == 2
+
+    def test_burst_is_handed_over_as_one_batch(self):
+        """Test queued completions are processed together and failures settled per event."""
+        from src.services.queue.webhook_queue import WebhookPayload, WebhookQueueWorker
+
+        store = InMemoryQueueStore()
+        worker = WebhookQueueWorker(name='webhook_batch')
+        worker.attach_store(store)
+        batches = []
+
+        def handle(payloads):
+            batches.append([p.hash_id for p in payloads])
+            return {'b' * 40: 'boom'}
+
+        worker.register_batch_handler(WebhookQueueWorker.EVENT_TORRENT_COMPLETED, handle)
+        worker.register_batch_handler(WebhookQueueWorker.EVENT_TORRENT_FINISHED, handle)
+        for hash_id in ('a' * 40, 'b' * 40):
+            worker.enqueue_completion(hash_id)
+        worker.enqueue_event(WebhookQueueWorker.EVENT_TORRENT_FINISHED, WebhookPayload('c' * 40))
+        worker.enqueue_error('d' * 40, 'disk full')
+
+        event, _ = worker._claim_ready_event([])
+        worker._process_event(event)
+
+        assert batches == [['a' * 40, 'b' * 40, 'c' * 40]]
+        assert worker.get_queue_size() == 1
+        stats = worker.get_status()['stats']
+        assert stats['total_success'] == 2
+        assert stats['total_failed'] == 1
+        assert [r['status'] for r in store.records.values()] == ['failed', 'pending']
+
+        # The failed torrent can be retried immediately
+        assert worker.enqueue_completion('b' * 40) is not None
+        assert worker.get_queue_size() == 2
+
+    def test_completion_batch_fetches_each_torrent_once(self):
+        """Test a batch updates statuses in one call and fetches files once per hash."""
+        from src.services.download.completion_handler import CompletionHandler
+
+        download_repo = MagicMock()
+        download_repo.get_by_hashes.return_value = {'a' * 40: MagicMock()}
+        client = MagicMock()
+        client.get_torrent_files.return_value = [{'name': 'Show/Show - 01.mkv', 'size': 1}]
+        notifier = MagicMock()
+        handler = CompletionHandler(
+            MagicMock(), download_repo, client, MagicMock(), MagicMock(),
+            MagicMock(), MagicMock(), notifier
+        )
+        handler._create_hardlinks = MagicMock(return_value=1)
+
+        results = handler.handle_completed_batch([
+            ('a' * 40, {'name': 'A', 'save_path': '/dl'}),
+            ('b' * 40, {'name': 'B', 'save_path': '/dl'}),
+        ])
+
+        download_repo.update_statuses.assert_called_once()
+        assert len(download_repo.update_statuses.call_args.args[0]) == 2
+        download_repo.get_by_hash.assert_not_called()
+        client.get_torrent_files.assert_called_once_with('a' * 40)
+        client.get_torrent_folder_structure.assert_not_called()
+        assert len(notifier.notify_webhooks_received.call_args.args[0]) == 2
+        assert results['a' * 40]['hardlinks_created'] == 1
+        assert results['b' * 40]['success']
+
+
 @pytest.mark.integration
 class TestQueueIntegration:
     """Integration tests for queue functionality."""
@@ -305,9 +914,9 @@ class TestQueueIntegration:
     def test_webhook_queue_processes_event(self):
         """Test that webhook queue processes events correctly."""
         from src.services.queue.webhook_queue import (
-            get_webhook_queue,
             WebhookPayload,
-            WebhookQueueWorker
+            WebhookQueueWorker,
+            get_webhook_queue,
         )
 
         queue = get_webhook_queue()
@@ -341,11 +950,7 @@ class TestQueueIntegration:
 
     def test_rss_queue_processes_event(self):
         """Test that RSS queue processes events correctly."""
-        from src.services.queue.rss_queue import (
-            get_rss_queue,
-            RSSPayload,
-            RSSQueueWorker
-        )
+        from src.services.queue.rss_queue import RSSPayload, RSSQueueWorker, get_rss_queue
 
         queue = get_rss_queue()
         processed = []